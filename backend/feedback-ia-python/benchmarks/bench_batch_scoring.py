@@ -0,0 +1,86 @@
+"""
+Benchmark de re-puntuación masiva (cambio de rúbrica sobre grabaciones históricas).
+
+Compara, para M análisis y P parámetros:
+- calculate_scores_for_parameters por análisis (un producto matriz-vector y
+  las reglas de negocio en Python por cada grabación)
+- score_analyses: matriz M×K, un producto de matrices y reglas como máscaras
+- score_batch con la matriz ya construida (p. ej. leída en columnas)
+
+Uso:
+    python -m benchmarks.bench_batch_scoring --recordings 100000 --parametros 20
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from src.domain.services.feedback_analyzer import FeedbackAnalyzerService
+from src.domain.services.scoring_rubric import ScoringRubric, legacy_group_for
+
+
+def _analyses(count: int):
+    rng = random.Random(7)
+    return [
+        {
+            "audio_metrics": {
+                "clarity_score": rng.random(),
+                "volume_consistency": rng.random(),
+                "speech_rate": rng.uniform(90, 200),
+                "pause_patterns": rng.random(),
+                "intonation_variety": rng.random(),
+            },
+            "duration_seconds": rng.uniform(10, 600),
+            "background_noise": rng.random() * 0.5,
+            "consistency_score": rng.random(),
+        }
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--recordings", type=int, default=100000)
+    parser.add_argument("--parametros", type=int, default=20)
+    parser.add_argument("--sample", type=int, default=5000,
+                        help="análisis medidos con el cálculo por grabación (se extrapola)")
+    args = parser.parse_args()
+
+    parametros_ids = list(range(1, args.parametros + 1))
+    rubric = ScoringRubric.compile({}, {parametro_id: legacy_group_for(parametro_id) for parametro_id in parametros_ids})
+    analyzer = FeedbackAnalyzerService()
+    analyses = _analyses(args.recordings)
+
+    async def per_recording(sample):
+        return [await analyzer.calculate_scores_for_parameters(parametros_ids, analysis) for analysis in sample]
+
+    sample = analyses[:min(args.sample, len(analyses))]
+    start = time.perf_counter()
+    reference = asyncio.run(per_recording(sample))
+    per_recording_s = (time.perf_counter() - start) / len(sample) * len(analyses)
+
+    start = time.perf_counter()
+    scores = analyzer.score_analyses(rubric, analyses, parametros_ids)
+    from_dicts_s = time.perf_counter() - start
+
+    metrics = rubric.metric_matrix([analysis["audio_metrics"] for analysis in analyses])
+    rules = [np.array([analysis[key] for analysis in analyses])
+             for key in ("duration_seconds", "background_noise", "consistency_score")]
+    start = time.perf_counter()
+    analyzer.score_batch(rubric, metrics, *rules, parametros_ids)
+    matrix_s = time.perf_counter() - start
+
+    # Los tres cálculos deben coincidir
+    assert np.allclose(scores[:len(sample)], [list(row.values()) for row in reference])
+
+    print(f"{args.recordings} grabaciones × {args.parametros} parámetros")
+    print(f"{'cálculo':28} {'s':>8} {'vs base':>8}")
+    print(f"{'por grabación (extrapolado)':28} {per_recording_s:8.2f} {1:7.1f}x")
+    print(f"{'score_analyses':28} {from_dicts_s:8.2f} {per_recording_s / from_dicts_s:7.1f}x")
+    print(f"{'score_batch (matriz lista)':28} {matrix_s:8.3f} {per_recording_s / matrix_s:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
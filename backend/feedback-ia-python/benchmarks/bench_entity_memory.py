@@ -0,0 +1,96 @@
+"""
+Benchmark de memoria por instancia de las entidades y value objects del dominio.
+
+Compara cada clase (dataclass con __slots__) contra una copia equivalente sin
+slots, como eran antes, y mide con tracemalloc los bytes por instancia y el
+tiempo de construcción validada vs. rehidratada.
+
+Uso:
+    python -m benchmarks.bench_entity_memory --count 100000
+"""
+import argparse
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime
+from typing import Callable, Dict
+
+from src.domain.entities import Feedback, Grabacion, Metrica, Parametro
+from src.domain.rehydration import rehydrator
+from src.domain.value_objects import ArchivoAudio, FeedbackScore, ParametroValor
+
+
+def _unslotted(cls: type) -> type:
+    """Dataclass con los mismos campos pero con __dict__ por instancia."""
+    return make_dataclass(f"{cls.__name__}SinSlots", [(f.name, f.type) for f in fields(cls)])
+
+
+def _sample_values() -> Dict[type, Callable[[int], dict]]:
+    now = datetime(2025, 1, 1)
+    score = FeedbackScore(80.0)
+    valor = ParametroValor(120.0, "ppm")
+    archivo = ArchivoAudio("clase.wav", "/audio/clase.wav", ".wav", 300.0)
+    return {
+        FeedbackScore: lambda i: {"value": float(i % 100)},
+        ParametroValor: lambda i: {"valor": float(i), "unidad": "ppm"},
+        ArchivoAudio: lambda i: {
+            "nombre_archivo": "clase.wav", "ruta_archivo": "/audio/clase.wav",
+            "formato": ".wav", "duracion": 300.0
+        },
+        Feedback: lambda i: {
+            "id": i + 1, "grabacion_id": 1, "parametro_id": 1, "score": score,
+            "comentario": None, "es_manual": False, "created_at": now, "updated_at": now
+        },
+        Grabacion: lambda i: {
+            "id": i + 1, "archivo_audio": archivo, "fecha_grabacion": now,
+            "created_at": now, "updated_at": now
+        },
+        Parametro: lambda i: {
+            "id": i + 1, "metrica_id": 1, "nombre": "Velocidad", "valor": valor,
+            "created_at": now, "updated_at": now
+        },
+        Metrica: lambda i: {
+            "id": i + 1, "nombre": "Fluidez", "descripcion": None, "tipo_metrica_id": 1,
+            "created_at": now, "updated_at": now
+        },
+    }
+
+
+def _bytes_per_instance(factory: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Se descuenta la lista que contiene las instancias
+    size = after - before - (len(instances) * 8 + 56)
+    del instances
+    return size / count
+
+
+def _ns_per_instance(factory: Callable[[int], object], count: int) -> float:
+    start = time.perf_counter_ns()
+    for i in range(count):
+        factory(i)
+    return (time.perf_counter_ns() - start) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'clase':16} {'bytes antes':>12} {'bytes ahora':>12} {'ns validado':>12} {'ns rehidratado':>15}")
+    for cls, values in _sample_values().items():
+        # La memoria se mide con instancias rehidratadas en ambos casos, para
+        # comparar solo la representación y no la normalización de __post_init__
+        legacy, trusted = rehydrator(_unslotted(cls)), rehydrator(cls)
+        before = _bytes_per_instance(lambda i: legacy(**values(i)), args.count)
+        after = _bytes_per_instance(lambda i: trusted(**values(i)), args.count)
+        validated_ns = _ns_per_instance(lambda i: cls(**values(i)), args.count)
+        trusted_ns = _ns_per_instance(lambda i: trusted(**values(i)), args.count)
+        print(f"{cls.__name__:16} {before:12.0f} {after:12.0f} {validated_ns:12.0f} {trusted_ns:15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark del listado de feedbacks: camino de entidades vs. filas planas.
+
+Compara, para un listado de N feedbacks:
+- entidades: FeedbackModel -> Feedback (con FeedbackScore) -> FeedbackResponseDTO
+- filas: Row -> FeedbackListItem
+
+Reporta tiempo por listado y pico de memoria por fila (tracemalloc),
+incluyendo la serialización a dict.
+
+Uso:
+    python -m benchmarks.bench_feedback_listing --rows 1000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.application.dtos.feedback_dto import FeedbackListItem, FeedbackResponseDTO
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import FeedbackModel, GrabacionModel, ParametroModel
+from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import (
+    SQLAlchemyFeedbackRepository
+)
+
+
+def _seed(db: Session, rows: int, parametros: int = 5) -> None:
+    grabaciones = rows // parametros + 1
+    db.add_all(GrabacionModel(nombre_archivo=f"g{i}.wav", ruta_archivo=f"/audio/g{i}.wav")
+               for i in range(grabaciones))
+    db.add_all(ParametroModel(nombre=f"p{i}", valor=1.0) for i in range(parametros))
+    db.flush()
+    db.add_all(
+        FeedbackModel(grabacion_id=i // parametros + 1, parametro_id=i % parametros + 1,
+                      valor=float(i % 100), comentario="ok", es_manual=False)
+        for i in range(rows)
+    )
+    db.commit()
+
+
+async def _measure(db: Session, listing: Callable[[], Awaitable[list]], runs: int) -> Tuple[float, int]:
+    """Retorna (ms por listado, pico de bytes asignados por listado)."""
+    await listing()
+    db.expunge_all()
+    start = time.perf_counter()
+    for _ in range(runs):
+        await listing()
+        db.expunge_all()
+    elapsed_ms = (time.perf_counter() - start) / runs * 1000
+
+    tracemalloc.start()
+    result = await listing()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    db.expunge_all()
+    return elapsed_ms, peak
+
+
+async def run(rows: int, runs: int) -> None:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    _seed(db, rows)
+    repository = SQLAlchemyFeedbackRepository(db)
+
+    async def entity_listing():
+        return [FeedbackResponseDTO.from_entity(f).to_dict() for f in await repository.get_all(0, rows)]
+
+    async def row_listing():
+        return [FeedbackListItem(*row).to_dict() for row in await repository.list_rows(limit=rows)]
+
+    print(f"{'camino':12} {'ms/listado':>11} {'pico bytes/fila':>16}")
+    for name, listing in (("entidades", entity_listing), ("filas", row_listing)):
+        elapsed_ms, peak = await _measure(db, listing, runs)
+        print(f"{name:12} {elapsed_ms:11.2f} {peak / rows:16.0f}")
+    db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark del costo por llamada de SQLAlchemyFeedbackRepository.
+
+Compara las consultas precompiladas del repositorio (select() a nivel de
+módulo con parámetros enlazados) contra el estilo anterior, que construía
+una Query con and_() en cada llamada. Usa SQLite en memoria para que el
+tiempo medido sea principalmente el de construcción y compilación.
+
+Uso:
+    python -m benchmarks.bench_feedback_repository --calls 5000
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict
+
+from sqlalchemy import and_, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import FeedbackModel, GrabacionModel, ParametroModel
+from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import (
+    SQLAlchemyFeedbackRepository
+)
+
+
+class LegacyQueries:
+    """Consultas con el estilo Query + and_() que usaba el repositorio."""
+
+    def __init__(self, db: Session):
+        self._db = db
+
+    async def get_by_id(self, feedback_id: int):
+        return self._db.query(FeedbackModel).filter(FeedbackModel.id == feedback_id).first()
+
+    async def get_by_grabacion_id(self, grabacion_id: int):
+        return self._db.query(FeedbackModel).filter(FeedbackModel.grabacion_id == grabacion_id).all()
+
+    async def exists_by_grabacion_and_parametro(self, grabacion_id: int, parametro_id: int):
+        return self._db.query(FeedbackModel).filter(
+            and_(
+                FeedbackModel.grabacion_id == grabacion_id,
+                FeedbackModel.parametro_id == parametro_id
+            )
+        ).first() is not None
+
+
+def _seed(db: Session, grabaciones: int, parametros: int) -> None:
+    db.add_all(GrabacionModel(nombre_archivo=f"g{i}.wav", ruta_archivo=f"/audio/g{i}.wav")
+               for i in range(grabaciones))
+    db.add_all(ParametroModel(nombre=f"p{i}", valor=1.0) for i in range(parametros))
+    db.flush()
+    db.add_all(
+        FeedbackModel(grabacion_id=g + 1, parametro_id=p + 1, valor=float((g * p) % 100), es_manual=False)
+        for g in range(grabaciones) for p in range(parametros)
+    )
+    db.commit()
+
+
+async def _time_per_call(call: Callable, calls: int) -> float:
+    """Retorna microsegundos por llamada."""
+    for i in range(min(calls, 100)):  # calentamiento (llena el caché de compilación)
+        await call(i)
+    start = time.perf_counter()
+    for i in range(calls):
+        await call(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def run(calls: int, grabaciones: int, parametros: int) -> Dict[str, Dict[str, float]]:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    _seed(db, grabaciones, parametros)
+    total = grabaciones * parametros
+
+    implementations = {
+        "precompiled": SQLAlchemyFeedbackRepository(db),
+        "legacy_query": LegacyQueries(db),
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for name, repo in implementations.items():
+        db.expunge_all()
+        results[name] = {
+            "get_by_id": await _time_per_call(lambda i: repo.get_by_id(i % total + 1), calls),
+            "get_by_grabacion_id": await _time_per_call(
+                lambda i: repo.get_by_grabacion_id(i % grabaciones + 1), calls
+            ),
+            "exists_by_grabacion_and_parametro": await _time_per_call(
+                lambda i: repo.exists_by_grabacion_and_parametro(i % grabaciones + 1, i % parametros + 1),
+                calls
+            ),
+        }
+    db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--grabaciones", type=int, default=200)
+    parser.add_argument("--parametros", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.calls, args.grabaciones, args.parametros))
+
+    print(f"{'método':40} {'precompilado µs':>16} {'Query µs':>10} {'mejora':>8}")
+    for method, value in results["precompiled"].items():
+        legacy = results["legacy_query"][method]
+        print(f"{method:40} {value:16.1f} {legacy:10.1f} {legacy / value:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
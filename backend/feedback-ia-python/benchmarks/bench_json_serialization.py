@@ -0,0 +1,70 @@
+"""
+Benchmark de serialización JSON de un listado de feedbacks.
+
+Compara, para N elementos:
+- jsonable_encoder + json.dumps (endpoints sin response_model antes de FastJSONRoute)
+- Pydantic validate + dump_json (ruta de FastAPI para endpoints con response_model)
+- orjson (FastJSONResponse) sobre FeedbackResponseDTO y sobre FeedbackListItem
+
+Uso:
+    python -m benchmarks.bench_json_serialization --items 1000
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from src.application.dtos.feedback_dto import FeedbackListItem, FeedbackResponseDTO
+from src.shared.utils.fast_json import FastJSONResponse
+
+
+def _ms_per_call(call: Callable[[], bytes], runs: int) -> float:
+    call()
+    start = time.perf_counter()
+    for _ in range(runs):
+        call()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    now = datetime(2025, 6, 20, 12, 30)
+    dtos = [
+        FeedbackResponseDTO(i, i // 5 + 1, i % 5 + 1, float(i % 100), "Buen ritmo", False,
+                            "Regular", now, now)
+        for i in range(args.items)
+    ]
+    items = [
+        FeedbackListItem(i, i // 5 + 1, i % 5 + 1, float(i % 100), "Buen ritmo", False, now, now)
+        for i in range(args.items)
+    ]
+    adapter = TypeAdapter(List[FeedbackResponseDTO])
+
+    # Todas las variantes deben producir el mismo JSON
+    expected = json.loads(json.dumps(jsonable_encoder(dtos)))
+    assert json.loads(FastJSONResponse(dtos).body) == expected
+
+    cases = {
+        "jsonable_encoder + json": lambda: json.dumps(jsonable_encoder(dtos)).encode(),
+        "pydantic dump_json": lambda: adapter.dump_json(adapter.validate_python(dtos)),
+        "orjson (DTO)": lambda: FastJSONResponse(dtos).body,
+        "orjson (FeedbackListItem)": lambda: FastJSONResponse(items).body,
+    }
+    baseline = None
+    print(f"{'serialización':28} {'ms':>8} {'vs base':>8}")
+    for name, call in cases.items():
+        elapsed = _ms_per_call(call, args.runs)
+        baseline = baseline or elapsed
+        print(f"{name:28} {elapsed:8.2f} {baseline / elapsed:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark de puntuación de N parámetros para un mismo análisis.
+
+Compara el cálculo anterior de FeedbackAnalyzerService (por parámetro, con
+despacho por nombre de métrica en cada llamada) con la rúbrica compilada
+(un producto matriz-vector para todos los parámetros).
+
+Uso:
+    python -m benchmarks.bench_parameter_scoring --parametros 50
+"""
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.domain.services.scoring_rubric import DEFAULT_GROUPS, ScoringRubric, legacy_group_for
+
+AUDIO_METRICS = {
+    "clarity_score": 0.82,
+    "volume_consistency": 0.74,
+    "speech_rate": 138,
+    "pause_patterns": 0.66,
+    "intonation_variety": 0.58,
+}
+
+# Copia del cálculo anterior, como línea base
+_LEGACY_WEIGHTS = {"claridad": 0.25, "volumen": 0.20, "velocidad": 0.20, "pausas": 0.15, "entonacion": 0.20}
+_LEGACY_SOURCES = {
+    "claridad": "clarity_score", "volumen": "volume_consistency", "velocidad": "speech_rate",
+    "pausas": "pause_patterns", "entonacion": "intonation_variety",
+}
+
+
+def _legacy_normalize(metric_name: str, value: float) -> float:
+    if metric_name in ["claridad", "volumen", "entonacion"]:
+        return max(0.0, min(1.0, value))
+    elif metric_name == "velocidad":
+        if value <= 0:
+            return 0.0
+        return max(0.0, 1.0 - abs(value - 150) / 150)
+    elif metric_name == "pausas":
+        return max(0.0, min(1.0, value))
+    return 0.5
+
+
+def _legacy_scores(parametros_ids: List[int], audio_metrics: Dict) -> List[float]:
+    scores = []
+    for parametro_id in parametros_ids:
+        group = legacy_group_for(parametro_id)
+        metrics = {metrica.clave: audio_metrics.get(_LEGACY_SOURCES[metrica.clave], 0.5)
+                   for metrica in DEFAULT_GROUPS[group]}
+        weighted, total = 0.0, 0.0
+        for name, value in metrics.items():
+            weight = _LEGACY_WEIGHTS.get(name, 0.1)
+            weighted += _legacy_normalize(name, value) * weight
+            total += weight
+        scores.append(weighted / total * 100)
+    return scores
+
+
+def _us_per_call(call: Callable[[], object], runs: int) -> float:
+    call()
+    start = time.perf_counter()
+    for _ in range(runs):
+        call()
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parametros", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    parametros_ids = list(range(1, args.parametros + 1))
+    groups = {parametro_id: legacy_group_for(parametro_id) for parametro_id in parametros_ids}
+    rubric = ScoringRubric.compile({}, groups)
+
+    # Ambos cálculos deben coincidir
+    assert np.allclose(rubric.score_all(AUDIO_METRICS), _legacy_scores(parametros_ids, AUDIO_METRICS))
+
+    legacy = _us_per_call(lambda: _legacy_scores(parametros_ids, AUDIO_METRICS), args.runs)
+    compiled = _us_per_call(lambda: rubric.score_all(AUDIO_METRICS), args.runs)
+    print(f"{'puntuación':22} {'µs':>9} {'vs base':>8}")
+    print(f"{'por parámetro':22} {legacy:9.1f} {1:7.1f}x")
+    print(f"{'rúbrica compilada':22} {compiled:9.1f} {legacy / compiled:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
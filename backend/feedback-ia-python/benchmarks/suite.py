@@ -0,0 +1,622 @@
+"""
+Suite reproducible de benchmarks de la API y de los caminos críticos del dominio.
+
+Mide cada caso con datos deterministas y tamaños fijos, y guarda los
+resultados en JSON junto con el commit, la versión de Python, los paquetes
+y la máquina, para comparar entre commits:
+
+    python -m benchmarks.suite run                          # todos los casos
+    python -m benchmarks.suite run --quick --filter dto     # sin los casos lentos
+    python -m benchmarks.suite list
+    python -m benchmarks.suite compare benchmarks/results/BASE.json benchmarks/results/NUEVO.json
+
+Cada caso se repite en rondas de N llamadas (N se ajusta para que una ronda
+dure al menos --min-round-ms, con el recolector de basura desactivado como
+en timeit) y se guardan la mediana, el mínimo, la media y la desviación por
+llamada. `compare` marca como regresión un caso cuya mediana y cuyo mínimo
+empeoran ambos más que --threshold, para no confundir ruido con regresiones,
+y termina con código 1 si hay alguna.
+
+Los casos de la API usan una base SQLite temporal con las migraciones
+aplicadas y el servidor local compatible con OpenAI (ai_stub_server) sin
+latencia: miden la aplicación, no la red ni el modelo.
+"""
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+SCHEMA_VERSION = 1
+
+# Paquetes cuya versión se guarda con los resultados
+PACKAGES = ("fastapi", "starlette", "pydantic", "sqlalchemy", "numpy", "orjson", "openai")
+
+API_KEY = "benchmark-key"
+AUTH_HEADERS = {"Authorization": f"Bearer {API_KEY}"}
+
+
+@dataclass
+class BenchContext:
+    """Recursos compartidos por los casos de una ejecución (directorio temporal, API, stub de IA)."""
+
+    workdir: Path
+    stub_port: int
+    resources: ExitStack = field(default_factory=ExitStack)
+    _client: Any = None
+
+    def api_client(self):
+        """TestClient de la aplicación sobre la base temporal (se crea una vez)."""
+        if self._client is None:
+            self._start_ai_stub()
+            _migrate_database()
+            from fastapi.testclient import TestClient
+            from src.main import create_app
+
+            self._client = self.resources.enter_context(TestClient(create_app()))
+        return self._client
+
+    def _start_ai_stub(self) -> None:
+        import uvicorn
+        from src.interface.cli.ai_stub_server import StubConfig, create_stub_app
+
+        server = uvicorn.Server(uvicorn.Config(
+            create_stub_app(StubConfig(seed=7)), host="127.0.0.1", port=self.stub_port, log_level="warning"
+        ))
+        thread = threading.Thread(target=server.run, name="ai-stub", daemon=True)
+        thread.start()
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError(f"No se pudo iniciar el servidor de IA local en el puerto {self.stub_port}")
+            time.sleep(0.01)
+
+        def stop() -> None:
+            server.should_exit = True
+            thread.join()
+
+        self.resources.callback(stop)
+
+
+@dataclass(frozen=True)
+class Case:
+    """Un caso de la suite con un juego de parámetros."""
+
+    name: str
+    params: Dict[str, Any]
+    setup: Callable[..., Callable[[], Any]]
+    slow: bool = False
+
+    @property
+    def id(self) -> str:
+        if not self.params:
+            return self.name
+        return f"{self.name}[{','.join(f'{key}={value}' for key, value in self.params.items())}]"
+
+
+CASES: List[Case] = []
+
+
+def benchmark(name: str, params: Tuple[Dict[str, Any], ...] = ({},),
+              slow: Callable[[Dict[str, Any]], bool] = lambda params: False):
+    """
+    Registra un caso. La función recibe el contexto y los parámetros, prepara
+    los datos (sin medir) y retorna la llamada que se mide.
+    """
+    def register(setup: Callable[..., Callable[[], Any]]):
+        for case_params in params:
+            CASES.append(Case(name, dict(case_params), setup, slow(case_params)))
+        return setup
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Dominio
+# ---------------------------------------------------------------------------
+
+_NOW = datetime(2025, 6, 20, 12, 30)
+
+
+def _scores(count: int) -> List[float]:
+    # Congruencial: determinista y sin costo de random por elemento
+    return [float((i * 7919) % 1001) / 10 for i in range(count)]
+
+
+def _feedbacks(count: int):
+    from src.domain.entities.feedback import Feedback
+    from src.domain.value_objects.feedback_score import FeedbackScore
+
+    return [
+        Feedback(None, i // 5 + 1, i % 5 + 1, FeedbackScore(score), "Buen ritmo" if i % 3 else None,
+                 i % 4 == 0, _NOW, _NOW)
+        for i, score in enumerate(_scores(count))
+    ]
+
+
+@benchmark("feedback_score.create")
+def bench_feedback_score_create(ctx: BenchContext):
+    from src.domain.value_objects.feedback_score import FeedbackScore
+
+    return lambda: FeedbackScore(73.5)
+
+
+@benchmark("repository.model_to_entity", params=({"rows": 1000},))
+def bench_model_to_entity(ctx: BenchContext, rows: int):
+    from src.infrastructure.database.models import FeedbackModel
+    from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import (
+        SQLAlchemyFeedbackRepository
+    )
+
+    to_entity = SQLAlchemyFeedbackRepository(None)._model_to_entity
+    models = [
+        FeedbackModel(id=i + 1, grabacion_id=i // 5 + 1, parametro_id=i % 5 + 1, valor=score,
+                      comentario="Buen ritmo", es_manual=False, created_at=_NOW, updated_at=_NOW)
+        for i, score in enumerate(_scores(rows))
+    ]
+    return lambda: [to_entity(model) for model in models]
+
+
+@benchmark("repository.entity_to_model", params=({"rows": 1000},))
+def bench_entity_to_model(ctx: BenchContext, rows: int):
+    from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import (
+        SQLAlchemyFeedbackRepository
+    )
+
+    to_model = SQLAlchemyFeedbackRepository(None)._entity_to_model
+    entities = _feedbacks(rows)
+    return lambda: [to_model(entity) for entity in entities]
+
+
+@benchmark("analyze_feedback_patterns",
+           params=({"feedbacks": 1_000}, {"feedbacks": 100_000}, {"feedbacks": 1_000_000}),
+           slow=lambda params: params["feedbacks"] >= 1_000_000)
+def bench_analyze_feedback_patterns(ctx: BenchContext, feedbacks: int):
+    from src.domain.services.feedback_analyzer import FeedbackAnalyzerService
+
+    analyzer = FeedbackAnalyzerService()
+    entities = _feedbacks(feedbacks)
+    return lambda: analyzer.analyze_feedback_patterns(entities)
+
+
+@benchmark("dto.from_entity", params=({"items": 1000},))
+def bench_dto_from_entity(ctx: BenchContext, items: int):
+    from src.application.dtos.feedback_dto import FeedbackResponseDTO
+
+    entities = _feedbacks(items)
+    return lambda: [FeedbackResponseDTO.from_entity(entity) for entity in entities]
+
+
+@benchmark("dto.serialize_json", params=({"items": 1000},))
+def bench_dto_serialize_json(ctx: BenchContext, items: int):
+    from src.application.dtos.feedback_dto import FeedbackResponseDTO
+    from src.shared.utils.fast_json import FastJSONResponse
+
+    dtos = [FeedbackResponseDTO.from_entity(entity) for entity in _feedbacks(items)]
+    return lambda: FastJSONResponse(dtos).body
+
+
+# ---------------------------------------------------------------------------
+# Análisis de audio
+# ---------------------------------------------------------------------------
+
+WAV_SAMPLE_RATE = 16000
+
+
+def write_synthetic_wav(path: Path, seconds: float, sample_rate: int = WAV_SAMPLE_RATE) -> None:
+    """
+    Escribe un WAV PCM mono de 16 bits en silencio con la duración pedida.
+
+    Los datos se reservan con truncate() (archivo disperso), así que una
+    grabación de 2 horas no ocupa disco ni tiempo de escritura.
+    """
+    data_size = int(seconds * sample_rate) * 2
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        f.truncate(len(header) + data_size)
+
+
+@benchmark("audio_analyzer.wav", params=tuple({"minutes": minutes} for minutes in (1, 10, 30, 60, 120)))
+def bench_audio_analyzer(ctx: BenchContext, minutes: int):
+    import wave
+
+    from src.domain.entities.grabacion import Grabacion
+    from src.domain.services.audio_analyzer_service import AudioAnalyzerService
+    from src.domain.value_objects.archivo_audio import ArchivoAudio
+
+    path = ctx.workdir / f"sintetico_{minutes}min.wav"
+    write_synthetic_wav(path, minutes * 60)
+    analyzer = AudioAnalyzerService()
+
+    def analyze():
+        # El analizador trabaja con los metadatos: se mide leer la cabecera y
+        # el análisis que hace el caso de uso (debe ser constante con la duración)
+        with wave.open(str(path), "rb") as audio:
+            duracion = audio.getnframes() / audio.getframerate()
+        grabacion = Grabacion(1, ArchivoAudio(path.name, str(path), ".wav", duracion))
+        result = analyzer.analyze_grabacion(grabacion)
+        analyzer.estimate_processing_cost(grabacion)
+        analyzer.recommend_preprocessing_steps(grabacion)
+        return result
+
+    assert analyze().duracion_segundos == minutes * 60
+    return analyze
+
+
+# ---------------------------------------------------------------------------
+# API (extremo a extremo)
+# ---------------------------------------------------------------------------
+
+def _migrate_database() -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(ROOT / "alembic.ini")), "head")
+
+
+def _seed_catalog(client, label: str, parametros: int) -> List[int]:
+    """Crea un tipo de métrica, una métrica y los parámetros del caso; retorna sus IDs."""
+    tipo = client.post("/api/v1/tipos-metrica/", json={"nombre": f"Voz ({label})"}, headers=AUTH_HEADERS).json()
+    metrica = client.post(
+        "/api/v1/metricas/", json={"nombre": f"Claridad ({label})", "tipo_metrica_id": tipo["id"]},
+        headers=AUTH_HEADERS
+    ).json()
+    return [
+        client.post(
+            "/api/v1/parametros/",
+            json={"nombre": f"Parámetro {i} ({label})", "metrica_id": metrica["id"], "valor": 1.0},
+            headers=AUTH_HEADERS
+        ).json()["id"]
+        for i in range(parametros)
+    ]
+
+
+def _seed_grabaciones(count: int) -> int:
+    """Inserta grabaciones en bloque; retorna el primer ID."""
+    from sqlalchemy import func, insert, select
+
+    from src.database.connection import SessionLocal
+    from src.models.models import Grabacion
+
+    with SessionLocal() as db:
+        first_id = (db.scalar(select(func.max(Grabacion.id))) or 0) + 1
+        db.execute(insert(Grabacion), [
+            {"nombre_archivo": f"bench_{i}.wav", "ruta_archivo": f"/audio/bench_{i}.wav",
+             "duracion": 120.0, "formato": ".wav"}
+            for i in range(count)
+        ])
+        db.commit()
+    return first_id
+
+
+@benchmark("api.post_feedback")
+def bench_api_post_feedback(ctx: BenchContext, grabaciones: int = 20000):
+    client = ctx.api_client()
+    parametros_ids = _seed_catalog(client, "post_feedback", 5)
+    first_id = _seed_grabaciones(grabaciones)
+    # Cada llamada usa un par (grabación, parámetro) nuevo: un duplicado daría 409
+    pairs = ((first_id + i, parametro_id) for i in range(grabaciones) for parametro_id in parametros_ids)
+
+    def post():
+        grabacion_id, parametro_id = next(pairs)
+        response = client.post("/api/v1/feedbacks/", json={
+            "grabacion_id": grabacion_id, "parametro_id": parametro_id, "valor": 82.5,
+            "comentario": "Buen ritmo"
+        }, headers=AUTH_HEADERS)
+        assert response.status_code == 201, response.text
+    return post
+
+
+@benchmark("api.generate_ai", params=({"parametros": 5},))
+def bench_api_generate_ai(ctx: BenchContext, parametros: int):
+    from src.infrastructure.jobs.estados import COMPLETADO
+
+    client = ctx.api_client()
+    parametros_ids = _seed_catalog(client, "generate_ai", parametros)
+    grabacion_id = _seed_grabaciones(1)
+    muestras = itertools.count()
+
+    def generate():
+        # Datos de audio distintos en cada llamada: el análisis no se reutiliza
+        response = client.post("/api/v1/feedbacks/generate-ai", json={
+            "grabacion_id": grabacion_id,
+            "parametros_ids": parametros_ids,
+            "audio_analysis_data": {"duration": 120, "muestra": next(muestras)}
+        }, headers=AUTH_HEADERS)
+        assert response.status_code == 202, response.text
+        return response.json()["job_id"]
+
+    # TestClient ejecuta la tarea en segundo plano antes de retornar: cada
+    # llamada mide la petición y el análisis completo
+    job = client.get(f"/api/v1/analysis-jobs/{generate()}", headers=AUTH_HEADERS).json()
+    assert job["estado"] == COMPLETADO, job
+    assert len(job["resultado"]) == parametros
+    return generate
+
+
+# ---------------------------------------------------------------------------
+# Medición
+# ---------------------------------------------------------------------------
+
+def _time_round(call: Callable[[], Any], number: int) -> float:
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(call: Callable[[], Any], rounds: int, min_round_s: float, max_case_s: float) -> Dict[str, Any]:
+    """
+    Mide una llamada en rondas y retorna las estadísticas por llamada (segundos).
+
+    Con casos lentos se detiene al superar max_case_s, con al menos 3 rondas.
+    """
+    started = time.perf_counter()
+    number = 1
+    elapsed = _time_round(call, number)  # calentamiento y calibración
+    while elapsed < min_round_s:
+        number = max(number + 1, int(number * min_round_s / max(elapsed, 1e-9) * 1.2))
+        elapsed = _time_round(call, number)
+
+    samples = [elapsed / number]
+    while len(samples) < rounds and (len(samples) < 3 or time.perf_counter() - started < max_case_s):
+        samples.append(_time_round(call, number) / number)
+
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "mean_s": statistics.fmean(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": len(samples),
+        "number": number,
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(("git", *args), cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info() -> Dict[str, Any]:
+    """Commit, intérprete, paquetes y máquina de la ejecución."""
+    packages = {}
+    for package in PACKAGES:
+        try:
+            packages[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            packages[package] = None
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "packages": packages,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _configure_environment(workdir: Path, stub_port: int) -> None:
+    """
+    Configura la aplicación antes de importarla: base temporal, IA local y
+    sin instrumentación opcional. La configuración se lee una sola vez.
+    """
+    if "src.infrastructure.config.settings" in sys.modules:
+        raise RuntimeError("La configuración ya se cargó; ejecutar la suite en un proceso nuevo")
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{workdir / 'benchmark.db'}",
+        "API_KEY": API_KEY,
+        "AI_PROVIDER": "openai",
+        "OPENAI_API_KEY": "stub",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+        "METRICS_ENABLED": "false",
+        "TRACING_ENABLED": "false",
+    })
+
+
+def select_cases(pattern: Optional[str], quick: bool) -> List[Case]:
+    """Casos cuyo ID coincide con el patrón (expresión regular), sin los lentos si quick."""
+    regex = re.compile(pattern) if pattern else None
+    return [
+        case for case in CASES
+        if (regex is None or regex.search(case.id)) and not (quick and case.slow)
+    ]
+
+
+def run(cases: List[Case], rounds: int, min_round_s: float, max_case_s: float) -> Dict[str, Any]:
+    """Ejecuta los casos y retorna el documento de resultados."""
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        context = BenchContext(workdir=Path(tmp), stub_port=_free_port())
+        _configure_environment(context.workdir, context.stub_port)
+        with context.resources:
+            for case in cases:
+                call = case.setup(context, **case.params)
+                stats = measure(call, rounds, min_round_s, max_case_s)
+                del call
+                results[case.id] = {"name": case.name, "params": case.params, **stats}
+                print(f"{case.id:45} {_format_duration(stats['median_s']):>10} "
+                      f"± {_format_duration(stats['stdev_s']):>9}  ({stats['rounds']}×{stats['number']})",
+                      flush=True)
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": environment_info(),
+        "options": {"rounds": rounds, "min_round_s": min_round_s, "max_case_s": max_case_s},
+        "results": results,
+    }
+
+
+def default_output_path(environment: Dict[str, Any]) -> Path:
+    """benchmarks/results/<commit>[-dirty].json"""
+    commit = (environment.get("commit") or "sin-commit")[:12]
+    return RESULTS_DIR / f"{commit}{'-dirty' if environment.get('dirty') else ''}.json"
+
+
+# ---------------------------------------------------------------------------
+# Comparación
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Comparison:
+    """Cambio de un caso entre dos ejecuciones (ratio > 1: más lento)."""
+
+    case_id: str
+    base_s: float
+    new_s: float
+    ratio: float
+    min_ratio: float
+    status: str  # "regresión" | "mejora" | "igual"
+
+
+def compare_results(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[Comparison]:
+    """
+    Compara los casos presentes en ambas ejecuciones.
+
+    Args:
+        base: Resultados de referencia
+        new: Resultados a evaluar
+        threshold: Cambio relativo a partir del cual se reporta (0.1 = 10 %)
+    """
+    comparisons = []
+    for case_id, new_stats in new["results"].items():
+        base_stats = base["results"].get(case_id)
+        if base_stats is None:
+            continue
+        ratio = new_stats["median_s"] / base_stats["median_s"]
+        min_ratio = new_stats["min_s"] / base_stats["min_s"]
+        if ratio > 1 + threshold and min_ratio > 1 + threshold:
+            status = "regresión"
+        elif ratio < 1 / (1 + threshold) and min_ratio < 1 / (1 + threshold):
+            status = "mejora"
+        else:
+            status = "igual"
+        comparisons.append(Comparison(case_id, base_stats["median_s"], new_stats["median_s"],
+                                      ratio, min_ratio, status))
+    return comparisons
+
+
+def _format_duration(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _describe(document: Dict[str, Any]) -> str:
+    environment = document["environment"]
+    commit = (environment.get("commit") or "?")[:12]
+    return f"{commit}{' (sin commitear)' if environment.get('dirty') else ''}, Python {environment['python']}"
+
+
+def _compare_command(args: argparse.Namespace) -> int:
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+    print(f"base:  {_describe(base)}")
+    print(f"nuevo: {_describe(new)}")
+    for key in ("python", "machine", "cpu_count", "packages"):
+        if base["environment"].get(key) != new["environment"].get(key):
+            print(f"aviso: distinto {key} entre ejecuciones; los tiempos pueden no ser comparables")
+
+    comparisons = compare_results(base, new, args.threshold)
+    print(f"\n{'caso':45} {'base':>10} {'nuevo':>10} {'cambio':>8}")
+    for comparison in comparisons:
+        marker = {"regresión": "  ← regresión", "mejora": "  mejora"}.get(comparison.status, "")
+        print(f"{comparison.case_id:45} {_format_duration(comparison.base_s):>10} "
+              f"{_format_duration(comparison.new_s):>10} {comparison.ratio - 1:+7.1%}{marker}")
+    for case_id in sorted(set(base["results"]) ^ set(new["results"])):
+        print(f"{case_id:45} solo en {'base' if case_id in base['results'] else 'nuevo'}")
+
+    regressions = [comparison for comparison in comparisons if comparison.status == "regresión"]
+    if regressions:
+        print(f"\nRegresiones por encima de {args.threshold:.0%}: {len(regressions)}")
+        return 1
+    return 0
+
+
+def _run_command(args: argparse.Namespace) -> int:
+    cases = select_cases(args.filter, args.quick)
+    if not cases:
+        print("Ningún caso coincide con el filtro", file=sys.stderr)
+        return 2
+    document = run(cases, args.rounds, args.min_round_ms / 1000, args.max_case_s)
+    output = Path(args.output) if args.output else default_output_path(document["environment"])
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"\nResultados en {output}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="ejecutar los casos y guardar los resultados")
+    run_parser.add_argument("--filter", help="expresión regular sobre el ID del caso")
+    run_parser.add_argument("--quick", action="store_true", help="omitir los casos lentos (1M feedbacks)")
+    run_parser.add_argument("--rounds", type=int, default=7)
+    run_parser.add_argument("--min-round-ms", type=float, default=100.0)
+    run_parser.add_argument("--max-case-s", type=float, default=20.0,
+                            help="tiempo máximo por caso antes de cortar las rondas (mínimo 3)")
+    run_parser.add_argument("--output", help="archivo JSON (por defecto benchmarks/results/<commit>.json)")
+
+    subparsers.add_parser("list", help="listar los casos")
+
+    compare_parser = subparsers.add_parser("compare", help="comparar dos archivos de resultados")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="cambio relativo que se reporta (0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for case in CASES:
+            print(f"{case.id}{'  (lento)' if case.slow else ''}")
+        return 0
+    if args.command == "compare":
+        return _compare_command(args)
+    return _run_command(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
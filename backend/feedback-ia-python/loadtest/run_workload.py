@@ -0,0 +1,312 @@
+"""
+Prueba de carga HTTP con una mezcla de operaciones a RPS objetivo.
+
+Reproduce contra una instancia en marcha (p. ej. uvicorn con N workers y
+PostgreSQL cargado con seed_data) una mezcla de lecturas de catálogos,
+listados de feedbacks, creaciones y generate-ai, y reporta por ruta los
+percentiles de latencia, el throughput y la tasa de errores.
+
+La carga es de lazo abierto: las llegadas siguen un proceso de Poisson con
+la tasa pedida, sin esperar a que terminen las peticiones anteriores, y la
+latencia se mide desde el instante programado. Así un servidor saturado se
+ve como latencia creciente (no como menos peticiones), y el tiempo que la
+petición espera una conexión del cliente también cuenta. Si se alcanza
+--max-in-flight, las llegadas se descartan y se reportan como "omitidas":
+el cliente, no el servidor, es el límite y hay que repartir la carga.
+
+Con varias tasas (--rps 50 100 200) se ejecuta una etapa por tasa, para
+encontrar dónde se rompe el objetivo de latencia con cada configuración.
+
+Uso:
+    python -m loadtest.run_workload --base-url http://localhost:8000 \
+        --manifest loadtest_manifest.json --rps 50 100 200 --duration-s 120 \
+        --mix catalog=40,list=40,create=15,generate_ai=5 --output reporte.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .seed_data import feedback_parametro_index
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+DEFAULT_MIX = "catalog=40,list=40,create=15,generate_ai=5"
+
+# Una operación hace una petición y retorna (ruta, respuesta)
+Operation = Callable[[httpx.AsyncClient, random.Random], Awaitable[Tuple[str, httpx.Response]]]
+
+
+@dataclass
+class RouteStats:
+    """Latencias y resultados de una ruta durante una etapa."""
+
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+    def record(self, latency_ms: float, outcome: str, is_error: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.statuses[outcome] += 1
+        if is_error:
+            self.errors += 1
+
+    def summary(self, duration_s: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "rps": count / duration_s if duration_s else 0.0,
+            "error_rate": self.errors / count if count else 0.0,
+            "statuses": dict(self.statuses),
+            "latency_ms": {
+                **{f"p{percentile:g}": percentile_of(latencies, percentile) for percentile in PERCENTILES},
+                "max": latencies[-1] if latencies else None,
+            },
+        }
+
+
+def percentile_of(sorted_values: List[float], percentile: float) -> Optional[float]:
+    """Percentil por rango más cercano de una lista ordenada."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percentile // 100))
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+class Workload:
+    """
+    Operaciones de la mezcla, construidas con los rangos de IDs del manifiesto.
+
+    Las creaciones usan pares (grabación, parámetro) que el seeder dejó libres,
+    para no chocar con la restricción única de feedbacks.
+    """
+
+    def __init__(self, manifest: Dict[str, Any]):
+        self._parametros = manifest["parametros"]
+        self._grabaciones = manifest["grabaciones"]
+        self._seeded_slots = manifest["feedbacks_por_grabacion"]
+        self._parametro_count = self._parametros[1] - self._parametros[0] + 1
+        self.operations: Dict[str, Operation] = {
+            "catalog": self.catalog,
+            "list": self.list_feedbacks,
+            "create": self.create_feedback,
+            "generate_ai": self.generate_ai,
+        }
+
+    def _grabacion(self, rng: random.Random) -> Tuple[int, int]:
+        """Grabación al azar: (índice en el manifiesto, ID)."""
+        index = rng.randrange(self._grabaciones[1] - self._grabaciones[0] + 1)
+        return index, self._grabaciones[0] + index
+
+    def _parametro_id(self, grabacion_index: int, slot: int) -> int:
+        return self._parametros[0] + feedback_parametro_index(grabacion_index, slot, self._parametro_count)
+
+    async def catalog(self, client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, httpx.Response]:
+        choice = rng.random()
+        if choice < 0.25:
+            return "GET /tipos-metrica/", await client.get("/api/v1/tipos-metrica/")
+        if choice < 0.5:
+            return "GET /metricas/", await client.get("/api/v1/metricas/")
+        if choice < 0.75:
+            return "GET /parametros/", await client.get("/api/v1/parametros/")
+        parametro_id = rng.randint(*self._parametros)
+        return "GET /parametros/{id}", await client.get(f"/api/v1/parametros/{parametro_id}")
+
+    async def list_feedbacks(self, client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, httpx.Response]:
+        if rng.random() < 0.75:
+            _, grabacion_id = self._grabacion(rng)
+            return "GET /feedbacks/grabacion/{id}", await client.get(f"/api/v1/feedbacks/grabacion/{grabacion_id}")
+        skip = rng.randrange(100) * 100
+        return "GET /feedbacks/", await client.get("/api/v1/feedbacks/", params={"skip": skip, "limit": 100})
+
+    async def create_feedback(self, client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, httpx.Response]:
+        index, grabacion_id = self._grabacion(rng)
+        slot = rng.randrange(self._seeded_slots, self._parametro_count)
+        return "POST /feedbacks/", await client.post("/api/v1/feedbacks/", json={
+            "grabacion_id": grabacion_id,
+            "parametro_id": self._parametro_id(index, slot),
+            "valor": round(rng.uniform(0, 100), 1),
+            "comentario": "Creado por la prueba de carga",
+        })
+
+    async def generate_ai(self, client: httpx.AsyncClient, rng: random.Random) -> Tuple[str, httpx.Response]:
+        index, grabacion_id = self._grabacion(rng)
+        parametros_ids = [self._parametro_id(index, slot) for slot in range(min(self._seeded_slots, 5))]
+        return "POST /feedbacks/generate-ai", await client.post("/api/v1/feedbacks/generate-ai", json={
+            "grabacion_id": grabacion_id,
+            "parametros_ids": parametros_ids,
+            "audio_analysis_data": {"duration": round(rng.uniform(60, 3600), 1), "muestra": rng.random()},
+        })
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """'catalog=40,list=40' -> {'catalog': 0.5, 'list': 0.5}"""
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight)
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("La mezcla debe tener algún peso positivo")
+    return {name: weight / total for name, weight in weights.items() if weight > 0}
+
+
+async def run_stage(client: httpx.AsyncClient, operations: Dict[str, Operation], mix: Dict[str, float],
+                    rps: float, duration_s: float, warmup_s: float = 0.0, max_in_flight: int = 1000,
+                    seed: int = 42) -> Dict[str, Any]:
+    """
+    Ejecuta una etapa de carga de lazo abierto y retorna su reporte.
+
+    Args:
+        client: Cliente HTTP hacia la aplicación
+        operations: Operaciones por nombre
+        mix: Proporción de cada operación (suma 1)
+        rps: Llegadas por segundo
+        duration_s: Duración medida de la etapa
+        warmup_s: Tiempo previo cuyas peticiones no se cuentan
+        max_in_flight: Peticiones simultáneas máximas del cliente
+        seed: Semilla de las llegadas y de los datos de las peticiones
+    """
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    routes: Dict[str, RouteStats] = {}
+    in_flight: set = set()
+    omitted = 0
+    max_lag_ms = 0.0
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    measure_from = start + warmup_s
+    end = measure_from + duration_s
+
+    async def execute(name: str, scheduled: float, op_rng: random.Random) -> None:
+        try:
+            route, response = await operations[name](client, op_rng)
+            outcome, is_error = str(response.status_code), response.status_code >= 400
+        except httpx.HTTPError as e:
+            # Sin respuesta (conexión rechazada, timeout...): se cuenta por operación
+            route, outcome, is_error = f"[{name}]", type(e).__name__, True
+        latency_ms = (loop.time() - scheduled) * 1000
+        if scheduled >= measure_from:
+            routes.setdefault(route, RouteStats()).record(latency_ms, outcome, is_error)
+
+    scheduled = start
+    while True:
+        scheduled += rng.expovariate(rps)
+        if scheduled >= end:
+            break
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif scheduled >= measure_from:
+            max_lag_ms = max(max_lag_ms, -delay * 1000)
+
+        name = rng.choices(names, weights)[0]
+        if len(in_flight) >= max_in_flight:
+            if scheduled >= measure_from:
+                omitted += 1
+            continue
+        task = asyncio.create_task(execute(name, scheduled, random.Random(rng.random())))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        await asyncio.wait(set(in_flight))
+
+    total = RouteStats()
+    for stats in routes.values():
+        total.latencies_ms.extend(stats.latencies_ms)
+        total.statuses.update(stats.statuses)
+        total.errors += stats.errors
+    return {
+        "target_rps": rps,
+        "duration_s": duration_s,
+        "omitted": omitted,
+        "max_schedule_lag_ms": max_lag_ms,
+        "total": total.summary(duration_s),
+        "routes": {route: stats.summary(duration_s) for route, stats in sorted(routes.items())},
+    }
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_stage(report: Dict[str, Any]) -> None:
+    """Tabla de una etapa por ruta."""
+    total = report["total"]
+    print(f"\n== {report['target_rps']:g} RPS objetivo: {total['rps']:.1f} RPS medidos, "
+          f"{total['error_rate']:.2%} errores, {report['omitted']} omitidas "
+          f"(retraso máximo del cliente {report['max_schedule_lag_ms']:.0f} ms)")
+    print(f"{'ruta':32} {'peticiones':>10} {'errores':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'p99.9':>8} {'máx':>8}")
+    for route, stats in [*report["routes"].items(), ("TOTAL", total)]:
+        latency = stats["latency_ms"]
+        print(f"{route:32} {stats['requests']:10d} {stats['error_rate']:8.2%} {_fmt(latency['p50']):>8} "
+              f"{_fmt(latency['p95']):>8} {_fmt(latency['p99']):>8} {_fmt(latency['p99.9']):>8} "
+              f"{_fmt(latency['max']):>8}")
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    with open(args.manifest, encoding="utf-8") as f:
+        workload = Workload(json.load(f))
+    mix = parse_mix(args.mix)
+    unknown = set(mix) - set(workload.operations)
+    if unknown:
+        raise ValueError(f"Operaciones desconocidas en la mezcla: {', '.join(sorted(unknown))}")
+
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers={"Authorization": f"Bearer {args.api_key}"},
+        timeout=args.timeout_s, limits=limits
+    ) as client:
+        reports = []
+        for stage, rps in enumerate(args.rps):
+            report = await run_stage(client, workload.operations, mix, rps, args.duration_s, args.warmup_s,
+                                     args.max_in_flight, seed=args.seed + stage)
+            print_stage(report)
+            reports.append(report)
+        return reports
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--api-key", default=os.environ.get("API_KEY"), help="por defecto, la variable API_KEY")
+    parser.add_argument("--manifest", default="loadtest_manifest.json", help="manifiesto escrito por seed_data")
+    parser.add_argument("--rps", type=float, nargs="+", default=[50.0], help="una etapa por tasa")
+    parser.add_argument("--duration-s", type=float, default=60.0, help="duración medida de cada etapa")
+    parser.add_argument("--warmup-s", type=float, default=10.0, help="tiempo no medido al inicio de cada etapa")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"pesos por operación (por defecto {DEFAULT_MIX})")
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--timeout-s", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="archivo JSON con el reporte de todas las etapas")
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error("falta --api-key (o la variable API_KEY)")
+
+    reports = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "base_url": args.base_url,
+                "mix": parse_mix(args.mix),
+                "max_in_flight": args.max_in_flight,
+                "stages": reports,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\nReporte en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""
+Generador de datos sintéticos para pruebas de carga.
+
+Llena el esquema (ya migrado con `alembic upgrade head`) con volúmenes de
+producción: catálogos de miles de tipos de métrica, métricas y parámetros,
+un millón de grabaciones y decenas de millones de feedbacks. Los datos son
+deterministas para una misma --seed.
+
+Las filas se insertan por lotes con IDs explícitos a continuación de los
+existentes: en PostgreSQL con COPY (y luego se ajustan las secuencias), en
+otras bases con INSERT de varias filas. Al terminar se ejecuta ANALYZE para
+que el planificador vea los volúmenes reales.
+
+Escribe un manifiesto JSON con los rangos de IDs generados, que usa
+run_workload para construir peticiones válidas.
+
+Uso:
+    alembic upgrade head
+    python -m loadtest.seed_data --grabaciones 1000000 --feedbacks-por-grabacion 20 \
+        --manifest loadtest_manifest.json
+"""
+import argparse
+import csv
+import io
+import json
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from src.models.models import Feedback, Grabacion, Metrica, Parametro, TipoMetrica
+
+logger = logging.getLogger(__name__)
+
+# Primo para repartir los parámetros de cada grabación sin repetir pares
+_PARAMETRO_STRIDE = 7919
+
+# Intervalo mínimo entre mensajes de avance
+_LOG_INTERVAL_S = 5.0
+
+_FORMATOS = (".wav", ".mp3", ".m4a", ".flac", ".ogg")
+_COMENTARIOS = (
+    "Buen ritmo y buena articulación.",
+    "Procura hacer pausas entre ideas.",
+    "La entonación mantiene la atención, aunque el volumen baja al final.",
+    "Reduce las muletillas en las transiciones.",
+    "Introducción clara; la conclusión puede ser más breve.",
+)
+
+
+@dataclass(frozen=True)
+class SeedVolumes:
+    """Cantidades a generar."""
+
+    tipos: int = 1000
+    metricas_por_tipo: int = 3
+    parametros_por_metrica: int = 3
+    grabaciones: int = 1_000_000
+    feedbacks_por_grabacion: int = 20
+
+    @property
+    def metricas(self) -> int:
+        return self.tipos * self.metricas_por_tipo
+
+    @property
+    def parametros(self) -> int:
+        return self.metricas * self.parametros_por_metrica
+
+    @property
+    def feedbacks(self) -> int:
+        return self.grabaciones * self.feedbacks_por_grabacion
+
+
+def feedback_parametro_index(grabacion_index: int, slot: int, parametros: int) -> int:
+    """
+    Índice (0..parametros-1) del parámetro del feedback `slot` de una grabación.
+
+    Los slots 0..feedbacks_por_grabacion-1 los genera el seeder; los
+    siguientes quedan libres para los feedbacks que crea la prueba de carga
+    sin chocar con la restricción única (grabacion_id, parametro_id).
+    """
+    return (grabacion_index * _PARAMETRO_STRIDE + slot) % parametros
+
+
+class _BatchWriter:
+    """Inserta filas por lotes en una tabla, con COPY si la base es PostgreSQL (psycopg2)."""
+
+    def __init__(self, engine: Engine, batch_size: int):
+        self._engine = engine
+        self._batch_size = batch_size
+        self._copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2"
+
+    def write(self, table: Table, columns: Tuple[str, ...], rows: Iterable[tuple], total: int) -> None:
+        start = last_log = time.perf_counter()
+        written = 0
+        for batch in _batches(rows, self._batch_size):
+            with self._engine.begin() as conn:
+                if self._copy:
+                    self._copy_batch(conn, table, columns, batch)
+                else:
+                    conn.execute(table.insert(), [dict(zip(columns, row)) for row in batch])
+            written += len(batch)
+            now = time.perf_counter()
+            if written == total or now - last_log >= _LOG_INTERVAL_S:
+                logger.info("%s: %d/%d filas (%.0f filas/s)", table.name, written, total, written / (now - start))
+                last_log = now
+
+    @staticmethod
+    def _copy_batch(conn: Connection, table: Table, columns: Tuple[str, ...], batch: List[tuple]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)  # None se escribe vacío: NULL en COPY csv
+        buffer.seek(0)
+        with conn.connection.dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _batches(rows: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _next_id(conn: Connection, table: Table) -> int:
+    return (conn.scalar(select(func.max(table.c.id))) or 0) + 1
+
+
+def seed(engine: Engine, volumes: SeedVolumes, seed_value: int = 42, batch_size: int = 10000,
+         now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Genera los datos y retorna el manifiesto con los rangos de IDs.
+
+    Args:
+        engine: Engine de la base ya migrada
+        volumes: Cantidades a generar
+        seed_value: Semilla de los datos aleatorios
+        batch_size: Filas por lote (y por transacción)
+        now: Fecha de la grabación más reciente (por defecto, ahora)
+
+    Raises:
+        RuntimeError: Si el esquema no está creado
+    """
+    if volumes.feedbacks_por_grabacion > volumes.parametros:
+        raise ValueError("feedbacks_por_grabacion no puede superar el número de parámetros")
+    if not inspect(engine).has_table(Feedback.__tablename__):
+        raise RuntimeError("El esquema no existe: ejecutar antes `alembic upgrade head`")
+
+    rng = random.Random(seed_value)
+    now = now or datetime.utcnow()
+    tipos_t, metricas_t, parametros_t = TipoMetrica.__table__, Metrica.__table__, Parametro.__table__
+    grabaciones_t, feedbacks_t = Grabacion.__table__, Feedback.__table__
+    with engine.connect() as conn:
+        first = {table.name: _next_id(conn, table)
+                 for table in (tipos_t, metricas_t, parametros_t, grabaciones_t, feedbacks_t)}
+    writer = _BatchWriter(engine, batch_size)
+
+    first_tipo, first_metrica, first_parametro = first["tipos_metrica"], first["metricas"], first["parametros"]
+    writer.write(tipos_t, ("id", "nombre", "descripcion", "created_at", "updated_at"), (
+        (first_tipo + i, f"Carga tipo {first_tipo + i}", "Tipo de métrica sintético", now, now)
+        for i in range(volumes.tipos)
+    ), volumes.tipos)
+    writer.write(metricas_t, ("id", "nombre", "descripcion", "tipo_metrica_id", "created_at", "updated_at"), (
+        (first_metrica + i, f"Carga métrica {first_metrica + i}", None,
+         first_tipo + i // volumes.metricas_por_tipo, now, now)
+        for i in range(volumes.metricas)
+    ), volumes.metricas)
+    writer.write(parametros_t, ("id", "metrica_id", "nombre", "valor", "unidad", "created_at", "updated_at"), (
+        (first_parametro + i, first_metrica + i // volumes.parametros_por_metrica,
+         f"Carga parámetro {first_parametro + i}", round(rng.uniform(0, 10), 2), "puntos", now, now)
+        for i in range(volumes.parametros)
+    ), volumes.parametros)
+
+    # Grabaciones repartidas en el último año, en orden de creación
+    first_grabacion = first["grabaciones"]
+    span_s = 365 * 24 * 3600
+
+    def created_at(index: int) -> datetime:
+        return now - timedelta(seconds=span_s * (1 - index / max(volumes.grabaciones, 1)))
+
+    writer.write(grabaciones_t, (
+        "id", "nombre_archivo", "ruta_archivo", "duracion", "formato", "fecha_grabacion", "created_at", "updated_at"
+    ), (
+        (first_grabacion + i, f"carga_{first_grabacion + i}.wav", f"/audio/carga/{first_grabacion + i}.wav",
+         round(rng.uniform(60, 3600), 1), rng.choice(_FORMATOS), created_at(i), created_at(i), created_at(i))
+        for i in range(volumes.grabaciones)
+    ), volumes.grabaciones)
+
+    first_feedback = first["feedbacks"]
+
+    def feedback_rows() -> Iterator[tuple]:
+        feedback_id = first_feedback
+        for i in range(volumes.grabaciones):
+            created = created_at(i)
+            for slot in range(volumes.feedbacks_por_grabacion):
+                parametro_id = first_parametro + feedback_parametro_index(i, slot, volumes.parametros)
+                valor = round(min(100.0, max(0.0, rng.gauss(70, 15))), 1)
+                es_manual = rng.random() < 0.1
+                comentario = rng.choice(_COMENTARIOS) if rng.random() < 0.5 else None
+                yield (feedback_id, first_grabacion + i, parametro_id, valor, comentario, es_manual,
+                       created, created)
+                feedback_id += 1
+
+    writer.write(feedbacks_t, (
+        "id", "grabacion_id", "parametro_id", "valor", "comentario", "es_manual", "created_at", "updated_at"
+    ), feedback_rows(), volumes.feedbacks)
+
+    _finish(engine, (tipos_t, metricas_t, parametros_t, grabaciones_t, feedbacks_t))
+
+    return {
+        "created_at": now.isoformat(timespec="seconds"),
+        "dialect": engine.dialect.name,
+        "seed": seed_value,
+        "volumes": asdict(volumes),
+        "tipos_metrica": [first_tipo, first_tipo + volumes.tipos - 1],
+        "metricas": [first_metrica, first_metrica + volumes.metricas - 1],
+        "parametros": [first_parametro, first_parametro + volumes.parametros - 1],
+        "grabaciones": [first_grabacion, first_grabacion + volumes.grabaciones - 1],
+        "feedbacks_por_grabacion": volumes.feedbacks_por_grabacion,
+    }
+
+
+def _finish(engine: Engine, tables: Tuple[Table, ...]) -> None:
+    """Ajusta secuencias, invalida las cachés de catálogos y actualiza estadísticas."""
+    # Import diferido: la caché lee la configuración al importarse
+    from src.infrastructure.cache.catalog import METRICAS, PARAMETROS, TIPOS_METRICA, mark_catalog_changed
+
+    with Session(engine) as db:
+        if engine.dialect.name == "postgresql":
+            for table in tables:
+                db.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+                ))
+        # Los workers en marcha recargan los catálogos en su próxima sincronización
+        mark_catalog_changed(db, TIPOS_METRICA, METRICAS, PARAMETROS)
+        db.commit()
+
+    with engine.connect() as conn:
+        for table in tables:
+            conn.execute(text(f"ANALYZE {table.name}"))
+        conn.commit()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    defaults = SeedVolumes()
+    parser.add_argument("--tipos", type=int, default=defaults.tipos)
+    parser.add_argument("--metricas-por-tipo", type=int, default=defaults.metricas_por_tipo)
+    parser.add_argument("--parametros-por-metrica", type=int, default=defaults.parametros_por_metrica)
+    parser.add_argument("--grabaciones", type=int, default=defaults.grabaciones)
+    parser.add_argument("--feedbacks-por-grabacion", type=int, default=defaults.feedbacks_por_grabacion)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--manifest", default="loadtest_manifest.json", help="archivo JSON con los rangos de IDs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from src.database.connection import engine
+
+    volumes = SeedVolumes(
+        tipos=args.tipos,
+        metricas_por_tipo=args.metricas_por_tipo,
+        parametros_por_metrica=args.parametros_por_metrica,
+        grabaciones=args.grabaciones,
+        feedbacks_por_grabacion=args.feedbacks_por_grabacion,
+    )
+    logger.info(
+        "Generando %d tipos, %d métricas, %d parámetros, %d grabaciones y %d feedbacks",
+        volumes.tipos, volumes.metricas, volumes.parametros, volumes.grabaciones, volumes.feedbacks
+    )
+    manifest = seed(engine, volumes, seed_value=args.seed, batch_size=args.batch_size)
+    with open(args.manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    logger.info("Manifiesto escrito en %s", args.manifest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Esquema inicial (tablas existentes creadas antes con create_all)
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-06-20
+
+Las tablas se crean con if_not_exists, de modo que las bases de datos que
+ya fueron creadas por la aplicación pueden ejecutar `alembic upgrade head`
+directamente.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tipos_metrica",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("nombre", sa.String(100), nullable=False, unique=True),
+        sa.Column("descripcion", sa.Text(), nullable=True),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    op.create_index("ix_tipos_metrica_id", "tipos_metrica", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "metricas",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("nombre", sa.String(100), nullable=False),
+        sa.Column("descripcion", sa.Text(), nullable=True),
+        sa.Column("tipo_metrica_id", sa.Integer(), sa.ForeignKey("tipos_metrica.id"), nullable=True),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    op.create_index("ix_metricas_id", "metricas", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "parametros",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("metrica_id", sa.Integer(), sa.ForeignKey("metricas.id"), nullable=True),
+        sa.Column("nombre", sa.String(100), nullable=False),
+        sa.Column("valor", sa.Float(), nullable=False),
+        sa.Column("unidad", sa.String(50), nullable=True),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    op.create_index("ix_parametros_id", "parametros", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "grabaciones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("nombre_archivo", sa.String(255), nullable=False),
+        sa.Column("ruta_archivo", sa.String(500), nullable=False),
+        sa.Column("duracion", sa.Float(), nullable=True),
+        sa.Column("formato", sa.String(20), nullable=True),
+        sa.Column("fecha_grabacion", sa.DateTime(), nullable=True),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    op.create_index("ix_grabaciones_id", "grabaciones", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "feedbacks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("grabacion_id", sa.Integer(), sa.ForeignKey("grabaciones.id"), nullable=True),
+        sa.Column("parametro_id", sa.Integer(), sa.ForeignKey("parametros.id"), nullable=True),
+        sa.Column("valor", sa.Float(), nullable=False),
+        sa.Column("comentario", sa.Text(), nullable=True),
+        sa.Column("es_manual", sa.Boolean(), nullable=True),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    op.create_index("ix_feedbacks_id", "feedbacks", ["id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    for table in ("feedbacks", "grabaciones", "parametros", "metricas", "tipos_metrica"):
+        op.drop_table(table)
@@ -0,0 +1,77 @@
+"""Índices de rendimiento y feedback único por grabación y parámetro
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-06-20
+
+En PostgreSQL los índices se crean con CREATE INDEX CONCURRENTLY fuera de
+la transacción de la migración, para no bloquear escrituras. Si una creación
+concurrente se interrumpe, el índice queda INVALID: basta con eliminarlo y
+volver a ejecutar `alembic upgrade head`.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+# (nombre, tabla, columnas, único)
+INDEXES = [
+    ("uq_feedbacks_grabacion_parametro", "feedbacks", ["grabacion_id", "parametro_id"], True),
+    ("ix_feedbacks_parametro_id", "feedbacks", ["parametro_id"], False),
+    ("ix_feedbacks_grabacion_es_manual", "feedbacks", ["grabacion_id", "es_manual"], False),
+    ("ix_feedbacks_valor", "feedbacks", ["valor"], False),
+    ("ix_feedbacks_created_at_id", "feedbacks", ["created_at", "id"], False),
+    ("ix_grabaciones_created_at_id", "grabaciones", ["created_at", "id"], False),
+]
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _check_duplicate_feedbacks() -> None:
+    """Falla con un mensaje claro si hay duplicados que impiden el índice único."""
+    if context.is_offline_mode():
+        return
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT COUNT(*) FROM ("
+        " SELECT grabacion_id, parametro_id FROM feedbacks"
+        " GROUP BY grabacion_id, parametro_id HAVING COUNT(*) > 1"
+        ") AS duplicados"
+    )).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f"Hay {duplicates} combinaciones (grabacion_id, parametro_id) con feedbacks duplicados. "
+            "Elimine los duplicados antes de aplicar esta migración."
+        )
+
+
+def upgrade() -> None:
+    _check_duplicate_feedbacks()
+
+    if _is_postgres():
+        # CONCURRENTLY no puede ejecutarse dentro de una transacción
+        with op.get_context().autocommit_block():
+            for name, table, columns, unique in INDEXES:
+                op.create_index(
+                    name, table, columns, unique=unique,
+                    postgresql_concurrently=True, if_not_exists=True
+                )
+    else:
+        for name, table, columns, unique in INDEXES:
+            op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table, _, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
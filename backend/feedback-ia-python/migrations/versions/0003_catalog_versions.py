@@ -0,0 +1,40 @@
+"""Versiones de catálogos para invalidar la caché entre workers
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-06-20
+
+Cada escritura en tipos_metrica, metricas o parametros incrementa la
+versión de su catálogo en la misma transacción. Los workers comparan estas
+versiones con las que vieron para descartar su copia en memoria.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+CATALOGS = ["tipos_metrica", "metricas", "parametros"]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "catalog_versions",
+        sa.Column("catalog", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    # La tabla puede existir ya si la creó la aplicación (init_db)
+    for catalog in CATALOGS:
+        op.execute(
+            f"INSERT INTO catalog_versions (catalog, version) SELECT '{catalog}', 0 "
+            f"WHERE NOT EXISTS (SELECT 1 FROM catalog_versions WHERE catalog = '{catalog}')"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_versions", if_exists=True)
@@ -0,0 +1,48 @@
+"""Configuración de métricas por parámetro (rúbrica de puntuación)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-06-20
+
+Los parámetros sin filas en parametro_metricas siguen usando el grupo de
+métricas por defecto según el nombre de su métrica, por lo que la tabla
+puede empezar vacía.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parametro_metricas",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("parametro_id", sa.Integer(), sa.ForeignKey("parametros.id"), nullable=False),
+        sa.Column("clave", sa.String(50), nullable=False),
+        sa.Column("fuente", sa.String(100), nullable=False),
+        sa.Column("peso", sa.Float(), nullable=False),
+        sa.Column("normalizacion", sa.String(20), nullable=False),
+        sa.Column("objetivo", sa.Float(), nullable=True),
+        sa.UniqueConstraint("parametro_id", "clave", name="uq_parametro_metricas_parametro_clave"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_parametro_metricas_id", "parametro_metricas", ["id"], if_not_exists=True)
+    op.create_index(
+        "ix_parametro_metricas_parametro_id", "parametro_metricas", ["parametro_id"], if_not_exists=True
+    )
+    op.execute(
+        "INSERT INTO catalog_versions (catalog, version) SELECT 'parametro_metricas', 0 "
+        "WHERE NOT EXISTS (SELECT 1 FROM catalog_versions WHERE catalog = 'parametro_metricas')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM catalog_versions WHERE catalog = 'parametro_metricas'")
+    op.drop_index("ix_parametro_metricas_parametro_id", table_name="parametro_metricas", if_exists=True)
+    op.drop_index("ix_parametro_metricas_id", table_name="parametro_metricas", if_exists=True)
+    op.drop_table("parametro_metricas", if_exists=True)
@@ -0,0 +1,57 @@
+"""Resultados de análisis por grabación y trabajos de re-puntuación
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-06-20
+
+analisis_grabacion guarda el último análisis de IA de cada grabación, de
+modo que un cambio de rúbrica se aplica re-puntuando sin volver a analizar
+el audio. rescore_jobs guarda el avance de cada re-puntuación para poder
+reanudarla.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analisis_grabacion",
+        sa.Column("grabacion_id", sa.Integer(), sa.ForeignKey("grabaciones.id"), primary_key=True),
+        sa.Column("resultado", sa.JSON(), nullable=False),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "rescore_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("estado", sa.String(20), nullable=False),
+        sa.Column("parametros", sa.JSON(), nullable=True),
+        sa.Column("ultimo_grabacion_id", sa.Integer(), nullable=False),
+        sa.Column("grabaciones_procesadas", sa.Integer(), nullable=False),
+        sa.Column("feedbacks_actualizados", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        *_timestamps(),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_rescore_jobs_id", "rescore_jobs", ["id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rescore_jobs_id", table_name="rescore_jobs", if_exists=True)
+    op.drop_table("rescore_jobs", if_exists=True)
+    op.drop_table("analisis_grabacion", if_exists=True)
@@ -0,0 +1,79 @@
+"""Análisis por grabación y analizador, con versión, tiempos y vector de métricas
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-06-20
+
+analisis_grabacion pasa a guardar un análisis por (grabación, analizador)
+con la versión del analizador, el hash de la entrada y la duración del
+análisis, para reutilizarlo en lugar de repetirlo. El resultado se guarda
+como JSONB en PostgreSQL y los campos numéricos de los análisis de IA
+además como vector float64 (columna metricas).
+
+La clave primaria cambia, así que la tabla se reconstruye copiando las
+filas existentes (como análisis de IA sin versión).
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _resultado_type():
+    return postgresql.JSONB() if _is_postgres() else sa.JSON()
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analisis_grabacion_nueva",
+        sa.Column("grabacion_id", sa.Integer(), sa.ForeignKey("grabaciones.id"), nullable=False),
+        sa.Column("analizador", sa.String(20), nullable=False),
+        sa.Column("version", sa.String(100), nullable=False),
+        sa.Column("hash_entrada", sa.String(64), nullable=False),
+        sa.Column("resultado", _resultado_type(), nullable=False),
+        sa.Column("metricas", sa.LargeBinary(), nullable=True),
+        sa.Column("duracion_ms", sa.Float(), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("grabacion_id", "analizador", name="pk_analisis_grabacion"),
+    )
+    resultado = "CAST(resultado AS JSONB)" if _is_postgres() else "resultado"
+    op.execute(
+        "INSERT INTO analisis_grabacion_nueva "
+        "(grabacion_id, analizador, version, hash_entrada, resultado, created_at, updated_at) "
+        f"SELECT grabacion_id, 'ia', '', '', {resultado}, created_at, updated_at FROM analisis_grabacion"
+    )
+    op.drop_table("analisis_grabacion")
+    op.rename_table("analisis_grabacion_nueva", "analisis_grabacion")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "analisis_grabacion_anterior",
+        sa.Column("grabacion_id", sa.Integer(), sa.ForeignKey("grabaciones.id"), primary_key=True),
+        sa.Column("resultado", sa.JSON(), nullable=False),
+        *_timestamps(),
+    )
+    resultado = "CAST(resultado AS JSON)" if _is_postgres() else "resultado"
+    op.execute(
+        "INSERT INTO analisis_grabacion_anterior (grabacion_id, resultado, created_at, updated_at) "
+        f"SELECT grabacion_id, {resultado}, created_at, updated_at FROM analisis_grabacion "
+        "WHERE analizador = 'ia'"
+    )
+    op.drop_table("analisis_grabacion")
+    op.rename_table("analisis_grabacion_anterior", "analisis_grabacion")
@@ -0,0 +1,40 @@
+"""Trabajos de análisis en segundo plano (avance por etapas)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-06-20
+
+analysis_jobs guarda el último avance de cada análisis lanzado en segundo
+plano, para que un cliente conectado a otro worker pueda seguirlo.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_jobs",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("tipo", sa.String(50), nullable=False),
+        sa.Column("estado", sa.String(20), nullable=False),
+        sa.Column("etapa", sa.String(30), nullable=True),
+        sa.Column("progreso", sa.Float(), nullable=False),
+        sa.Column("detalle", sa.Text(), nullable=True),
+        sa.Column("secuencia", sa.Integer(), nullable=False),
+        sa.Column("resultado", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("analysis_jobs", if_exists=True)
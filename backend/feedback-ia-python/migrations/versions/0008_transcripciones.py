@@ -0,0 +1,41 @@
+"""Transcripciones por contenido de audio, idioma y modelo
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-06-20
+
+transcripciones guarda cada transcripción una sola vez por hash del
+archivo, idioma y modelo, para no volver a enviar la misma grabación al
+servicio de transcripción.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcripciones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("hash_audio", sa.String(64), nullable=False),
+        sa.Column("idioma", sa.String(10), nullable=False),
+        sa.Column("modelo", sa.String(50), nullable=False),
+        sa.Column("texto", sa.Text(), nullable=True),
+        sa.Column("ruta_comprimida", sa.String(500), nullable=True),
+        sa.Column("palabras", sa.Integer(), nullable=False),
+        sa.Column("duracion_segundos", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.UniqueConstraint("hash_audio", "idioma", "modelo", name="uq_transcripcion_audio_idioma_modelo"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_transcripciones_id", "transcripciones", ["id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcripciones_id", table_name="transcripciones", if_exists=True)
+    op.drop_table("transcripciones", if_exists=True)
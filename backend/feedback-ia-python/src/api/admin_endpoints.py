@@ -0,0 +1,94 @@
+# filepath: /src/api/admin_endpoints.py
+"""
+Endpoints de diagnóstico del worker en producción.
+
+GET /admin/profile perfila el worker que atiende la petición durante N
+segundos (muestreo de pilas, sin reiniciar ni instrumentar) y retorna las
+pilas colapsadas. Cada worker de uvicorn es un proceso: para perfilar
+todos, repetir la petición hasta cubrir los PID (header X-Profile-Pid).
+
+GET /admin/slow-queries lista las consultas lentas del worker por lugar del
+código, con su plan de ejecución.
+
+Ejemplo:
+    curl -H "Authorization: Bearer $API_KEY" \\
+        "http://localhost:8000/api/v1/admin/profile?seconds=15" > perfil.txt
+    flamegraph.pl perfil.txt > perfil.svg
+"""
+import asyncio
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.middleware.auth_middleware import verify_api_key
+from src.infrastructure.observability.profiler import ProfilerBusyError, sampling_profiler
+from src.infrastructure.observability.slow_queries import SlowQueryLog, get_slow_query_log
+from src.shared.utils.fast_json import FastJSONRoute
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+def _require_slow_query_log() -> SlowQueryLog:
+    slow_query_log = get_slow_query_log()
+    if slow_query_log is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="El registro de consultas lentas está desactivado (SLOW_QUERY_MS=0)"
+        )
+    return slow_query_log
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(default=10.0, gt=0),
+    interval_ms: float = Query(default=10.0, ge=1.0, le=1000.0),
+    include_idle: bool = False,
+    token: str = Depends(verify_api_key)
+):
+    """Perfilar el worker por muestreo y obtener pilas colapsadas (requiere autenticación)."""
+    max_seconds = get_settings().app.profiler_max_seconds
+    if seconds > max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"La duración máxima del perfilado es {max_seconds} segundos"
+        )
+    try:
+        sampling_profiler.start(interval_ms=interval_ms, include_idle=include_idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    # El muestreo corre en su hilo; el event loop sigue atendiendo peticiones
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        result = sampling_profiler.stop()
+
+    return PlainTextResponse(result.collapsed(), headers={
+        "X-Profile-Pid": str(os.getpid()),
+        "X-Profile-Samples": str(result.samples),
+        "X-Profile-Duration-S": f"{result.duration_s:.3f}",
+    })
+
+
+@router.get("/slow-queries")
+def get_slow_queries(
+    slow_query_log: SlowQueryLog = Depends(_require_slow_query_log),
+    token: str = Depends(verify_api_key)
+):
+    """Obtener las consultas lentas del worker por lugar del código (requiere autenticación)."""
+    return {
+        "pid": os.getpid(),
+        "threshold_ms": slow_query_log.threshold_ms,
+        "call_sites": slow_query_log.stats(),
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def reset_slow_queries(
+    slow_query_log: SlowQueryLog = Depends(_require_slow_query_log),
+    token: str = Depends(verify_api_key)
+):
+    """Reiniciar el registro de consultas lentas del worker (requiere autenticación)."""
+    slow_query_log.reset()
@@ -0,0 +1,160 @@
+# filepath: /src/api/analysis_job_endpoints.py
+"""
+Endpoints de análisis en segundo plano con avance por Server-Sent Events.
+
+POST /feedbacks/generate-ai responde de inmediato con el ID del trabajo; el
+cliente sigue el avance por etapas en /analysis-jobs/{job_id}/events (SSE)
+en lugar de bloquearse o sondear, y puede consultar el último estado en
+/analysis-jobs/{job_id}.
+"""
+import logging
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from src.application.dtos.feedback_dto import GenerateAIFeedbackDTO
+from src.application.interfaces.ai_service_interface import AIServiceInterface
+from src.application.use_cases.feedback.generate_ai_feedback import GenerateAIFeedbackUseCase
+from src.infrastructure.cache.catalog import CachedCatalogRepository
+from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.database.models.grabacion_model import GrabacionModel
+from src.infrastructure.database.repositories.sqlalchemy_analisis_grabacion_repository import (
+    SQLAlchemyAnalisisGrabacionRepository
+)
+from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import SQLAlchemyFeedbackRepository
+from src.infrastructure.jobs import AnalysisJobBroker, get_analysis_job_broker
+from src.infrastructure.middleware.auth_middleware import verify_api_key
+from src.interface.api.dependencies import get_ai_service
+from src.schemas import schemas
+from src.shared.utils.deadline import clear_deadline, reset_deadline
+from src.shared.utils.fast_json import FastJSONRoute, dumps
+from src.shared.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=FastJSONRoute)
+
+GENERATE_AI = "generate_ai"
+
+# Cabeceras para que proxies no almacenen ni agrupen los eventos
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _grabacion_file_path(grabacion_id: int) -> Optional[str]:
+    """Ruta del archivo de la grabación, o None si no existe."""
+    with SessionLocal() as db:
+        return db.scalar(select(GrabacionModel.ruta_archivo).where(GrabacionModel.id == grabacion_id))
+
+
+async def _run_generate_ai(
+    broker: AnalysisJobBroker,
+    job_id: str,
+    generate_dto: GenerateAIFeedbackDTO,
+    ai_service: AIServiceInterface
+) -> None:
+    """Ejecuta la generación de feedback con IA y publica su avance y resultado."""
+    # La tarea hereda el contexto de la petición, cuyo plazo ya venció o está
+    # por vencer: el trabajo no debe heredarlo
+    token = clear_deadline()
+    try:
+        await _generate_ai(broker, job_id, generate_dto, ai_service)
+    finally:
+        reset_deadline(token)
+
+
+async def _generate_ai(
+    broker: AnalysisJobBroker,
+    job_id: str,
+    generate_dto: GenerateAIFeedbackDTO,
+    ai_service: AIServiceInterface
+) -> None:
+    audio_data = generate_dto.audio_analysis_data
+    if not (audio_data.get("ruta_archivo") or audio_data.get("file_path")):
+        # Con la ruta, los análisis que necesitan texto reutilizan la
+        # transcripción guardada de la grabación (TranscriptStore)
+        ruta_archivo = await run_in_threadpool(_grabacion_file_path, generate_dto.grabacion_id)
+        if ruta_archivo:
+            generate_dto.audio_analysis_data = {**audio_data, "ruta_archivo": ruta_archivo}
+    # El analizador importa numpy: se carga con el primer trabajo, no al arrancar
+    from src.domain.services.feedback_analyzer import FeedbackAnalyzerService
+
+    # Sesión propia: la de la petición ya se cerró al enviar la respuesta
+    with SessionLocal() as db:
+        use_case = GenerateAIFeedbackUseCase(
+            SQLAlchemyFeedbackRepository(db),
+            ai_service,
+            FeedbackAnalyzerService(CachedCatalogRepository(db)),
+            SQLAlchemyAnalisisGrabacionRepository(db)
+        )
+        try:
+            with span("analysis_job.generate_ai", **{"job.id": job_id}):
+                feedbacks = await use_case.execute(generate_dto, broker.reporter(job_id))
+        except Exception as e:
+            logger.exception("Falló el trabajo de análisis %s", job_id)
+            await broker.fail(job_id, str(e))
+            return
+    await broker.complete(job_id, orjson.loads(dumps(feedbacks)))
+
+
+async def _event_stream(broker: AnalysisJobBroker, job_id: str, last_event_id: int) -> AsyncIterator[bytes]:
+    """Eventos del trabajo en formato text/event-stream."""
+    async for event in broker.events(job_id, last_event_id):
+        if event is None:
+            yield b": keep-alive\n\n"
+            continue
+        yield b"id: %d\nevent: %s\ndata: %s\n\n" % (event.secuencia, event.estado.encode(), dumps(event))
+
+
+@router.post("/feedbacks/generate-ai", response_model=schemas.AnalysisJobCreated, status_code=status.HTTP_202_ACCEPTED)
+async def generate_ai_feedback(
+    request: schemas.GenerateAIFeedbackRequest,
+    background_tasks: BackgroundTasks,
+    ai_service: AIServiceInterface = Depends(get_ai_service),
+    broker: AnalysisJobBroker = Depends(get_analysis_job_broker),
+    token: str = Depends(verify_api_key)
+):
+    """Lanza la generación de feedback con IA en segundo plano (requiere autenticación)."""
+    generate_dto = GenerateAIFeedbackDTO(**request.model_dump())
+    try:
+        generate_dto.validate()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    job_id = await run_in_threadpool(broker.create, GENERATE_AI)
+    background_tasks.add_task(_run_generate_ai, broker, job_id, generate_dto, ai_service)
+    return schemas.AnalysisJobCreated(job_id=job_id, events_url=f"/api/v1/analysis-jobs/{job_id}/events")
+
+
+@router.get("/analysis-jobs/{job_id}", response_model=schemas.AnalysisJobResponse)
+def get_analysis_job(
+    job_id: str,
+    broker: AnalysisJobBroker = Depends(get_analysis_job_broker),
+    token: str = Depends(verify_api_key)
+):
+    """Obtener el último estado de un análisis en segundo plano (requiere autenticación)."""
+    event = broker.get(job_id)
+    if event is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado")
+    return event
+
+
+@router.get("/analysis-jobs/{job_id}/events")
+def stream_analysis_job(
+    job_id: str,
+    last_event_id: Optional[str] = Header(default=None),
+    broker: AnalysisJobBroker = Depends(get_analysis_job_broker),
+    token: str = Depends(verify_api_key)
+) -> StreamingResponse:
+    """Seguir el avance de un análisis por Server-Sent Events hasta que termine (requiere autenticación)."""
+    if broker.get(job_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado")
+    resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+    return StreamingResponse(
+        _event_stream(broker, job_id, resume_from),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS
+    )
@@ -0,0 +1,14 @@
+# filepath: /src/api/dependencies.py
+"""
+Dependencias compartidas por los routers de la API.
+"""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_db
+from src.infrastructure.cache.catalog import get_catalog_cache
+
+
+def sync_catalog_versions(db: Session = Depends(get_db)) -> None:
+    """Descarta los catálogos cacheados que otro worker haya modificado."""
+    get_catalog_cache().sync(db)
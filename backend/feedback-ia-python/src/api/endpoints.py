@@ -1,62 +1,81 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from typing import List
+from src.api.dependencies import sync_catalog_versions
 from src.database.connection import get_db
+from src.infrastructure.cache import response_cache as catalog_cache
 from src.schemas import schemas
 from src.services.feedback_service import FeedbackService
+from src.domain.exceptions.validation_exceptions import DuplicateFeedbackError
+from src.shared.utils.fast_json import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Rutas para TipoMetrica
 @router.post("/tipos-metrica/", response_model=schemas.TipoMetricaResponse, status_code=status.HTTP_201_CREATED)
 def create_tipo_metrica(tipo_metrica: schemas.TipoMetricaCreate, db: Session = Depends(get_db)):
     return FeedbackService.create_tipo_metrica(db, tipo_metrica)
 
-@router.get("/tipos-metrica/", response_model=List[schemas.TipoMetricaResponse])
-def get_tipos_metrica(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    tipos_metrica = FeedbackService.get_tipos_metrica(db, skip=skip, limit=limit)
-    return tipos_metrica
-
-@router.get("/tipos-metrica/{tipo_metrica_id}", response_model=schemas.TipoMetricaResponse)
-def get_tipo_metrica(tipo_metrica_id: int, db: Session = Depends(get_db)):
-    tipo_metrica = FeedbackService.get_tipo_metrica_by_id(db, tipo_metrica_id)
-    if tipo_metrica is None:
-        raise HTTPException(status_code=404, detail="Tipo de métrica no encontrado")
-    return tipo_metrica
+@router.get("/tipos-metrica/", response_model=List[schemas.TipoMetricaResponse], dependencies=[Depends(sync_catalog_versions)])
+def get_tipos_metrica(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.TIPOS_METRICA, ("list", skip, limit),
+        lambda: FeedbackService.get_tipos_metrica(db, skip=skip, limit=limit),
+        schemas.TipoMetricaListAdapter
+    )
+
+@router.get("/tipos-metrica/{tipo_metrica_id}", response_model=schemas.TipoMetricaResponse, dependencies=[Depends(sync_catalog_versions)])
+def get_tipo_metrica(request: Request, tipo_metrica_id: int, db: Session = Depends(get_db)):
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.TIPOS_METRICA, ("id", tipo_metrica_id),
+        lambda: FeedbackService.get_tipo_metrica_by_id(db, tipo_metrica_id),
+        schemas.TipoMetricaAdapter,
+        not_found_detail="Tipo de métrica no encontrado"
+    )
 
 # Rutas para Metrica
 @router.post("/metricas/", response_model=schemas.MetricaResponse, status_code=status.HTTP_201_CREATED)
 def create_metrica(metrica: schemas.MetricaCreate, db: Session = Depends(get_db)):
     return FeedbackService.create_metrica(db, metrica)
 
-@router.get("/metricas/", response_model=List[schemas.MetricaResponse])
-def get_metricas(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    metricas = FeedbackService.get_metricas(db, skip=skip, limit=limit)
-    return metricas
-
-@router.get("/metricas/{metrica_id}", response_model=schemas.MetricaResponse)
-def get_metrica(metrica_id: int, db: Session = Depends(get_db)):
-    metrica = FeedbackService.get_metrica_by_id(db, metrica_id)
-    if metrica is None:
-        raise HTTPException(status_code=404, detail="Métrica no encontrada")
-    return metrica
+@router.get("/metricas/", response_model=List[schemas.MetricaResponse], dependencies=[Depends(sync_catalog_versions)])
+def get_metricas(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.METRICAS, ("list", skip, limit),
+        lambda: FeedbackService.get_metricas(db, skip=skip, limit=limit),
+        schemas.MetricaListAdapter
+    )
+
+@router.get("/metricas/{metrica_id}", response_model=schemas.MetricaResponse, dependencies=[Depends(sync_catalog_versions)])
+def get_metrica(request: Request, metrica_id: int, db: Session = Depends(get_db)):
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.METRICAS, ("id", metrica_id),
+        lambda: FeedbackService.get_metrica_by_id(db, metrica_id),
+        schemas.MetricaAdapter,
+        not_found_detail="Métrica no encontrada"
+    )
 
 # Rutas para Parametro
 @router.post("/parametros/", response_model=schemas.ParametroResponse, status_code=status.HTTP_201_CREATED)
 def create_parametro(parametro: schemas.ParametroCreate, db: Session = Depends(get_db)):
     return FeedbackService.create_parametro(db, parametro)
 
-@router.get("/parametros/", response_model=List[schemas.ParametroResponse])
-def get_parametros(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    parametros = FeedbackService.get_parametros(db, skip=skip, limit=limit)
-    return parametros
-
-@router.get("/parametros/{parametro_id}", response_model=schemas.ParametroResponse)
-def get_parametro(parametro_id: int, db: Session = Depends(get_db)):
-    parametro = FeedbackService.get_parametro_by_id(db, parametro_id)
-    if parametro is None:
-        raise HTTPException(status_code=404, detail="Parámetro no encontrado")
-    return parametro
+@router.get("/parametros/", response_model=List[schemas.ParametroResponse], dependencies=[Depends(sync_catalog_versions)])
+def get_parametros(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.PARAMETROS, ("list", skip, limit),
+        lambda: FeedbackService.get_parametros(db, skip=skip, limit=limit),
+        schemas.ParametroListAdapter
+    )
+
+@router.get("/parametros/{parametro_id}", response_model=schemas.ParametroResponse, dependencies=[Depends(sync_catalog_versions)])
+def get_parametro(request: Request, parametro_id: int, db: Session = Depends(get_db)):
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.PARAMETROS, ("id", parametro_id),
+        lambda: FeedbackService.get_parametro_by_id(db, parametro_id),
+        schemas.ParametroAdapter,
+        not_found_detail="Parámetro no encontrado"
+    )
 
 # Rutas para Grabacion
 @router.post("/grabaciones/", response_model=schemas.GrabacionResponse, status_code=status.HTTP_201_CREATED)
@@ -78,7 +97,10 @@ def get_grabacion(grabacion_id: int, db: Session = Depends(get_db)):
 # Rutas para Feedback
 @router.post("/feedbacks/", response_model=schemas.FeedbackResponse, status_code=status.HTTP_201_CREATED)
 def create_feedback(feedback: schemas.FeedbackCreate, db: Session = Depends(get_db)):
-    return FeedbackService.create_feedback(db, feedback)
+    try:
+        return FeedbackService.create_feedback(db, feedback)
+    except DuplicateFeedbackError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
 
 @router.get("/feedbacks/", response_model=List[schemas.FeedbackResponse])
 def get_feedbacks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
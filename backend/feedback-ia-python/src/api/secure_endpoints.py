@@ -2,15 +2,39 @@
 """
 Endpoints seguros con autenticación para el módulo de feedback.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List
+from src.api.dependencies import sync_catalog_versions
+from src.application.use_cases.grabacion.analyze_grabacion import AnalyzeGrabacionUseCase
 from src.database.connection import get_db
+from src.infrastructure.cache import response_cache as catalog_cache
+from src.infrastructure.config.settings import get_settings
 from src.schemas import schemas
 from src.services.feedback_service import FeedbackService
+from src.domain.exceptions.validation_exceptions import (
+    DomainValidationError,
+    DuplicateFeedbackError,
+    GrabacionNotFoundError,
+    ParametroNotFoundError
+)
 from src.infrastructure.middleware.auth_middleware import verify_api_key
+from src.interface.api.dependencies import get_analyze_grabacion_use_case
+from src.shared.utils.fast_json import FastJSONRoute
+from src.shared.utils.token_usage import process_token_usage
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+def _check_batch_size(items: list) -> None:
+    """Rechaza los lotes vacíos o con más elementos que BATCH_MAX_ITEMS."""
+    max_items = get_settings().app.batch_max_items
+    if not items or len(items) > max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"El lote debe tener entre 1 y {max_items} elementos"
+        )
 
-router = APIRouter()
 
 # Rutas para TipoMetrica (con autenticación)
 @router.post("/tipos-metrica/", response_model=schemas.TipoMetricaResponse, status_code=status.HTTP_201_CREATED)
@@ -23,29 +47,36 @@ def create_tipo_metrica(
     return FeedbackService.create_tipo_metrica(db, tipo_metrica)
 
 
-@router.get("/tipos-metrica/", response_model=List[schemas.TipoMetricaResponse])
+@router.get("/tipos-metrica/", response_model=List[schemas.TipoMetricaResponse], dependencies=[Depends(sync_catalog_versions)])
 def get_tipos_metrica(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     db: Session = Depends(get_db),
     token: str = Depends(verify_api_key)
 ):
     """Obtener tipos de métrica con paginación (requiere autenticación)."""
-    tipos_metrica = FeedbackService.get_tipos_metrica(db, skip=skip, limit=limit)
-    return tipos_metrica
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.TIPOS_METRICA, ("list", skip, limit),
+        lambda: FeedbackService.get_tipos_metrica(db, skip=skip, limit=limit),
+        schemas.TipoMetricaListAdapter
+    )
 
 
-@router.get("/tipos-metrica/{tipo_metrica_id}", response_model=schemas.TipoMetricaResponse)
+@router.get("/tipos-metrica/{tipo_metrica_id}", response_model=schemas.TipoMetricaResponse, dependencies=[Depends(sync_catalog_versions)])
 def get_tipo_metrica(
+    request: Request,
     tipo_metrica_id: int, 
     db: Session = Depends(get_db),
     token: str = Depends(verify_api_key)
 ):
     """Obtener tipo de métrica por ID (requiere autenticación)."""
-    tipo_metrica = FeedbackService.get_tipo_metrica_by_id(db, tipo_metrica_id)
-    if tipo_metrica is None:
-        raise HTTPException(status_code=404, detail="Tipo de métrica no encontrado")
-    return tipo_metrica
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.TIPOS_METRICA, ("id", tipo_metrica_id),
+        lambda: FeedbackService.get_tipo_metrica_by_id(db, tipo_metrica_id),
+        schemas.TipoMetricaAdapter,
+        not_found_detail="Tipo de métrica no encontrado"
+    )
 
 
 # Rutas para Metrica (con autenticación)
@@ -59,29 +90,36 @@ def create_metrica(
     return FeedbackService.create_metrica(db, metrica)
 
 
-@router.get("/metricas/", response_model=List[schemas.MetricaResponse])
+@router.get("/metricas/", response_model=List[schemas.MetricaResponse], dependencies=[Depends(sync_catalog_versions)])
 def get_metricas(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     db: Session = Depends(get_db),
     token: str = Depends(verify_api_key)
 ):
     """Obtener métricas con paginación (requiere autenticación)."""
-    metricas = FeedbackService.get_metricas(db, skip=skip, limit=limit)
-    return metricas
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.METRICAS, ("list", skip, limit),
+        lambda: FeedbackService.get_metricas(db, skip=skip, limit=limit),
+        schemas.MetricaListAdapter
+    )
 
 
-@router.get("/metricas/{metrica_id}", response_model=schemas.MetricaResponse)
+@router.get("/metricas/{metrica_id}", response_model=schemas.MetricaResponse, dependencies=[Depends(sync_catalog_versions)])
 def get_metrica(
+    request: Request,
     metrica_id: int, 
     db: Session = Depends(get_db),
     token: str = Depends(verify_api_key)
 ):
     """Obtener métrica por ID (requiere autenticación)."""
-    metrica = FeedbackService.get_metrica_by_id(db, metrica_id)
-    if metrica is None:
-        raise HTTPException(status_code=404, detail="Métrica no encontrada")
-    return metrica
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.METRICAS, ("id", metrica_id),
+        lambda: FeedbackService.get_metrica_by_id(db, metrica_id),
+        schemas.MetricaAdapter,
+        not_found_detail="Métrica no encontrada"
+    )
 
 
 # Rutas para Parametro (con autenticación)
@@ -95,29 +133,79 @@ def create_parametro(
     return FeedbackService.create_parametro(db, parametro)
 
 
-@router.get("/parametros/", response_model=List[schemas.ParametroResponse])
+@router.post("/parametros/batch", response_model=schemas.BatchCreateResponse[schemas.ParametroResponse], status_code=status.HTTP_201_CREATED)
+def create_parametros_batch(
+    parametros: List[schemas.ParametroCreate],
+    response: Response,
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_api_key)
+):
+    """Crear varios parámetros en una transacción, con un resultado por elemento (requiere autenticación)."""
+    _check_batch_size(parametros)
+    result = FeedbackService.create_parametros_batch(db, parametros)
+    if result["failed"]:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
+@router.get("/parametros/", response_model=List[schemas.ParametroResponse], dependencies=[Depends(sync_catalog_versions)])
 def get_parametros(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     db: Session = Depends(get_db),
     token: str = Depends(verify_api_key)
 ):
     """Obtener parámetros con paginación (requiere autenticación)."""
-    parametros = FeedbackService.get_parametros(db, skip=skip, limit=limit)
-    return parametros
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.PARAMETROS, ("list", skip, limit),
+        lambda: FeedbackService.get_parametros(db, skip=skip, limit=limit),
+        schemas.ParametroListAdapter
+    )
 
 
-@router.get("/parametros/{parametro_id}", response_model=schemas.ParametroResponse)
+@router.get("/parametros/{parametro_id}", response_model=schemas.ParametroResponse, dependencies=[Depends(sync_catalog_versions)])
 def get_parametro(
+    request: Request,
     parametro_id: int, 
     db: Session = Depends(get_db),
     token: str = Depends(verify_api_key)
 ):
     """Obtener parámetro por ID (requiere autenticación)."""
-    parametro = FeedbackService.get_parametro_by_id(db, parametro_id)
-    if parametro is None:
-        raise HTTPException(status_code=404, detail="Parámetro no encontrado")
-    return parametro
+    return catalog_cache.cached_json_response(
+        request, catalog_cache.PARAMETROS, ("id", parametro_id),
+        lambda: FeedbackService.get_parametro_by_id(db, parametro_id),
+        schemas.ParametroAdapter,
+        not_found_detail="Parámetro no encontrado"
+    )
+
+
+@router.get("/parametros/{parametro_id}/metricas", response_model=List[schemas.ParametroMetricaResponse])
+def get_parametro_metricas(
+    parametro_id: int,
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_api_key)
+):
+    """Obtener las métricas ponderadas que evalúan a un parámetro (requiere autenticación)."""
+    if FeedbackService.get_parametro_by_id(db, parametro_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Parámetro no encontrado")
+    return FeedbackService.get_parametro_metricas(db, parametro_id)
+
+
+@router.put("/parametros/{parametro_id}/metricas", response_model=List[schemas.ParametroMetricaResponse])
+def replace_parametro_metricas(
+    parametro_id: int,
+    metricas: List[schemas.ParametroMetricaCreate],
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_api_key)
+):
+    """Reemplazar las métricas ponderadas de un parámetro (requiere autenticación)."""
+    try:
+        return FeedbackService.replace_parametro_metricas(db, parametro_id, metricas)
+    except ParametroNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except DomainValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 
 # Rutas para Grabacion (con autenticación)
@@ -131,6 +219,21 @@ def create_grabacion(
     return FeedbackService.create_grabacion(db, grabacion)
 
 
+@router.post("/grabaciones/batch", response_model=schemas.BatchCreateResponse[schemas.GrabacionResponse], status_code=status.HTTP_201_CREATED)
+def create_grabaciones_batch(
+    grabaciones: List[schemas.GrabacionCreate],
+    response: Response,
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_api_key)
+):
+    """Crear varias grabaciones en una transacción, con un resultado por elemento (requiere autenticación)."""
+    _check_batch_size(grabaciones)
+    result = FeedbackService.create_grabaciones_batch(db, grabaciones)
+    if result["failed"]:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
+
+
 @router.get("/grabaciones/", response_model=List[schemas.GrabacionResponse])
 def get_grabaciones(
     skip: int = 0, 
@@ -156,6 +259,21 @@ def get_grabacion(
     return grabacion
 
 
+@router.get("/grabaciones/{grabacion_id}/analizar")
+async def analizar_grabacion(
+    grabacion_id: int,
+    use_case: AnalyzeGrabacionUseCase = Depends(get_analyze_grabacion_use_case),
+    token: str = Depends(verify_api_key)
+):
+    """Analizar la calidad técnica del audio; reutiliza el análisis guardado si el archivo no cambió (requiere autenticación)."""
+    try:
+        return await use_case.execute(grabacion_id)
+    except GrabacionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except DomainValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
 # Rutas para Feedback (con autenticación)
 @router.post("/feedbacks/", response_model=schemas.FeedbackResponse, status_code=status.HTTP_201_CREATED)
 def create_feedback(
@@ -164,7 +282,25 @@ def create_feedback(
     token: str = Depends(verify_api_key)
 ):
     """Crear un nuevo feedback (requiere autenticación)."""
-    return FeedbackService.create_feedback(db, feedback)
+    try:
+        return FeedbackService.create_feedback(db, feedback)
+    except DuplicateFeedbackError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+
+
+@router.post("/feedbacks/batch", response_model=schemas.BatchCreateResponse[schemas.FeedbackResponse], status_code=status.HTTP_201_CREATED)
+def create_feedbacks_batch(
+    feedbacks: List[schemas.FeedbackCreate],
+    response: Response,
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_api_key)
+):
+    """Crear varios feedbacks en una transacción, con un resultado por elemento (requiere autenticación)."""
+    _check_batch_size(feedbacks)
+    result = FeedbackService.create_feedbacks_batch(db, feedbacks)
+    if result["failed"]:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return result
 
 
 @router.get("/feedbacks/", response_model=List[schemas.FeedbackResponse])
@@ -212,3 +348,10 @@ def get_feedbacks_by_parametro(
     """Obtener todos los feedbacks de un parámetro (requiere autenticación)."""
     feedbacks = FeedbackService.get_feedbacks_by_parametro(db, parametro_id)
     return feedbacks
+
+
+# Uso de tokens de IA (con autenticación)
+@router.get("/ai/token-usage")
+def get_ai_token_usage(token: str = Depends(verify_api_key)):
+    """Obtener el uso acumulado de tokens de IA del proceso, por tipo de llamada (requiere autenticación)."""
+    return process_token_usage()
@@ -3,10 +3,11 @@ Data Transfer Objects (DTOs) para Feedback.
 Objetos para transferir datos entre capas de la aplicación.
 """
 from datetime import datetime
-from typing import Optional
-from dataclasses import dataclass
+from typing import Optional, Tuple
+from dataclasses import dataclass, field
 
 from ...domain.entities.feedback import Feedback
+from ...domain.value_objects.feedback_score import FeedbackScore
 
 
 @dataclass
@@ -95,6 +96,51 @@ class FeedbackResponseDTO:
         }
 
 
+@dataclass(slots=True)
+class FeedbackListItem:
+    """
+    Elemento compacto de respuesta para listados de feedback.
+    
+    Se construye directamente desde una fila de la base de datos (una sola
+    asignación por fila, campos en el orden de FEEDBACK_ROW_FIELDS) y no
+    vuelve a validar el puntaje: los listados y exportaciones solo leen datos
+    que ya se validaron al escribirse. Al ser una dataclass, orjson la
+    serializa de forma nativa.
+    """
+    
+    id: int
+    grabacion_id: int
+    parametro_id: int
+    valor: float
+    comentario: Optional[str]
+    es_manual: bool
+    created_at: datetime
+    updated_at: datetime
+    performance_level: str = field(init=False)
+    
+    def __post_init__(self):
+        self.performance_level = FeedbackScore.performance_level_for(self.valor)
+    
+    @classmethod
+    def from_row(cls, row: Tuple) -> 'FeedbackListItem':
+        """Crea el elemento desde una fila con las columnas de FEEDBACK_ROW_FIELDS."""
+        return cls(*row)
+    
+    def to_dict(self) -> dict:
+        """Convierte el elemento a diccionario con el formato de FeedbackResponseDTO."""
+        return {
+            'id': self.id,
+            'grabacion_id': self.grabacion_id,
+            'parametro_id': self.parametro_id,
+            'valor': self.valor,
+            'comentario': self.comentario,
+            'es_manual': self.es_manual,
+            'performance_level': self.performance_level,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
 @dataclass
 class FeedbackFilterDTO:
     """DTO para filtrar feedbacks."""
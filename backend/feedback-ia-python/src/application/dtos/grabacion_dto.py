@@ -0,0 +1,23 @@
+"""
+Data Transfer Objects (DTOs) para Grabacion.
+Objetos para transferir datos entre capas de la aplicación.
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class GrabacionAnalysisResponseDTO:
+    """DTO de respuesta con el análisis de una grabación."""
+    
+    grabacion_id: int
+    duracion_segundos: float
+    formato_detectado: str
+    calidad_audio: str
+    metricas_extraidas: Dict[str, float]
+    problemas_detectados: List[str]
+    confiabilidad_analisis: float
+    puede_analisis_avanzado: bool
+    recomendaciones_preproceso: List[str]
+    estimacion_costo: Dict[str, float]
+    info_archivo: str
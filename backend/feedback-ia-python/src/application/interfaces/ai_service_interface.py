@@ -18,6 +18,16 @@ class AIServiceInterface(ABC):
     - Interface Segregation: Interfaz específica para operaciones de IA
     """
     
+    # Versión de los análisis que produce la implementación. Al cambiar la
+    # forma de calcularlos se incrementa, y los análisis guardados con la
+    # versión anterior dejan de reutilizarse.
+    ANALYSIS_VERSION = "1"
+    
+    @property
+    def analyzer_version(self) -> str:
+        """Identificador del analizador (implementación y versión)."""
+        return f"{type(self).__name__}:{self.ANALYSIS_VERSION}"
+    
     @abstractmethod
     async def analyze_audio_basic(
         self, 
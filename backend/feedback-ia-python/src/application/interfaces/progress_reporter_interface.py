@@ -0,0 +1,34 @@
+"""
+Interface para reportar el avance de procesos largos.
+Los casos de uso informan etapas; la infraestructura decide cómo se publican.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+# Etapas del análisis de una grabación, en orden
+ETAPA_TRANSCRIPCION = "transcripcion"  # Transcripción del archivo (o reutilización de la guardada)
+ETAPA_ANALISIS = "analisis"            # Análisis de audio con IA (o reutilización del guardado)
+ETAPA_PUNTUACION = "puntuacion"        # Puntajes de todos los parámetros
+ETAPA_COMENTARIOS = "comentarios"      # Comentario por parámetro (puede llamar a la IA)
+ETAPA_PERSISTENCIA = "persistencia"    # Guardado de los feedbacks
+
+
+class ProgressReporterInterface(ABC):
+    """
+    Interface que recibe el avance de un proceso largo por etapas.
+
+    Las implementaciones no deben fallar ni bloquear el proceso: el avance
+    es informativo.
+    """
+
+    @abstractmethod
+    async def report(self, etapa: str, progreso: float, detalle: Optional[str] = None) -> None:
+        """
+        Informa el avance dentro de una etapa.
+
+        Args:
+            etapa: Etapa actual (ver constantes ETAPA_*)
+            progreso: Avance de la etapa, de 0.0 a 1.0
+            detalle: Descripción breve opcional (p. ej. "3/10 parámetros")
+        """
+        pass
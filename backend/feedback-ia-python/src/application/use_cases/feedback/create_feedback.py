@@ -2,88 +2,20 @@
 Caso de uso para crear un nuevo feedback.
 Orquesta la lógica de negocio para la creación de feedbacks.
 """
-from typing import Optional
-
-from ...domain.entities.feedback import Feedback
-from ...domain.repositories.feedback_repository import FeedbackRepositoryInterface
-from ...domain.exceptions.validation_exceptions import DuplicateFeedbackError
-from ..dtos.feedback_dto import CreateFeedbackDTO, FeedbackResponseDTO
+from ....domain.entities.feedback import Feedback
+from ....domain.repositories.catalog_repository import CatalogRepositoryInterface
+from ....domain.repositories.feedback_repository import FeedbackRepositoryInterface
+from ....domain.exceptions.validation_exceptions import DuplicateFeedbackError, ParametroNotFoundError
+from ...dtos.feedback_dto import CreateFeedbackDTO, FeedbackResponseDTO
+from ....shared.utils.tracing import traced
 
 
 class CreateFeedbackUseCase:
     """
     Caso de uso para crear un nuevo feedback.
     
-    Orquesta la creación de feedback validando reglas de negocio
-    y coordinando entre repositorios y servicios.
-    """
-    
-    def __init__(
-        self,
-        feedback_repository: FeedbackRepositoryInterface,
-        grabacion_repository: "GrabacionRepositoryInterface",
-        parametro_repository: "ParametroRepositoryInterface"
-    ):
-        self._feedback_repository = feedback_repository
-        self._grabacion_repository = grabacion_repository
-        self._parametro_repository = parametro_repository
-    
-    async def execute(self, dto: CreateFeedbackDTO) -> FeedbackResponseDTO:
-        """
-        Ejecuta la creación de un nuevo feedback.
-        
-        Args:
-            dto: Datos para crear el feedback
-            
-        Returns:
-            DTO con los datos del feedback creado
-            
-        Raises:
-            ValidationException: Si los datos no son válidos
-            GrabacionNotFoundError: Si la grabación no existe
-            ParametroNotFoundError: Si el parámetro no existe
-            DuplicateFeedbackError: Si ya existe feedback para esta combinación
-        """
-        # Validar DTO
-        dto.validate()
-        
-        # Verificar que la grabación existe
-        grabacion = await self._grabacion_repository.get_by_id(dto.grabacion_id)
-        if not grabacion:
-            raise GrabacionNotFoundError(f"Grabación con ID {dto.grabacion_id} no encontrada")
-        
-        # Verificar que el parámetro existe
-        parametro = await self._parametro_repository.get_by_id(dto.parametro_id)
-        if not parametro:
-            raise ParametroNotFoundError(f"Parámetro con ID {dto.parametro_id} no encontrado")
-        
-        # Verificar que no existe feedback duplicado
-        existing_feedbacks = await self._feedback_repository.get_by_grabacion_and_parametro(
-            dto.grabacion_id, dto.parametro_id
-        )
-        if existing_feedbacks and not dto.es_manual:
-            raise DuplicateFeedbackError(
-                f"Ya existe feedback automático para grabación {dto.grabacion_id} y parámetro {dto.parametro_id}"
-            )
-        
-        # Crear entidad de dominio
-        feedback = Feedback.create_new(
-            grabacion_id=dto.grabacion_id,
-            parametro_id=dto.parametro_id,
-            valor=dto.valor,
-            comentario=dto.comentario,
-            es_manual=dto.es_manual
-        )
-        
-        # Persistir en repositorio
-        created_feedback = await self._feedback_repository.create(feedback)
-        
-        # Retornar DTO de respuesta
-        return FeedbackResponseDTO.from_entity(created_feedback)
-    """
-    Caso de uso para crear un nuevo feedback.
-    
     Responsabilidades:
+    - Validar que el parámetro exista
     - Validar que no exista un feedback duplicado
     - Crear la entidad de dominio
     - Persistir el feedback
@@ -94,9 +26,15 @@ class CreateFeedbackUseCase:
     - Dependency Inversion: Depende de interfaces, no de implementaciones
     """
     
-    def __init__(self, feedback_repository: FeedbackRepositoryInterface):
+    def __init__(
+        self,
+        feedback_repository: FeedbackRepositoryInterface,
+        catalog: CatalogRepositoryInterface
+    ):
         self._feedback_repository = feedback_repository
+        self._catalog = catalog
     
+    @traced()
     async def execute(self, create_dto: CreateFeedbackDTO) -> FeedbackResponseDTO:
         """
         Ejecuta el caso de uso de creación de feedback.
@@ -108,9 +46,14 @@ class CreateFeedbackUseCase:
             FeedbackResponseDTO con el feedback creado
             
         Raises:
+            ParametroNotFoundError: Si el parámetro no existe
             DuplicateFeedbackError: Si ya existe un feedback para la grabación y parámetro
             InvalidFeedbackDataError: Si los datos son inválidos
         """
+        # Verificar que el parámetro existe (catálogo en memoria, sin consulta)
+        if await self._catalog.get_parametro(create_dto.parametro_id) is None:
+            raise ParametroNotFoundError(create_dto.parametro_id)
+        
         # Verificar si ya existe un feedback para esta grabación y parámetro
         await self._validate_no_duplicate_feedback(
             create_dto.grabacion_id, 
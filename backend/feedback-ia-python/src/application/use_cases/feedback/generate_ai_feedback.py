@@ -2,18 +2,34 @@
 Caso de uso para generar feedback automático usando IA.
 Orquesta el análisis de audio y generación de feedback inteligente.
 """
-from typing import List
+import time
+from typing import TYPE_CHECKING, List, Optional
 
-from ...domain.entities.feedback import Feedback
-from ...domain.repositories.feedback_repository import FeedbackRepositoryInterface
-from ...domain.services.feedback_analyzer import FeedbackAnalyzerService
-from ...domain.exceptions.validation_exceptions import (
+from ....domain.entities.feedback import Feedback
+from ....domain.repositories.analisis_grabacion_repository import (
+    AnalisisGrabacionRepositoryInterface,
+    analysis_input_hash
+)
+from ....domain.repositories.feedback_repository import FeedbackRepositoryInterface
+from ....domain.exceptions.validation_exceptions import (
     GrabacionNotFoundError,
     ParametroNotFoundError,
     AIServiceError
 )
-from ..interfaces.ai_service_interface import AIServiceInterface
-from ..dtos.feedback_dto import GenerateAIFeedbackDTO, FeedbackResponseDTO
+from ...interfaces.ai_service_interface import AIServiceInterface
+from ...interfaces.progress_reporter_interface import (
+    ETAPA_ANALISIS,
+    ETAPA_COMENTARIOS,
+    ETAPA_PERSISTENCIA,
+    ETAPA_PUNTUACION,
+    ETAPA_TRANSCRIPCION,
+    ProgressReporterInterface
+)
+from ...dtos.feedback_dto import GenerateAIFeedbackDTO, FeedbackResponseDTO
+from ....shared.utils.tracing import traced
+
+if TYPE_CHECKING:
+    from ....domain.services.feedback_analyzer import FeedbackAnalyzerService
 
 
 class GenerateAIFeedbackUseCase:
@@ -36,18 +52,26 @@ class GenerateAIFeedbackUseCase:
         self,
         feedback_repository: FeedbackRepositoryInterface,
         ai_service: AIServiceInterface,
-        feedback_analyzer: FeedbackAnalyzerService
+        feedback_analyzer: "FeedbackAnalyzerService",
+        analisis_repository: Optional[AnalisisGrabacionRepositoryInterface] = None
     ):
         self._feedback_repository = feedback_repository
         self._ai_service = ai_service
         self._feedback_analyzer = feedback_analyzer
+        self._analisis_repository = analisis_repository
     
-    async def execute(self, generate_dto: GenerateAIFeedbackDTO) -> List[FeedbackResponseDTO]:
+    @traced()
+    async def execute(
+        self,
+        generate_dto: GenerateAIFeedbackDTO,
+        progress: Optional[ProgressReporterInterface] = None
+    ) -> List[FeedbackResponseDTO]:
         """
         Ejecuta la generación de feedback con IA.
         
         Args:
             generate_dto: DTO con los datos para generar feedback
+            progress: Receptor opcional del avance por etapas
             
         Returns:
             Lista de FeedbackResponseDTO generados
@@ -60,22 +84,25 @@ class GenerateAIFeedbackUseCase:
         # Validar entrada
         generate_dto.validate()
         
-        # Analizar audio con IA
-        ai_analysis = await self._analyze_audio_with_ai(
+        # Analizar audio con IA (o reutilizar el análisis guardado)
+        ai_analysis = await self._get_or_analyze_audio(
             generate_dto.grabacion_id,
             generate_dto.audio_analysis_data,
-            generate_dto.use_advanced_model
+            generate_dto.use_advanced_model,
+            progress
         )
+        await self._report(progress, ETAPA_ANALISIS, 1.0)
         
         # Generar feedbacks para cada parámetro
         feedbacks = await self._generate_feedbacks_for_parameters(
             generate_dto.grabacion_id,
             generate_dto.parametros_ids,
-            ai_analysis
+            ai_analysis,
+            progress
         )
         
         # Persistir los feedbacks
-        created_feedbacks = await self._persist_feedbacks(feedbacks)
+        created_feedbacks = await self._persist_feedbacks(feedbacks, progress)
         
         # Retornar DTOs de respuesta
         return [
@@ -83,6 +110,87 @@ class GenerateAIFeedbackUseCase:
             for feedback in created_feedbacks
         ]
     
+    @staticmethod
+    async def _report(
+        progress: Optional[ProgressReporterInterface],
+        etapa: str,
+        avance: float,
+        detalle: Optional[str] = None
+    ) -> None:
+        """Informa el avance si hay un receptor."""
+        if progress is not None:
+            await progress.report(etapa, avance, detalle)
+    
+    @traced()
+    async def _get_or_analyze_audio(
+        self,
+        grabacion_id: int,
+        audio_data: dict,
+        use_advanced_model: bool,
+        progress: Optional[ProgressReporterInterface] = None
+    ) -> dict:
+        """
+        Devuelve el análisis guardado si coincide el analizador y la entrada;
+        si no, transcribe y analiza con IA y guarda el resultado.
+        """
+        if self._analisis_repository is None:
+            return await self._transcribe_and_analyze(grabacion_id, audio_data, use_advanced_model, progress)
+        
+        version = f"{self._ai_service.analyzer_version}:{'avanzado' if use_advanced_model else 'basico'}"
+        hash_entrada = analysis_input_hash(audio_data)
+        ai_analysis = await self._analisis_repository.get_by_grabacion_id(
+            grabacion_id, version=version, hash_entrada=hash_entrada
+        )
+        if ai_analysis is not None:
+            return ai_analysis
+        
+        start = time.perf_counter()
+        ai_analysis = await self._transcribe_and_analyze(grabacion_id, audio_data, use_advanced_model, progress)
+        await self._analisis_repository.save(
+            grabacion_id,
+            ai_analysis,
+            version=version,
+            hash_entrada=hash_entrada,
+            duracion_ms=(time.perf_counter() - start) * 1000
+        )
+        return ai_analysis
+    
+    async def _transcribe_and_analyze(
+        self,
+        grabacion_id: int,
+        audio_data: dict,
+        use_advanced_model: bool,
+        progress: Optional[ProgressReporterInterface]
+    ) -> dict:
+        """Transcribe el archivo, si lo hay, y analiza el audio con IA."""
+        await self._transcribe(audio_data, progress)
+        await self._report(progress, ETAPA_ANALISIS, 0.0)
+        return await self._analyze_audio_with_ai(grabacion_id, audio_data, use_advanced_model)
+    
+    @traced()
+    async def _transcribe(self, audio_data: dict, progress: Optional[ProgressReporterInterface]) -> None:
+        """
+        Transcribe el archivo de la grabación como etapa propia.
+        
+        El servicio de IA guarda la transcripción, así que el análisis la
+        reutiliza en lugar de volver a transcribir. Sin transcripción el
+        análisis continúa con las métricas de audio, como sin archivo.
+        """
+        audio_file_path = audio_data.get("ruta_archivo") or audio_data.get("file_path")
+        if not audio_file_path:
+            return
+        
+        await self._report(progress, ETAPA_TRANSCRIPCION, 0.0)
+        try:
+            transcription = await self._ai_service.transcribe_audio(
+                audio_file_path, audio_data.get("language", "es")
+            )
+            detalle = f"{transcription.get('word_count', 0)} palabras"
+        except AIServiceError as e:
+            detalle = f"Sin transcripción: {e.message}"
+        await self._report(progress, ETAPA_TRANSCRIPCION, 1.0, detalle)
+    
+    @traced()
     async def _analyze_audio_with_ai(
         self,
         grabacion_id: int,
@@ -102,26 +210,31 @@ class GenerateAIFeedbackUseCase:
         except Exception as e:
             raise AIServiceError(f"Error en análisis de IA: {str(e)}")
     
+    @traced()
     async def _generate_feedbacks_for_parameters(
         self,
         grabacion_id: int,
         parametros_ids: List[int],
-        ai_analysis: dict
+        ai_analysis: dict,
+        progress: Optional[ProgressReporterInterface] = None
     ) -> List[Feedback]:
         """Genera feedbacks para cada parámetro basado en el análisis de IA."""
         feedbacks = []
         
-        for parametro_id in parametros_ids:
+        # Puntajes de todos los parámetros en una sola pasada sobre la rúbrica
+        scores = await self._feedback_analyzer.calculate_scores_for_parameters(
+            parametros_ids, ai_analysis
+        )
+        await self._report(progress, ETAPA_PUNTUACION, 1.0)
+        
+        for index, parametro_id in enumerate(parametros_ids, start=1):
             # Verificar que no exista ya un feedback para este parámetro
             existing_feedback = await self._feedback_repository.get_by_grabacion_and_parametro(
                 grabacion_id, parametro_id
             )
             
             if existing_feedback is None:
-                # Calcular puntaje usando el analizador de feedback
-                score = await self._feedback_analyzer.calculate_score_for_parameter(
-                    parametro_id, ai_analysis
-                )
+                score = scores[parametro_id]
                 
                 # Generar comentario automático
                 comentario = await self._feedback_analyzer.generate_comment_for_parameter(
@@ -137,13 +250,24 @@ class GenerateAIFeedbackUseCase:
                 )
                 
                 feedbacks.append(feedback)
+            
+            await self._report(
+                progress, ETAPA_COMENTARIOS, index / len(parametros_ids),
+                f"{index}/{len(parametros_ids)} parámetros"
+            )
         
         return feedbacks
     
-    async def _persist_feedbacks(self, feedbacks: List[Feedback]) -> List[Feedback]:
+    @traced()
+    async def _persist_feedbacks(
+        self,
+        feedbacks: List[Feedback],
+        progress: Optional[ProgressReporterInterface] = None
+    ) -> List[Feedback]:
         """Persiste todos los feedbacks generados."""
         created_feedbacks = []
         
+        await self._report(progress, ETAPA_PERSISTENCIA, 0.0)
         for feedback in feedbacks:
             try:
                 created_feedback = await self._feedback_repository.create(feedback)
@@ -152,5 +276,8 @@ class GenerateAIFeedbackUseCase:
                 # Log el error pero continúa con los otros feedbacks
                 print(f"Error al crear feedback: {str(e)}")
                 continue
+        await self._report(
+            progress, ETAPA_PERSISTENCIA, 1.0, f"{len(created_feedbacks)} feedbacks guardados"
+        )
         
         return created_feedbacks
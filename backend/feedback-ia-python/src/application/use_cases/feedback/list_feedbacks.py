@@ -0,0 +1,66 @@
+"""
+Caso de uso para listar feedbacks.
+Usa el camino de solo lectura del repositorio: filas planas mapeadas
+directamente a FeedbackListItem, sin entidades ni modelos del ORM.
+"""
+from typing import List, Optional
+
+from ....domain.repositories.feedback_repository import FeedbackRepositoryInterface
+from ...dtos.feedback_dto import FeedbackFilterDTO, FeedbackListItem
+from ....shared.utils.tracing import traced
+
+
+class ListFeedbacksUseCase:
+    """
+    Caso de uso para listados y exportaciones de feedback.
+
+    Cada fila de la base de datos produce un único objeto de respuesta.
+    """
+
+    def __init__(self, feedback_repository: FeedbackRepositoryInterface):
+        self._feedback_repository = feedback_repository
+
+    @traced()
+    async def execute(self, filters: FeedbackFilterDTO) -> List[FeedbackListItem]:
+        """
+        Lista feedbacks aplicando los filtros indicados.
+
+        Args:
+            filters: Filtros y paginación
+
+        Returns:
+            Lista de elementos compactos de feedback
+
+        Raises:
+            ValueError: Si los filtros no son válidos
+        """
+        filters.validate()
+
+        rows = await self._feedback_repository.list_rows(
+            grabacion_id=filters.grabacion_id,
+            parametro_id=filters.parametro_id,
+            es_manual=filters.es_manual,
+            min_valor=filters.min_valor,
+            max_valor=filters.max_valor,
+            skip=filters.skip,
+            limit=filters.limit
+        )
+        return [FeedbackListItem(*row) for row in rows]
+
+    async def by_grabacion(
+        self,
+        grabacion_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[FeedbackListItem]:
+        """Lista los feedbacks de una grabación."""
+        return await self.execute(FeedbackFilterDTO(grabacion_id=grabacion_id, skip=skip, limit=limit))
+
+    async def by_parametro(
+        self,
+        parametro_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[FeedbackListItem]:
+        """Lista los feedbacks de un parámetro."""
+        return await self.execute(FeedbackFilterDTO(parametro_id=parametro_id, skip=skip, limit=limit))
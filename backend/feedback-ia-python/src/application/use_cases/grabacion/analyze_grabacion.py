@@ -1,12 +1,19 @@
 # filepath: /src/application/use_cases/grabacion/analyze_grabacion.py
-from typing import Dict, Any
+import time
+from dataclasses import asdict
+from typing import Dict, Any, Optional
 
-from ...domain.entities.grabacion import Grabacion
-from ...domain.repositories.grabacion_repository import GrabacionRepositoryInterface
-from ...domain.services.audio_analyzer_service import AudioAnalyzerService, AudioAnalysisResult
-from ...infrastructure.exceptions.repository_exceptions import EntityNotFoundError
-from ...domain.exceptions.validation_exceptions import DomainValidationError
-from ..dtos.grabacion_dto import GrabacionAnalysisResponseDTO
+from ....domain.entities.grabacion import Grabacion
+from ....domain.repositories.analisis_grabacion_repository import (
+    ANALIZADOR_AUDIO,
+    AnalisisGrabacionRepositoryInterface,
+    analysis_input_hash
+)
+from ....domain.repositories.grabacion_repository import GrabacionRepositoryInterface
+from ....domain.services.audio_analyzer_service import AudioAnalyzerService, AudioAnalysisResult
+from ....domain.exceptions.validation_exceptions import DomainValidationError, GrabacionNotFoundError
+from ...dtos.grabacion_dto import GrabacionAnalysisResponseDTO
+from ....shared.utils.tracing import traced
 
 
 class AnalyzeGrabacionUseCase:
@@ -20,11 +27,14 @@ class AnalyzeGrabacionUseCase:
     def __init__(
         self, 
         grabacion_repository: GrabacionRepositoryInterface,
-        audio_analyzer_service: AudioAnalyzerService
+        audio_analyzer_service: AudioAnalyzerService,
+        analisis_repository: Optional[AnalisisGrabacionRepositoryInterface] = None
     ):
         self._repository = grabacion_repository
         self._audio_analyzer = audio_analyzer_service
+        self._analisis_repository = analisis_repository
     
+    @traced()
     async def execute(self, grabacion_id: int) -> GrabacionAnalysisResponseDTO:
         """
         Ejecuta el análisis completo de una grabación.
@@ -36,13 +46,13 @@ class AnalyzeGrabacionUseCase:
             GrabacionAnalysisResponseDTO con los resultados del análisis
             
         Raises:
-            EntityNotFoundError: Si la grabación no existe
+            GrabacionNotFoundError: Si la grabación no existe
             DomainValidationError: Si la grabación no puede ser analizada
         """
         # Obtener la grabación
         grabacion = await self._repository.get_by_id(grabacion_id)
         if not grabacion:
-            raise EntityNotFoundError(f"Grabación con ID {grabacion_id} no encontrada")
+            raise GrabacionNotFoundError(grabacion_id)
         
         # Verificar que puede ser analizada
         if not self._audio_analyzer.is_grabacion_analyzable(grabacion):
@@ -51,11 +61,8 @@ class AnalyzeGrabacionUseCase:
                 f"La grabación no puede ser analizada. Recomendaciones: {', '.join(recomendaciones)}"
             )
         
-        # Realizar el análisis
-        try:
-            analysis_result = self._audio_analyzer.analyze_grabacion(grabacion)
-        except Exception as e:
-            raise DomainValidationError(f"Error durante el análisis: {str(e)}")
+        # Realizar el análisis (o reutilizar el guardado)
+        analysis_result = await self._get_or_analyze(grabacion)
         
         # Obtener estimaciones de costo
         costo_estimado = self._audio_analyzer.estimate_processing_cost(grabacion)
@@ -78,6 +85,37 @@ class AnalyzeGrabacionUseCase:
             info_archivo=grabacion.get_info_archivo()
         )
     
+    async def _get_or_analyze(self, grabacion: Grabacion) -> AudioAnalysisResult:
+        """
+        Devuelve el análisis guardado si el archivo y la versión del
+        analizador no cambiaron; si no, analiza y guarda el resultado.
+        """
+        version = f"AudioAnalyzerService:{self._audio_analyzer.ANALYSIS_VERSION}"
+        hash_entrada = analysis_input_hash(asdict(grabacion.archivo_audio))
+        if self._analisis_repository is not None:
+            stored = await self._analisis_repository.get_by_grabacion_id(
+                grabacion.id, ANALIZADOR_AUDIO, version, hash_entrada
+            )
+            if stored is not None:
+                return AudioAnalysisResult(**stored)
+        
+        start = time.perf_counter()
+        try:
+            analysis_result = self._audio_analyzer.analyze_grabacion(grabacion)
+        except Exception as e:
+            raise DomainValidationError(f"Error durante el análisis: {str(e)}")
+        
+        if self._analisis_repository is not None:
+            await self._analisis_repository.save(
+                grabacion.id,
+                asdict(analysis_result),
+                analizador=ANALIZADOR_AUDIO,
+                version=version,
+                hash_entrada=hash_entrada,
+                duracion_ms=(time.perf_counter() - start) * 1000
+            )
+        return analysis_result
+    
     async def get_preprocessing_recommendations(self, grabacion_id: int) -> Dict[str, Any]:
         """
         Obtiene recomendaciones de preprocesamiento para una grabación.
@@ -89,12 +127,12 @@ class AnalyzeGrabacionUseCase:
             Diccionario con recomendaciones detalladas
             
         Raises:
-            EntityNotFoundError: Si la grabación no existe
+            GrabacionNotFoundError: Si la grabación no existe
         """
         # Obtener la grabación
         grabacion = await self._repository.get_by_id(grabacion_id)
         if not grabacion:
-            raise EntityNotFoundError(f"Grabación con ID {grabacion_id} no encontrada")
+            raise GrabacionNotFoundError(grabacion_id)
         
         # Generar recomendaciones
         recomendaciones = self._audio_analyzer.recommend_preprocessing_steps(grabacion)
@@ -123,12 +161,12 @@ class AnalyzeGrabacionUseCase:
             Diccionario con información de validación
             
         Raises:
-            EntityNotFoundError: Si la grabación no existe
+            GrabacionNotFoundError: Si la grabación no existe
         """
         # Obtener la grabación
         grabacion = await self._repository.get_by_id(grabacion_id)
         if not grabacion:
-            raise EntityNotFoundError(f"Grabación con ID {grabacion_id} no encontrada")
+            raise GrabacionNotFoundError(grabacion_id)
         
         # Realizar validaciones
         es_valida = grabacion.is_archivo_valido()
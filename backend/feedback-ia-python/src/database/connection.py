@@ -3,12 +3,15 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
+from src.infrastructure.observability.slow_queries import install_slow_query_log
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./feedback.db")
 
 engine = create_engine(DATABASE_URL)
+# Registro de consultas lentas (SLOW_QUERY_MS) con su plan de ejecución
+install_slow_query_log(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -18,4 +21,17 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def init_db(bind=None):
+    """
+    Crea las tablas que falten en la base de datos.
+
+    Se ejecuta una vez al arrancar (si SCHEMA_AUTO_CREATE está activo) o con
+    `python -m src.interface.cli.init_db`, no al importar la aplicación.
+    """
+    # Registrar los modelos en Base.metadata
+    import src.models.models  # noqa: F401
+
+    Base.metadata.create_all(bind=bind or engine)
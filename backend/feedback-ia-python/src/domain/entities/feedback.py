@@ -10,7 +10,7 @@ from ..value_objects.feedback_score import FeedbackScore
 from ..exceptions.validation_exceptions import InvalidFeedbackDataError
 
 
-@dataclass
+@dataclass(slots=True)
 class Feedback:
     """
     Entidad de dominio que representa un feedback de una grabación.
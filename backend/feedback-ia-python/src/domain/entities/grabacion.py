@@ -7,7 +7,7 @@ from ..exceptions.validation_exceptions import DomainValidationError
 from ..value_objects.archivo_audio import ArchivoAudio
 
 
-@dataclass
+@dataclass(slots=True)
 class Grabacion:
     """
     Entidad de dominio que representa una grabación de audio.
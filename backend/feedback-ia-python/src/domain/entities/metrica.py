@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from ..exceptions.validation_exceptions import DomainValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrica:
     """
     Entidad de dominio que representa una métrica específica.
@@ -7,7 +7,7 @@ from ..exceptions.validation_exceptions import DomainValidationError
 from ..value_objects.parametro_valor import ParametroValor
 
 
-@dataclass
+@dataclass(slots=True)
 class Parametro:
     """
     Entidad de dominio que representa un parámetro específico de una métrica.
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from ..exceptions.validation_exceptions import DomainValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class TipoMetrica:
     """
     Entidad de dominio que representa un tipo de métrica.
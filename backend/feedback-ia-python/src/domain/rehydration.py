@@ -0,0 +1,105 @@
+"""
+Reconstrucción de entidades y value objects desde filas persistidas.
+
+Las entidades validan y normalizan en __post_init__. Al leer de la base de
+datos, repetir esa validación es costoso en lecturas masivas; un
+rehidratador asigna los campos directamente, sin llamar a __init__.
+
+No todas las filas pasaron por esas reglas: la API heredada
+(services.feedback_service) guarda los valores tal como llegan, con nombres
+sin normalizar o puntajes fuera de 0-100. La instancia rehidratada conserva
+el valor guardado y los métodos del dominio no dependen de las reglas de
+escritura, así que esas filas se leen igual que las demás en lugar de
+fallar al leerlas.
+"""
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from typing import Any, Callable, Type, TypeVar
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def rehydrator(cls: Type[T]) -> Callable[..., T]:
+    """
+    Genera (una vez por clase) un constructor sin validación.
+
+    Igual que dataclasses con __init__, el constructor se genera como código
+    con una asignación directa por campo; acepta los campos por posición o
+    por nombre, con los mismos valores por defecto (default y default_factory)
+    que la dataclass. En las clases congeladas asigna con object.__setattr__.
+
+    Solo debe usarse con filas leídas del almacenamiento, nunca con datos
+    de una petición (esos pasan por el constructor normal).
+
+    Args:
+        cls: Clase de la entidad o value object (dataclass)
+
+    Returns:
+        Función que crea instancias de cls sin ejecutar __init__ ni __post_init__
+    """
+    namespace = {"_new": object.__new__, "_set": object.__setattr__, "_cls": cls, "_MISSING": MISSING}
+    frozen = cls.__dataclass_params__.frozen
+    params, body = [], []
+    for field in fields(cls):
+        name = field.name
+        if field.default is not MISSING:
+            namespace[f"_default_{name}"] = field.default
+            value = f"_default_{name}"
+        elif field.default_factory is not MISSING:
+            # Como en dataclasses: la fábrica se llama en cada instancia que no recibe el campo
+            namespace[f"_factory_{name}"] = field.default_factory
+            value = f"_factory_{name}()"
+        else:
+            value = None
+
+        if not field.init:
+            # Igual que __init__: el campo no es parámetro y toma su valor por defecto
+            if value is None:
+                continue
+            target = value
+        elif value is None:
+            params.append(name)
+            target = name
+        elif field.default is not MISSING:
+            params.append(f"{name}={value}")
+            target = name
+        else:
+            params.append(f"{name}=_MISSING")
+            target = f"{value} if {name} is _MISSING else {name}"
+
+        if frozen:
+            body.append(f"    _set(instance, {name!r}, {target})")
+        else:
+            body.append(f"    instance.{name} = {target}")
+
+    source = (
+        f"def rehydrate({', '.join(params)}):\n"
+        f"    instance = _new(_cls)\n"
+        + "\n".join(body)
+        + "\n    return instance\n"
+    )
+    exec(source, namespace)
+    function = namespace["rehydrate"]
+    function.__qualname__ = f"rehydrator({cls.__name__})"
+    return function
+
+
+def rehydrate(cls: Type[T], **values: Any) -> T:
+    """
+    Crea una instancia confiable de cls sin ejecutar la validación.
+
+    Atajo de rehydrator(cls)(**values). En bucles calientes conviene guardar
+    rehydrator(cls) y llamarlo directamente.
+
+    Args:
+        cls: Clase de la entidad o value object (dataclass)
+        **values: Valores de los campos; los omitidos toman su valor por defecto
+
+    Returns:
+        Instancia con los campos asignados
+
+    Raises:
+        TypeError: Si falta un campo obligatorio o sobra alguno
+    """
+    return rehydrator(cls)(**values)
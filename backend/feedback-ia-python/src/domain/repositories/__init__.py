@@ -6,6 +6,8 @@ This module contains all repository interfaces that define contracts for data ac
 following the Repository pattern and Dependency Inversion Principle.
 """
 
+from .analisis_grabacion_repository import AnalisisGrabacionRepositoryInterface
+from .catalog_repository import CatalogRepositoryInterface
 from .feedback_repository import FeedbackRepositoryInterface
 from .grabacion_repository import GrabacionRepositoryInterface
 from .metrica_repository import MetricaRepositoryInterface
@@ -13,6 +15,8 @@ from .parametro_repository import ParametroRepositoryInterface
 from .tipo_metrica_repository import TipoMetricaRepositoryInterface
 
 __all__ = [
+    "AnalisisGrabacionRepositoryInterface",
+    "CatalogRepositoryInterface",
     "FeedbackRepositoryInterface",
     "GrabacionRepositoryInterface",
     "MetricaRepositoryInterface", 
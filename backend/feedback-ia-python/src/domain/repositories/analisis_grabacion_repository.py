@@ -0,0 +1,81 @@
+# filepath: /src/domain/repositories/analisis_grabacion_repository.py
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+# Analizadores cuyos resultados se guardan por grabación
+ANALIZADOR_IA = "ia"        # Servicio de IA (audio_metrics, usado para puntuar)
+ANALIZADOR_AUDIO = "audio"  # AudioAnalyzerService (calidad y métricas del archivo)
+
+
+def analysis_input_hash(data: Any) -> str:
+    """
+    Hash de los datos de entrada de un análisis.
+
+    Un análisis guardado solo se reutiliza si se calculó con la misma
+    entrada (p. ej. las mismas métricas de audio enviadas por el cliente).
+
+    Args:
+        data: Datos serializables a JSON
+
+    Returns:
+        Hash SHA-256 hexadecimal
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AnalisisGrabacionRepositoryInterface(ABC):
+    """
+    Interfaz del repositorio de resultados de análisis por grabación.
+
+    Guarda el último análisis de cada grabación y analizador, con la
+    versión del analizador y el hash de su entrada, para reutilizarlo en
+    lugar de volver a analizar y para re-puntuar cuando cambia la rúbrica.
+    """
+
+    @abstractmethod
+    async def save(
+        self,
+        grabacion_id: int,
+        resultado: Dict,
+        analizador: str = ANALIZADOR_IA,
+        version: str = "",
+        hash_entrada: str = "",
+        duracion_ms: Optional[float] = None
+    ) -> None:
+        """
+        Guarda (o reemplaza) el análisis de una grabación.
+
+        Args:
+            grabacion_id: ID de la grabación analizada
+            resultado: Resultado completo del análisis
+            analizador: ANALIZADOR_IA o ANALIZADOR_AUDIO
+            version: Versión del analizador que produjo el resultado
+            hash_entrada: Hash de los datos de entrada (ver analysis_input_hash)
+            duracion_ms: Tiempo que tomó el análisis
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_grabacion_id(
+        self,
+        grabacion_id: int,
+        analizador: str = ANALIZADOR_IA,
+        version: Optional[str] = None,
+        hash_entrada: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Obtiene el último análisis guardado de una grabación.
+
+        Args:
+            grabacion_id: ID de la grabación
+            analizador: ANALIZADOR_IA o ANALIZADOR_AUDIO
+            version: Si se indica, solo se devuelve un análisis de esa versión
+            hash_entrada: Si se indica, solo se devuelve un análisis de esa entrada
+
+        Returns:
+            Resultado del análisis, None si no hay uno que coincida
+        """
+        pass
@@ -0,0 +1,97 @@
+# filepath: /src/domain/repositories/catalog_repository.py
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, List, Optional
+
+from ..entities.metrica import Metrica
+from ..entities.parametro import Parametro
+from ..entities.tipo_metrica import TipoMetrica
+
+if TYPE_CHECKING:
+    # Solo para anotaciones: la rúbrica importa numpy, que no hace falta al arrancar
+    from ..services.scoring_rubric import ScoringRubric
+
+
+class CatalogRepositoryInterface(ABC):
+    """
+    Interfaz de solo lectura para los catálogos de evaluación.
+
+    Los tipos de métrica, métricas y parámetros cambian muy poco y se
+    consultan en cada creación y análisis de feedback; las implementaciones
+    pueden servirlos desde memoria.
+    """
+
+    @abstractmethod
+    async def get_tipo_metrica(self, id: int) -> Optional[TipoMetrica]:
+        """
+        Obtiene un tipo de métrica por su ID.
+
+        Args:
+            id: ID del tipo de métrica
+
+        Returns:
+            TipoMetrica si existe, None en caso contrario
+        """
+        pass
+
+    @abstractmethod
+    async def get_metrica(self, id: int) -> Optional[Metrica]:
+        """
+        Obtiene una métrica por su ID.
+
+        Args:
+            id: ID de la métrica
+
+        Returns:
+            Metrica si existe, None en caso contrario
+        """
+        pass
+
+    @abstractmethod
+    async def get_parametro(self, id: int) -> Optional[Parametro]:
+        """
+        Obtiene un parámetro por su ID.
+
+        Args:
+            id: ID del parámetro
+
+        Returns:
+            Parametro si existe, None en caso contrario
+        """
+        pass
+
+    @abstractmethod
+    async def get_parametros_by_metrica(self, metrica_id: int) -> List[Parametro]:
+        """
+        Obtiene los parámetros de una métrica.
+
+        Args:
+            metrica_id: ID de la métrica
+
+        Returns:
+            Lista de parámetros de la métrica (vacía si no tiene)
+        """
+        pass
+
+    @abstractmethod
+    async def get_metrica_for_parametro(self, parametro_id: int) -> Optional[Metrica]:
+        """
+        Obtiene la métrica a la que pertenece un parámetro.
+
+        Args:
+            parametro_id: ID del parámetro
+
+        Returns:
+            Metrica del parámetro, None si el parámetro o la métrica no existen
+        """
+        pass
+
+    @abstractmethod
+    async def get_scoring_rubric(self) -> "ScoringRubric":
+        """
+        Obtiene la rúbrica de puntuación compilada de todos los parámetros.
+
+        Returns:
+            ScoringRubric con la configuración de parametro_metricas; los
+            parámetros sin configuración usan el grupo por defecto de su métrica
+        """
+        pass
@@ -3,11 +3,18 @@ Interface del repositorio de Feedback.
 Define el contrato que deben cumplir las implementaciones concretas.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from ..entities.feedback import Feedback
 
 
+# Orden de las columnas en las filas de solo lectura que retorna list_rows
+FEEDBACK_ROW_FIELDS = (
+    "id", "grabacion_id", "parametro_id", "valor",
+    "comentario", "es_manual", "created_at", "updated_at"
+)
+
+
 class FeedbackRepositoryInterface(ABC):
     """
     Interface que define las operaciones de persistencia para Feedback.
@@ -217,3 +224,35 @@ class FeedbackRepositoryInterface(ABC):
             Puntaje promedio o None si no hay feedbacks
         """
         pass
+    
+    @abstractmethod
+    async def list_rows(
+        self,
+        grabacion_id: Optional[int] = None,
+        parametro_id: Optional[int] = None,
+        es_manual: Optional[bool] = None,
+        min_valor: Optional[float] = None,
+        max_valor: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Sequence[Tuple]:
+        """
+        Lista feedbacks como filas planas de solo lectura.
+        
+        Camino de lectura para listados y exportaciones: no crea entidades ni
+        pasa por el identity map del ORM. Los valores se retornan tal como
+        están guardados, sin validarlos.
+        
+        Args:
+            grabacion_id: Filtrar por ID de grabación (opcional)
+            parametro_id: Filtrar por ID de parámetro (opcional)
+            es_manual: Filtrar por tipo manual/automático (opcional)
+            min_valor: Valor mínimo inclusive (opcional)
+            max_valor: Valor máximo inclusive (opcional)
+            skip: Número de registros a saltar
+            limit: Número máximo de registros a retornar
+            
+        Returns:
+            Filas con las columnas en el orden de FEEDBACK_ROW_FIELDS, ordenadas por ID
+        """
+        pass
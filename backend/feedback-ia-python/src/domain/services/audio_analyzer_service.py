@@ -30,6 +30,9 @@ class AudioAnalyzerService:
     el análisis de grabaciones de audio y extracción de métricas.
     """
     
+    # Versión del análisis (ver analisis_grabacion); incrementarla al cambiar las reglas
+    ANALYSIS_VERSION = "1"
+    
     # Umbrales de calidad de audio
     CALIDAD_ALTA_BITRATE = 256  # kbps
     CALIDAD_MEDIA_BITRATE = 128  # kbps
@@ -2,11 +2,15 @@
 Servicio de dominio para análisis de feedback.
 Contiene lógica compleja de negocio que no pertenece a una entidad específica.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from ..entities.feedback import Feedback
+from ..repositories.catalog_repository import CatalogRepositoryInterface
 from ..value_objects.feedback_score import FeedbackScore
+from .scoring_rubric import DEFAULT_METRIC_VALUE, DEFAULT_RUBRIC, ScoringRubric, _as_float
 
 
 class FeedbackAnalyzerService:
@@ -25,15 +29,6 @@ class FeedbackAnalyzerService:
     - Aplicar reglas de negocio complejas
     """
     
-    # Configuración de pesos para diferentes métricas
-    METRIC_WEIGHTS = {
-        'claridad': 0.25,
-        'volumen': 0.20,
-        'velocidad': 0.20,
-        'pausas': 0.15,
-        'entonacion': 0.20
-    }
-    
     # Umbrales para categorización de puntajes
     THRESHOLDS = {
         'excelente': 90,
@@ -43,6 +38,29 @@ class FeedbackAnalyzerService:
         'necesita_mejora': 40
     }
     
+    # Reglas de negocio sobre el análisis completo (umbral, factor)
+    SHORT_RECORDING_RULE = (30, 0.95)   # duración menor a 30 s: penalizar ligeramente
+    BACKGROUND_NOISE_RULE = (0.3, 0.9)  # ruido de fondo mayor a 0.3: penalizar
+    CONSISTENCY_RULE = (0.8, 1.05)      # consistencia mayor a 0.8: bonificar 5%
+    
+    # Campos numéricos de un análisis de IA, en el orden del vector que se
+    # guarda por grabación (el primero indica si el análisis trae audio_metrics)
+    AUDIO_METRIC_FIELDS = (
+        'clarity_score', 'volume_consistency', 'speech_rate', 'pause_patterns', 'intonation_variety'
+    )
+    ANALYSIS_VECTOR_FIELDS = (
+        'has_audio_metrics', *AUDIO_METRIC_FIELDS, 'duration_seconds', 'background_noise', 'consistency_score'
+    )
+    
+    def __init__(self, catalog: Optional[CatalogRepositoryInterface] = None):
+        """
+        Args:
+            catalog: Catálogo de métricas y parámetros, con la rúbrica compilada.
+                Sin catálogo se usan los grupos por defecto y el mapeo histórico
+                por ID (parámetros 1-2 claridad, 3-4 ritmo)
+        """
+        self._catalog = catalog
+    
     async def calculate_score_for_parameter(
         self,
         parametro_id: int,
@@ -58,34 +76,159 @@ class FeedbackAnalyzerService:
         Returns:
             Puntaje calculado (0-100)
         """
-        # Obtener métricas relevantes para el parámetro
-        relevant_metrics = self._get_relevant_metrics_for_parameter(parametro_id, ai_analysis)
+        scores = await self.calculate_scores_for_parameters([parametro_id], ai_analysis)
+        return scores[parametro_id]
+    
+    async def calculate_scores_for_parameters(
+        self,
+        parametros_ids: List[int],
+        ai_analysis: Dict
+    ) -> Dict[int, float]:
+        """
+        Calcula los puntajes de varios parámetros para un mismo análisis.
         
-        if not relevant_metrics:
-            return 50.0  # Puntaje neutral si no hay métricas
+        Los puntajes ponderados salen de un único producto matriz-vector sobre
+        el vector de métricas del análisis (ver ScoringRubric).
+        
+        Args:
+            parametros_ids: IDs de los parámetros a evaluar
+            ai_analysis: Datos del análisis de IA
+            
+        Returns:
+            Puntaje calculado (0-100) por parámetro
+        """
+        if 'audio_metrics' not in ai_analysis:
+            return {parametro_id: 50.0 for parametro_id in parametros_ids}  # Puntaje neutral si no hay métricas
         
-        # Calcular puntaje ponderado
-        weighted_score = 0.0
-        total_weight = 0.0
+        rubric = await self._get_rubric()
+        weighted_scores = rubric.scores_for(parametros_ids, ai_analysis['audio_metrics'])
         
-        for metric_name, metric_value in relevant_metrics.items():
-            weight = self.METRIC_WEIGHTS.get(metric_name, 0.1)
-            normalized_score = self._normalize_metric_value(metric_name, metric_value)
+        scores = {}
+        for parametro_id, weighted_score in zip(parametros_ids, weighted_scores.tolist()):
+            # Aplicar ajustes basados en reglas de negocio
+            final_score = self._apply_business_rules(parametro_id, weighted_score, ai_analysis)
             
-            weighted_score += normalized_score * weight
-            total_weight += weight
+            # Asegurar que el puntaje esté en el rango válido
+            scores[parametro_id] = max(0.0, min(100.0, final_score))
+        return scores
+    
+    def score_batch(
+        self,
+        rubric: ScoringRubric,
+        metrics: np.ndarray,
+        duration_seconds: np.ndarray,
+        background_noise: np.ndarray,
+        consistency_score: np.ndarray,
+        parametros_ids: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Calcula los puntajes de muchos análisis a la vez.
         
-        # Calcular puntaje final
-        if total_weight > 0:
-            final_score = (weighted_score / total_weight) * 100
-        else:
-            final_score = 50.0
+        Equivale a calculate_scores_for_parameters para cada análisis, con las
+        reglas de negocio aplicadas como máscaras sobre arreglos.
         
-        # Aplicar ajustes basados en reglas de negocio
-        final_score = self._apply_business_rules(parametro_id, final_score, ai_analysis)
+        Args:
+            rubric: Rúbrica compilada
+            metrics: Matriz M×K de métricas sin normalizar (ver ScoringRubric.metric_matrix)
+            duration_seconds: Duración de cada grabación (M)
+            background_noise: Nivel de ruido de fondo de cada análisis (M)
+            consistency_score: Consistencia de cada análisis (M)
+            parametros_ids: Parámetros a puntuar; por defecto, rubric.parametro_ids
+            
+        Returns:
+            Matriz M×P de puntajes (0-100)
+        """
+        scores = rubric.batch_scores(metrics, parametros_ids)
+        factors = self._business_rule_factors(
+            np.asarray(duration_seconds, dtype=float),
+            np.asarray(background_noise, dtype=float),
+            np.asarray(consistency_score, dtype=float)
+        )
+        scores *= factors[:, np.newaxis]
+        return np.clip(scores, 0.0, 100.0, out=scores)
+    
+    def score_analyses(
+        self,
+        rubric: ScoringRubric,
+        analyses: Sequence[Dict],
+        parametros_ids: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Calcula los puntajes de una lista de análisis de IA.
         
-        # Asegurar que el puntaje esté en el rango válido
-        return max(0.0, min(100.0, final_score))
+        Args:
+            rubric: Rúbrica compilada
+            analyses: Resultados de análisis de IA (un diccionario por grabación)
+            parametros_ids: Parámetros a puntuar; por defecto, rubric.parametro_ids
+            
+        Returns:
+            Matriz M×P de puntajes (0-100); 50 para los análisis sin métricas
+        """
+        scores = self.score_batch(
+            rubric,
+            rubric.metric_matrix([analysis.get('audio_metrics', {}) for analysis in analyses]),
+            [analysis.get('duration_seconds', 0) for analysis in analyses],
+            [analysis.get('background_noise', 0) for analysis in analyses],
+            [analysis.get('consistency_score', 0.5) for analysis in analyses],
+            parametros_ids
+        )
+        # Puntaje neutral si no hay métricas
+        without_metrics = np.array(['audio_metrics' not in analysis for analysis in analyses], dtype=bool)
+        scores[without_metrics] = 50.0
+        return scores
+    
+    @classmethod
+    def analysis_vector(cls, ai_analysis: Dict) -> np.ndarray:
+        """
+        Extrae el vector numérico de un análisis de IA (ver ANALYSIS_VECTOR_FIELDS).
+        
+        Los valores faltantes toman los mismos valores por defecto que en
+        score_analyses, de modo que ambos cálculos coinciden.
+        
+        Args:
+            ai_analysis: Resultado del análisis de IA
+            
+        Returns:
+            Vector de longitud len(ANALYSIS_VECTOR_FIELDS)
+        """
+        metrics = ai_analysis.get('audio_metrics') or {}
+        rule_inputs = (
+            ai_analysis.get('duration_seconds', 0),
+            ai_analysis.get('background_noise', 0),
+            ai_analysis.get('consistency_score', 0.5)
+        )
+        return np.array([
+            float('audio_metrics' in ai_analysis),
+            *(_as_float(metrics.get(field, DEFAULT_METRIC_VALUE)) for field in cls.AUDIO_METRIC_FIELDS),
+            *(np.nan if value is None else float(value) for value in rule_inputs)
+        ])
+    
+    def score_vectors(
+        self,
+        rubric: ScoringRubric,
+        vectors: np.ndarray,
+        parametros_ids: Optional[Sequence[int]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Calcula los puntajes a partir de vectores de análisis guardados.
+        
+        Args:
+            rubric: Rúbrica compilada
+            vectors: Matriz M×len(ANALYSIS_VECTOR_FIELDS) (ver analysis_vector)
+            parametros_ids: Parámetros a puntuar; por defecto, rubric.parametro_ids
+            
+        Returns:
+            Matriz M×P de puntajes (0-100), igual a score_analyses; None si la
+            rúbrica usa métricas que no están en el vector
+        """
+        if not set(rubric.fuentes) <= set(self.AUDIO_METRIC_FIELDS):
+            return None
+        
+        vectors = np.asarray(vectors, dtype=float)
+        columns = [1 + self.AUDIO_METRIC_FIELDS.index(fuente) for fuente in rubric.fuentes]
+        scores = self.score_batch(rubric, vectors[:, columns], *vectors[:, -3:].T, parametros_ids)
+        scores[vectors[:, 0] == 0] = 50.0
+        return scores
     
     async def generate_comment_for_parameter(
         self,
@@ -104,11 +247,26 @@ class FeedbackAnalyzerService:
         Returns:
             Comentario generado automáticamente
         """
-        score_obj = FeedbackScore(score)
-        performance_level = score_obj.get_performance_level()
-        
         # Obtener métricas específicas para el comentario
-        metrics = self._get_relevant_metrics_for_parameter(parametro_id, ai_analysis)
+        metrics = {}
+        if 'audio_metrics' in ai_analysis:
+            rubric = await self._get_rubric()
+            metrics = rubric.normalized_metrics(parametro_id, ai_analysis['audio_metrics'])
+        
+        return self.build_comment(metrics, score)
+    
+    def build_comment(self, metrics: Dict, score: float) -> str:
+        """
+        Construye el comentario basado en reglas para un conjunto de métricas.
+        
+        Args:
+            metrics: Métricas normalizadas (0-1) por nombre
+            score: Puntaje calculado (0-100)
+            
+        Returns:
+            Comentario según el nivel de rendimiento
+        """
+        performance_level = FeedbackScore(score).get_performance_level()
         
         # Generar comentario basado en el nivel de rendimiento
         if performance_level == "Excelente":
@@ -151,50 +309,11 @@ class FeedbackAnalyzerService:
         
         return analysis
     
-    def _get_relevant_metrics_for_parameter(
-        self,
-        parametro_id: int,
-        ai_analysis: Dict
-    ) -> Dict:
-        """Obtiene las métricas relevantes para un parámetro específico."""
-        # Esta lógica dependería de la configuración de parámetros
-        # Por ahora, retornamos todas las métricas disponibles
-        metrics = {}
-        
-        if 'audio_metrics' in ai_analysis:
-            audio_metrics = ai_analysis['audio_metrics']
-            
-            # Mapear métricas según el tipo de parámetro
-            if parametro_id in [1, 2]:  # Parámetros de claridad
-                metrics['claridad'] = audio_metrics.get('clarity_score', 0.5)
-                metrics['volumen'] = audio_metrics.get('volume_consistency', 0.5)
-            elif parametro_id in [3, 4]:  # Parámetros de ritmo
-                metrics['velocidad'] = audio_metrics.get('speech_rate', 0.5)
-                metrics['pausas'] = audio_metrics.get('pause_patterns', 0.5)
-            else:  # Otros parámetros
-                metrics['entonacion'] = audio_metrics.get('intonation_variety', 0.5)
-        
-        return metrics
-    
-    def _normalize_metric_value(self, metric_name: str, value: float) -> float:
-        """Normaliza un valor de métrica a un rango 0-1."""
-        # Diferentes métricas pueden tener diferentes rangos
-        if metric_name in ['claridad', 'volumen', 'entonacion']:
-            # Estas métricas ya vienen normalizadas (0-1)
-            return max(0.0, min(1.0, value))
-        elif metric_name == 'velocidad':
-            # Velocidad óptima está alrededor de 150 palabras por minuto
-            optimal_speed = 150
-            if value <= 0:
-                return 0.0
-            # Calcular qué tan cerca está del óptimo
-            deviation = abs(value - optimal_speed) / optimal_speed
-            return max(0.0, 1.0 - deviation)
-        elif metric_name == 'pausas':
-            # Pausas apropiadas mejoran la comprensión
-            return max(0.0, min(1.0, value))
-        else:
-            return 0.5  # Valor neutral para métricas desconocidas
+    async def _get_rubric(self) -> ScoringRubric:
+        """Rúbrica compilada del catálogo, o la rúbrica por defecto."""
+        if self._catalog is None:
+            return DEFAULT_RUBRIC
+        return await self._catalog.get_scoring_rubric()
     
     def _apply_business_rules(
         self,
@@ -206,22 +325,38 @@ class FeedbackAnalyzerService:
         adjusted_score = score
         
         # Regla: Si la grabación es muy corta, penalizar ligeramente
-        duration = ai_analysis.get('duration_seconds', 0)
-        if duration < 30:  # Menos de 30 segundos
-            adjusted_score *= 0.95
+        threshold, factor = self.SHORT_RECORDING_RULE
+        if ai_analysis.get('duration_seconds', 0) < threshold:
+            adjusted_score *= factor
         
         # Regla: Si hay mucho ruido de fondo, penalizar
-        noise_level = ai_analysis.get('background_noise', 0)
-        if noise_level > 0.3:  # Alto nivel de ruido
-            adjusted_score *= 0.9
+        threshold, factor = self.BACKGROUND_NOISE_RULE
+        if ai_analysis.get('background_noise', 0) > threshold:
+            adjusted_score *= factor
         
         # Regla: Bonificar consistencia en el rendimiento
-        consistency = ai_analysis.get('consistency_score', 0.5)
-        if consistency > 0.8:
-            adjusted_score *= 1.05  # Bonificación del 5%
+        threshold, factor = self.CONSISTENCY_RULE
+        if ai_analysis.get('consistency_score', 0.5) > threshold:
+            adjusted_score *= factor
         
         return adjusted_score
     
+    def _business_rule_factors(
+        self,
+        duration_seconds: np.ndarray,
+        background_noise: np.ndarray,
+        consistency_score: np.ndarray
+    ) -> np.ndarray:
+        """Factor de ajuste por análisis: las reglas de negocio como máscaras."""
+        short_threshold, short_factor = self.SHORT_RECORDING_RULE
+        noise_threshold, noise_factor = self.BACKGROUND_NOISE_RULE
+        consistency_threshold, consistency_factor = self.CONSISTENCY_RULE
+        return (
+            np.where(duration_seconds < short_threshold, short_factor, 1.0)
+            * np.where(background_noise > noise_threshold, noise_factor, 1.0)
+            * np.where(consistency_score > consistency_threshold, consistency_factor, 1.0)
+        )
+    
     def _generate_excellent_comment(self, metrics: Dict) -> str:
         """Genera comentario para rendimiento excelente."""
         strong_metrics = [name for name, value in metrics.items() if value > 0.8]
@@ -0,0 +1,265 @@
+"""
+Rúbrica de puntuación compilada (parámetros × métricas).
+
+La configuración de qué métricas evalúan a cada parámetro (tabla
+parametro_metricas) se compila una vez en:
+- un índice denso de columnas: cada columna es una métrica del análisis de
+  audio con su normalización (fuente, normalización, objetivo);
+- una matriz de pesos P×K con las filas normalizadas a suma 1.
+
+Puntuar todos los parámetros de un análisis es entonces normalizar el vector
+de métricas (operaciones vectorizadas por columna) y un producto
+matriz-vector, sin recorrer nombres de métricas por cada llamada.
+"""
+import unicodedata
+from numbers import Real
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..value_objects.metrica_ponderada import NORMALIZACION_OBJETIVO, MetricaPonderada
+
+# Valor asumido cuando el análisis no trae una métrica
+DEFAULT_METRIC_VALUE = 0.5
+
+GRUPO_CLARIDAD = "claridad"
+GRUPO_RITMO = "ritmo"
+GRUPO_ENTONACION = "entonacion"
+
+# Métricas por defecto para los parámetros sin configuración propia
+DEFAULT_GROUPS: Dict[str, Tuple[MetricaPonderada, ...]] = {
+    GRUPO_CLARIDAD: (
+        MetricaPonderada("claridad", "clarity_score", 0.25),
+        MetricaPonderada("volumen", "volume_consistency", 0.20),
+    ),
+    GRUPO_RITMO: (
+        # Velocidad óptima alrededor de 150 palabras por minuto
+        MetricaPonderada("velocidad", "speech_rate", 0.20, NORMALIZACION_OBJETIVO, 150.0),
+        MetricaPonderada("pausas", "pause_patterns", 0.15),
+    ),
+    GRUPO_ENTONACION: (
+        MetricaPonderada("entonacion", "intonation_variety", 0.20),
+    ),
+}
+
+# Palabras clave en el nombre de la métrica del parámetro (sin tildes)
+GROUP_KEYWORDS = {
+    GRUPO_CLARIDAD: ("clar", "volumen", "diccion", "pronuncia", "articula"),
+    GRUPO_RITMO: ("velocidad", "ritmo", "pausa", "fluidez", "palabras por minuto"),
+}
+
+
+def metric_group_for(metrica_nombre: str) -> str:
+    """
+    Grupo de métricas por defecto según el nombre de la métrica del parámetro.
+
+    Args:
+        metrica_nombre: Nombre de la métrica (p. ej. "Velocidad del habla")
+
+    Returns:
+        Clave de DEFAULT_GROUPS
+    """
+    nombre = unicodedata.normalize("NFKD", metrica_nombre.lower())
+    nombre = "".join(char for char in nombre if not unicodedata.combining(char))
+    for group, keywords in GROUP_KEYWORDS.items():
+        if any(keyword in nombre for keyword in keywords):
+            return group
+    return GRUPO_ENTONACION
+
+
+def legacy_group_for(parametro_id: int) -> str:
+    """Mapeo histórico por ID para parámetros que no están en el catálogo."""
+    if parametro_id in (1, 2):
+        return GRUPO_CLARIDAD
+    if parametro_id in (3, 4):
+        return GRUPO_RITMO
+    return GRUPO_ENTONACION
+
+
+def _as_float(value) -> float:
+    # Algunas fuentes traen estructuras (p. ej. pause_patterns detallado)
+    return float(value) if isinstance(value, Real) else DEFAULT_METRIC_VALUE
+
+
+class ScoringRubric:
+    """
+    Rúbrica compilada e inmutable; se comparte entre peticiones.
+
+    Las filas de la matriz son los parámetros configurados (en el orden de
+    parametro_ids) seguidas de los grupos por defecto, que se usan para
+    parámetros desconocidos.
+    """
+
+    __slots__ = (
+        "parametro_ids", "weights", "_all_weights", "_fuentes", "_es_objetivo",
+        "_objetivos", "_row_index", "_group_index", "_claves"
+    )
+
+    def __init__(self, rows: Sequence[Tuple[Optional[int], Sequence[MetricaPonderada]]]):
+        """
+        Args:
+            rows: (parametro_id, métricas) por parámetro; parametro_id None para
+                los grupos por defecto
+        """
+        group_rows = [(None, metricas) for metricas in DEFAULT_GROUPS.values()]
+        rows = [row for row in rows if row[0] is not None] + group_rows
+
+        columns: Dict[tuple, int] = {}
+        for _, metricas in rows:
+            for metrica in metricas:
+                columns.setdefault(metrica.columna, len(columns))
+
+        weights = np.zeros((len(rows), len(columns)))
+        claves: List[Tuple[Tuple[str, int], ...]] = []
+        for row, (_, metricas) in enumerate(rows):
+            total = sum(metrica.peso for metrica in metricas)
+            for metrica in metricas:
+                weights[row, columns[metrica.columna]] += metrica.peso / total
+            claves.append(tuple((metrica.clave, columns[metrica.columna]) for metrica in metricas))
+
+        configured = len(rows) - len(group_rows)
+        self.parametro_ids: Tuple[int, ...] = tuple(parametro_id for parametro_id, _ in rows[:configured])
+        self._all_weights = weights
+        self.weights = weights[:configured]
+        self._row_index = {parametro_id: row for row, parametro_id in enumerate(self.parametro_ids)}
+        self._group_index = {group: configured + i for i, group in enumerate(DEFAULT_GROUPS)}
+        self._claves = tuple(claves)
+
+        self._fuentes = tuple(fuente for fuente, _, _ in columns)
+        self._es_objetivo = np.array([norm == NORMALIZACION_OBJETIVO for _, norm, _ in columns], dtype=bool)
+        self._objetivos = np.array([objetivo or 1.0 for _, _, objetivo in columns])
+
+    @classmethod
+    def compile(
+        cls,
+        mappings: Mapping[int, Sequence[MetricaPonderada]],
+        groups: Optional[Mapping[int, str]] = None
+    ) -> "ScoringRubric":
+        """
+        Compila la rúbrica a partir de la configuración.
+
+        Args:
+            mappings: Métricas configuradas por parametro_id
+            groups: Grupo por defecto de los parámetros del catálogo sin configuración
+
+        Returns:
+            Rúbrica compilada
+        """
+        rows = {parametro_id: DEFAULT_GROUPS[group] for parametro_id, group in (groups or {}).items()}
+        rows.update({parametro_id: metricas for parametro_id, metricas in mappings.items() if metricas})
+        return cls(sorted(rows.items()))
+
+    @property
+    def fuentes(self) -> Tuple[str, ...]:
+        """Clave de audio_metrics de cada columna del vector de métricas."""
+        return self._fuentes
+
+    def row(self, parametro_id: int) -> int:
+        """Fila de la matriz de pesos que corresponde a un parámetro."""
+        row = self._row_index.get(parametro_id)
+        if row is None:
+            row = self._group_index[legacy_group_for(parametro_id)]
+        return row
+
+    def metric_vector(self, audio_metrics: Mapping) -> np.ndarray:
+        """
+        Extrae el vector de métricas (sin normalizar) de un análisis.
+
+        Args:
+            audio_metrics: ai_analysis["audio_metrics"]
+
+        Returns:
+            Vector de longitud K
+        """
+        return np.fromiter(
+            (_as_float(audio_metrics.get(fuente, DEFAULT_METRIC_VALUE)) for fuente in self._fuentes),
+            dtype=float, count=len(self._fuentes)
+        )
+
+    def normalize(self, raw: np.ndarray) -> np.ndarray:
+        """
+        Normaliza métricas a 0-1 por columna.
+
+        Args:
+            raw: Vector K o matriz M×K de métricas sin normalizar
+
+        Returns:
+            Arreglo de la misma forma con valores en 0-1
+        """
+        raw = np.asarray(raw, dtype=float)
+        lineal = np.clip(raw, 0.0, 1.0)
+        desviacion = np.abs(raw - self._objetivos) / self._objetivos
+        objetivo = np.where(raw > 0, np.maximum(0.0, 1.0 - desviacion), 0.0)
+        return np.where(self._es_objetivo, objetivo, lineal)
+
+    def score_all(self, audio_metrics: Mapping) -> np.ndarray:
+        """Puntaje (0-100) de cada parámetro de parametro_ids."""
+        return self.weights @ self.normalize(self.metric_vector(audio_metrics)) * 100
+
+    def scores_for(self, parametro_ids: Iterable[int], audio_metrics: Mapping) -> np.ndarray:
+        """
+        Puntajes (0-100) de los parámetros indicados, antes de reglas de negocio.
+
+        Args:
+            parametro_ids: Parámetros a puntuar (pueden no estar configurados)
+            audio_metrics: ai_analysis["audio_metrics"]
+
+        Returns:
+            Vector con un puntaje por parámetro, en el mismo orden
+        """
+        rows = [self.row(parametro_id) for parametro_id in parametro_ids]
+        return self._all_weights[rows] @ self.normalize(self.metric_vector(audio_metrics)) * 100
+
+    def score(self, parametro_id: int, audio_metrics: Mapping) -> float:
+        """Puntaje (0-100) de un parámetro, antes de reglas de negocio."""
+        return float(self.scores_for((parametro_id,), audio_metrics)[0])
+
+    def metric_matrix(self, audio_metrics: Sequence[Mapping]) -> np.ndarray:
+        """
+        Extrae la matriz de métricas (sin normalizar) de varios análisis.
+
+        Args:
+            audio_metrics: ai_analysis["audio_metrics"] de cada grabación
+
+        Returns:
+            Matriz M×K, una fila por análisis
+        """
+        matrix = np.empty((len(audio_metrics), len(self._fuentes)))
+        for column, fuente in enumerate(self._fuentes):
+            matrix[:, column] = [_as_float(metrics.get(fuente, DEFAULT_METRIC_VALUE)) for metrics in audio_metrics]
+        return matrix
+
+    def batch_scores(self, metrics: np.ndarray, parametro_ids: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Puntajes (0-100) de muchos análisis a la vez, antes de reglas de negocio.
+
+        Args:
+            metrics: Matriz M×K de métricas sin normalizar (ver metric_matrix)
+            parametro_ids: Parámetros a puntuar; por defecto, parametro_ids
+
+        Returns:
+            Matriz M×P con un puntaje por análisis y parámetro
+        """
+        if parametro_ids is None:
+            weights = self.weights
+        else:
+            weights = self._all_weights[[self.row(parametro_id) for parametro_id in parametro_ids]]
+        return self.normalize(metrics) @ weights.T * 100
+
+    def normalized_metrics(self, parametro_id: int, audio_metrics: Mapping) -> Dict[str, float]:
+        """
+        Métricas normalizadas (0-1) que evalúan a un parámetro, por clave.
+
+        Args:
+            parametro_id: ID del parámetro
+            audio_metrics: ai_analysis["audio_metrics"]
+
+        Returns:
+            Diccionario {clave: valor normalizado}, para generar comentarios
+        """
+        normalized = self.normalize(self.metric_vector(audio_metrics))
+        return {clave: float(normalized[column]) for clave, column in self._claves[self.row(parametro_id)]}
+
+
+# Rúbrica sin configuración: solo los grupos por defecto
+DEFAULT_RUBRIC = ScoringRubric(())
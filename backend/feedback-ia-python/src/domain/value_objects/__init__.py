@@ -8,10 +8,12 @@ and represent concepts that are defined by their value rather than identity.
 
 from .archivo_audio import ArchivoAudio
 from .feedback_score import FeedbackScore
+from .metrica_ponderada import MetricaPonderada
 from .parametro_valor import ParametroValor
 
 __all__ = [
     "ArchivoAudio",
     "FeedbackScore",
+    "MetricaPonderada",
     "ParametroValor"
 ]
\ No newline at end of file
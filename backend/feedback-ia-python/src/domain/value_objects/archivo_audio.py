@@ -6,7 +6,7 @@ from pathlib import Path
 from ..exceptions.validation_exceptions import DomainValidationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchivoAudio:
     """
     Value object que representa las propiedades de un archivo de audio.
@@ -8,7 +8,7 @@ from typing import Union
 from ..exceptions.validation_exceptions import InvalidScoreError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeedbackScore:
     """
     Value Object inmutable que representa un puntaje de feedback.
@@ -43,13 +43,22 @@ class FeedbackScore:
     
     def get_performance_level(self) -> str:
         """Obtiene el nivel de rendimiento basado en el puntaje."""
-        if self.is_high(90):
+        return self.performance_level_for(self.value)
+    
+    @staticmethod
+    def performance_level_for(value: float) -> str:
+        """
+        Nivel de rendimiento de un puntaje ya validado, sin crear el value object.
+        
+        Lo usan las lecturas masivas, donde el valor viene de la base de datos.
+        """
+        if value >= 90:
             return "Excelente"
-        elif self.is_high(80):
+        elif value >= 80:
             return "Muy Bueno"
-        elif self.is_high(60):
+        elif value >= 60:
             return "Bueno"
-        elif self.is_low(40):
+        elif value <= 40:
             return "Necesita Mejora"
         else:
             return "Regular"
@@ -0,0 +1,55 @@
+# filepath: /src/domain/value_objects/metrica_ponderada.py
+from dataclasses import dataclass
+from typing import Optional
+
+from ..exceptions.validation_exceptions import DomainValidationError
+
+# Normalizaciones soportadas al convertir el valor medido a 0-1
+NORMALIZACION_LINEAL = "lineal"      # el valor ya viene en 0-1; se acota
+NORMALIZACION_OBJETIVO = "objetivo"  # 1 en el objetivo, decrece con la desviación relativa
+NORMALIZACIONES = (NORMALIZACION_LINEAL, NORMALIZACION_OBJETIVO)
+
+
+@dataclass(frozen=True, slots=True)
+class MetricaPonderada:
+    """
+    Value object que describe cómo contribuye una métrica al puntaje de un parámetro.
+
+    Ejemplo: el parámetro "Velocidad" se evalúa con la métrica "velocidad",
+    que se lee de audio_metrics["speech_rate"], pesa 0.2 y se normaliza
+    respecto a un objetivo de 150 palabras por minuto.
+    """
+
+    clave: str
+    fuente: str
+    peso: float
+    normalizacion: str = NORMALIZACION_LINEAL
+    objetivo: Optional[float] = None
+
+    def __post_init__(self):
+        """Validación después de la inicialización."""
+        self._validate()
+
+    def _validate(self) -> None:
+        """Valida la métrica según las reglas de negocio."""
+        if not self.clave or not self.clave.strip():
+            raise DomainValidationError("La clave de la métrica es obligatoria")
+
+        if not self.fuente or not self.fuente.strip():
+            raise DomainValidationError("La fuente de la métrica es obligatoria")
+
+        if self.peso is None or self.peso <= 0:
+            raise DomainValidationError("El peso de la métrica debe ser positivo")
+
+        if self.normalizacion not in NORMALIZACIONES:
+            raise DomainValidationError(
+                f"Normalización no soportada: {self.normalizacion}. Use una de {', '.join(NORMALIZACIONES)}"
+            )
+
+        if self.normalizacion == NORMALIZACION_OBJETIVO and (self.objetivo is None or self.objetivo <= 0):
+            raise DomainValidationError("La normalización por objetivo requiere un objetivo positivo")
+
+    @property
+    def columna(self) -> tuple:
+        """Identifica la columna del vector de métricas que usa esta métrica."""
+        return (self.fuente, self.normalizacion, self.objetivo)
@@ -5,7 +5,7 @@ from typing import Optional
 from ..exceptions.validation_exceptions import DomainValidationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParametroValor:
     """
     Value object que representa el valor de un parámetro con su unidad.
@@ -0,0 +1,349 @@
+"""
+Caché en memoria de los catálogos (tipos de métrica, métricas y parámetros).
+
+Los catálogos son pequeños y casi no cambian, pero se consultan en cada
+creación y análisis de feedback. Cada catálogo se carga completo la primera
+vez que se usa (read-through) como entidades de dominio indexadas por ID, y
+las consultas posteriores son accesos a diccionario. La rúbrica de
+puntuación (parametro_metricas) se compila a partir de ellos una sola vez.
+
+Invalidación:
+- En el proceso que escribe: mark_catalog_changed() incrementa la versión del
+  catálogo en la tabla catalog_versions dentro de la misma transacción, y al
+  confirmarse (after_commit) se descarta la copia local y se invalida la
+  caché de respuestas HTTP.
+- En los demás workers: sync() compara las versiones de catalog_versions con
+  las últimas vistas, como mucho una vez cada CATALOG_REFRESH_MS.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, column, event, insert, inspect, select, table, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ...domain.entities.metrica import Metrica
+from ...domain.entities.parametro import Parametro
+from ...domain.entities.tipo_metrica import TipoMetrica
+from ...domain.rehydration import rehydrator
+from ...domain.repositories.catalog_repository import CatalogRepositoryInterface
+from ...domain.value_objects.metrica_ponderada import MetricaPonderada
+from ...domain.value_objects.parametro_valor import ParametroValor
+from ...shared.utils.tracing import trace_public_methods
+from ..config.settings import get_settings
+from ..database.models import MetricaModel, ParametroMetricaModel, ParametroModel, TipoMetricaModel
+from .response_cache import METRICAS, PARAMETROS, TIPOS_METRICA, response_cache
+
+if TYPE_CHECKING:
+    # La rúbrica importa numpy: se carga al compilarla, no al importar el módulo
+    from ...domain.services.scoring_rubric import ScoringRubric
+
+logger = logging.getLogger(__name__)
+
+# Configuración de métricas por parámetro (no tiene respuestas HTTP cacheadas)
+PARAMETRO_METRICAS = "parametro_metricas"
+
+CATALOGS = (TIPOS_METRICA, METRICAS, PARAMETROS, PARAMETRO_METRICAS)
+
+# Catálogos de los que depende la rúbrica compilada
+_RUBRIC_CATALOGS = (METRICAS, PARAMETROS, PARAMETRO_METRICAS)
+
+# Clave de Session.info con los catálogos modificados en la transacción en curso
+_PENDING_KEY = "catalog_changes"
+
+_VERSIONS = table("catalog_versions", column("catalog"), column("version"))
+_SELECT_VERSIONS = select(_VERSIONS.c.catalog, _VERSIONS.c.version)
+_BUMP_VERSION = (
+    update(_VERSIONS)
+    .where(_VERSIONS.c.catalog == bindparam("name"))
+    .values(version=_VERSIONS.c.version + 1)
+)
+_INSERT_VERSION = insert(_VERSIONS).values(catalog=bindparam("name"), version=1)
+
+_LOAD = {
+    TIPOS_METRICA: select(
+        TipoMetricaModel.id, TipoMetricaModel.nombre, TipoMetricaModel.descripcion,
+        TipoMetricaModel.created_at, TipoMetricaModel.updated_at
+    ),
+    METRICAS: select(
+        MetricaModel.id, MetricaModel.nombre, MetricaModel.descripcion,
+        MetricaModel.tipo_metrica_id, MetricaModel.created_at, MetricaModel.updated_at
+    ),
+    PARAMETROS: select(
+        ParametroModel.id, ParametroModel.metrica_id, ParametroModel.nombre,
+        ParametroModel.valor, ParametroModel.unidad,
+        ParametroModel.created_at, ParametroModel.updated_at
+    ),
+    PARAMETRO_METRICAS: select(
+        ParametroMetricaModel.parametro_id, ParametroMetricaModel.clave, ParametroMetricaModel.fuente,
+        ParametroMetricaModel.peso, ParametroMetricaModel.normalizacion, ParametroMetricaModel.objetivo
+    ).order_by(ParametroMetricaModel.id),
+}
+
+# Las filas se reconstruyen tal como se guardaron, sin validar (ver domain.rehydration)
+_trusted_tipo_metrica = rehydrator(TipoMetrica)
+_trusted_metrica = rehydrator(Metrica)
+_trusted_parametro = rehydrator(Parametro)
+_trusted_valor = rehydrator(ParametroValor)
+_trusted_metrica_ponderada = rehydrator(MetricaPonderada)
+
+
+def _to_entities(catalog: str, rows: Iterable[Tuple]) -> Dict[int, object]:
+    if catalog == PARAMETRO_METRICAS:
+        # Indexado por parametro_id: tupla de métricas ponderadas
+        grouped = defaultdict(list)
+        for parametro_id, *metrica in rows:
+            grouped[parametro_id].append(_trusted_metrica_ponderada(*metrica))
+        return {parametro_id: tuple(metricas) for parametro_id, metricas in grouped.items()}
+    if catalog == PARAMETROS:
+        return {
+            id: _trusted_parametro(id, metrica_id, nombre, _trusted_valor(valor, unidad), created, updated)
+            for id, metrica_id, nombre, valor, unidad, created, updated in rows
+        }
+    factory = _trusted_tipo_metrica if catalog == TIPOS_METRICA else _trusted_metrica
+    return {row[0]: factory(*row) for row in rows}
+
+
+def _versions_table_missing(engine) -> bool:
+    try:
+        return not inspect(engine).has_table(_VERSIONS.name)
+    except SQLAlchemyError:
+        # Sin poder comprobarlo se trata como un error transitorio
+        return False
+
+
+class CatalogCache:
+    """
+    Copia en memoria de los catálogos, compartida por el proceso.
+
+    Es segura entre hilos: los endpoints síncronos se ejecutan en el
+    threadpool de FastAPI. Las entidades cacheadas se comparten entre
+    peticiones y no deben modificarse.
+    """
+
+    def __init__(self, refresh_interval_ms: int = 1000):
+        self._refresh_interval = refresh_interval_ms / 1000
+        self._tables: Dict[str, Dict[int, object]] = {}
+        self._parametros_by_metrica: Optional[Dict[int, List[Parametro]]] = None
+        self._rubric: Optional["ScoringRubric"] = None
+        # Generación local: evita guardar una carga que empezó antes de una invalidación
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._seen_versions: Dict[str, int] = {}
+        self._checked_at = float("-inf")
+        self._versions_available = True
+        self._lock = threading.Lock()
+        # Lecturas de catálogos servidas desde memoria / desde la base de datos
+        self.hits = 0
+        self.misses = 0
+
+    def table(self, db: Session, catalog: str) -> Dict[int, object]:
+        """
+        Retorna el catálogo completo indexado por ID, cargándolo si hace falta.
+
+        Args:
+            db: Sesión de base de datos (solo se usa si el catálogo no está cargado)
+            catalog: Uno de CATALOGS
+
+        Returns:
+            Diccionario {id: entidad}; para PARAMETRO_METRICAS,
+            {parametro_id: tupla de MetricaPonderada}
+        """
+        loaded = self._tables.get(catalog)
+        if loaded is not None:
+            self.hits += 1
+            return loaded
+        self.misses += 1
+        generation = self._generations[catalog]
+        loaded = _to_entities(catalog, db.execute(_LOAD[catalog]).all())
+        with self._lock:
+            if generation == self._generations[catalog]:
+                self._tables[catalog] = loaded
+        return loaded
+
+    def hit_ratio(self) -> float:
+        """Proporción de lecturas servidas desde memoria desde el arranque."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def parametros_by_metrica(self, db: Session) -> Dict[int, List[Parametro]]:
+        """Parámetros agrupados por métrica."""
+        grouped = self._parametros_by_metrica
+        if grouped is None:
+            generation = self._generations[PARAMETROS]
+            grouped = defaultdict(list)
+            for parametro in self.table(db, PARAMETROS).values():
+                grouped[parametro.metrica_id].append(parametro)
+            grouped = dict(grouped)
+            with self._lock:
+                if generation == self._generations[PARAMETROS]:
+                    self._parametros_by_metrica = grouped
+        return grouped
+
+    def rubric(self, db: Session) -> "ScoringRubric":
+        """
+        Rúbrica de puntuación compilada, compilándola si hace falta.
+
+        Los parámetros sin filas en parametro_metricas usan el grupo por
+        defecto que corresponde al nombre de su métrica.
+
+        Args:
+            db: Sesión de base de datos (solo se usa si algún catálogo no está cargado)
+
+        Returns:
+            ScoringRubric compartida por el proceso
+        """
+        rubric = self._rubric
+        if rubric is None:
+            from ...domain.services.scoring_rubric import ScoringRubric, legacy_group_for, metric_group_for
+
+            generations = tuple(self._generations[catalog] for catalog in _RUBRIC_CATALOGS)
+            metricas = self.table(db, METRICAS)
+            groups = {
+                parametro.id: (
+                    metric_group_for(metricas[parametro.metrica_id].nombre)
+                    if parametro.metrica_id in metricas else legacy_group_for(parametro.id)
+                )
+                for parametro in self.table(db, PARAMETROS).values()
+            }
+            rubric = ScoringRubric.compile(self.table(db, PARAMETRO_METRICAS), groups)
+            with self._lock:
+                if generations == tuple(self._generations[catalog] for catalog in _RUBRIC_CATALOGS):
+                    self._rubric = rubric
+        return rubric
+
+    def invalidate(self, *catalogs: str) -> None:
+        """
+        Descarta la copia local de los catálogos y sus respuestas HTTP cacheadas.
+
+        Args:
+            *catalogs: Catálogos modificados
+        """
+        with self._lock:
+            for catalog in catalogs:
+                self._generations[catalog] += 1
+                self._tables.pop(catalog, None)
+                if catalog == PARAMETROS:
+                    self._parametros_by_metrica = None
+                if catalog in _RUBRIC_CATALOGS:
+                    self._rubric = None
+        response_cache.bump(*catalogs)
+
+    def sync(self, db: Session) -> None:
+        """
+        Invalida los catálogos modificados por otros workers.
+
+        Lee catalog_versions como mucho una vez por intervalo de refresco, en
+        una conexión propia: un error no afecta la transacción de la sesión.
+        Si la tabla no existe se deja de sincronizar; ante otros errores se
+        reintenta en el siguiente intervalo.
+
+        Args:
+            db: Sesión de base de datos (solo se usa su engine)
+        """
+        now = time.monotonic()
+        if not self._versions_available or now - self._checked_at < self._refresh_interval:
+            return
+        self._checked_at = now
+        engine = db.get_bind()
+        try:
+            with engine.connect() as connection:
+                versions = dict(connection.execute(_SELECT_VERSIONS).all())
+        except SQLAlchemyError:
+            if _versions_table_missing(engine):
+                # Base de datos sin la migración 0003: solo hay invalidación local
+                self._versions_available = False
+                logger.warning("Tabla catalog_versions no disponible; la caché de catálogos no se sincroniza entre workers")
+            else:
+                logger.warning("No se pudieron leer las versiones de los catálogos; se reintentará", exc_info=True)
+            return
+
+        changed = [
+            catalog for catalog in CATALOGS
+            if catalog in self._seen_versions and versions.get(catalog, 0) != self._seen_versions[catalog]
+        ]
+        for catalog in CATALOGS:
+            self._seen_versions[catalog] = versions.get(catalog, 0)
+        if changed:
+            self.invalidate(*changed)
+
+    def clear(self) -> None:
+        """Vacía la caché y olvida las versiones vistas."""
+        with self._lock:
+            for catalog in CATALOGS:
+                self._generations[catalog] += 1
+            self._tables.clear()
+            self._parametros_by_metrica = None
+            self._rubric = None
+            self._seen_versions.clear()
+            self._checked_at = float("-inf")
+
+
+@lru_cache(maxsize=None)
+def get_catalog_cache() -> CatalogCache:
+    """Caché de catálogos del proceso."""
+    return CatalogCache(get_settings().database.catalog_refresh_ms)
+
+
+def mark_catalog_changed(db: Session, *catalogs: str) -> None:
+    """
+    Registra la modificación de catálogos en la transacción en curso.
+
+    Debe llamarse antes de db.commit(). La versión en catalog_versions se
+    incrementa en la misma transacción, de modo que los demás workers ven el
+    cambio junto con los datos; la caché local se invalida al confirmarse.
+
+    Args:
+        db: Sesión de la transacción que escribe
+        *catalogs: Catálogos modificados
+    """
+    for catalog in catalogs:
+        if db.execute(_BUMP_VERSION, {"name": catalog}).rowcount == 0:
+            db.execute(_INSERT_VERSION, {"name": catalog})
+    db.info.setdefault(_PENDING_KEY, set()).update(catalogs)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_catalogs(session: Session) -> None:
+    catalogs = session.info.pop(_PENDING_KEY, None)
+    if catalogs:
+        get_catalog_cache().invalidate(*catalogs)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_catalogs(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+@trace_public_methods
+class CachedCatalogRepository(CatalogRepositoryInterface):
+    """Catálogos servidos desde CatalogCache (una instancia por petición)."""
+
+    def __init__(self, db: Session, cache: Optional[CatalogCache] = None):
+        self._db = db
+        self._cache = cache or get_catalog_cache()
+        self._cache.sync(db)
+
+    async def get_tipo_metrica(self, id: int) -> Optional[TipoMetrica]:
+        return self._cache.table(self._db, TIPOS_METRICA).get(id)
+
+    async def get_metrica(self, id: int) -> Optional[Metrica]:
+        return self._cache.table(self._db, METRICAS).get(id)
+
+    async def get_parametro(self, id: int) -> Optional[Parametro]:
+        return self._cache.table(self._db, PARAMETROS).get(id)
+
+    async def get_parametros_by_metrica(self, metrica_id: int) -> List[Parametro]:
+        return list(self._cache.parametros_by_metrica(self._db).get(metrica_id, ()))
+
+    async def get_metrica_for_parametro(self, parametro_id: int) -> Optional[Metrica]:
+        parametro = self._cache.table(self._db, PARAMETROS).get(parametro_id)
+        if parametro is None:
+            return None
+        return self._cache.table(self._db, METRICAS).get(parametro.metrica_id)
+
+    async def get_scoring_rubric(self) -> "ScoringRubric":
+        return self._cache.rubric(self._db)
@@ -0,0 +1,167 @@
+"""
+Caché de respuestas HTTP para catálogos (tipos de métrica, métricas, parámetros).
+
+Cada catálogo tiene un contador de versión que se incrementa en cada
+escritura. Las respuestas se guardan ya serializadas (bytes) por forma de
+consulta, junto con un ETag fuerte derivado solo del contenido: la versión
+es un contador local de cada proceso y con varios workers haría que el
+mismo catálogo tuviera ETags distintos según quién responda. En un acierto no se consulta la base de datos ni se vuelve a serializar, y
+si el cliente envía If-None-Match con el ETag vigente se responde 304.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+
+# Catálogos cacheados
+TIPOS_METRICA = "tipos_metrica"
+METRICAS = "metricas"
+PARAMETROS = "parametros"
+
+# Los clientes pueden guardar la respuesta pero deben revalidarla (304)
+CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Respuesta serializada de una versión concreta de un catálogo."""
+
+    version: int
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """
+    Caché en memoria de respuestas serializadas, invalidada por versión.
+
+    Es segura entre hilos: los endpoints síncronos se ejecutan en el
+    threadpool de FastAPI.
+    """
+
+    def __init__(self, max_entries_per_namespace: int = 256):
+        self._max_entries = max_entries_per_namespace
+        self._versions: Dict[str, int] = {}
+        self._entries: Dict[str, "OrderedDict[Hashable, CachedResponse]"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, namespace: str) -> int:
+        """Versión vigente de un catálogo."""
+        return self._versions.get(namespace, 0)
+
+    def bump(self, *namespaces: str) -> None:
+        """Invalida los catálogos indicados tras una escritura."""
+        with self._lock:
+            for namespace in namespaces:
+                self._versions[namespace] = self._versions.get(namespace, 0) + 1
+                self._entries.pop(namespace, None)
+
+    def get(self, namespace: str, key: Hashable) -> Optional[CachedResponse]:
+        """Retorna la respuesta cacheada si corresponde a la versión vigente."""
+        with self._lock:
+            entries = self._entries.get(namespace)
+            entry = entries.get(key) if entries else None
+            if entry is None or entry.version != self._versions.get(namespace, 0):
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, namespace: str, key: Hashable, version: int, body: bytes) -> CachedResponse:
+        """
+        Guarda una respuesta serializada.
+
+        Args:
+            namespace: Catálogo
+            key: Forma de la consulta (p. ej. ("list", skip, limit))
+            version: Versión del catálogo leída antes de consultar la base de datos
+            body: Respuesta serializada
+
+        Returns:
+            Entrada creada (no se guarda si el catálogo cambió durante la consulta)
+        """
+        # Igual contenido, igual ETag, en cualquier worker y tras reinicios
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        entry = CachedResponse(version, body, f'"{namespace}-{digest}"')
+        with self._lock:
+            if version == self._versions.get(namespace, 0):
+                entries = self._entries.setdefault(namespace, OrderedDict())
+                entries[key] = entry
+                entries.move_to_end(key)
+                if len(entries) > self._max_entries:
+                    entries.popitem(last=False)
+        return entry
+
+    def hit_ratio(self) -> float:
+        """Proporción de aciertos desde el arranque."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Vacía la caché (las versiones se conservan)."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Instancia compartida por el proceso
+response_cache = ResponseCache()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de If-None-Match (RFC 9110), admite listas y '*'."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached_json_response(
+    request: Request,
+    namespace: str,
+    key: Tuple,
+    load: Callable[[], Any],
+    adapter: TypeAdapter,
+    not_found_detail: Optional[str] = None,
+    cache: ResponseCache = response_cache,
+) -> Response:
+    """
+    Responde un catálogo desde la caché, o lo carga, serializa y cachea.
+
+    Args:
+        request: Petición (para If-None-Match)
+        namespace: Catálogo consultado
+        key: Forma de la consulta
+        load: Función que consulta la base de datos
+        adapter: TypeAdapter del esquema de respuesta
+        not_found_detail: Si se indica y load retorna None, responde 404
+        cache: Caché a utilizar
+
+    Returns:
+        Respuesta 200 con el JSON cacheado o 304 si el ETag coincide
+
+    Raises:
+        HTTPException: 404 si el recurso no existe
+    """
+    entry = cache.get(namespace, key)
+    if entry is None:
+        version = cache.version(namespace)
+        content = load()
+        if content is None and not_found_detail is not None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+        entry = cache.put(namespace, key, version, body)
+
+    headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
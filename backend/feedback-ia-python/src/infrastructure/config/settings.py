@@ -3,7 +3,8 @@
 Configuración de la aplicación.
 """
 import os
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from dotenv import load_dotenv
@@ -16,8 +17,17 @@ class DatabaseConfig(BaseSettings):
     
     url: str = Field(default="sqlite:///./feedback.db", env="DATABASE_URL")
     echo_sql: bool = Field(default=False, env="DATABASE_ECHO")
+    # Crear tablas faltantes al arrancar (desactivar en producción y usar init_db)
+    schema_auto_create: bool = Field(default=True, env="SCHEMA_AUTO_CREATE")
     pool_size: int = Field(default=5, env="DATABASE_POOL_SIZE")
     max_overflow: int = Field(default=10, env="DATABASE_MAX_OVERFLOW")
+    # Intervalo mínimo entre comprobaciones de catalog_versions (caché de catálogos)
+    catalog_refresh_ms: int = Field(default=1000, env="CATALOG_REFRESH_MS")
+    # Consultas lentas: umbral en ms (0 = desactivado), plan de ejecución y
+    # tiempo mínimo entre dos planes del mismo lugar del código
+    slow_query_ms: float = Field(default=200.0, env="SLOW_QUERY_MS")
+    slow_query_explain: bool = Field(default=True, env="SLOW_QUERY_EXPLAIN")
+    slow_query_explain_interval_s: float = Field(default=300.0, env="SLOW_QUERY_EXPLAIN_INTERVAL_S")
 
 
 class AuthConfig(BaseSettings):
@@ -35,6 +45,22 @@ class AIConfig(BaseSettings):
     openai_model: str = Field(default="gpt-3.5-turbo", env="OPENAI_MODEL")
     max_tokens: int = Field(default=1000, env="AI_MAX_TOKENS")
     temperature: float = Field(default=0.7, env="AI_TEMPERATURE")
+    # Permite apuntar a un servidor compatible (p. ej. src.interface.cli.ai_stub_server)
+    openai_base_url: Optional[str] = Field(default=None, env="OPENAI_BASE_URL")
+    openai_max_retries: int = Field(default=2, env="OPENAI_MAX_RETRIES")
+    
+    # Proveedor de IA: "openai" o "rule_based" (local, sin red)
+    ai_provider: str = Field(default="openai", env="AI_PROVIDER")
+    # Proveedor por tenant, en JSON: {"tenant-a": "rule_based"}
+    ai_tenant_providers: Dict[str, str] = Field(default_factory=dict, env="AI_TENANT_PROVIDERS")
+    
+    # Plazos: copia de la llamada tras el p95 y margen para el respaldo local
+    ai_hedge_delay_ms: int = Field(default=2500, env="AI_HEDGE_DELAY_MS")
+    ai_fallback_margin_ms: int = Field(default=300, env="AI_FALLBACK_MARGIN_MS")
+    
+    # Transcripción
+    transcription_model: str = Field(default="whisper-1", env="TRANSCRIPTION_MODEL")
+    transcript_cache_dir: Optional[str] = Field(default=None, env="TRANSCRIPT_CACHE_DIR")
 
 
 class AppConfig(BaseSettings):
@@ -45,6 +71,26 @@ class AppConfig(BaseSettings):
     version: str = Field(default="1.0.0", env="APP_VERSION")
     debug: bool = Field(default=False, env="DEBUG")
     cors_origins: list = Field(default=["*"], env="CORS_ORIGINS")
+    # Plazo por defecto de cada petición (se puede reducir con X-Request-Timeout-Ms)
+    request_deadline_ms: int = Field(default=15000, env="REQUEST_DEADLINE_MS")
+    # Avance de análisis por SSE: lectura de analysis_jobs para trabajos de
+    # otro worker y comentario de keep-alive cuando no hay eventos
+    progress_poll_ms: int = Field(default=1000, env="PROGRESS_POLL_MS")
+    sse_heartbeat_ms: int = Field(default=15000, env="SSE_HEARTBEAT_MS")
+    # Un trabajo de otro worker sin avance durante este tiempo se da por
+    # fallido (su worker murió); debe superar la etapa más lenta del análisis
+    analysis_job_stale_ms: int = Field(default=300000, env="ANALYSIS_JOB_STALE_MS")
+    # Métricas Prometheus en /metrics (desactivadas: sin costo en las peticiones)
+    metrics_enabled: bool = Field(default=False, env="METRICS_ENABLED")
+    # Trazas por petición (casos de uso, repositorios, SQL e IA) exportadas a
+    # un archivo JSON por líneas; TRACING_SAMPLE_RATIO de 0.0 a 1.0
+    tracing_enabled: bool = Field(default=False, env="TRACING_ENABLED")
+    tracing_export_path: str = Field(default="./traces/spans.jsonl", env="TRACING_EXPORT_PATH")
+    tracing_sample_ratio: float = Field(default=1.0, env="TRACING_SAMPLE_RATIO")
+    # Duración máxima de un perfilado con GET /api/v1/admin/profile
+    profiler_max_seconds: float = Field(default=60.0, env="PROFILER_MAX_SECONDS")
+    # Elementos máximos por petición en los endpoints de creación por lotes
+    batch_max_items: int = Field(default=500, env="BATCH_MAX_ITEMS")
     
     # Configuraciones de archivo
     max_file_size_mb: int = Field(default=50, env="MAX_FILE_SIZE_MB")
@@ -59,13 +105,28 @@ class AppConfig(BaseSettings):
 
 
 class Settings:
-    """Clase principal de configuración que agrupa todas las configuraciones."""
+    """
+    Clase principal de configuración que agrupa todas las configuraciones.
+    
+    Cada grupo se carga la primera vez que se usa, de modo que importar
+    la aplicación no exige variables que aún no se necesitan (p. ej. API_KEY).
+    """
+    
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        return DatabaseConfig()
     
-    def __init__(self):
-        self.database = DatabaseConfig()
-        self.auth = AuthConfig()
-        self.ai = AIConfig()
-        self.app = AppConfig()
+    @cached_property
+    def auth(self) -> AuthConfig:
+        return AuthConfig()
+    
+    @cached_property
+    def ai(self) -> AIConfig:
+        return AIConfig()
+    
+    @cached_property
+    def app(self) -> AppConfig:
+        return AppConfig()
     
     @property
     def is_development(self) -> bool:
@@ -78,13 +139,17 @@ class Settings:
         return not self.app.debug
 
 
-# Instancia global de configuración
-settings = Settings()
-
-
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """
     Función para obtener las configuraciones.
     Útil para inyección de dependencias.
     """
-    return settings
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Compatibilidad con `from ...settings import settings` sin construirla al importar
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
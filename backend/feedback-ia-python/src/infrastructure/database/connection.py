@@ -7,6 +7,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from ..observability.slow_queries import install_slow_query_log
+
 # URL de la base de datos
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./feedback_db.sqlite")
 
@@ -16,6 +18,9 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
 )
 
+# Registro de consultas lentas (SLOW_QUERY_MS) con su plan de ejecución
+install_slow_query_log(engine)
+
 # Crear la sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,27 @@
+"""
+Modelos SQLAlchemy de la capa de infraestructura.
+Se importan todos para que las relaciones entre modelos se resuelvan.
+"""
+from .tipo_metrica_model import TipoMetricaModel
+from .metrica_model import MetricaModel
+from .parametro_model import ParametroModel
+from .parametro_metrica_model import ParametroMetricaModel
+from .grabacion_model import GrabacionModel
+from .feedback_model import FeedbackModel
+from .transcript_model import TranscriptModel
+from .analisis_grabacion_model import AnalisisGrabacionModel
+from .rescore_job_model import RescoreJobModel
+from .analysis_job_model import AnalysisJobModel
+
+__all__ = [
+    "TipoMetricaModel",
+    "MetricaModel",
+    "ParametroModel",
+    "ParametroMetricaModel",
+    "GrabacionModel",
+    "FeedbackModel",
+    "TranscriptModel",
+    "AnalisisGrabacionModel",
+    "RescoreJobModel",
+    "AnalysisJobModel",
+]
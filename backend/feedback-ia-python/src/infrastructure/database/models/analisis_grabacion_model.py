@@ -0,0 +1,38 @@
+"""
+Modelo SQLAlchemy para los resultados de análisis por grabación.
+"""
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, LargeBinary
+from datetime import datetime
+
+from ..connection import Base
+from ..types import JSONDocument
+
+
+class AnalisisGrabacionModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla analisis_grabacion.
+
+    Guarda el último análisis de cada grabación por analizador ("ia" o
+    "audio"). El resultado completo va en `resultado` (JSONB en PostgreSQL)
+    y, para los análisis de IA, los campos numéricos que usa la puntuación
+    van además en `metricas` como float64 little-endian (ver
+    FeedbackAnalyzerService.ANALYSIS_VECTOR_FIELDS), de modo que re-puntuar
+    muchas grabaciones no requiere decodificar JSON.
+    """
+
+    __tablename__ = "analisis_grabacion"
+
+    grabacion_id = Column(Integer, ForeignKey("grabaciones.id"), primary_key=True)
+    analizador = Column(String(20), primary_key=True, default="ia")
+    version = Column(String(100), nullable=False, default="")
+    hash_entrada = Column(String(64), nullable=False, default="")
+    resultado = Column(JSONDocument(), nullable=False)
+    metricas = Column(LargeBinary, nullable=True)
+    duracion_ms = Column(Float, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AnalisisGrabacionModel(grabacion_id={self.grabacion_id}, analizador={self.analizador}, version={self.version})>"
@@ -0,0 +1,38 @@
+"""
+Modelo SQLAlchemy para los trabajos de análisis en segundo plano.
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, JSON
+from datetime import datetime
+
+from ..connection import Base
+
+
+class AnalysisJobModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla analysis_jobs.
+
+    Guarda el último avance de cada trabajo. Los clientes conectados al
+    worker que ejecuta el trabajo reciben los eventos en memoria; los
+    conectados a otro worker leen esta tabla. `secuencia` aumenta con cada
+    evento y sirve como ID del evento SSE.
+    """
+
+    __tablename__ = "analysis_jobs"
+
+    id = Column(String(32), primary_key=True)
+    tipo = Column(String(50), nullable=False)
+    estado = Column(String(20), nullable=False, default="pendiente")
+    etapa = Column(String(30), nullable=True)
+    progreso = Column(Float, nullable=False, default=0.0)
+    detalle = Column(Text, nullable=True)
+    secuencia = Column(Integer, nullable=False, default=0)
+    resultado = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<AnalysisJobModel(id={self.id}, estado={self.estado}, etapa={self.etapa})>"
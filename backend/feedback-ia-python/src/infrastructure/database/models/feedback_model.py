@@ -2,7 +2,7 @@
 Modelo SQLAlchemy para Feedback.
 Representa la estructura de datos en la capa de infraestructura.
 """
-from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -23,8 +23,8 @@ class FeedbackModel(Base):
     __tablename__ = "feedbacks"
 
     id = Column(Integer, primary_key=True, index=True)
-    grabacion_id = Column(Integer, ForeignKey("grabaciones.id"), nullable=False, index=True)
-    parametro_id = Column(Integer, ForeignKey("parametros.id"), nullable=False, index=True)
+    grabacion_id = Column(Integer, ForeignKey("grabaciones.id"), nullable=False)
+    parametro_id = Column(Integer, ForeignKey("parametros.id"), nullable=False)
     valor = Column(Float, nullable=False)
     comentario = Column(Text, nullable=True)
     es_manual = Column(Boolean, default=False, nullable=False)
@@ -37,9 +37,14 @@ class FeedbackModel(Base):
     grabacion = relationship("GrabacionModel", back_populates="feedbacks")
     parametro = relationship("ParametroModel", back_populates="feedbacks")
     
-    # Índices compuestos para mejorar performance
+    # Índices compuestos para mejorar performance (mismos nombres que las migraciones)
     __table_args__ = (
         # Índice único para evitar feedbacks duplicados
+        Index("uq_feedbacks_grabacion_parametro", "grabacion_id", "parametro_id", unique=True),
+        Index("ix_feedbacks_parametro_id", "parametro_id"),
+        Index("ix_feedbacks_grabacion_es_manual", "grabacion_id", "es_manual"),
+        Index("ix_feedbacks_valor", "valor"),
+        Index("ix_feedbacks_created_at_id", "created_at", "id"),
         {'sqlite_autoincrement': True}  # Para SQLite
     )
     
@@ -0,0 +1,37 @@
+"""
+Modelo SQLAlchemy para Grabacion.
+Representa la estructura de datos en la capa de infraestructura.
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from ..connection import Base
+
+
+class GrabacionModel(Base):
+    """Modelo SQLAlchemy para la tabla grabaciones."""
+
+    __tablename__ = "grabaciones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    nombre_archivo = Column(String(255), nullable=False)
+    ruta_archivo = Column(String(500), nullable=False)
+    duracion = Column(Float, nullable=True)  # en segundos
+    formato = Column(String(20), nullable=True)
+    fecha_grabacion = Column(DateTime, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relaciones
+    feedbacks = relationship("FeedbackModel", back_populates="grabacion")
+
+    # Paginación por cursor (mismo nombre que en las migraciones)
+    __table_args__ = (
+        Index("ix_grabaciones_created_at_id", "created_at", "id"),
+    )
+
+    def __repr__(self):
+        return f"<GrabacionModel(id={self.id}, nombre_archivo={self.nombre_archivo})>"
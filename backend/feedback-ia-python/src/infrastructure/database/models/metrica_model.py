@@ -0,0 +1,31 @@
+"""
+Modelo SQLAlchemy para Metrica.
+Representa la estructura de datos en la capa de infraestructura.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from ..connection import Base
+
+
+class MetricaModel(Base):
+    """Modelo SQLAlchemy para la tabla metricas."""
+
+    __tablename__ = "metricas"
+
+    id = Column(Integer, primary_key=True, index=True)
+    nombre = Column(String(100), nullable=False)
+    descripcion = Column(Text, nullable=True)
+    tipo_metrica_id = Column(Integer, ForeignKey("tipos_metrica.id"))
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relaciones
+    tipo_metrica = relationship("TipoMetricaModel", back_populates="metricas")
+    parametros = relationship("ParametroModel", back_populates="metrica")
+
+    def __repr__(self):
+        return f"<MetricaModel(id={self.id}, nombre={self.nombre})>"
@@ -0,0 +1,33 @@
+"""
+Modelo SQLAlchemy para la configuración de métricas de cada parámetro.
+Representa la estructura de datos en la capa de infraestructura.
+"""
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, UniqueConstraint
+
+from ..connection import Base
+
+
+class ParametroMetricaModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla parametro_metricas.
+
+    Cada fila indica que una métrica del análisis de audio (fuente) aporta al
+    puntaje de un parámetro con un peso y una normalización.
+    """
+
+    __tablename__ = "parametro_metricas"
+
+    id = Column(Integer, primary_key=True, index=True)
+    parametro_id = Column(Integer, ForeignKey("parametros.id"), nullable=False, index=True)
+    clave = Column(String(50), nullable=False)
+    fuente = Column(String(100), nullable=False)
+    peso = Column(Float, nullable=False)
+    normalizacion = Column(String(20), nullable=False, default="lineal")
+    objetivo = Column(Float, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("parametro_id", "clave", name="uq_parametro_metricas_parametro_clave"),
+    )
+
+    def __repr__(self):
+        return f"<ParametroMetricaModel(parametro_id={self.parametro_id}, clave={self.clave}, peso={self.peso})>"
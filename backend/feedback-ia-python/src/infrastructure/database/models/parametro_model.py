@@ -0,0 +1,32 @@
+"""
+Modelo SQLAlchemy para Parametro.
+Representa la estructura de datos en la capa de infraestructura.
+"""
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from ..connection import Base
+
+
+class ParametroModel(Base):
+    """Modelo SQLAlchemy para la tabla parametros."""
+
+    __tablename__ = "parametros"
+
+    id = Column(Integer, primary_key=True, index=True)
+    metrica_id = Column(Integer, ForeignKey("metricas.id"))
+    nombre = Column(String(100), nullable=False)
+    valor = Column(Float, nullable=False)
+    unidad = Column(String(50), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relaciones
+    metrica = relationship("MetricaModel", back_populates="parametros")
+    feedbacks = relationship("FeedbackModel", back_populates="parametro")
+
+    def __repr__(self):
+        return f"<ParametroModel(id={self.id}, nombre={self.nombre}, valor={self.valor})>"
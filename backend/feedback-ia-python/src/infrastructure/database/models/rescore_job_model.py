@@ -0,0 +1,34 @@
+"""
+Modelo SQLAlchemy para los trabajos de re-puntuación de feedbacks.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON
+from datetime import datetime
+
+from ..connection import Base
+
+
+class RescoreJobModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla rescore_jobs.
+
+    Las grabaciones se recorren en orden de ID; `ultimo_grabacion_id` es el
+    checkpoint desde el que se reanuda un trabajo interrumpido.
+    """
+
+    __tablename__ = "rescore_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    estado = Column(String(20), nullable=False, default="pendiente")
+    parametros = Column(JSON, nullable=True)  # None: todos los parámetros
+    ultimo_grabacion_id = Column(Integer, nullable=False, default=0)
+    grabaciones_procesadas = Column(Integer, nullable=False, default=0)
+    feedbacks_actualizados = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<RescoreJobModel(id={self.id}, estado={self.estado}, ultimo_grabacion_id={self.ultimo_grabacion_id})>"
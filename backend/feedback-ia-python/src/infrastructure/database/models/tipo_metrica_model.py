@@ -0,0 +1,29 @@
+"""
+Modelo SQLAlchemy para TipoMetrica.
+Representa la estructura de datos en la capa de infraestructura.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from ..connection import Base
+
+
+class TipoMetricaModel(Base):
+    """Modelo SQLAlchemy para la tabla tipos_metrica."""
+
+    __tablename__ = "tipos_metrica"
+
+    id = Column(Integer, primary_key=True, index=True)
+    nombre = Column(String(100), unique=True, nullable=False)
+    descripcion = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relaciones
+    metricas = relationship("MetricaModel", back_populates="tipo_metrica")
+
+    def __repr__(self):
+        return f"<TipoMetricaModel(id={self.id}, nombre={self.nombre})>"
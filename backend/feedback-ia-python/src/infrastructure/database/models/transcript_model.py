@@ -0,0 +1,43 @@
+"""
+Modelo SQLAlchemy para transcripciones de audio.
+Almacena cada transcripción una sola vez por contenido de audio, idioma y modelo.
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, UniqueConstraint
+from datetime import datetime
+
+from ..connection import Base
+
+
+class TranscriptModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla transcripciones.
+
+    La clave lógica es (hash_audio, idioma, modelo): el hash se calcula
+    sobre el contenido del archivo, de modo que la misma grabación nunca
+    se transcribe dos veces aunque cambie su ruta o nombre.
+
+    El texto se guarda en la columna `texto` o, si está configurado un
+    directorio de caché, en un archivo comprimido referenciado por
+    `ruta_comprimida`.
+    """
+
+    __tablename__ = "transcripciones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    hash_audio = Column(String(64), nullable=False)
+    idioma = Column(String(10), nullable=False)
+    modelo = Column(String(50), nullable=False)
+    texto = Column(Text, nullable=True)
+    ruta_comprimida = Column(String(500), nullable=True)
+    palabras = Column(Integer, nullable=False, default=0)
+    duracion_segundos = Column(Float, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("hash_audio", "idioma", "modelo", name="uq_transcripcion_audio_idioma_modelo"),
+    )
+
+    def __repr__(self):
+        return f"<TranscriptModel(id={self.id}, hash_audio={self.hash_audio[:12]}, idioma={self.idioma}, modelo={self.modelo})>"
@@ -0,0 +1,106 @@
+"""
+Implementación del repositorio de análisis por grabación usando SQLAlchemy.
+"""
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from ....domain.repositories.analisis_grabacion_repository import (
+    ANALIZADOR_IA,
+    AnalisisGrabacionRepositoryInterface
+)
+from ....shared.utils.tracing import trace_public_methods
+from ...observability.metrics import instrument_repository
+from ..models.analisis_grabacion_model import AnalisisGrabacionModel
+from ..models.grabacion_model import GrabacionModel
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Codificación del vector de métricas: float64 little-endian, sin cabecera.
+# numpy y el analizador se importan al codificar o decodificar, no al importar
+# el repositorio (que está en el camino de arranque de la API)
+_VECTOR_DTYPE = "<f8"
+
+
+def encode_metric_vector(resultado: Dict) -> bytes:
+    """Codifica los campos numéricos de un análisis de IA (ver ANALYSIS_VECTOR_FIELDS)."""
+    from ....domain.services.feedback_analyzer import FeedbackAnalyzerService
+
+    return FeedbackAnalyzerService.analysis_vector(resultado).astype(_VECTOR_DTYPE).tobytes()
+
+
+def decode_metric_matrix(blobs: Sequence[bytes]) -> Optional["np.ndarray"]:
+    """
+    Decodifica varios vectores guardados en una matriz.
+
+    Args:
+        blobs: Contenido de la columna metricas, uno por análisis
+
+    Returns:
+        Matriz M×len(ANALYSIS_VECTOR_FIELDS); None si algún vector falta o
+        tiene otra longitud (guardado con otra versión de los campos)
+    """
+    import numpy as np
+
+    from ....domain.services.feedback_analyzer import FeedbackAnalyzerService
+
+    length = len(FeedbackAnalyzerService.ANALYSIS_VECTOR_FIELDS)
+    dtype = np.dtype(_VECTOR_DTYPE)
+    if any(blob is None or len(blob) != length * dtype.itemsize for blob in blobs):
+        return None
+    return np.frombuffer(b"".join(blobs), dtype=dtype).reshape(len(blobs), length)
+
+
+@trace_public_methods
+@instrument_repository
+class SQLAlchemyAnalisisGrabacionRepository(AnalisisGrabacionRepositoryInterface):
+    """Guarda un análisis por grabación y analizador (el más reciente reemplaza al anterior)."""
+
+    def __init__(self, db_session: Session):
+        self._db = db_session
+
+    async def save(
+        self,
+        grabacion_id: int,
+        resultado: Dict,
+        analizador: str = ANALIZADOR_IA,
+        version: str = "",
+        hash_entrada: str = "",
+        duracion_ms: Optional[float] = None
+    ) -> None:
+        """
+        Guarda (o reemplaza) el análisis de una grabación.
+
+        Si la grabación ya no existe (p. ej. se eliminó durante el análisis)
+        no se guarda nada; cualquier otro error de integridad se propaga.
+        """
+        if self._db.get(GrabacionModel, grabacion_id) is None:
+            return
+        self._db.merge(AnalisisGrabacionModel(
+            grabacion_id=grabacion_id,
+            analizador=analizador,
+            version=version,
+            hash_entrada=hash_entrada,
+            resultado=resultado,
+            metricas=encode_metric_vector(resultado) if analizador == ANALIZADOR_IA else None,
+            duracion_ms=duracion_ms
+        ))
+        self._db.commit()
+
+    async def get_by_grabacion_id(
+        self,
+        grabacion_id: int,
+        analizador: str = ANALIZADOR_IA,
+        version: Optional[str] = None,
+        hash_entrada: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Obtiene el último análisis guardado de una grabación."""
+        analisis = self._db.get(AnalisisGrabacionModel, (grabacion_id, analizador))
+        if analisis is None:
+            return None
+        if version is not None and analisis.version != version:
+            return None
+        if hash_entrada is not None and analisis.hash_entrada != hash_entrada:
+            return None
+        return analisis.resultado
@@ -2,20 +2,106 @@
 Implementación concreta del repositorio de Feedback usando SQLAlchemy.
 Esta implementación pertenece a la capa de infraestructura.
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
 
-from ...domain.entities.feedback import Feedback
-from ...domain.repositories.feedback_repository import FeedbackRepositoryInterface
-from ...domain.value_objects.feedback_score import FeedbackScore
-from ...domain.exceptions.validation_exceptions import (
+from ....domain.entities.feedback import Feedback
+from ....domain.rehydration import rehydrator
+from ....domain.repositories.feedback_repository import (
+    FEEDBACK_ROW_FIELDS,
+    FeedbackRepositoryInterface
+)
+from ....domain.value_objects.feedback_score import FeedbackScore
+from ....domain.exceptions.validation_exceptions import (
     FeedbackNotFoundError,
     DuplicateFeedbackError
 )
+from ....shared.utils.tracing import trace_public_methods
+from ...observability.metrics import instrument_repository
 from ..models.feedback_model import FeedbackModel
 
 
+# Consultas construidas una sola vez al importar el módulo. Los valores se pasan
+# como parámetros enlazados, así cada ejecución reutiliza la sentencia compilada
+# del caché de SQLAlchemy en lugar de construir y compilar una Query nueva.
+_GET_BY_ID = select(FeedbackModel).where(FeedbackModel.id == bindparam("feedback_id"))
+
+_GET_ALL = (
+    select(FeedbackModel)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+_GET_BY_GRABACION = select(FeedbackModel).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id")
+)
+
+_GET_BY_PARAMETRO = select(FeedbackModel).where(
+    FeedbackModel.parametro_id == bindparam("parametro_id")
+)
+
+_GET_BY_GRABACION_AND_ORIGEN = select(FeedbackModel).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id"),
+    FeedbackModel.es_manual == bindparam("es_manual")
+)
+
+_GET_BY_GRABACION_AND_PARAMETRO = select(FeedbackModel).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id"),
+    FeedbackModel.parametro_id == bindparam("parametro_id")
+)
+
+_EXISTS_BY_GRABACION_AND_PARAMETRO = select(FeedbackModel.id).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id"),
+    FeedbackModel.parametro_id == bindparam("parametro_id")
+).limit(1)
+
+_GET_LOW_SCORES = (
+    select(FeedbackModel)
+    .where(FeedbackModel.valor <= bindparam("threshold"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+_AVERAGE_BY_GRABACION = select(func.avg(FeedbackModel.valor)).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id")
+)
+
+_COUNT_BY_GRABACION = select(func.count(FeedbackModel.id)).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id")
+)
+
+_GET_BY_SCORE_RANGE = select(FeedbackModel).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id"),
+    FeedbackModel.valor >= bindparam("min_score"),
+    FeedbackModel.valor <= bindparam("max_score")
+)
+
+# Constructores sin validación para filas persistidas, tal como se guardaron (ver domain.rehydration)
+_trusted_feedback = rehydrator(Feedback)
+_trusted_score = rehydrator(FeedbackScore)
+
+# Columnas planas para el camino de solo lectura (sin instancias del ORM)
+_ROW_COLUMNS = [getattr(FeedbackModel, field) for field in FEEDBACK_ROW_FIELDS]
+
+# Índice único que impide dos feedbacks para la misma grabación y parámetro
+_UNIQUE_INDEX = "uq_feedbacks_grabacion_parametro"
+_SQLITE_UNIQUE_MESSAGE = "UNIQUE constraint failed: feedbacks.grabacion_id, feedbacks.parametro_id"
+
+
+def _is_duplicate_feedback(error: IntegrityError) -> bool:
+    """Indica si el error es la violación del índice único (y no, p. ej., una clave foránea)."""
+    # psycopg2 y psycopg exponen la restricción violada; SQLite solo el mensaje
+    constraint = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint is not None:
+        return constraint == _UNIQUE_INDEX
+    message = str(error.orig)
+    return _UNIQUE_INDEX in message or _SQLITE_UNIQUE_MESSAGE in message
+
+
+@trace_public_methods
+@instrument_repository
 class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
     """
     Implementación concreta del repositorio de Feedback usando SQLAlchemy.
@@ -36,22 +122,21 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
     async def create(self, feedback: Feedback) -> Feedback:
         """Crea un nuevo feedback en la base de datos."""
         # Verificar duplicados
-        existing = self._db.query(FeedbackModel).filter(
-            and_(
-                FeedbackModel.grabacion_id == feedback.grabacion_id,
-                FeedbackModel.parametro_id == feedback.parametro_id
-            )
-        ).first()
-        
-        if existing:
+        if await self.exists_by_grabacion_and_parametro(feedback.grabacion_id, feedback.parametro_id):
             raise DuplicateFeedbackError(feedback.grabacion_id, feedback.parametro_id)
         
         # Convertir entidad a modelo SQLAlchemy
         db_feedback = self._entity_to_model(feedback)
         
-        # Persistir
+        # Persistir (el índice único cubre inserciones concurrentes)
         self._db.add(db_feedback)
-        self._db.commit()
+        try:
+            self._db.commit()
+        except IntegrityError as e:
+            self._db.rollback()
+            if _is_duplicate_feedback(e):
+                raise DuplicateFeedbackError(feedback.grabacion_id, feedback.parametro_id)
+            raise
         self._db.refresh(db_feedback)
         
         # Convertir de vuelta a entidad
@@ -59,9 +144,7 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
     
     async def get_by_id(self, feedback_id: int) -> Optional[Feedback]:
         """Obtiene un feedback por su ID."""
-        db_feedback = self._db.query(FeedbackModel).filter(
-            FeedbackModel.id == feedback_id
-        ).first()
+        db_feedback = self._db.scalars(_GET_BY_ID, {"feedback_id": feedback_id}).first()
         
         if db_feedback:
             return self._model_to_entity(db_feedback)
@@ -69,51 +152,39 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Feedback]:
         """Obtiene todos los feedbacks con paginación."""
-        db_feedbacks = self._db.query(FeedbackModel).offset(skip).limit(limit).all()
+        db_feedbacks = self._db.scalars(_GET_ALL, {"skip": skip, "limit": limit}).all()
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
     async def get_by_grabacion_id(self, grabacion_id: int) -> List[Feedback]:
         """Obtiene todos los feedbacks de una grabación."""
-        db_feedbacks = self._db.query(FeedbackModel).filter(
-            FeedbackModel.grabacion_id == grabacion_id
-        ).all()
+        db_feedbacks = self._db.scalars(_GET_BY_GRABACION, {"grabacion_id": grabacion_id}).all()
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
     async def get_by_parametro_id(self, parametro_id: int) -> List[Feedback]:
         """Obtiene todos los feedbacks de un parámetro específico."""
-        db_feedbacks = self._db.query(FeedbackModel).filter(
-            FeedbackModel.parametro_id == parametro_id
-        ).all()
+        db_feedbacks = self._db.scalars(_GET_BY_PARAMETRO, {"parametro_id": parametro_id}).all()
         
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
     async def get_automatic_feedbacks(self, grabacion_id: int) -> List[Feedback]:
         """Obtiene todos los feedbacks automáticos de una grabación."""
-        db_feedbacks = self._db.query(FeedbackModel).filter(
-            and_(
-                FeedbackModel.grabacion_id == grabacion_id,
-                FeedbackModel.es_manual == False
-            )
+        db_feedbacks = self._db.scalars(
+            _GET_BY_GRABACION_AND_ORIGEN, {"grabacion_id": grabacion_id, "es_manual": False}
         ).all()
         
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
     async def get_manual_feedbacks(self, grabacion_id: int) -> List[Feedback]:
         """Obtiene todos los feedbacks manuales de una grabación."""
-        db_feedbacks = self._db.query(FeedbackModel).filter(
-            and_(
-                FeedbackModel.grabacion_id == grabacion_id,
-                FeedbackModel.es_manual == True
-            )
+        db_feedbacks = self._db.scalars(
+            _GET_BY_GRABACION_AND_ORIGEN, {"grabacion_id": grabacion_id, "es_manual": True}
         ).all()
         
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
     async def update(self, feedback: Feedback) -> Feedback:
         """Actualiza un feedback existente."""
-        db_feedback = self._db.query(FeedbackModel).filter(
-            FeedbackModel.id == feedback.id
-        ).first()
+        db_feedback = self._db.get(FeedbackModel, feedback.id)
         
         if not db_feedback:
             raise FeedbackNotFoundError(feedback.id)
@@ -131,9 +202,7 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
     
     async def delete(self, feedback_id: int) -> bool:
         """Elimina un feedback por su ID."""
-        db_feedback = self._db.query(FeedbackModel).filter(
-            FeedbackModel.id == feedback_id
-        ).first()
+        db_feedback = self._db.get(FeedbackModel, feedback_id)
         
         if db_feedback:
             self._db.delete(db_feedback)
@@ -147,13 +216,10 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
         parametro_id: int
     ) -> bool:
         """Verifica si existe un feedback para grabación y parámetro específicos."""
-        exists = self._db.query(FeedbackModel).filter(
-            and_(
-                FeedbackModel.grabacion_id == grabacion_id,
-                FeedbackModel.parametro_id == parametro_id
-            )
+        return self._db.execute(
+            _EXISTS_BY_GRABACION_AND_PARAMETRO,
+            {"grabacion_id": grabacion_id, "parametro_id": parametro_id}
         ).first() is not None
-        return exists
     
     async def get_by_grabacion_and_parametro(
         self, 
@@ -161,11 +227,9 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
         parametro_id: int
     ) -> Optional[Feedback]:
         """Obtiene feedback específico por grabación y parámetro."""
-        db_feedback = self._db.query(FeedbackModel).filter(
-            and_(
-                FeedbackModel.grabacion_id == grabacion_id,
-                FeedbackModel.parametro_id == parametro_id
-            )
+        db_feedback = self._db.scalars(
+            _GET_BY_GRABACION_AND_PARAMETRO,
+            {"grabacion_id": grabacion_id, "parametro_id": parametro_id}
         ).first()
         
         if db_feedback:
@@ -179,25 +243,21 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
         limit: int = 100
     ) -> List[Feedback]:
         """Obtiene feedbacks con puntajes bajos."""
-        db_feedbacks = self._db.query(FeedbackModel).filter(
-            FeedbackModel.valor <= threshold
-        ).offset(skip).limit(limit).all()
+        db_feedbacks = self._db.scalars(
+            _GET_LOW_SCORES, {"threshold": threshold, "skip": skip, "limit": limit}
+        ).all()
         
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
     async def get_average_score_by_grabacion(self, grabacion_id: int) -> Optional[float]:
         """Calcula el puntaje promedio de una grabación."""
-        result = self._db.query(func.avg(FeedbackModel.valor)).filter(
-            FeedbackModel.grabacion_id == grabacion_id
-        ).scalar()
+        result = self._db.scalar(_AVERAGE_BY_GRABACION, {"grabacion_id": grabacion_id})
         
         return float(result) if result is not None else None
     
     async def count_by_grabacion(self, grabacion_id: int) -> int:
         """Cuenta el número de feedbacks de una grabación."""
-        return self._db.query(FeedbackModel).filter(
-            FeedbackModel.grabacion_id == grabacion_id
-        ).count()
+        return self._db.scalar(_COUNT_BY_GRABACION, {"grabacion_id": grabacion_id})
     
     async def get_feedbacks_by_score_range(
         self, 
@@ -206,16 +266,47 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
         max_score: float
     ) -> List[Feedback]:
         """Obtiene feedbacks dentro de un rango de scores específico."""
-        db_feedbacks = self._db.query(FeedbackModel).filter(
-            and_(
-                FeedbackModel.grabacion_id == grabacion_id,
-                FeedbackModel.valor >= min_score,
-                FeedbackModel.valor <= max_score
-            )
+        db_feedbacks = self._db.scalars(
+            _GET_BY_SCORE_RANGE,
+            {"grabacion_id": grabacion_id, "min_score": min_score, "max_score": max_score}
         ).all()
         
         return [self._model_to_entity(db_feedback) for db_feedback in db_feedbacks]
     
+    async def list_rows(
+        self,
+        grabacion_id: Optional[int] = None,
+        parametro_id: Optional[int] = None,
+        es_manual: Optional[bool] = None,
+        min_valor: Optional[float] = None,
+        max_valor: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Sequence[Tuple]:
+        """Lista feedbacks como filas planas, sin crear modelos ni entidades."""
+        # Cada combinación de filtros es una forma de consulta distinta y queda
+        # en el caché de compilación; los valores van como parámetros enlazados.
+        stmt = select(*_ROW_COLUMNS)
+        params = {"skip": skip, "limit": limit}
+        if grabacion_id is not None:
+            stmt = stmt.where(FeedbackModel.grabacion_id == bindparam("grabacion_id"))
+            params["grabacion_id"] = grabacion_id
+        if parametro_id is not None:
+            stmt = stmt.where(FeedbackModel.parametro_id == bindparam("parametro_id"))
+            params["parametro_id"] = parametro_id
+        if es_manual is not None:
+            stmt = stmt.where(FeedbackModel.es_manual == bindparam("es_manual"))
+            params["es_manual"] = es_manual
+        if min_valor is not None:
+            stmt = stmt.where(FeedbackModel.valor >= bindparam("min_valor"))
+            params["min_valor"] = min_valor
+        if max_valor is not None:
+            stmt = stmt.where(FeedbackModel.valor <= bindparam("max_valor"))
+            params["max_valor"] = max_valor
+        stmt = stmt.order_by(FeedbackModel.id).offset(bindparam("skip")).limit(bindparam("limit"))
+        
+        return self._db.execute(stmt, params).all()
+    
     def _entity_to_model(self, feedback: Feedback) -> FeedbackModel:
         """Convierte una entidad de dominio a modelo SQLAlchemy."""
         return FeedbackModel(
@@ -230,12 +321,17 @@ class SQLAlchemyFeedbackRepository(FeedbackRepositoryInterface):
         )
     
     def _model_to_entity(self, db_feedback: FeedbackModel) -> Feedback:
-        """Convierte un modelo SQLAlchemy a entidad de dominio."""
-        return Feedback(
+        """
+        Convierte un modelo SQLAlchemy a entidad de dominio.
+        
+        La entidad se reconstruye sin validar; las filas de la API heredada
+        conservan sus valores originales (ver domain.rehydration).
+        """
+        return _trusted_feedback(
             id=db_feedback.id,
             grabacion_id=db_feedback.grabacion_id,
             parametro_id=db_feedback.parametro_id,
-            score=FeedbackScore(db_feedback.valor),
+            score=_trusted_score(db_feedback.valor),
             comentario=db_feedback.comentario,
             es_manual=db_feedback.es_manual,
             created_at=db_feedback.created_at,
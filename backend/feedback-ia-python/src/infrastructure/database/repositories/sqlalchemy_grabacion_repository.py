@@ -0,0 +1,206 @@
+"""
+Implementación concreta del repositorio de Grabacion usando SQLAlchemy.
+Esta implementación pertenece a la capa de infraestructura.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session
+
+from ....domain.entities.grabacion import Grabacion
+from ....domain.exceptions.validation_exceptions import GrabacionNotFoundError
+from ....domain.rehydration import rehydrator
+from ....domain.repositories.grabacion_repository import GrabacionRepositoryInterface
+from ....domain.value_objects.archivo_audio import ArchivoAudio
+from ....shared.utils.tracing import trace_public_methods
+from ...observability.metrics import instrument_repository
+from ..models.feedback_model import FeedbackModel
+from ..models.grabacion_model import GrabacionModel
+
+
+_GET_BY_ID = select(GrabacionModel).where(GrabacionModel.id == bindparam("grabacion_id"))
+
+_GET_BY_NOMBRE = select(GrabacionModel).where(GrabacionModel.nombre_archivo == bindparam("nombre_archivo"))
+
+_GET_BY_RUTA = select(GrabacionModel).where(GrabacionModel.ruta_archivo == bindparam("ruta_archivo"))
+
+_HAS_FEEDBACKS = select(FeedbackModel.id).where(
+    FeedbackModel.grabacion_id == bindparam("grabacion_id")
+).limit(1)
+
+# Constructores sin validación para filas persistidas, tal como se guardaron (ver domain.rehydration)
+_trusted_grabacion = rehydrator(Grabacion)
+_trusted_archivo = rehydrator(ArchivoAudio)
+
+
+@trace_public_methods
+@instrument_repository
+class SQLAlchemyGrabacionRepository(GrabacionRepositoryInterface):
+    """
+    Implementación concreta del repositorio de Grabacion usando SQLAlchemy.
+
+    Convierte entre la entidad Grabacion (con su ArchivoAudio) y las
+    columnas planas de la tabla grabaciones.
+    """
+
+    def __init__(self, db_session: Session):
+        self._db = db_session
+
+    async def create(self, grabacion: Grabacion) -> Grabacion:
+        """Crea una nueva grabación en la base de datos."""
+        db_grabacion = self._entity_to_model(grabacion)
+        self._db.add(db_grabacion)
+        self._db.commit()
+        self._db.refresh(db_grabacion)
+        return self._model_to_entity(db_grabacion)
+
+    async def get_by_id(self, id: int) -> Optional[Grabacion]:
+        """Obtiene una grabación por su ID."""
+        return self._first(_GET_BY_ID, {"grabacion_id": id})
+
+    async def get_by_nombre_archivo(self, nombre_archivo: str) -> Optional[Grabacion]:
+        """Obtiene una grabación por su nombre de archivo."""
+        return self._first(_GET_BY_NOMBRE, {"nombre_archivo": nombre_archivo})
+
+    async def get_by_ruta_archivo(self, ruta_archivo: str) -> Optional[Grabacion]:
+        """Obtiene una grabación por su ruta de archivo."""
+        return self._first(_GET_BY_RUTA, {"ruta_archivo": ruta_archivo})
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Grabacion]:
+        """Obtiene todas las grabaciones con paginación."""
+        return self._list(select(GrabacionModel), skip, limit)
+
+    async def get_by_formato(self, formato: str, skip: int = 0, limit: int = 100) -> List[Grabacion]:
+        """Obtiene grabaciones por formato de archivo."""
+        return self._list(select(GrabacionModel).where(GrabacionModel.formato == formato), skip, limit)
+
+    async def get_by_fecha_range(
+        self,
+        fecha_inicio: datetime,
+        fecha_fin: datetime,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Grabacion]:
+        """Obtiene grabaciones dentro de un rango de fechas."""
+        stmt = select(GrabacionModel).where(GrabacionModel.fecha_grabacion.between(fecha_inicio, fecha_fin))
+        return self._list(stmt, skip, limit)
+
+    async def get_by_duracion_range(
+        self,
+        duracion_min: float,
+        duracion_max: float,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Grabacion]:
+        """Obtiene grabaciones dentro de un rango de duración."""
+        stmt = select(GrabacionModel).where(GrabacionModel.duracion.between(duracion_min, duracion_max))
+        return self._list(stmt, skip, limit)
+
+    async def update(self, grabacion: Grabacion) -> Grabacion:
+        """Actualiza una grabación existente."""
+        db_grabacion = self._db.get(GrabacionModel, grabacion.id)
+        if not db_grabacion:
+            raise GrabacionNotFoundError(grabacion.id)
+
+        archivo = grabacion.archivo_audio
+        db_grabacion.nombre_archivo = archivo.nombre_archivo
+        db_grabacion.ruta_archivo = archivo.ruta_archivo
+        db_grabacion.formato = archivo.formato
+        db_grabacion.duracion = archivo.duracion
+        db_grabacion.fecha_grabacion = grabacion.fecha_grabacion
+
+        self._db.commit()
+        self._db.refresh(db_grabacion)
+        return self._model_to_entity(db_grabacion)
+
+    async def delete(self, id: int) -> bool:
+        """Elimina una grabación por su ID."""
+        db_grabacion = self._db.get(GrabacionModel, id)
+        if db_grabacion:
+            self._db.delete(db_grabacion)
+            self._db.commit()
+            return True
+        return False
+
+    async def exists_by_ruta_archivo(self, ruta_archivo: str, exclude_id: Optional[int] = None) -> bool:
+        """Verifica si existe una grabación con la ruta especificada."""
+        stmt = select(GrabacionModel.id).where(GrabacionModel.ruta_archivo == ruta_archivo)
+        if exclude_id is not None:
+            stmt = stmt.where(GrabacionModel.id != exclude_id)
+        return self._db.execute(stmt.limit(1)).first() is not None
+
+    async def count(self) -> int:
+        """Cuenta el total de grabaciones."""
+        return self._db.scalar(select(func.count(GrabacionModel.id)))
+
+    async def count_by_formato(self, formato: str) -> int:
+        """Cuenta las grabaciones por formato."""
+        return self._db.scalar(select(func.count(GrabacionModel.id)).where(GrabacionModel.formato == formato))
+
+    async def has_feedbacks(self, id: int) -> bool:
+        """Verifica si la grabación tiene feedbacks asociados."""
+        return self._db.execute(_HAS_FEEDBACKS, {"grabacion_id": id}).first() is not None
+
+    async def search_by_nombre(self, nombre_parcial: str, skip: int = 0, limit: int = 100) -> List[Grabacion]:
+        """Busca grabaciones por nombre parcial."""
+        stmt = select(GrabacionModel).where(GrabacionModel.nombre_archivo.ilike(f"%{nombre_parcial}%"))
+        return self._list(stmt, skip, limit)
+
+    async def get_recent_grabaciones(self, days: int = 30, skip: int = 0, limit: int = 100) -> List[Grabacion]:
+        """Obtiene grabaciones creadas en los últimos días."""
+        desde = datetime.utcnow() - timedelta(days=days)
+        stmt = select(GrabacionModel).where(GrabacionModel.created_at >= desde).order_by(
+            GrabacionModel.created_at.desc()
+        )
+        return self._list(stmt, skip, limit)
+
+    async def get_grabaciones_sin_fecha(self, skip: int = 0, limit: int = 100) -> List[Grabacion]:
+        """Obtiene grabaciones sin fecha de grabación especificada."""
+        return self._list(select(GrabacionModel).where(GrabacionModel.fecha_grabacion.is_(None)), skip, limit)
+
+    async def get_total_duracion(self) -> float:
+        """Calcula la duración total de todas las grabaciones."""
+        return float(self._db.scalar(select(func.coalesce(func.sum(GrabacionModel.duracion), 0.0))))
+
+    def _first(self, stmt, params) -> Optional[Grabacion]:
+        db_grabacion = self._db.scalars(stmt, params).first()
+        return self._model_to_entity(db_grabacion) if db_grabacion else None
+
+    def _list(self, stmt, skip: int, limit: int) -> List[Grabacion]:
+        db_grabaciones = self._db.scalars(stmt.offset(skip).limit(limit)).all()
+        return [self._model_to_entity(db_grabacion) for db_grabacion in db_grabaciones]
+
+    def _entity_to_model(self, grabacion: Grabacion) -> GrabacionModel:
+        """Convierte una entidad de dominio a modelo SQLAlchemy."""
+        archivo = grabacion.archivo_audio
+        return GrabacionModel(
+            id=grabacion.id,
+            nombre_archivo=archivo.nombre_archivo,
+            ruta_archivo=archivo.ruta_archivo,
+            formato=archivo.formato,
+            duracion=archivo.duracion,
+            fecha_grabacion=grabacion.fecha_grabacion,
+            created_at=grabacion.created_at,
+            updated_at=grabacion.updated_at
+        )
+
+    def _model_to_entity(self, db_grabacion: GrabacionModel) -> Grabacion:
+        """
+        Convierte un modelo SQLAlchemy a entidad de dominio.
+
+        La entidad se reconstruye sin validar; las filas de la API heredada
+        conservan sus valores originales (ver domain.rehydration).
+        """
+        return _trusted_grabacion(
+            id=db_grabacion.id,
+            archivo_audio=_trusted_archivo(
+                nombre_archivo=db_grabacion.nombre_archivo,
+                ruta_archivo=db_grabacion.ruta_archivo,
+                formato=db_grabacion.formato,
+                duracion=db_grabacion.duracion
+            ),
+            fecha_grabacion=db_grabacion.fecha_grabacion,
+            created_at=db_grabacion.created_at,
+            updated_at=db_grabacion.updated_at
+        )
@@ -0,0 +1,25 @@
+"""
+Tipos de columna compartidos por los modelos SQLAlchemy.
+"""
+from sqlalchemy import JSON
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONDocument(TypeDecorator):
+    """
+    Documento JSON: JSONB en PostgreSQL, JSON en el resto de motores.
+
+    Equivale a JSON().with_variant(JSONB(), "postgresql"), pero el dialecto de
+    PostgreSQL solo se importa al usar la columna con él, no al importar los
+    modelos (está en el camino de arranque de la API).
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import JSONB
+
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
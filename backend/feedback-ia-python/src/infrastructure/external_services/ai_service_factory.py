@@ -0,0 +1,79 @@
+"""
+Selección del proveedor de IA por petición o por tenant.
+"""
+from typing import Callable, Dict, Optional
+
+from ...application.interfaces.ai_service_interface import AIServiceInterface
+from ...domain.exceptions.validation_exceptions import AIServiceError
+from ..config.settings import AIConfig
+
+
+def _create_openai_service() -> AIServiceInterface:
+    # Import diferido: el cliente de OpenAI solo se carga si se usa
+    from .openai_service import OpenAIService
+    return OpenAIService()
+
+
+def _create_rule_based_service() -> AIServiceInterface:
+    from .rule_based_ai_service import RuleBasedAIService
+    return RuleBasedAIService()
+
+
+class AIServiceFactory:
+    """
+    Resuelve la implementación de AIServiceInterface a usar.
+
+    Orden de prioridad:
+    1. Proveedor pedido explícitamente (header X-AI-Provider)
+    2. Proveedor configurado para el tenant (AI_TENANT_PROVIDERS)
+    3. Proveedor por defecto (AI_PROVIDER)
+
+    Las instancias se reutilizan entre peticiones.
+    """
+
+    PROVIDERS: Dict[str, Callable[[], AIServiceInterface]] = {
+        "openai": _create_openai_service,
+        "rule_based": _create_rule_based_service,
+    }
+
+    def __init__(self, config: Optional[AIConfig] = None):
+        self.config = config or AIConfig()
+        self._instances: Dict[str, AIServiceInterface] = {}
+
+    def resolve_provider(self, provider: Optional[str] = None, tenant_id: Optional[str] = None) -> str:
+        """
+        Determina el nombre del proveedor.
+
+        Args:
+            provider: Proveedor pedido en la petición
+            tenant_id: Identificador del tenant
+
+        Returns:
+            Nombre del proveedor
+
+        Raises:
+            AIServiceError: Si el proveedor no existe
+        """
+        name = provider or self.config.ai_tenant_providers.get(tenant_id or "") or self.config.ai_provider
+        name = name.strip().lower()
+        if name not in self.PROVIDERS:
+            raise AIServiceError(
+                f"Proveedor de IA no soportado: {name}. Opciones: {', '.join(self.PROVIDERS)}"
+            )
+        return name
+
+    def get_service(self, provider: Optional[str] = None, tenant_id: Optional[str] = None) -> AIServiceInterface:
+        """
+        Obtiene el servicio de IA para la petición.
+
+        Args:
+            provider: Proveedor pedido en la petición
+            tenant_id: Identificador del tenant
+
+        Returns:
+            Implementación de AIServiceInterface
+        """
+        name = self.resolve_provider(provider, tenant_id)
+        if name not in self._instances:
+            self._instances[name] = self.PROVIDERS[name]()
+        return self._instances[name]
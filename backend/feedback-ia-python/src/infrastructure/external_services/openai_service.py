@@ -4,13 +4,29 @@ Esta implementación pertenece a la capa de infraestructura.
 """
 import asyncio
 import json
-from typing import Dict, List
-import openai
+import re
+from typing import Dict, List, Optional
 from ...application.interfaces.ai_service_interface import AIServiceInterface
 from ...domain.exceptions.validation_exceptions import AIServiceError
-from ..config.ai_config import AIConfig
+from ...shared.utils.deadline import hedged_call, remaining_time
+from ...shared.utils.token_usage import record_token_usage
+from ...shared.utils.tracing import set_span_attributes, span, trace_public_methods
+from ..config.settings import AIConfig
+from ..observability.metrics import observe_llm_call, record_llm_tokens
+from .prompt_builder import (
+    PROMPT_TOKEN_BUDGETS,
+    compact_json,
+    estimate_messages_tokens,
+    estimate_tokens,
+    fit_to_budget,
+    select_metrics,
+    select_metrics_for_areas
+)
+from .rule_based_ai_service import RuleBasedAIService
+from .transcript_store import TranscriptStore
 
 
+@trace_public_methods
 class OpenAIService(AIServiceInterface):
     """
     Implementación del servicio de IA usando OpenAI API.
@@ -23,12 +39,38 @@ class OpenAIService(AIServiceInterface):
     - Procesar archivos de audio
     - Generar análisis y métricas
     - Manejar errores de servicios externos
+    - Reutilizar transcripciones ya generadas (una por grabación)
     """
     
-    def __init__(self):
+    # Muletillas contadas sobre la transcripción
+    FILLER_WORDS = {"eh", "este", "pues", "bueno", "o sea", "digamos", "em", "mmm", "ehh"}
+    
+    # Aspectos de estructura que el modelo califica de 0 a 1
+    STRUCTURE_FIELDS = ("introduction_quality", "content_organization", "transition_quality", "conclusion_quality")
+    
+    # Estructura supuesta cuando no hay transcripción o la IA no responde
+    DEFAULT_STRUCTURE = {
+        "clear_opening": 0.78,
+        "logical_flow": 0.71,
+        "strong_closing": 0.69
+    }
+    
+    def __init__(self, transcript_store: Optional[TranscriptStore] = None):
+        # Import diferido: el SDK de OpenAI tarda en cargar y solo se necesita aquí
+        import openai
+        
         self.config = AIConfig()
         openai.api_key = self.config.openai_api_key
-        self.client = openai.AsyncOpenAI(api_key=self.config.openai_api_key)
+        self.client = openai.AsyncOpenAI(
+            api_key=self.config.openai_api_key,
+            base_url=self.config.openai_base_url,
+            max_retries=self.config.openai_max_retries
+        )
+        self._transcripts = transcript_store or TranscriptStore(
+            compressed_dir=self.config.transcript_cache_dir
+        )
+        # Respaldo local cuando la IA no responde
+        self._fallback = RuleBasedAIService()
     
     async def analyze_audio_basic(
         self, 
@@ -117,7 +159,8 @@ class OpenAIService(AIServiceInterface):
             context = self._prepare_comment_context(analysis_results, parametro_type, score)
             
             # Usar OpenAI para generar comentario personalizado
-            response = await self.client.chat.completions.create(
+            response = await self._chat_completion(
+                "comment",
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -129,7 +172,7 @@ class OpenAIService(AIServiceInterface):
                         "role": "user",
                         "content": f"Basándote en este análisis: {context}, "
                                  f"genera un comentario específico y constructivo para el parámetro '{parametro_type}' "
-                                 f"con puntaje {score}. Mantén el comentario entre 50-150 palabras."
+                                 f"con puntaje {score:.1f}. Mantén el comentario entre 50-150 palabras."
                     }
                 ],
                 max_tokens=200,
@@ -139,8 +182,8 @@ class OpenAIService(AIServiceInterface):
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            # Fallback a comentario genérico si falla la IA
-            return self._generate_fallback_comment(parametro_type, score)
+            # Fallback a comentario basado en reglas si falla la IA
+            return await self._fallback.generate_feedback_comment(analysis_results, parametro_type, score)
     
     async def extract_speech_metrics(self, audio_file_path: str) -> Dict:
         """
@@ -202,33 +245,47 @@ class OpenAIService(AIServiceInterface):
     ) -> Dict:
         """
         Transcribe el audio a texto.
+        
+        La transcripción se guarda por hash de contenido, idioma y modelo,
+        por lo que cada grabación se envía a Whisper una sola vez.
         """
         try:
-            # En implementación real usarías Whisper de OpenAI
-            with open(audio_file_path, "rb") as audio_file:
-                transcript = await self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=language
-                )
-            
-            return {
-                "text": transcript.text,
-                "language": language,
-                "confidence": 0.95,
-                "word_count": len(transcript.text.split()),
-                "processing_time_ms": 2000
-            }
+            return await self._transcripts.get_or_transcribe(
+                audio_file_path,
+                language,
+                self.config.transcription_model,
+                lambda: self._transcribe_with_whisper(audio_file_path, language)
+            )
             
         except Exception as e:
             raise AIServiceError(f"Error transcribiendo audio: {str(e)}")
     
+    async def _transcribe_with_whisper(self, audio_file_path: str, language: str) -> Dict:
+        """Realiza la transcripción real con Whisper."""
+        with open(audio_file_path, "rb") as audio_file, \
+                span("llm.transcription", **{"llm.model": self.config.transcription_model}), \
+                observe_llm_call("transcription"):
+            transcript = await self.client.audio.transcriptions.create(
+                model=self.config.transcription_model,
+                file=audio_file,
+                language=language
+            )
+        
+        return {
+            "text": transcript.text,
+            "language": language,
+            "confidence": 0.95,
+            "word_count": len(transcript.text.split()),
+            "processing_time_ms": 2000
+        }
+    
     async def analyze_presentation_structure(self, transcript: str) -> Dict:
         """
         Analiza la estructura de una presentación.
         """
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._chat_completion(
+                "structure",
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -237,20 +294,16 @@ class OpenAIService(AIServiceInterface):
                     },
                     {
                         "role": "user",
-                        "content": f"Analiza la estructura de esta presentación y califica del 0 al 1: {transcript[:1000]}..."
+                        "content": (
+                            "Califica del 0 al 1 la estructura de esta presentación. Responde solo un "
+                            f"objeto JSON con las claves {', '.join(self.STRUCTURE_FIELDS)}: {transcript}"
+                        )
                     }
                 ],
                 max_tokens=300
             )
             
-            # En implementación real, parsearías la respuesta para extraer métricas
-            return {
-                "introduction_quality": 0.75,
-                "conclusion_quality": 0.68,
-                "content_organization": 0.82,
-                "transition_quality": 0.71,
-                "structure_score": 0.74
-            }
+            return self._parse_structure(response.choices[0].message.content)
             
         except Exception as e:
             raise AIServiceError(f"Error analizando estructura: {str(e)}")
@@ -266,7 +319,8 @@ class OpenAIService(AIServiceInterface):
         try:
             suggestions_prompt = self._build_suggestions_prompt(analysis_results, weak_areas)
             
-            response = await self.client.chat.completions.create(
+            response = await self._chat_completion(
+                "suggestions",
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -288,7 +342,7 @@ class OpenAIService(AIServiceInterface):
             return suggestions[:5]  # Máximo 5 sugerencias
             
         except Exception as e:
-            return self._generate_fallback_suggestions(weak_areas)
+            return self._fallback.fallback_suggestions(weak_areas)
     
     async def compare_with_benchmarks(
         self,
@@ -299,28 +353,93 @@ class OpenAIService(AIServiceInterface):
         Compara con benchmarks establecidos.
         """
         try:
-            # Benchmarks predefinidos por tipo de presentación
-            benchmarks = self._get_benchmarks(presentation_type)
-            
-            comparison = {}
-            audio_metrics = analysis_results.get("audio_metrics", {})
-            
-            for metric, benchmark_value in benchmarks.items():
-                actual_value = audio_metrics.get(metric, 0)
-                comparison[metric] = {
-                    "actual": actual_value,
-                    "benchmark": benchmark_value,
-                    "performance": "above" if actual_value > benchmark_value else "below",
-                    "difference": actual_value - benchmark_value
-                }
-            
-            return comparison
-            
+            return await self._fallback.compare_with_benchmarks(analysis_results, presentation_type)
         except Exception as e:
             raise AIServiceError(f"Error comparando con benchmarks: {str(e)}")
     
     # Métodos auxiliares privados
     
+    async def _chat_completion(self, call_type: str, **request):
+        """
+        Llama a chat completions respetando el plazo y el presupuesto de tokens.
+        
+        El último mensaje se recorta si el prompt supera el presupuesto del
+        tipo de llamada, y el uso de tokens se registra por petición.
+        
+        Si queda menos tiempo que el margen configurado se lanza AIServiceError
+        de inmediato, para que el llamador use el respaldo local. Si la llamada
+        supera el retardo de cobertura (p95) se lanza una copia y se usa la
+        primera respuesta; la copia cancelada también se contabiliza.
+        """
+        margin = self.config.ai_fallback_margin_ms / 1000
+        remaining = remaining_time()
+        if remaining is not None and remaining <= margin:
+            raise AIServiceError("Plazo de la petición agotado, se usa el respaldo local")
+        
+        request["messages"] = self._fit_messages_to_budget(
+            call_type, request["messages"], request.get("model")
+        )
+        
+        timeout = remaining - margin if remaining is not None else None
+        # Intentos lanzados y fallidos: los que no fallaron se facturan
+        # aunque la cobertura cancele el que llegó segundo
+        attempts = [0, 0]
+        
+        async def attempt():
+            attempts[0] += 1
+            try:
+                return await self.client.chat.completions.create(**request)
+            except Exception:
+                attempts[1] += 1
+                raise
+        
+        with span("llm.chat_completion", **{"llm.call_type": call_type, "llm.model": request.get("model", "")}):
+            try:
+                with observe_llm_call(call_type):
+                    response = await hedged_call(
+                        attempt,
+                        hedge_after=self.config.ai_hedge_delay_ms / 1000,
+                        timeout=timeout
+                    )
+            except asyncio.TimeoutError:
+                raise AIServiceError("La IA no respondió dentro del plazo de la petición")
+            
+            self._record_usage(call_type, request, response, duplicates=attempts[0] - attempts[1] - 1)
+        return response
+    
+    def _fit_messages_to_budget(self, call_type: str, messages: List[Dict], model: Optional[str]) -> List[Dict]:
+        """Recorta el último mensaje para respetar el presupuesto de tokens del prompt."""
+        budget = PROMPT_TOKEN_BUDGETS.get(call_type)
+        if budget is None or estimate_messages_tokens(messages, model) <= budget:
+            return messages
+        
+        fixed_tokens = estimate_messages_tokens(messages[:-1], model) + 4
+        last = messages[-1]
+        return [
+            *messages[:-1],
+            {**last, "content": fit_to_budget(last["content"], budget - fixed_tokens, model)}
+        ]
+    
+    def _record_usage(self, call_type: str, request: Dict, response, duplicates: int = 0) -> None:
+        """
+        Registra los tokens reportados por la API (o una estimación).
+        
+        Cada copia cancelada por la cobertura se registra como una llamada más
+        con los tokens de la respuesta ganadora (el proveedor la factura, pero
+        su uso real no se conoce). Los reintentos internos del SDK
+        (OPENAI_MAX_RETRIES) no son visibles aquí: el total es una cota inferior.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            prompt_tokens, completion_tokens = usage.prompt_tokens, usage.completion_tokens
+        else:
+            prompt_tokens = estimate_messages_tokens(request["messages"], request.get("model"))
+            completion_tokens = estimate_tokens(response.choices[0].message.content or "")
+        for _ in range(1 + max(0, duplicates)):
+            record_token_usage(call_type, prompt_tokens, completion_tokens)
+            record_llm_tokens(call_type, prompt_tokens, completion_tokens)
+        set_span_attributes(**{"llm.prompt_tokens": prompt_tokens, "llm.completion_tokens": completion_tokens})
+    
     async def _calculate_basic_clarity(self, audio_data: Dict) -> float:
         """Calcula puntaje básico de claridad."""
         # Simulación - en implementación real analizaría el audio
@@ -358,70 +477,85 @@ class OpenAIService(AIServiceInterface):
     
     async def _analyze_presentation_structure(self, audio_data: Dict) -> Dict:
         """Analiza estructura de presentación desde audio."""
+        transcript = await self._get_transcript_text(audio_data)
+        if not transcript:
+            return dict(self.DEFAULT_STRUCTURE)
+        
+        try:
+            structure = await self.analyze_presentation_structure(transcript)
+        except AIServiceError:
+            # Sin clave, sin plazo o con la IA saturada se usan los valores supuestos
+            return dict(self.DEFAULT_STRUCTURE)
         return {
-            "clear_opening": 0.78,
-            "logical_flow": 0.71,
-            "strong_closing": 0.69
+            "clear_opening": structure["introduction_quality"],
+            "logical_flow": structure["content_organization"],
+            "strong_closing": structure["conclusion_quality"]
         }
     
+    def _parse_structure(self, content: Optional[str]) -> Dict:
+        """
+        Extrae las calificaciones de estructura de la respuesta del modelo.
+        
+        Raises:
+            ValueError, KeyError: Si la respuesta no trae un objeto JSON con todas las calificaciones
+        """
+        text = content or ""
+        data = json.loads(text[text.find("{"):text.rfind("}") + 1])
+        if not isinstance(data, dict):
+            raise ValueError("La respuesta de estructura no es un objeto JSON")
+        
+        scores = {field: min(1.0, max(0.0, float(data[field]))) for field in self.STRUCTURE_FIELDS}
+        scores["structure_score"] = round(sum(scores.values()) / len(scores), 2)
+        return scores
+    
     async def _estimate_engagement_level(self, audio_data: Dict) -> float:
         """Estima nivel de engagement."""
         return 0.74
     
     async def _count_filler_words(self, audio_data: Dict) -> int:
         """Cuenta palabras de relleno."""
-        return audio_data.get("filler_words", 8)
+        transcript = await self._get_transcript_text(audio_data)
+        if transcript is None:
+            return audio_data.get("filler_words", 8)
+        
+        text = transcript.lower()
+        return sum(
+            len(re.findall(rf"\b{re.escape(filler)}\b", text))
+            for filler in self.FILLER_WORDS
+        )
+    
+    async def _get_transcript_text(self, audio_data: Dict) -> Optional[str]:
+        """
+        Obtiene la transcripción compartida de la grabación, si hay archivo.
+        
+        Todos los análisis que necesitan texto pasan por aquí, de modo que
+        reutilizan la misma transcripción persistida.
+        """
+        audio_file_path = audio_data.get("ruta_archivo") or audio_data.get("file_path")
+        if not audio_file_path:
+            return None
+        
+        try:
+            transcription = await self.transcribe_audio(
+                audio_file_path, audio_data.get("language", "es")
+            )
+        except AIServiceError:
+            return None
+        return transcription["text"]
     
     async def _analyze_pace_changes(self, audio_data: Dict) -> float:
         """Analiza variabilidad del ritmo."""
         return 0.65
     
     def _prepare_comment_context(self, analysis: Dict, parametro_type: str, score: float) -> str:
-        """Prepara contexto para generar comentario."""
-        return f"Parámetro: {parametro_type}, Puntaje: {score}, Métricas: {json.dumps(analysis.get('audio_metrics', {}))}"
-    
-    def _generate_fallback_comment(self, parametro_type: str, score: float) -> str:
-        """Genera comentario de respaldo si falla la IA."""
-        if score >= 80:
-            return f"Excelente rendimiento en {parametro_type}. ¡Sigue así!"
-        elif score >= 60:
-            return f"Buen trabajo en {parametro_type}. Hay oportunidades de mejora."
-        else:
-            return f"Se recomienda practicar más en {parametro_type} para mejorar el rendimiento."
+        """Prepara contexto para generar comentario (solo métricas del parámetro)."""
+        metrics = select_metrics(analysis, parametro_type)
+        return f"Parámetro: {parametro_type}, Puntaje: {score:.1f}, Métricas: {compact_json(metrics)}"
     
     def _build_suggestions_prompt(self, analysis: Dict, weak_areas: List[str]) -> str:
-        """Construye prompt para sugerencias."""
-        return f"Basándote en este análisis {analysis} y estas áreas débiles {weak_areas}, proporciona 3-5 sugerencias específicas de mejora."
-    
-    def _generate_fallback_suggestions(self, weak_areas: List[str]) -> List[str]:
-        """Genera sugerencias de respaldo."""
-        fallback_suggestions = {
-            "clarity": "Practica articular claramente cada palabra",
-            "volume": "Mantén un volumen consistente durante toda la presentación",
-            "pace": "Varía el ritmo para mantener el interés del público",
-            "pauses": "Usa pausas estratégicas para enfatizar puntos importantes"
-        }
-        
-        return [fallback_suggestions.get(area, f"Mejora tu {area}") for area in weak_areas[:3]]
-    
-    def _get_benchmarks(self, presentation_type: str) -> Dict:
-        """Obtiene benchmarks por tipo de presentación."""
-        benchmarks_db = {
-            "academic": {
-                "clarity_score": 0.85,
-                "speech_rate": 140,
-                "pause_patterns": 0.75
-            },
-            "corporate": {
-                "clarity_score": 0.80,
-                "speech_rate": 160,
-                "pause_patterns": 0.70
-            },
-            "general": {
-                "clarity_score": 0.75,
-                "speech_rate": 150,
-                "pause_patterns": 0.65
-            }
-        }
-        
-        return benchmarks_db.get(presentation_type, benchmarks_db["general"])
+        """Construye prompt para sugerencias con las métricas de las áreas débiles."""
+        metrics = select_metrics_for_areas(analysis, weak_areas)
+        return (
+            f"Basándote en estas métricas {compact_json(metrics)} y estas áreas débiles "
+            f"{', '.join(weak_areas)}, proporciona 3-5 sugerencias específicas de mejora."
+        )
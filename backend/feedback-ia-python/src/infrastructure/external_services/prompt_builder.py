@@ -0,0 +1,165 @@
+"""
+Construcción compacta de prompts para el servicio de IA.
+
+Selecciona solo las métricas relevantes para cada parámetro, redondea los
+valores numéricos y recorta el contenido al presupuesto de tokens de cada
+tipo de llamada.
+"""
+import json
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # Dependencia opcional: se usa una estimación
+    tiktoken = None
+
+
+# Presupuesto de tokens del prompt (mensajes de sistema + usuario) por tipo de llamada
+PROMPT_TOKEN_BUDGETS = {
+    "comment": 250,
+    "suggestions": 350,
+    "structure": 600,
+}
+
+# Métricas del análisis relevantes para cada tipo de parámetro
+PARAMETER_METRICS = {
+    "claridad": ("clarity_score", "articulation_clarity", "background_noise"),
+    "volumen": ("volume_consistency", "background_noise"),
+    "velocidad": ("speech_rate", "pace_variability"),
+    "ritmo": ("speech_rate", "pace_variability", "pause_patterns"),
+    "pausas": ("pause_patterns", "speech_rate"),
+    "entonacion": ("intonation_variety", "emotion_analysis"),
+    "estructura": ("presentation_structure",),
+    "muletillas": ("filler_words_count",),
+    "engagement": ("audience_engagement", "intonation_variety"),
+}
+
+# Métricas usadas cuando el parámetro no está en el mapa
+DEFAULT_METRICS = ("clarity_score", "speech_rate", "volume_consistency", "intonation_variety")
+
+# Caracteres por token aproximados cuando no está tiktoken
+CHARS_PER_TOKEN = 4
+
+_encodings: Dict[str, object] = {}
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Cuenta (o estima) los tokens de un texto.
+
+    Args:
+        text: Texto a medir
+        model: Modelo, para elegir la codificación si tiktoken está instalado
+
+    Returns:
+        Número de tokens
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def estimate_messages_tokens(messages: List[Dict], model: Optional[str] = None) -> int:
+    """Estima los tokens de una lista de mensajes de chat (incluye ~4 por mensaje de formato)."""
+    return sum(estimate_tokens(str(m.get("content", "")), model) + 4 for m in messages)
+
+
+def fit_to_budget(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    Recorta un texto para que no supere el presupuesto de tokens.
+
+    Args:
+        text: Texto original
+        max_tokens: Tokens máximos permitidos
+        model: Modelo para contar tokens
+
+    Returns:
+        Texto recortado (sin cambios si ya cabe)
+    """
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text, model) <= max_tokens:
+        return text
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+    return text[:max_tokens * CHARS_PER_TOKEN]
+
+
+def round_values(value, precision: int = 2):
+    """Redondea recursivamente los float de un valor (dict, lista o número)."""
+    if isinstance(value, float):
+        return round(value, precision)
+    if isinstance(value, dict):
+        return {key: round_values(item, precision) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_values(item, precision) for item in value]
+    return value
+
+
+def select_metrics(analysis: Dict, parametro_type: Optional[str] = None, precision: int = 2) -> Dict:
+    """
+    Selecciona las métricas relevantes para un parámetro.
+
+    Busca en `audio_metrics` y `advanced_metrics` del análisis.
+
+    Args:
+        analysis: Resultado del análisis de audio
+        parametro_type: Nombre del parámetro evaluado
+        precision: Decimales a conservar
+
+    Returns:
+        Diccionario compacto con las métricas seleccionadas
+    """
+    keys = _metrics_for_parameter(parametro_type)
+    available = {
+        **(analysis.get("audio_metrics") or {}),
+        **(analysis.get("advanced_metrics") or {}),
+    }
+    return {key: round_values(available[key], precision) for key in keys if key in available}
+
+
+def select_metrics_for_areas(analysis: Dict, areas: Iterable[str], precision: int = 2) -> Dict:
+    """Une las métricas relevantes de varias áreas débiles."""
+    selected: Dict = {}
+    for area in areas:
+        selected.update(select_metrics(analysis, area, precision))
+    return selected or select_metrics(analysis, None, precision)
+
+
+def compact_json(data: Dict) -> str:
+    """Serializa sin espacios y sin escapar caracteres no ASCII."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _metrics_for_parameter(parametro_type: Optional[str]) -> Iterable[str]:
+    if not parametro_type:
+        return DEFAULT_METRICS
+    name = _normalize_name(parametro_type)
+    for key, metrics in PARAMETER_METRICS.items():
+        if key in name:
+            return metrics
+    return DEFAULT_METRICS
+
+
+def _normalize_name(name: str) -> str:
+    """Minúsculas y sin acentos, para comparar nombres de parámetros."""
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _get_encoding(model: Optional[str]):
+    if tiktoken is None:
+        return None
+    key = model or ""
+    if key not in _encodings:
+        try:
+            _encodings[key] = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            _encodings[key] = tiktoken.get_encoding("cl100k_base")
+    return _encodings[key]
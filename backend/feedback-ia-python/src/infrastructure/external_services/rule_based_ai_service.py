@@ -0,0 +1,302 @@
+"""
+Implementación local del servicio de IA basada en reglas.
+No realiza llamadas de red: todas las métricas, comentarios y sugerencias
+se calculan en el proceso, lo que permite procesar miles de feedbacks por segundo.
+"""
+import re
+from typing import Dict, List, Optional
+
+from ...application.interfaces.ai_service_interface import AIServiceInterface
+from ...domain.exceptions.validation_exceptions import AIServiceError
+from ...domain.services.feedback_analyzer import FeedbackAnalyzerService
+
+
+class RuleBasedAIService(AIServiceInterface):
+    """
+    Implementación del servicio de IA sin dependencias externas.
+
+    Usa las métricas ya calculadas que llegan en `audio_data` (por ejemplo,
+    las obtenidas del procesamiento de la señal) y, si faltan, estimaciones
+    a partir de los metadatos del archivo. Los comentarios reutilizan las
+    reglas de FeedbackAnalyzerService.
+
+    Responsabilidades:
+    - Generar análisis básicos y avanzados de forma determinista
+    - Generar comentarios, sugerencias y comparaciones sin red
+    - Servir de respaldo para OpenAIService cuando la IA no responde
+    """
+
+    # Velocidad de habla de referencia (palabras por minuto)
+    OPTIMAL_SPEECH_RATE = 150.0
+
+    # Métricas del análisis (en inglés) y su nombre en el analizador de feedback
+    METRIC_NAMES = {
+        "clarity_score": "claridad",
+        "volume_consistency": "volumen",
+        "speech_rate": "velocidad",
+        "pause_patterns": "pausas",
+        "intonation_variety": "entonacion",
+    }
+
+    # Valores por defecto cuando no hay métricas calculadas
+    DEFAULT_METRICS = {
+        "clarity_score": 0.75,
+        "volume_consistency": 0.75,
+        "speech_rate": 145.0,
+        "pause_patterns": 0.65,
+        "intonation_variety": 0.70,
+    }
+
+    FALLBACK_SUGGESTIONS = {
+        "clarity": "Practica articular claramente cada palabra",
+        "volume": "Mantén un volumen consistente durante toda la presentación",
+        "pace": "Varía el ritmo para mantener el interés del público",
+        "pauses": "Usa pausas estratégicas para enfatizar puntos importantes"
+    }
+
+    BENCHMARKS = {
+        "academic": {
+            "clarity_score": 0.85,
+            "speech_rate": 140,
+            "pause_patterns": 0.75
+        },
+        "corporate": {
+            "clarity_score": 0.80,
+            "speech_rate": 160,
+            "pause_patterns": 0.70
+        },
+        "general": {
+            "clarity_score": 0.75,
+            "speech_rate": 150,
+            "pause_patterns": 0.65
+        }
+    }
+
+    # Marcadores usados para evaluar la estructura de la transcripción
+    OPENING_MARKERS = ("hola", "buenos días", "buenas tardes", "bienvenid", "hoy vamos", "hoy les")
+    CLOSING_MARKERS = ("en conclusión", "para concluir", "para terminar", "en resumen", "gracias")
+    TRANSITION_MARKERS = ("primero", "segundo", "además", "por otro lado", "luego", "finalmente", "sin embargo")
+
+    def __init__(self, feedback_analyzer: Optional[FeedbackAnalyzerService] = None):
+        self._analyzer = feedback_analyzer or FeedbackAnalyzerService()
+
+    async def analyze_audio_basic(
+        self,
+        grabacion_id: int,
+        audio_data: Dict
+    ) -> Dict:
+        """
+        Realiza análisis básico de audio a partir de métricas locales.
+        """
+        return {
+            "grabacion_id": grabacion_id,
+            "analysis_type": "basic",
+            "provider": "rule_based",
+            "duration_seconds": audio_data.get("duration", 0),
+            "audio_metrics": {
+                **self._audio_metrics(audio_data),
+                "background_noise": audio_data.get("noise_level", 0.1)
+            },
+            "confidence_score": 0.6,
+            "processing_time_ms": 0
+        }
+
+    async def analyze_audio_advanced(
+        self,
+        grabacion_id: int,
+        audio_data: Dict
+    ) -> Dict:
+        """
+        Realiza análisis avanzado de audio a partir de métricas locales.
+        """
+        basic_analysis = await self.analyze_audio_basic(grabacion_id, audio_data)
+        audio_metrics = basic_analysis["audio_metrics"]
+
+        advanced_metrics = {
+            "emotion_analysis": self._emotion_profile(audio_metrics),
+            "intonation_variety": audio_metrics["intonation_variety"],
+            "articulation_clarity": audio_metrics["clarity_score"],
+            "presentation_structure": {
+                "clear_opening": 0.7,
+                "logical_flow": 0.7,
+                "strong_closing": 0.7
+            },
+            "audience_engagement": round(
+                (audio_metrics["intonation_variety"] + audio_metrics["volume_consistency"]) / 2, 3
+            ),
+            "filler_words_count": audio_data.get("filler_words", 0),
+            "pace_variability": audio_data.get("pace_variability", 0.65)
+        }
+
+        return {
+            **basic_analysis,
+            "analysis_type": "advanced",
+            "advanced_metrics": advanced_metrics,
+            "confidence_score": 0.65
+        }
+
+    async def generate_feedback_comment(
+        self,
+        analysis_results: Dict,
+        parametro_type: str,
+        score: float
+    ) -> str:
+        """
+        Genera el comentario con las reglas del analizador de feedback.
+        """
+        metrics = self._normalized_metrics(analysis_results.get("audio_metrics", {}))
+        comment = self._analyzer.build_comment(metrics, max(0.0, min(100.0, score)))
+        return f"{parametro_type.capitalize()}: {comment}" if parametro_type else comment
+
+    async def extract_speech_metrics(self, audio_file_path: str) -> Dict:
+        """
+        Retorna las métricas de habla de referencia.
+
+        Sin procesamiento de señal disponible, se usan los valores por defecto.
+        """
+        return {
+            "speech_rate": self.DEFAULT_METRICS["speech_rate"],
+            "pause_patterns": {
+                "total_pauses": 0,
+                "average_pause_duration": 0.0,
+                "pause_frequency": 0.0
+            },
+            "volume_consistency": self.DEFAULT_METRICS["volume_consistency"],
+            "clarity_score": self.DEFAULT_METRICS["clarity_score"],
+            "intonation_variety": self.DEFAULT_METRICS["intonation_variety"],
+            "silence_ratio": 0.12,
+            "speaking_time_ratio": 0.88
+        }
+
+    async def detect_emotions(self, audio_file_path: str) -> Dict:
+        """
+        Retorna un perfil emocional neutro.
+        """
+        return {
+            "confidence": 0.5,
+            "neutral": 1.0,
+            "positive": 0.0,
+            "enthusiastic": 0.0,
+            "nervous": 0.0,
+            "dominant_emotion": "neutral",
+            "emotional_variability": 0.0
+        }
+
+    async def transcribe_audio(
+        self,
+        audio_file_path: str,
+        language: str = "es"
+    ) -> Dict:
+        """
+        La transcripción requiere un modelo externo y no está disponible en modo local.
+        """
+        raise AIServiceError("La transcripción no está disponible en el modo basado en reglas")
+
+    async def analyze_presentation_structure(self, transcript: str) -> Dict:
+        """
+        Evalúa la estructura buscando marcadores de apertura, cierre y transición.
+        """
+        text = transcript.lower()
+        sentences = [s for s in re.split(r"[.!?]+", text) if s.strip()]
+        if not sentences:
+            return {
+                "introduction_quality": 0.0,
+                "conclusion_quality": 0.0,
+                "content_organization": 0.0,
+                "transition_quality": 0.0,
+                "structure_score": 0.0
+            }
+
+        head = " ".join(sentences[:2])
+        tail = " ".join(sentences[-2:])
+        introduction = 0.85 if any(marker in head for marker in self.OPENING_MARKERS) else 0.5
+        conclusion = 0.85 if any(marker in tail for marker in self.CLOSING_MARKERS) else 0.5
+        transitions = sum(text.count(marker) for marker in self.TRANSITION_MARKERS)
+        transition_quality = min(1.0, 0.4 + 0.15 * transitions)
+        organization = min(1.0, 0.5 + 0.05 * min(len(sentences), 10))
+
+        return {
+            "introduction_quality": introduction,
+            "conclusion_quality": conclusion,
+            "content_organization": organization,
+            "transition_quality": transition_quality,
+            "structure_score": round(
+                (introduction + conclusion + organization + transition_quality) / 4, 3
+            )
+        }
+
+    async def get_improvement_suggestions(
+        self,
+        analysis_results: Dict,
+        weak_areas: List[str]
+    ) -> List[str]:
+        """
+        Genera sugerencias predefinidas para las áreas débiles.
+        """
+        return self.fallback_suggestions(weak_areas)
+
+    async def compare_with_benchmarks(
+        self,
+        analysis_results: Dict,
+        presentation_type: str
+    ) -> Dict:
+        """
+        Compara con benchmarks establecidos.
+        """
+        benchmarks = self.BENCHMARKS.get(presentation_type, self.BENCHMARKS["general"])
+        audio_metrics = analysis_results.get("audio_metrics", {})
+
+        comparison = {}
+        for metric, benchmark_value in benchmarks.items():
+            actual_value = audio_metrics.get(metric, 0)
+            comparison[metric] = {
+                "actual": actual_value,
+                "benchmark": benchmark_value,
+                "performance": "above" if actual_value > benchmark_value else "below",
+                "difference": actual_value - benchmark_value
+            }
+
+        return comparison
+
+    def fallback_suggestions(self, weak_areas: List[str]) -> List[str]:
+        """Sugerencias predefinidas (también usadas como respaldo de OpenAIService)."""
+        return [self.FALLBACK_SUGGESTIONS.get(area, f"Mejora tu {area}") for area in weak_areas[:3]]
+
+    def _audio_metrics(self, audio_data: Dict) -> Dict:
+        """Obtiene las métricas calculadas o, en su defecto, estimaciones."""
+        computed = audio_data.get("audio_metrics") or {}
+        metrics = {
+            name: computed.get(name, audio_data.get(name, default))
+            for name, default in self.DEFAULT_METRICS.items()
+        }
+
+        # Estimaciones a partir de metadatos cuando no hay métricas calculadas
+        if "clarity_score" not in computed and "clarity_score" not in audio_data:
+            noise = audio_data.get("noise_level", 0.1)
+            metrics["clarity_score"] = round(max(0.0, min(1.0, 0.9 - noise)), 3)
+        if "speech_rate" not in computed and audio_data.get("word_count") and audio_data.get("duration"):
+            metrics["speech_rate"] = round(audio_data["word_count"] / audio_data["duration"] * 60, 1)
+
+        return metrics
+
+    def _normalized_metrics(self, audio_metrics: Dict) -> Dict:
+        """Convierte las métricas del análisis a valores 0-1 con nombres del dominio."""
+        normalized = {}
+        for name, domain_name in self.METRIC_NAMES.items():
+            value = audio_metrics.get(name)
+            if not isinstance(value, (int, float)):
+                continue
+            if name == "speech_rate":
+                deviation = abs(value - self.OPTIMAL_SPEECH_RATE) / self.OPTIMAL_SPEECH_RATE
+                value = 1.0 - deviation if value > 0 else 0.0
+            normalized[domain_name] = max(0.0, min(1.0, value))
+        return normalized
+
+    def _emotion_profile(self, audio_metrics: Dict) -> Dict:
+        """Estima un perfil emocional a partir de la entonación y el volumen."""
+        intonation = audio_metrics["intonation_variety"]
+        return {
+            "emotional_range": intonation,
+            "appropriate_emotion": round((intonation + audio_metrics["volume_consistency"]) / 2, 3),
+            "emotional_consistency": audio_metrics["volume_consistency"]
+        }
@@ -0,0 +1,225 @@
+"""
+Almacén persistente de transcripciones.
+Evita transcribir varias veces la misma grabación reutilizando el texto
+guardado por hash de contenido, idioma y modelo.
+"""
+import asyncio
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from ..database.connection import SessionLocal
+from ..database.models.transcript_model import TranscriptModel
+
+
+class TranscriptStore:
+    """
+    Caché persistente de transcripciones (tabla + archivos comprimidos opcionales).
+
+    Responsabilidades:
+    - Calcular el hash de contenido de un archivo de audio
+    - Buscar y guardar transcripciones por (hash, idioma, modelo)
+    - Garantizar una sola transcripción concurrente por clave dentro del proceso
+    - Guardar el texto comprimido en disco cuando se configura un directorio
+
+    La tabla la crea la migración 0008 (alembic upgrade head).
+    """
+
+    HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+    HASH_CACHE_SIZE = 1024  # Archivos recientes cuyo hash se recuerda
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        compressed_dir: Optional[str] = None
+    ):
+        self._session_factory = session_factory
+        self._compressed_dir = Path(compressed_dir) if compressed_dir else None
+        # Clave -> [lock, corrutinas que lo usan]; se elimina al salir la última
+        self._locks: Dict[Tuple[str, str, str], List] = {}
+        # (ruta, tamaño, mtime) -> hash, para no releer archivos grandes (LRU acotada)
+        self._hash_cache: "OrderedDict[Tuple[str, int, float], str]" = OrderedDict()
+        # Se calcula en hilos (asyncio.to_thread)
+        self._hash_lock = threading.Lock()
+
+    def compute_audio_hash(self, audio_file_path: str) -> str:
+        """
+        Calcula el hash SHA-256 del contenido del archivo de audio.
+
+        Args:
+            audio_file_path: Ruta al archivo de audio
+
+        Returns:
+            Hash hexadecimal del contenido
+        """
+        stat = os.stat(audio_file_path)
+        cache_key = (os.path.abspath(audio_file_path), stat.st_size, stat.st_mtime)
+        with self._hash_lock:
+            cached = self._hash_cache.get(cache_key)
+            if cached:
+                self._hash_cache.move_to_end(cache_key)
+                return cached
+
+        digest = hashlib.sha256()
+        with open(audio_file_path, "rb") as audio_file:
+            for chunk in iter(lambda: audio_file.read(self.HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        audio_hash = digest.hexdigest()
+        with self._hash_lock:
+            self._hash_cache[cache_key] = audio_hash
+            if len(self._hash_cache) > self.HASH_CACHE_SIZE:
+                self._hash_cache.popitem(last=False)
+        return audio_hash
+
+    def get(self, audio_hash: str, idioma: str, modelo: str) -> Optional[Dict]:
+        """
+        Obtiene una transcripción guardada.
+
+        Args:
+            audio_hash: Hash del contenido del audio
+            idioma: Idioma de la transcripción
+            modelo: Modelo usado para transcribir
+
+        Returns:
+            Diccionario con la transcripción o None si no existe
+        """
+        with self._session_factory() as db:
+            db_transcript = db.query(TranscriptModel).filter(
+                TranscriptModel.hash_audio == audio_hash,
+                TranscriptModel.idioma == idioma,
+                TranscriptModel.modelo == modelo
+            ).first()
+
+            if db_transcript is None:
+                return None
+            return self._model_to_dict(db_transcript)
+
+    def save(self, audio_hash: str, idioma: str, modelo: str, transcription: Dict) -> Dict:
+        """
+        Guarda una transcripción. Si otra petición ya la guardó, retorna la existente.
+
+        Args:
+            audio_hash: Hash del contenido del audio
+            idioma: Idioma de la transcripción
+            modelo: Modelo usado para transcribir
+            transcription: Resultado de la transcripción (requiere la clave "text")
+
+        Returns:
+            Diccionario con la transcripción persistida
+        """
+        texto = transcription.get("text", "")
+        ruta_comprimida = None
+        if self._compressed_dir is not None:
+            ruta_comprimida = self._write_compressed(audio_hash, idioma, modelo, texto)
+
+        db_transcript = TranscriptModel(
+            hash_audio=audio_hash,
+            idioma=idioma,
+            modelo=modelo,
+            texto=None if ruta_comprimida else texto,
+            ruta_comprimida=ruta_comprimida,
+            palabras=transcription.get("word_count", len(texto.split())),
+            duracion_segundos=transcription.get("duration_seconds")
+        )
+
+        with self._session_factory() as db:
+            db.add(db_transcript)
+            try:
+                db.commit()
+            except IntegrityError:
+                # Otro worker guardó la misma clave primero
+                db.rollback()
+                existing = self.get(audio_hash, idioma, modelo)
+                if existing is not None:
+                    return existing
+                raise
+            db.refresh(db_transcript)
+            return self._model_to_dict(db_transcript)
+
+    async def get_or_transcribe(
+        self,
+        audio_file_path: str,
+        idioma: str,
+        modelo: str,
+        transcribe: Callable[[], Awaitable[Dict]]
+    ) -> Dict:
+        """
+        Retorna la transcripción guardada o la genera una única vez.
+
+        El hash del archivo y las consultas corren en el pool de hilos para
+        no bloquear el event loop.
+
+        Args:
+            audio_file_path: Ruta al archivo de audio
+            idioma: Idioma de la transcripción
+            modelo: Modelo de transcripción
+            transcribe: Corrutina que realiza la transcripción real
+
+        Returns:
+            Diccionario con la transcripción y la clave "cached"
+        """
+        audio_hash = await asyncio.to_thread(self.compute_audio_hash, audio_file_path)
+        key = (audio_hash, idioma, modelo)
+
+        cached = await asyncio.to_thread(self.get, *key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        async with self._key_lock(key):
+            # Otra corrutina pudo completar la transcripción mientras esperábamos
+            cached = await asyncio.to_thread(self.get, *key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+            transcription = await transcribe()
+            stored = await asyncio.to_thread(self.save, audio_hash, idioma, modelo, transcription)
+            return {**transcription, **stored, "cached": False}
+
+    @asynccontextmanager
+    async def _key_lock(self, key: Tuple[str, str, str]) -> AsyncIterator[None]:
+        """Lock por clave que se descarta cuando ya nadie lo espera."""
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    def _write_compressed(self, audio_hash: str, idioma: str, modelo: str, texto: str) -> str:
+        """Escribe el texto comprimido con gzip y retorna su ruta."""
+        self._compressed_dir.mkdir(parents=True, exist_ok=True)
+        path = self._compressed_dir / f"{audio_hash}_{idioma}_{modelo}.txt.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as compressed:
+            compressed.write(texto)
+        return str(path)
+
+    def _read_text(self, db_transcript: TranscriptModel) -> str:
+        """Obtiene el texto desde la columna o desde el archivo comprimido."""
+        if db_transcript.ruta_comprimida:
+            with gzip.open(db_transcript.ruta_comprimida, "rt", encoding="utf-8") as compressed:
+                return compressed.read()
+        return db_transcript.texto or ""
+
+    def _model_to_dict(self, db_transcript: TranscriptModel) -> Dict:
+        """Convierte el modelo a diccionario con el formato de transcribe_audio."""
+        return {
+            "text": self._read_text(db_transcript),
+            "language": db_transcript.idioma,
+            "model": db_transcript.modelo,
+            "audio_hash": db_transcript.hash_audio,
+            "word_count": db_transcript.palabras,
+            "duration_seconds": db_transcript.duracion_segundos,
+        }
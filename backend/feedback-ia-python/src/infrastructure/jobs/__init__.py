@@ -0,0 +1,20 @@
+"""
+Trabajos en segundo plano de la capa de infraestructura.
+"""
+from .analysis_jobs import AnalysisJobBroker, AnalysisJobEvent, get_analysis_job_broker
+
+__all__ = [
+    "AnalysisJobBroker",
+    "AnalysisJobEvent",
+    "get_analysis_job_broker",
+    "RescoreJob",
+    "RescoreProgress",
+]
+
+
+def __getattr__(name: str):
+    # El re-puntuado importa numpy: solo se carga al usarlo, no al arrancar la API
+    if name in ("RescoreJob", "RescoreProgress"):
+        from . import rescore_job
+        return getattr(rescore_job, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
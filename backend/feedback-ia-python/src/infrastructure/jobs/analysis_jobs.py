@@ -0,0 +1,291 @@
+"""
+Avance de los análisis en segundo plano.
+
+Cada análisis lanzado en segundo plano tiene una fila en analysis_jobs con
+su último avance (etapa, progreso, resultado o error). Los eventos se
+distribuyen así:
+
+- En el worker que ejecuta el trabajo, por un pub/sub en memoria (una cola
+  asyncio por cliente suscrito): los clientes reciben cada evento al
+  instante, sin consultar la base de datos.
+- En cualquier otro worker, leyendo la tabla cada `poll_interval_ms` y
+  emitiendo el evento si `secuencia` avanzó. Solo se consulta mientras
+  haya clientes conectados, una vez por cliente y no por petición de
+  sondeo. Si el trabajo no avanza en `stale_after_ms` (su worker murió),
+  se marca como fallido y el stream termina con ese evento.
+
+Las consultas a la base de datos se ejecutan en el threadpool para no
+bloquear el event loop.
+"""
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+from sqlalchemy import update
+
+from ...application.interfaces.progress_reporter_interface import ProgressReporterInterface
+from ..config.settings import get_settings
+from ..database.connection import SessionLocal
+from ..database.models.analysis_job_model import AnalysisJobModel
+from .estados import COMPLETADO, EN_PROGRESO, FALLIDO, PENDIENTE, TERMINALES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnalysisJobEvent:
+    """Estado de un trabajo tras un evento."""
+
+    job_id: str
+    secuencia: int
+    estado: str
+    etapa: Optional[str]
+    progreso: float
+    detalle: Optional[str]
+    resultado: Optional[Any]
+    error: Optional[str]
+
+    @property
+    def terminal(self) -> bool:
+        """True si el trabajo terminó (completado o fallido)."""
+        return self.estado in TERMINALES
+
+    @classmethod
+    def from_model(cls, job: AnalysisJobModel) -> "AnalysisJobEvent":
+        return cls(
+            job_id=job.id,
+            secuencia=job.secuencia,
+            estado=job.estado,
+            etapa=job.etapa,
+            progreso=job.progreso,
+            detalle=job.detalle,
+            resultado=job.resultado,
+            error=job.error,
+        )
+
+
+class AnalysisJobBroker:
+    """
+    Registro y distribución del avance de análisis en segundo plano.
+
+    Responsabilidades:
+    - Crear trabajos y guardar cada evento en analysis_jobs
+    - Entregar los eventos a los clientes suscritos en este worker
+    - Seguir por la tabla los trabajos que se ejecutan en otro worker
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        poll_interval_ms: int = 1000,
+        heartbeat_ms: int = 15000,
+        stale_after_ms: int = 300000
+    ):
+        self._session_factory = session_factory
+        self._poll_interval = poll_interval_ms / 1000
+        self._heartbeat = heartbeat_ms / 1000
+        self._stale_after = timedelta(milliseconds=stale_after_ms)
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        # Trabajos que se ejecutan en este worker (sus eventos llegan por las colas)
+        self._local_jobs: Set[str] = set()
+
+    @property
+    def running_jobs(self) -> int:
+        """Trabajos sin terminar lanzados en este worker."""
+        return len(self._local_jobs)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Clientes siguiendo el avance de algún trabajo en este worker."""
+        return sum(len(queues) for queues in list(self._subscribers.values()))
+
+    def create(self, tipo: str) -> str:
+        """
+        Registra un trabajo nuevo que se ejecutará en este worker.
+
+        Args:
+            tipo: Tipo de análisis (p. ej. "generate_ai")
+
+        Returns:
+            ID del trabajo
+        """
+        job_id = uuid.uuid4().hex
+        with self._session_factory() as db:
+            db.add(AnalysisJobModel(id=job_id, tipo=tipo, estado=PENDIENTE, progreso=0.0, secuencia=0))
+            db.commit()
+        self._local_jobs.add(job_id)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[AnalysisJobEvent]:
+        """
+        Obtiene el último estado guardado de un trabajo.
+
+        Args:
+            job_id: ID del trabajo
+
+        Returns:
+            AnalysisJobEvent, None si el trabajo no existe
+        """
+        with self._session_factory() as db:
+            job = db.get(AnalysisJobModel, job_id)
+            return AnalysisJobEvent.from_model(job) if job else None
+
+    async def publish(self, job_id: str, **changes: Any) -> Optional[AnalysisJobEvent]:
+        """
+        Guarda un evento de un trabajo y lo entrega a los suscriptores locales.
+
+        Args:
+            job_id: ID del trabajo
+            **changes: Campos de AnalysisJobModel que cambian
+
+        Returns:
+            Estado tras el evento, None si el trabajo no existe
+        """
+        event = await asyncio.to_thread(self._save_event, job_id, changes)
+        if event is None:
+            return None
+        if event.terminal:
+            self._local_jobs.discard(job_id)
+        # Las colas asyncio no son seguras entre hilos: se entregan desde el loop
+        for queue in self._subscribers.get(job_id, ()):
+            queue.put_nowait(event)
+        return event
+
+    def _save_event(self, job_id: str, changes: Dict[str, Any]) -> Optional[AnalysisJobEvent]:
+        with self._session_factory() as db:
+            job = db.get(AnalysisJobModel, job_id)
+            if job is None:
+                return None
+            for field, value in changes.items():
+                setattr(job, field, value)
+            job.secuencia += 1
+            if job.estado in TERMINALES:
+                job.finished_at = datetime.utcnow()
+            db.commit()
+            return AnalysisJobEvent.from_model(job)
+
+    def _poll(self, job_id: str) -> Optional[AnalysisJobEvent]:
+        """
+        Lee un trabajo de otro worker y lo marca como fallido si dejó de avanzar.
+
+        La actualización es condicional (misma secuencia y sin terminar): si el
+        worker sigue vivo y publica a la vez, su evento prevalece.
+        """
+        with self._session_factory() as db:
+            job = db.get(AnalysisJobModel, job_id)
+            if job is None:
+                return None
+            now = datetime.utcnow()
+            if job.estado in TERMINALES or job.updated_at is None or now - job.updated_at < self._stale_after:
+                return AnalysisJobEvent.from_model(job)
+            db.execute(
+                update(AnalysisJobModel)
+                .where(
+                    AnalysisJobModel.id == job_id,
+                    AnalysisJobModel.secuencia == job.secuencia,
+                    AnalysisJobModel.estado.notin_(TERMINALES)
+                )
+                .values(
+                    estado=FALLIDO,
+                    error=f"El trabajo no informa avance desde {job.updated_at.isoformat()}",
+                    secuencia=AnalysisJobModel.secuencia + 1,
+                    finished_at=now,
+                    updated_at=now
+                )
+            )
+            db.commit()
+            db.refresh(job)
+            logger.warning("Trabajo de análisis %s sin avance; marcado como %s", job_id, job.estado)
+            return AnalysisJobEvent.from_model(job)
+
+    def reporter(self, job_id: str) -> ProgressReporterInterface:
+        """Receptor de avance que publica los eventos de un trabajo."""
+        return _JobProgressReporter(self, job_id)
+
+    async def complete(self, job_id: str, resultado: Any = None) -> None:
+        """Marca un trabajo como completado con su resultado."""
+        await self.publish(job_id, estado=COMPLETADO, progreso=1.0, resultado=resultado)
+
+    async def fail(self, job_id: str, error: str) -> None:
+        """Marca un trabajo como fallido."""
+        await self.publish(job_id, estado=FALLIDO, error=error)
+
+    async def events(self, job_id: str, last_event_id: int = 0) -> AsyncIterator[Optional[AnalysisJobEvent]]:
+        """
+        Sigue un trabajo hasta que termina.
+
+        Args:
+            job_id: ID del trabajo
+            last_event_id: Último evento recibido por el cliente (Last-Event-ID);
+                solo se emiten eventos posteriores
+
+        Yields:
+            AnalysisJobEvent por cada evento nuevo, o None cada `heartbeat_ms`
+            sin eventos (para mantener viva la conexión). Un trabajo de otro
+            worker sin avance en `stale_after_ms` termina con un evento fallido
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers[job_id].add(queue)
+        try:
+            # Suscrito antes de leer la tabla, para no perder eventos intermedios
+            event = await asyncio.to_thread(self.get, job_id)
+            if event is None:
+                return
+            idle = 0.0
+            while True:
+                if event.secuencia > last_event_id:
+                    last_event_id = event.secuencia
+                    idle = 0.0
+                    yield event
+                if event.terminal:
+                    return
+
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=self._poll_interval)
+                    continue
+                except asyncio.TimeoutError:
+                    idle += self._poll_interval
+
+                if job_id not in self._local_jobs:
+                    # Otro worker ejecuta el trabajo: su avance solo está en la tabla
+                    event = await asyncio.to_thread(self._poll, job_id) or event
+                if idle >= self._heartbeat:
+                    idle = 0.0
+                    yield None
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+
+class _JobProgressReporter(ProgressReporterInterface):
+    """Publica en analysis_jobs el avance informado por un caso de uso."""
+
+    def __init__(self, broker: AnalysisJobBroker, job_id: str):
+        self._broker = broker
+        self._job_id = job_id
+
+    async def report(self, etapa: str, progreso: float, detalle: Optional[str] = None) -> None:
+        try:
+            await self._broker.publish(self._job_id, estado=EN_PROGRESO, etapa=etapa, progreso=progreso, detalle=detalle)
+        except Exception:
+            # El avance es informativo: un fallo al publicarlo no detiene el análisis
+            logger.exception("No se pudo publicar el avance del trabajo %s", self._job_id)
+
+
+@lru_cache(maxsize=None)
+def get_analysis_job_broker() -> AnalysisJobBroker:
+    """Broker compartido por el proceso (necesario para el pub/sub en memoria)."""
+    config = get_settings().app
+    return AnalysisJobBroker(
+        poll_interval_ms=config.progress_poll_ms,
+        heartbeat_ms=config.sse_heartbeat_ms,
+        stale_after_ms=config.analysis_job_stale_ms
+    )
@@ -0,0 +1,10 @@
+"""
+Estados de los trabajos registrados en base de datos (rescore_jobs, analysis_jobs).
+"""
+PENDIENTE = "pendiente"
+EN_PROGRESO = "en_progreso"
+COMPLETADO = "completado"
+FALLIDO = "fallido"
+
+# Estados tras los que un trabajo ya no cambia
+TERMINALES = (COMPLETADO, FALLIDO)
@@ -0,0 +1,274 @@
+"""
+Re-puntuación masiva de feedbacks automáticos.
+
+Cuando cambia la rúbrica (parametro_metricas, parámetros o métricas), los
+feedbacks automáticos ya guardados conservan el puntaje anterior. Este
+trabajo los recalcula a partir de los análisis guardados en
+analisis_grabacion, sin volver a llamar al servicio de IA:
+
+- Recorre las grabaciones afectadas por ID (keyset), en lotes
+- Puntúa cada lote con una sola operación matricial, a partir de los
+  vectores de métricas guardados (score_vectors) o, si la rúbrica usa
+  métricas que no están en el vector, del resultado completo
+- Actualiza solo los valores que cambian con un UPDATE masivo
+  (UPDATE ... FROM (VALUES ...) en PostgreSQL, executemany en el resto)
+- Guarda el checkpoint en la misma transacción que las actualizaciones,
+  de modo que un trabajo interrumpido se reanuda sin repetir lotes
+
+Los comentarios de los feedbacks no se regeneran.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Float, Integer, bindparam, column, exists, select, update, values
+from sqlalchemy.orm import Session
+
+from ...domain.repositories.analisis_grabacion_repository import ANALIZADOR_IA
+from ...domain.services.feedback_analyzer import FeedbackAnalyzerService
+from ..cache.catalog import CatalogCache, get_catalog_cache
+from ..database.connection import SessionLocal
+from ..database.models.analisis_grabacion_model import AnalisisGrabacionModel
+from ..database.models.feedback_model import FeedbackModel
+from ..database.models.rescore_job_model import RescoreJobModel
+from ..database.repositories.sqlalchemy_analisis_grabacion_repository import decode_metric_matrix
+from .estados import COMPLETADO, EN_PROGRESO, FALLIDO, PENDIENTE
+
+logger = logging.getLogger(__name__)
+
+# Filas por sentencia en el UPDATE ... FROM (VALUES ...)
+UPDATE_CHUNK_SIZE = 5000
+
+# Tolerancia para considerar que un puntaje no cambió
+_SCORE_TOLERANCE = 1e-9
+
+_FEEDBACKS = FeedbackModel.__table__
+
+_AUTOMATIC = FeedbackModel.es_manual.is_(False)
+_IN_PARAMETROS = FeedbackModel.parametro_id.in_(bindparam("parametros", expanding=True))
+
+
+def _affected_grabaciones(filter_parametros: bool):
+    """Siguiente lote de grabaciones con análisis y feedbacks automáticos afectados."""
+    conditions = [FeedbackModel.grabacion_id == AnalisisGrabacionModel.grabacion_id, _AUTOMATIC]
+    if filter_parametros:
+        conditions.append(_IN_PARAMETROS)
+    return (
+        select(AnalisisGrabacionModel.grabacion_id, AnalisisGrabacionModel.metricas)
+        .where(
+            AnalisisGrabacionModel.analizador == ANALIZADOR_IA,
+            AnalisisGrabacionModel.grabacion_id > bindparam("after"),
+            exists().where(*conditions)
+        )
+        .order_by(AnalisisGrabacionModel.grabacion_id)
+        .limit(bindparam("limit"))
+    )
+
+
+def _automatic_feedbacks(filter_parametros: bool):
+    """Feedbacks automáticos de un lote de grabaciones."""
+    query = select(
+        FeedbackModel.id, FeedbackModel.grabacion_id, FeedbackModel.parametro_id, FeedbackModel.valor
+    ).where(FeedbackModel.grabacion_id.in_(bindparam("grabaciones", expanding=True)), _AUTOMATIC)
+    if filter_parametros:
+        query = query.where(_IN_PARAMETROS)
+    return query
+
+
+# Resultado completo, solo si la rúbrica necesita métricas fuera del vector
+_RESULTADOS = select(AnalisisGrabacionModel.resultado).where(
+    AnalisisGrabacionModel.analizador == ANALIZADOR_IA,
+    AnalisisGrabacionModel.grabacion_id.in_(bindparam("grabaciones", expanding=True))
+).order_by(AnalisisGrabacionModel.grabacion_id)
+
+
+# Consultas construidas una sola vez (con y sin filtro de parámetros)
+_AFFECTED = {flag: _affected_grabaciones(flag) for flag in (False, True)}
+_FEEDBACKS_OF_BATCH = {flag: _automatic_feedbacks(flag) for flag in (False, True)}
+
+# Actualización fila a fila para motores sin UPDATE ... FROM (VALUES ...)
+_UPDATE_VALOR = (
+    update(_FEEDBACKS)
+    .where(_FEEDBACKS.c.id == bindparam("feedback_id"))
+    .values(valor=bindparam("nuevo_valor"), updated_at=bindparam("ahora"))
+)
+
+
+@dataclass(frozen=True)
+class RescoreProgress:
+    """Estado de un trabajo de re-puntuación."""
+
+    job_id: int
+    estado: str
+    ultimo_grabacion_id: int
+    grabaciones_procesadas: int
+    feedbacks_actualizados: int
+
+    @classmethod
+    def from_model(cls, job: RescoreJobModel) -> "RescoreProgress":
+        return cls(
+            job_id=job.id,
+            estado=job.estado,
+            ultimo_grabacion_id=job.ultimo_grabacion_id,
+            grabaciones_procesadas=job.grabaciones_procesadas,
+            feedbacks_actualizados=job.feedbacks_actualizados,
+        )
+
+
+class RescoreJob:
+    """
+    Trabajo reanudable de re-puntuación de feedbacks automáticos.
+
+    Responsabilidades:
+    - Registrar trabajos en rescore_jobs (parámetros afectados y checkpoint)
+    - Recalcular puntajes por lotes con la rúbrica vigente
+    - Aplicar las actualizaciones y el checkpoint en una transacción por lote
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        analyzer: Optional[FeedbackAnalyzerService] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        batch_size: int = 1000
+    ):
+        if batch_size <= 0:
+            raise ValueError("batch_size debe ser mayor que 0")
+        self._session_factory = session_factory
+        self._analyzer = analyzer or FeedbackAnalyzerService()
+        self._catalog_cache = catalog_cache or get_catalog_cache()
+        self._batch_size = batch_size
+
+    def start(self, parametros_ids: Optional[Sequence[int]] = None) -> int:
+        """
+        Registra un trabajo nuevo.
+
+        Args:
+            parametros_ids: Parámetros a re-puntuar; None para todos
+
+        Returns:
+            ID del trabajo
+        """
+        with self._session_factory() as db:
+            job = RescoreJobModel(
+                estado=PENDIENTE,
+                parametros=sorted(set(parametros_ids)) if parametros_ids else None,
+                ultimo_grabacion_id=0,
+                grabaciones_procesadas=0,
+                feedbacks_actualizados=0,
+            )
+            db.add(job)
+            db.commit()
+            return job.id
+
+    def run(self, job_id: int) -> RescoreProgress:
+        """
+        Ejecuta (o reanuda desde su checkpoint) un trabajo.
+
+        Args:
+            job_id: ID del trabajo
+
+        Returns:
+            Estado final del trabajo
+
+        Raises:
+            ValueError: Si el trabajo no existe
+        """
+        with self._session_factory() as db:
+            job = db.get(RescoreJobModel, job_id)
+            if job is None:
+                raise ValueError(f"No existe el trabajo de re-puntuación {job_id}")
+            if job.estado == COMPLETADO:
+                return RescoreProgress.from_model(job)
+
+            job.estado = EN_PROGRESO
+            job.error = None
+            db.commit()
+
+            try:
+                self._catalog_cache.sync(db)
+                rubric = self._catalog_cache.rubric(db)
+                while self._run_batch(db, job, rubric):
+                    logger.info(
+                        "Re-puntuación %s: grabación %s, %s feedbacks actualizados",
+                        job.id, job.ultimo_grabacion_id, job.feedbacks_actualizados
+                    )
+            except Exception as e:
+                db.rollback()
+                job.estado = FALLIDO
+                job.error = str(e)
+                db.commit()
+                raise
+
+            job.estado = COMPLETADO
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            return RescoreProgress.from_model(job)
+
+    def _run_batch(self, db: Session, job: RescoreJobModel, rubric) -> bool:
+        """Procesa el siguiente lote; False cuando no quedan grabaciones."""
+        filtered = job.parametros is not None
+        params = {"parametros": job.parametros} if filtered else {}
+
+        analyses = db.execute(
+            _AFFECTED[filtered], {"after": job.ultimo_grabacion_id, "limit": self._batch_size, **params}
+        ).all()
+        if not analyses:
+            return False
+
+        grabacion_ids = [row.grabacion_id for row in analyses]
+        feedbacks = db.execute(_FEEDBACKS_OF_BATCH[filtered], {"grabaciones": grabacion_ids, **params}).all()
+
+        changes = self._changed_scores(db, rubric, analyses, feedbacks)
+        self._apply(db, changes)
+
+        job.ultimo_grabacion_id = grabacion_ids[-1]
+        job.grabaciones_procesadas += len(grabacion_ids)
+        job.feedbacks_actualizados += len(changes)
+        db.commit()
+        return True
+
+    def _changed_scores(self, db: Session, rubric, analyses, feedbacks) -> List[Tuple[int, float]]:
+        """Puntajes nuevos de los feedbacks del lote, solo los que cambian."""
+        if not feedbacks:
+            return []
+
+        feedback_ids, grabacion_ids, parametro_ids, old_values = (np.array(column) for column in zip(*feedbacks))
+        parametros, columns = np.unique(parametro_ids, return_inverse=True)
+        analysis_ids = [row.grabacion_id for row in analyses]
+        rows = np.searchsorted(analysis_ids, grabacion_ids)
+
+        scores = None
+        vectors = decode_metric_matrix([row.metricas for row in analyses])
+        if vectors is not None:
+            scores = self._analyzer.score_vectors(rubric, vectors, parametros.tolist())
+        if scores is None:
+            resultados = db.scalars(_RESULTADOS, {"grabaciones": analysis_ids}).all()
+            scores = self._analyzer.score_analyses(rubric, resultados, parametros.tolist())
+        new_values = scores[rows, columns]
+        changed = np.abs(new_values - old_values.astype(float)) > _SCORE_TOLERANCE
+        return list(zip(feedback_ids[changed].tolist(), new_values[changed].tolist()))
+
+    def _apply(self, db: Session, changes: List[Tuple[int, float]]) -> None:
+        """Aplica los puntajes nuevos con un UPDATE masivo."""
+        if not changes:
+            return
+        ahora = datetime.utcnow()
+
+        if db.get_bind().dialect.name == "postgresql":
+            for start in range(0, len(changes), UPDATE_CHUNK_SIZE):
+                nuevos = values(
+                    column("id", Integer), column("valor", Float), name="nuevos"
+                ).data(changes[start:start + UPDATE_CHUNK_SIZE])
+                db.execute(
+                    update(_FEEDBACKS)
+                    .where(_FEEDBACKS.c.id == nuevos.c.id)
+                    .values(valor=nuevos.c.valor, updated_at=ahora)
+                )
+        else:
+            db.execute(_UPDATE_VALOR, [
+                {"feedback_id": feedback_id, "nuevo_valor": valor, "ahora": ahora}
+                for feedback_id, valor in changes
+            ])
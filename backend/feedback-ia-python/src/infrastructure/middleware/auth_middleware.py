@@ -3,6 +3,7 @@
 Middleware de autenticación para validar tokens de acceso.
 """
 import os
+from functools import lru_cache
 from typing import Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -53,8 +54,22 @@ class AuthMiddleware:
         return credentials.credentials
 
 
-# Instancia global del middleware
-auth_middleware = AuthMiddleware()
+@lru_cache(maxsize=None)
+def get_auth_middleware() -> AuthMiddleware:
+    """
+    Instancia global del middleware, creada en la primera petición autenticada.
+    
+    Así importar la aplicación no requiere API_KEY.
+    """
+    return AuthMiddleware()
+
+
+def __getattr__(name: str):
+    # Compatibilidad con `from ...auth_middleware import auth_middleware`
+    if name == "auth_middleware":
+        return get_auth_middleware()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Dependencia para usar en los endpoints
 def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
@@ -70,7 +85,7 @@ def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)
     Raises:
         HTTPException: Si el token es inválido
     """
-    return auth_middleware.verify_token(credentials)
+    return get_auth_middleware().verify_token(credentials)
 
 
 def get_optional_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))) -> Optional[str]:
@@ -89,4 +104,4 @@ def get_optional_token(credentials: Optional[HTTPAuthorizationCredentials] = Dep
     if not credentials:
         return None
     
-    return auth_middleware.verify_token(credentials)
+    return get_auth_middleware().verify_token(credentials)
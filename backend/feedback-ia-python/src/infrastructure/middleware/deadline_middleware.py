@@ -0,0 +1,52 @@
+# filepath: /src/infrastructure/middleware/deadline_middleware.py
+"""
+Middleware que fija el plazo (deadline) de cada petición HTTP.
+"""
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ...shared.utils.deadline import reset_deadline, set_deadline
+
+# Header con el tiempo máximo que el cliente está dispuesto a esperar
+DEADLINE_HEADER = b"x-request-timeout-ms"
+
+
+class DeadlineMiddleware:
+    """
+    Propaga un plazo por petición a las capas internas.
+
+    El cliente puede indicar el plazo con el header X-Request-Timeout-Ms;
+    si no lo hace, se usa el valor por defecto. El plazo nunca supera
+    `max_timeout_ms`.
+    """
+
+    def __init__(self, app: ASGIApp, default_timeout_ms: int, max_timeout_ms: Optional[int] = None):
+        self.app = app
+        self.default_timeout_ms = default_timeout_ms
+        self.max_timeout_ms = max_timeout_ms or default_timeout_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout_ms = min(self._requested_timeout_ms(scope), self.max_timeout_ms)
+        token = set_deadline(timeout_ms / 1000)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+    def _requested_timeout_ms(self, scope: Scope) -> int:
+        """Lee el plazo pedido por el cliente o retorna el valor por defecto."""
+        for name, value in scope.get("headers", []):
+            if name == DEADLINE_HEADER:
+                try:
+                    requested = int(value)
+                except ValueError:
+                    break
+                if requested > 0:
+                    return requested
+                break
+        return self.default_timeout_ms
@@ -0,0 +1,44 @@
+# filepath: /src/infrastructure/middleware/metrics_middleware.py
+"""
+Middleware que mide la latencia de cada petición por ruta.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..observability.metrics import PrometheusMetrics, route_template
+
+
+class MetricsMiddleware:
+    """
+    Registra la duración de cada petición en http_request_duration_seconds.
+
+    La etiqueta `route` es la plantilla de la ruta (con {parametros}), de
+    modo que las series no crecen con cada ID. En respuestas en streaming
+    (SSE) la duración incluye todo el envío.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: PrometheusMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.http_request_duration.labels(
+                scope["method"], route_template(scope), str(status_code)
+            ).observe(time.perf_counter() - start)
@@ -0,0 +1,38 @@
+# filepath: /src/infrastructure/middleware/token_usage_middleware.py
+"""
+Middleware que registra el uso de tokens de IA de cada petición.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...shared.utils.token_usage import token_usage_scope
+
+
+class TokenUsageMiddleware:
+    """
+    Abre un acumulador de tokens por petición y lo expone en la respuesta.
+
+    Si la petición hizo llamadas al modelo, se agregan los headers
+    X-AI-Prompt-Tokens, X-AI-Completion-Tokens y X-AI-Calls.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with token_usage_scope() as usage:
+            async def send_with_usage(message: Message) -> None:
+                if message["type"] == "http.response.start" and usage.calls:
+                    headers = list(message.get("headers", []))
+                    headers.extend([
+                        (b"x-ai-prompt-tokens", str(usage.prompt_tokens).encode()),
+                        (b"x-ai-completion-tokens", str(usage.completion_tokens).encode()),
+                        (b"x-ai-calls", str(usage.calls).encode()),
+                    ])
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_usage)
@@ -0,0 +1,46 @@
+# filepath: /src/infrastructure/middleware/tracing_middleware.py
+"""
+Middleware que abre el span raíz de cada petición.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...shared.utils.tracing import span
+from ..observability.metrics import route_template
+
+
+class TracingMiddleware:
+    """
+    Abre un span por petición; los spans de casos de uso, repositorios,
+    SQL e IA quedan como sus hijos.
+
+    El ID de la traza se devuelve en el header X-Trace-Id, para buscar la
+    petición en el archivo de spans. Las tareas en segundo plano de la
+    respuesta (BackgroundTasks) forman parte de la misma traza.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        attributes = {"http.method": scope["method"], "http.target": scope["path"]}
+        with span(f"{scope['method']} request", **attributes) as current:
+            context = current.get_span_context()
+            trace_id = format(context.trace_id, "032x").encode() if context.is_valid else None
+
+            async def send_with_trace_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    current.set_attribute("http.status_code", message["status"])
+                    if trace_id is not None:
+                        message = {**message, "headers": [*message.get("headers", []), (b"x-trace-id", trace_id)]}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = route_template(scope)
+                current.set_attribute("http.route", route)
+                current.update_name(f"{scope['method']} {route}")
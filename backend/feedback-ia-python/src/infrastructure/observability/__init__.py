@@ -0,0 +1,20 @@
+"""
+Observabilidad del servicio: métricas de los caminos críticos.
+"""
+from .metrics import (
+    PrometheusMetrics,
+    get_metrics,
+    instrument_engine,
+    instrument_repository,
+    observe_llm_call,
+    record_llm_tokens
+)
+
+__all__ = [
+    "PrometheusMetrics",
+    "get_metrics",
+    "instrument_engine",
+    "instrument_repository",
+    "observe_llm_call",
+    "record_llm_tokens",
+]
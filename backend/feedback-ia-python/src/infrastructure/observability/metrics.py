@@ -0,0 +1,322 @@
+# filepath: /src/infrastructure/observability/metrics.py
+"""
+Métricas Prometheus de los caminos críticos.
+
+Se exponen en /metrics cuando METRICS_ENABLED está activo:
+
+- Latencia de cada petición HTTP por ruta (plantilla, no URL concreta)
+- Duración y número de consultas de cada método de repositorio
+- Duración de cada consulta SQL y espera al obtener una conexión del pool
+- Consultas lentas por lugar del código (ver slow_queries)
+- Latencia, errores y tokens de las llamadas al modelo de lenguaje
+- Análisis en segundo plano en curso y clientes siguiendo su avance
+- Aciertos y fallos de las cachés de catálogos y de respuestas
+
+Con METRICS_ENABLED desactivado no se importa prometheus_client, no se
+registran el middleware ni los eventos del engine, y los decoradores solo
+comprueban get_metrics() antes de llamar a la función original.
+"""
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config.settings import get_settings
+
+T = TypeVar("T")
+
+# Límites de los histogramas (segundos)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+
+# Ruta de las peticiones que no coinciden con ninguna (evita una serie por URL)
+UNMATCHED_ROUTE = "unmatched"
+
+# Consultas ejecutadas dentro del método de repositorio en curso
+_queries_in_call: ContextVar[Optional[List[int]]] = ContextVar("queries_in_call", default=None)
+
+# Inicio de las consultas en curso, por conexión
+_QUERY_START_KEY = "metrics_query_start"
+
+
+class PrometheusMetrics:
+    """
+    Métricas del proceso en un registro propio.
+
+    Las cachés, el pool y los análisis en segundo plano no se instrumentan
+    en su camino: sus contadores se leen solo cuando se consulta /metrics.
+    """
+
+    def __init__(self):
+        from prometheus_client import CollectorRegistry, Counter, Histogram
+
+        self.registry = CollectorRegistry()
+        self.http_request_duration = Histogram(
+            "http_request_duration_seconds", "Latencia de las peticiones HTTP por ruta",
+            ("method", "route", "status"), buckets=REQUEST_BUCKETS, registry=self.registry
+        )
+        self.repository_call_duration = Histogram(
+            "db_repository_call_duration_seconds", "Duración de los métodos de repositorio",
+            ("repository", "method"), buckets=DB_BUCKETS, registry=self.registry
+        )
+        self.repository_queries = Counter(
+            "db_repository_queries", "Consultas SQL ejecutadas por método de repositorio",
+            ("repository", "method"), registry=self.registry
+        )
+        self.query_duration = Histogram(
+            "db_query_duration_seconds", "Duración de las consultas SQL por operación",
+            ("operation",), buckets=DB_BUCKETS, registry=self.registry
+        )
+        self.pool_checkout_wait = Histogram(
+            "db_pool_checkout_wait_seconds", "Espera para obtener una conexión del pool",
+            ("engine",), buckets=DB_BUCKETS, registry=self.registry
+        )
+        self.llm_call_duration = Histogram(
+            "llm_call_duration_seconds", "Latencia de las llamadas al modelo por tipo de llamada",
+            ("call_type",), buckets=LLM_BUCKETS, registry=self.registry
+        )
+        self.llm_errors = Counter(
+            "llm_call_errors", "Llamadas al modelo que fallaron, por tipo de llamada y error",
+            ("call_type", "error"), registry=self.registry
+        )
+        self.llm_tokens = Counter(
+            "llm_tokens", "Tokens consumidos por tipo de llamada (prompt | completion)",
+            ("call_type", "kind"), registry=self.registry
+        )
+        self.engines: Dict[str, Engine] = {}
+        self.registry.register(_RuntimeCollector(self.engines))
+
+    def render(self) -> Tuple[bytes, str]:
+        """Métricas en formato de exposición de Prometheus y su content type."""
+        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+
+class _RuntimeCollector:
+    """Valores leídos en cada consulta de /metrics, sin costo en las peticiones."""
+
+    def __init__(self, engines: Dict[str, Engine]):
+        self._engines = engines
+
+    def collect(self):
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        # Imports diferidos: evitan ciclos al importar los repositorios
+        from ..cache.catalog import get_catalog_cache
+        from ..cache.response_cache import response_cache
+        from ..jobs.analysis_jobs import get_analysis_job_broker
+        from .slow_queries import get_slow_query_log
+
+        hits = CounterMetricFamily("cache_hits", "Aciertos de caché", labels=("cache",))
+        misses = CounterMetricFamily("cache_misses", "Fallos de caché", labels=("cache",))
+        ratio = GaugeMetricFamily("cache_hit_ratio", "Proporción de aciertos desde el arranque", labels=("cache",))
+        for name, cache in (("catalog", get_catalog_cache()), ("response", response_cache)):
+            hits.add_metric((name,), cache.hits)
+            misses.add_metric((name,), cache.misses)
+            ratio.add_metric((name,), cache.hit_ratio())
+        yield hits
+        yield misses
+        yield ratio
+
+        broker = get_analysis_job_broker()
+        yield GaugeMetricFamily(
+            "analysis_jobs_running", "Análisis en segundo plano ejecutándose en este worker",
+            value=broker.running_jobs
+        )
+        yield GaugeMetricFamily(
+            "analysis_event_subscribers", "Clientes siguiendo el avance de un análisis (SSE)",
+            value=broker.subscriber_count
+        )
+
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out", "Conexiones del pool en uso", labels=("engine",)
+        )
+        for name, engine in self._engines.items():
+            checkedout = getattr(engine.pool, "checkedout", None)
+            if checkedout is not None:
+                checked_out.add_metric((name,), checkedout())
+        yield checked_out
+
+        slow = CounterMetricFamily(
+            "db_slow_queries", "Consultas más lentas que SLOW_QUERY_MS por lugar del código", labels=("call_site",)
+        )
+        slow_query_log = get_slow_query_log()
+        for site in slow_query_log.stats() if slow_query_log is not None else ():
+            slow.add_metric((site["call_site"],), site["count"])
+        yield slow
+
+
+@lru_cache(maxsize=None)
+def get_metrics() -> Optional[PrometheusMetrics]:
+    """Métricas del proceso, None si METRICS_ENABLED está desactivado."""
+    if not get_settings().app.metrics_enabled:
+        return None
+    return PrometheusMetrics()
+
+
+def instrument_repository(cls: type) -> type:
+    """
+    Decorador de clase: mide cada método público del repositorio.
+
+    Registra la duración de cada llamada y cuántas consultas SQL ejecutó
+    (contadas por los eventos de instrument_engine). Acepta métodos de
+    instancia, estáticos y asíncronos.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_"):
+            continue
+        if isinstance(value, staticmethod):
+            setattr(cls, attr, staticmethod(_timed_repository_call(cls.__name__, attr, value.__func__)))
+        elif inspect.isfunction(value):
+            setattr(cls, attr, _timed_repository_call(cls.__name__, attr, value))
+    return cls
+
+
+def _timed_repository_call(repository: str, method: str, func: Callable[..., T]) -> Callable[..., T]:
+    """Envuelve un método de repositorio para medirlo."""
+
+    def observe(metrics: PrometheusMetrics, start: float, queries: List[int]) -> None:
+        metrics.repository_call_duration.labels(repository, method).observe(time.perf_counter() - start)
+        if queries[0]:
+            metrics.repository_queries.labels(repository, method).inc(queries[0])
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            metrics = get_metrics()
+            if metrics is None:
+                return await func(*args, **kwargs)
+            queries = [0]
+            token = _queries_in_call.set(queries)
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _queries_in_call.reset(token)
+                observe(metrics, start, queries)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics = get_metrics()
+        if metrics is None:
+            return func(*args, **kwargs)
+        queries = [0]
+        token = _queries_in_call.set(queries)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _queries_in_call.reset(token)
+            observe(metrics, start, queries)
+    return wrapper
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Mide las consultas y la espera del pool de un engine.
+
+    No hace nada si las métricas están desactivadas o el engine ya se
+    instrumentó.
+
+    Args:
+        engine: Engine de SQLAlchemy
+        name: Nombre del engine en la etiqueta `engine`
+    """
+    metrics = get_metrics()
+    if metrics is None or name in metrics.engines:
+        return
+    metrics.engines[name] = engine
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    # Connection pide la conexión con engine.raw_connection(); se envuelve en
+    # el engine (no en el pool) para que sobreviva a engine.dispose()
+    raw_connection = engine.raw_connection
+    wait = metrics.pool_checkout_wait.labels(name)
+
+    def timed_raw_connection():
+        start = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            wait.observe(time.perf_counter() - start)
+
+    engine.raw_connection = timed_raw_connection
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get(_QUERY_START_KEY)
+    metrics = get_metrics()
+    if not starts or metrics is None:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+    metrics.query_duration.labels(operation).observe(elapsed)
+    queries = _queries_in_call.get()
+    if queries is not None:
+        queries[0] += 1
+
+
+@contextmanager
+def observe_llm_call(call_type: str) -> Iterator[None]:
+    """
+    Mide una llamada al modelo: latencia y, si falla, el tipo de error.
+
+    Args:
+        call_type: Tipo de llamada (comment, suggestions, structure, transcription...)
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        metrics.llm_errors.labels(call_type, type(e).__name__).inc()
+        raise
+    finally:
+        metrics.llm_call_duration.labels(call_type).observe(time.perf_counter() - start)
+
+
+def record_llm_tokens(call_type: str, prompt_tokens: int, completion_tokens: int) -> None:
+    """Suma los tokens de una llamada al modelo."""
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    metrics.llm_tokens.labels(call_type, "prompt").inc(prompt_tokens)
+    metrics.llm_tokens.labels(call_type, "completion").inc(completion_tokens)
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """Plantilla de la ruta que atendió la petición (p. ej. /api/v1/feedbacks/{feedback_id})."""
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return UNMATCHED_ROUTE
+    regex = getattr(route, "path_regex", None)
+    path = scope["path"]
+    if regex is None or regex.match(path):
+        return template
+    # Con routers incluidos, route.path puede ser relativo al prefijo: se
+    # busca la parte de la URL que corresponde a la ruta y se conserva el prefijo
+    start = path.find("/", 1)
+    while start != -1:
+        if regex.match(path[start:]):
+            return path[:start] + template
+        start = path.find("/", start + 1)
+    return template
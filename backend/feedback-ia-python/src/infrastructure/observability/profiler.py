@@ -0,0 +1,149 @@
+# filepath: /src/infrastructure/observability/profiler.py
+"""
+Perfilador por muestreo para diagnosticar consumo de CPU en producción.
+
+Un hilo en segundo plano toma cada `interval_ms` la pila de todos los hilos
+del worker (sys._current_frames) y cuenta cuántas veces aparece cada pila.
+No instrumenta el código: el costo es una lectura de pilas por intervalo,
+solo mientras se perfila.
+
+El resultado se entrega en formato de pilas colapsadas (una línea por pila,
+"hilo;externa;...;interna cuenta"), que aceptan flamegraph.pl, speedscope
+e inferno.
+"""
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# Funciones en las que un hilo está esperando, no usando CPU (módulo, función)
+IDLE_FRAMES = frozenset({
+    ("selectors", "select"),
+    ("threading", "wait"),
+    ("queue", "get"),
+    ("concurrent.futures.thread", "_worker"),
+})
+
+# Profundidad máxima de pila registrada (se conservan los marcos más internos)
+MAX_STACK_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Ya hay un perfilado en curso en este worker."""
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    """Pilas muestreadas durante un perfilado."""
+
+    stacks: Dict[str, int]
+    samples: int
+    duration_s: float
+    interval_ms: float
+
+    def collapsed(self) -> str:
+        """Pilas colapsadas, de la más frecuente a la menos frecuente."""
+        ordered = sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+class SamplingProfiler:
+    """
+    Muestrea las pilas de todos los hilos del proceso.
+
+    Solo admite un perfilado a la vez por proceso.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stacks: Counter = Counter()
+        self._samples = 0
+        self._started_at = 0.0
+        self._interval = 0.01
+        self._include_idle = False
+
+    @property
+    def running(self) -> bool:
+        """True si hay un perfilado en curso."""
+        return self._thread is not None
+
+    def start(self, interval_ms: float = 10.0, include_idle: bool = False) -> None:
+        """
+        Inicia el muestreo en un hilo en segundo plano.
+
+        Args:
+            interval_ms: Tiempo entre muestras
+            include_idle: Incluir hilos que están esperando (E/S, locks, colas)
+
+        Raises:
+            ProfilerBusyError: Si ya hay un perfilado en curso
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise ProfilerBusyError("Ya hay un perfilado en curso en este worker")
+            self._stacks = Counter()
+            self._samples = 0
+            self._interval = interval_ms / 1000
+            self._include_idle = include_idle
+            self._stop.clear()
+            self._started_at = time.perf_counter()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> ProfileResult:
+        """
+        Detiene el muestreo y retorna las pilas acumuladas.
+
+        Returns:
+            ProfileResult del perfilado
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                raise RuntimeError("No hay un perfilado en curso")
+            self._stop.set()
+            thread.join()
+            self._thread = None
+            return ProfileResult(
+                stacks=dict(self._stacks),
+                samples=self._samples,
+                duration_s=time.perf_counter() - self._started_at,
+                interval_ms=self._interval * 1000,
+            )
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self._interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack, idle = _collapse(frame)
+                if idle and not self._include_idle:
+                    continue
+                self._stacks[f"{names.get(thread_id, thread_id)};{stack}"] += 1
+            self._samples += 1
+
+
+def _frame_label(frame) -> Tuple[str, str]:
+    return frame.f_globals.get("__name__", "?"), frame.f_code.co_name
+
+
+def _collapse(frame) -> Tuple[str, bool]:
+    """Pila de un hilo de la más externa a la más interna, y si está en espera."""
+    idle = _frame_label(frame) in IDLE_FRAMES
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        module, function = _frame_label(frame)
+        labels.append(f"{module}:{function}")
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels), idle
+
+
+# Instancia compartida por el proceso (un perfilado a la vez por worker)
+sampling_profiler = SamplingProfiler()
@@ -0,0 +1,217 @@
+# filepath: /src/infrastructure/observability/slow_queries.py
+"""
+Registro de consultas lentas con su plan de ejecución.
+
+Cada sentencia se cronometra con los eventos del engine. Las que superan
+SLOW_QUERY_MS se registran en el log con los parámetros ocultos (solo su
+tipo) y el lugar del código que las ejecutó, y se cuentan por ese lugar
+(GET /api/v1/admin/slow-queries).
+
+La primera vez que una consulta lenta aparece en un lugar del código (y
+luego como mucho una vez cada SLOW_QUERY_EXPLAIN_INTERVAL_S) se captura su
+plan en la misma conexión:
+
+- PostgreSQL: EXPLAIN (ANALYZE, BUFFERS) para lecturas. ANALYZE vuelve a
+  ejecutar la consulta, por eso las escrituras usan EXPLAIN sin ANALYZE. Se
+  ejecuta dentro de un SAVEPOINT para que un fallo no aborte la transacción.
+- SQLite: EXPLAIN QUERY PLAN.
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Raíz del código de la aplicación (para localizar el lugar que ejecuta la consulta)
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_OBSERVABILITY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Inicio de la sentencia, guardado en su contexto de ejecución: si la
+# sentencia falla after_cursor_execute no se llama y el contexto se descarta
+_START_ATTR = "_slow_query_start"
+
+# Lecturas: se pueden volver a ejecutar con EXPLAIN ANALYZE sin efectos
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b(?!.*\b(INSERT|UPDATE|DELETE|MERGE)\b)", re.IGNORECASE | re.DOTALL)
+
+UNKNOWN_CALL_SITE = "desconocido"
+
+
+@dataclass
+class CallSiteStats:
+    """Consultas lentas de un lugar del código."""
+
+    call_site: str
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    plan: Optional[str] = None
+    explained_at: float = float("-inf")
+
+
+class SlowQueryLog:
+    """
+    Cronometra las sentencias de uno o más engines y registra las lentas.
+
+    Responsabilidades:
+    - Medir cada sentencia (eventos before/after_cursor_execute)
+    - Registrar en el log las que superan el umbral, sin valores de parámetros
+    - Contar las consultas lentas por lugar del código y capturar su plan
+    """
+
+    def __init__(self, threshold_ms: float, explain: bool = True, explain_interval_s: float = 300.0):
+        self.threshold_ms = threshold_ms
+        self._explain = explain
+        self._explain_interval = explain_interval_s
+        self._sites: Dict[str, CallSiteStats] = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        """Registra los eventos en un engine (una sola vez por engine)."""
+        if event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Consultas lentas por lugar del código, de mayor a menor tiempo total."""
+        with self._lock:
+            sites = sorted(self._sites.values(), key=lambda site: site.total_ms, reverse=True)
+            return [
+                {key: value for key, value in asdict(site).items() if key != "explained_at"}
+                for site in sites
+            ]
+
+    def reset(self) -> None:
+        """Olvida las consultas lentas registradas."""
+        with self._lock:
+            self._sites.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            setattr(context, _START_ATTR, time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = getattr(context, _START_ATTR, None)
+        if start is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= self.threshold_ms:
+            self._record(conn, cursor, statement, parameters, executemany, elapsed_ms)
+
+    def _record(self, conn, cursor, statement, parameters, executemany, elapsed_ms: float) -> None:
+        """Cuenta, registra y (si corresponde) explica una consulta lenta."""
+        site = _call_site()
+        now = time.monotonic()
+        with self._lock:
+            stats = self._sites.get(site)
+            if stats is None:
+                stats = self._sites[site] = CallSiteStats(call_site=site, statement=statement)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            explain = self._explain and not executemany and now - stats.explained_at >= self._explain_interval
+            if explain:
+                stats.explained_at = now
+
+        plan = _explain_plan(conn, cursor, statement, parameters) if explain else None
+        if plan is not None:
+            with self._lock:
+                stats.plan = plan
+
+        logger.warning(
+            "Consulta lenta (%.1f ms) en %s\n%s\nParámetros: %s%s",
+            elapsed_ms, site, statement, redact_parameters(parameters, executemany),
+            f"\nPlan:\n{plan}" if plan else ""
+        )
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> str:
+    """Parámetros de una sentencia sin sus valores (solo tipos)."""
+    if executemany:
+        return f"{len(parameters)} filas"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: <{type(value).__name__}>" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(f"<{type(value).__name__}>" for value in parameters) + ")"
+    return "<ocultos>"
+
+
+def _call_site() -> str:
+    """Primer marco de la aplicación (fuera de SQLAlchemy y de este módulo) en la pila."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_SRC_DIR) and not filename.startswith(_OBSERVABILITY_DIR):
+            relative = os.path.relpath(filename, os.path.dirname(_SRC_DIR))
+            return f"{relative}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return UNKNOWN_CALL_SITE
+
+
+def _explain_plan(conn, cursor, statement: str, parameters: Any) -> Optional[str]:
+    """Plan de ejecución de una sentencia en la misma conexión, None si no se pudo obtener."""
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if _READ_ONLY.match(statement) else "EXPLAIN "
+    elif dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        return None
+
+    dbapi_connection = cursor.connection
+    explain_cursor = dbapi_connection.cursor()
+    savepoint = dialect == "postgresql"
+    try:
+        if savepoint:
+            explain_cursor.execute("SAVEPOINT slow_query_explain")
+        explain_cursor.execute(prefix + statement, parameters)
+        rows = explain_cursor.fetchall()
+        if savepoint:
+            explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    except Exception:
+        logger.debug("No se pudo obtener el plan de la consulta", exc_info=True)
+        if savepoint:
+            try:
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            except Exception:
+                logger.debug("No se pudo revertir el savepoint del plan", exc_info=True)
+        return None
+    finally:
+        explain_cursor.close()
+
+    if dialect == "sqlite":
+        # Filas (id, parent, notused, detail)
+        return "\n".join(str(row[-1]) for row in rows)
+    return "\n".join(str(row[0]) for row in rows)
+
+
+@lru_cache(maxsize=None)
+def get_slow_query_log() -> Optional[SlowQueryLog]:
+    """Registro de consultas lentas del proceso, None si SLOW_QUERY_MS es 0."""
+    config = get_settings().database
+    if config.slow_query_ms <= 0:
+        return None
+    return SlowQueryLog(
+        threshold_ms=config.slow_query_ms,
+        explain=config.slow_query_explain,
+        explain_interval_s=config.slow_query_explain_interval_s
+    )
+
+
+def install_slow_query_log(engine: Engine) -> None:
+    """Cronometra las sentencias del engine si el registro está activo."""
+    slow_query_log = get_slow_query_log()
+    if slow_query_log is not None:
+        slow_query_log.install(engine)
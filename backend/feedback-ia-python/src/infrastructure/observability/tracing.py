@@ -0,0 +1,179 @@
+# filepath: /src/infrastructure/observability/tracing.py
+"""
+Configuración de las trazas (OpenTelemetry) y su exportación a archivo.
+
+Con TRACING_ENABLED activo, cada petición genera una traza con un span por
+caso de uso, método de repositorio, sentencia SQL y llamada al servicio de
+IA. Los spans se escriben en TRACING_EXPORT_PATH, uno por línea en JSON con
+los mismos campos que enviaría un exportador OTLP (trace_id, span_id,
+parent_span_id, tiempos, atributos, estado y eventos): el archivo hace de
+colector local. Para desglosar una petición lenta:
+
+    python -m src.interface.cli.trace_report --slowest 5
+    python -m src.interface.cli.trace_report --trace-id <X-Trace-Id>
+"""
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ...shared.utils import tracing
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "feedback-ia-python"
+
+# Longitud máxima de la sentencia SQL guardada en el span
+MAX_STATEMENT_LENGTH = 500
+
+# Spans de SQL abiertos, por conexión
+_SQL_SPANS_KEY = "tracing_sql_spans"
+
+
+def span_to_dict(span: Any) -> Dict[str, Any]:
+    """Span terminado (ReadableSpan) como diccionario serializable."""
+    context = span.get_span_context()
+    return {
+        "trace_id": format(context.trace_id, "032x"),
+        "span_id": format(context.span_id, "016x"),
+        "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
+        "name": span.name,
+        "kind": span.kind.name,
+        "start_time_unix_nano": span.start_time,
+        "end_time_unix_nano": span.end_time,
+        "duration_ms": (span.end_time - span.start_time) / 1e6,
+        "status": span.status.status_code.name,
+        "attributes": dict(span.attributes or {}),
+        "events": [
+            {"name": item.name, "time_unix_nano": item.timestamp, "attributes": dict(item.attributes or {})}
+            for item in span.events
+        ],
+        "service": span.resource.attributes.get("service.name"),
+    }
+
+
+class JsonLinesSpanExporter:
+    """
+    Escribe los spans terminados en un archivo, uno por línea en JSON.
+
+    Implementa la interfaz SpanExporter del SDK (export, shutdown,
+    force_flush) sin heredarla, para no importar el SDK con las trazas
+    desactivadas.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: Sequence[Any]):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        lines = "".join(json.dumps(span_to_dict(span), default=str) + "\n" for span in spans)
+        try:
+            with self._lock, open(self._path, "a", encoding="utf-8") as output:
+                output.write(lines)
+        except OSError:
+            logger.exception("No se pudieron exportar %s spans a %s", len(spans), self._path)
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+@lru_cache(maxsize=None)
+def setup_tracing() -> bool:
+    """
+    Configura el tracer del proceso si TRACING_ENABLED está activo.
+
+    Returns:
+        True si las trazas quedaron activas
+    """
+    config = get_settings().app
+    if not config.tracing_enabled:
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(config.tracing_sample_ratio))
+    )
+    provider.add_span_processor(BatchSpanProcessor(JsonLinesSpanExporter(config.tracing_export_path)))
+    # Proveedor propio (no el global): solo se exportan los spans de este servicio
+    tracing.configure_tracer(provider.get_tracer(SERVICE_NAME))
+    return True
+
+
+def trace_engine(engine: Engine) -> None:
+    """
+    Abre un span por cada sentencia SQL ejecutada en el engine.
+
+    No hace nada si las trazas están desactivadas. El span es hijo del
+    activo (normalmente el del método de repositorio).
+
+    Args:
+        engine: Engine de SQLAlchemy
+    """
+    if not tracing.tracing_enabled() or event.contains(engine, "before_cursor_execute", _start_sql_span):
+        return
+    event.listen(engine, "before_cursor_execute", _start_sql_span)
+    event.listen(engine, "after_cursor_execute", _end_sql_span)
+    event.listen(engine, "handle_error", _fail_sql_span)
+
+
+def _start_sql_span(conn, cursor, statement, parameters, context, executemany) -> None:
+    tracer = tracing.get_tracer()
+    if tracer is None:
+        return
+    sql_span = tracer.start_span("db.query", attributes={
+        "db.system": conn.dialect.name,
+        "db.operation": statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER",
+        "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        "db.executemany": executemany,
+    })
+    conn.info.setdefault(_SQL_SPANS_KEY, []).append(sql_span)
+
+
+def _end_sql_span(conn, cursor, statement, parameters, context, executemany) -> None:
+    spans = conn.info.get(_SQL_SPANS_KEY)
+    if spans:
+        spans.pop().end()
+
+
+def _fail_sql_span(exception_context) -> None:
+    conn = exception_context.connection
+    spans = conn.info.get(_SQL_SPANS_KEY) if conn is not None else None
+    if not spans:
+        return
+    from opentelemetry.trace import Status, StatusCode
+
+    sql_span = spans.pop()
+    sql_span.record_exception(exception_context.original_exception)
+    sql_span.set_status(Status(StatusCode.ERROR))
+    sql_span.end()
+
+
+def current_trace_id() -> Optional[str]:
+    """ID (hex) de la traza activa, None sin trazas."""
+    if not tracing.tracing_enabled():
+        return None
+    from opentelemetry import trace
+
+    context = trace.get_current_span().get_span_context()
+    return format(context.trace_id, "032x") if context.is_valid else None
@@ -2,22 +2,36 @@
 Sistema de inyección de dependencias para la aplicación.
 Configura e inyecta las dependencias necesarias para cada capa.
 """
-from typing import Dict
-from fastapi import Depends, HTTPException, status
+from typing import TYPE_CHECKING, Dict, Optional
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from ...application.use_cases.feedback.create_feedback import CreateFeedbackUseCase
 from ...application.use_cases.feedback.generate_ai_feedback import GenerateAIFeedbackUseCase
-from ...domain.services.feedback_analyzer import FeedbackAnalyzerService
+from ...application.use_cases.feedback.list_feedbacks import ListFeedbacksUseCase
+from ...application.use_cases.grabacion.analyze_grabacion import AnalyzeGrabacionUseCase
+from ...application.interfaces.ai_service_interface import AIServiceInterface
+from ...domain.exceptions.validation_exceptions import AIServiceError
+from ...domain.services.audio_analyzer_service import AudioAnalyzerService
+from ...infrastructure.cache.catalog import CachedCatalogRepository
+from ...infrastructure.database.repositories.sqlalchemy_analisis_grabacion_repository import SQLAlchemyAnalisisGrabacionRepository
 from ...infrastructure.database.repositories.sqlalchemy_feedback_repository import SQLAlchemyFeedbackRepository
-from ...infrastructure.external_services.openai_service import OpenAIService
+from ...infrastructure.database.repositories.sqlalchemy_grabacion_repository import SQLAlchemyGrabacionRepository
+from ...infrastructure.external_services.ai_service_factory import AIServiceFactory
 from ...infrastructure.database.connection import get_db
 from ...infrastructure.security import verify_api_key
 
+if TYPE_CHECKING:
+    # El analizador importa numpy: se carga al inyectarlo, no al arrancar la API
+    from ...domain.services.feedback_analyzer import FeedbackAnalyzerService
+
 # === Instancias de seguridad ===
 security = HTTPBearer()
 
+# === Proveedores de IA (instancias compartidas entre peticiones) ===
+ai_service_factory = AIServiceFactory()
+
 
 def get_feedback_repository(db: Session = Depends(get_db)) -> SQLAlchemyFeedbackRepository:
     """
@@ -32,45 +46,110 @@ def get_feedback_repository(db: Session = Depends(get_db)) -> SQLAlchemyFeedback
     return SQLAlchemyFeedbackRepository(db)
 
 
-def get_feedback_analyzer() -> FeedbackAnalyzerService:
+def get_grabacion_repository(db: Session = Depends(get_db)) -> SQLAlchemyGrabacionRepository:
+    """
+    Inyecta el repositorio de grabaciones.
+    
+    Args:
+        db: Sesión de base de datos
+        
+    Returns:
+        Instancia del repositorio de grabaciones
+    """
+    return SQLAlchemyGrabacionRepository(db)
+
+
+def get_analisis_repository(db: Session = Depends(get_db)) -> SQLAlchemyAnalisisGrabacionRepository:
+    """
+    Inyecta el repositorio de análisis de IA por grabación.
+    
+    Args:
+        db: Sesión de base de datos
+        
+    Returns:
+        Instancia del repositorio de análisis
+    """
+    return SQLAlchemyAnalisisGrabacionRepository(db)
+
+
+def get_catalog_repository(db: Session = Depends(get_db)) -> CachedCatalogRepository:
+    """
+    Inyecta los catálogos (tipos de métrica, métricas y parámetros) en memoria.
+    
+    Args:
+        db: Sesión de base de datos
+        
+    Returns:
+        Catálogo respaldado por la caché del proceso
+    """
+    return CachedCatalogRepository(db)
+
+
+def get_feedback_analyzer(
+    catalog: CachedCatalogRepository = Depends(get_catalog_repository)
+) -> "FeedbackAnalyzerService":
     """
     Inyecta el servicio analizador de feedback.
     
+    Args:
+        catalog: Catálogo de métricas y parámetros
+        
     Returns:
         Instancia del analizador de feedback
     """
-    return FeedbackAnalyzerService()
+    from ...domain.services.feedback_analyzer import FeedbackAnalyzerService
+
+    return FeedbackAnalyzerService(catalog)
 
 
-def get_ai_service() -> OpenAIService:
+def get_ai_service(
+    x_ai_provider: Optional[str] = Header(default=None),
+    x_tenant_id: Optional[str] = Header(default=None)
+) -> AIServiceInterface:
     """
-    Inyecta el servicio de IA.
+    Inyecta el servicio de IA según la petición o el tenant.
     
+    Args:
+        x_ai_provider: Proveedor pedido ("openai" o "rule_based")
+        x_tenant_id: Tenant, para aplicar su proveedor configurado
+        
     Returns:
         Instancia del servicio de IA
+        
+    Raises:
+        HTTPException: 400 si el proveedor no es soportado
     """
-    return OpenAIService()
+    try:
+        return ai_service_factory.get_service(x_ai_provider, x_tenant_id)
+    except AIServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message
+        )
 
 
 def get_create_feedback_use_case(
-    repository: SQLAlchemyFeedbackRepository = Depends(get_feedback_repository)
+    repository: SQLAlchemyFeedbackRepository = Depends(get_feedback_repository),
+    catalog: CachedCatalogRepository = Depends(get_catalog_repository)
 ) -> CreateFeedbackUseCase:
     """
     Inyecta el caso de uso para crear feedback.
     
     Args:
         repository: Repositorio de feedback
+        catalog: Catálogo de métricas y parámetros
         
     Returns:
         Instancia del caso de uso
     """
-    return CreateFeedbackUseCase(repository)
+    return CreateFeedbackUseCase(repository, catalog)
 
 
 def get_generate_ai_feedback_use_case(
     repository: SQLAlchemyFeedbackRepository = Depends(get_feedback_repository),
-    ai_service: OpenAIService = Depends(get_ai_service),
-    analyzer: FeedbackAnalyzerService = Depends(get_feedback_analyzer)
+    ai_service: AIServiceInterface = Depends(get_ai_service),
+    analyzer: "FeedbackAnalyzerService" = Depends(get_feedback_analyzer),
+    analisis_repository: SQLAlchemyAnalisisGrabacionRepository = Depends(get_analisis_repository)
 ) -> GenerateAIFeedbackUseCase:
     """
     Inyecta el caso de uso para generar feedback con IA.
@@ -79,16 +158,53 @@ def get_generate_ai_feedback_use_case(
         repository: Repositorio de feedback
         ai_service: Servicio de IA
         analyzer: Analizador de feedback
+        analisis_repository: Repositorio de análisis por grabación
+        
+    Returns:
+        Instancia del caso de uso
+    """
+    return GenerateAIFeedbackUseCase(repository, ai_service, analyzer, analisis_repository)
+
+
+def get_analyze_grabacion_use_case(
+    repository: SQLAlchemyGrabacionRepository = Depends(get_grabacion_repository),
+    analisis_repository: SQLAlchemyAnalisisGrabacionRepository = Depends(get_analisis_repository)
+) -> AnalyzeGrabacionUseCase:
+    """
+    Inyecta el caso de uso de análisis de grabaciones.
+    
+    El repositorio de análisis permite reutilizar el resultado guardado
+    mientras no cambien el archivo ni la versión del analizador.
+    
+    Args:
+        repository: Repositorio de grabaciones
+        analisis_repository: Repositorio de análisis por grabación
+        
+    Returns:
+        Instancia del caso de uso
+    """
+    return AnalyzeGrabacionUseCase(repository, AudioAnalyzerService(), analisis_repository)
+
+
+def get_list_feedbacks_use_case(
+    repository: SQLAlchemyFeedbackRepository = Depends(get_feedback_repository)
+) -> ListFeedbacksUseCase:
+    """
+    Inyecta el caso de uso de listado de feedbacks.
+    
+    Args:
+        repository: Repositorio de feedback
         
     Returns:
         Instancia del caso de uso
     """
-    return GenerateAIFeedbackUseCase(repository, ai_service, analyzer)
+    return ListFeedbacksUseCase(repository)
 
 
 def get_feedback_use_cases(
     create_use_case: CreateFeedbackUseCase = Depends(get_create_feedback_use_case),
-    generate_ai_use_case: GenerateAIFeedbackUseCase = Depends(get_generate_ai_feedback_use_case)
+    generate_ai_use_case: GenerateAIFeedbackUseCase = Depends(get_generate_ai_feedback_use_case),
+    list_use_case: ListFeedbacksUseCase = Depends(get_list_feedbacks_use_case)
 ) -> Dict:
     """
     Inyecta todos los casos de uso de feedback.
@@ -96,6 +212,7 @@ def get_feedback_use_cases(
     Args:
         create_use_case: Caso de uso para crear feedback
         generate_ai_use_case: Caso de uso para generar feedback con IA
+        list_use_case: Caso de uso para listados de feedback
         
     Returns:
         Diccionario con todos los casos de uso
@@ -103,6 +220,7 @@ def get_feedback_use_cases(
     return {
         "create_feedback": create_use_case,
         "generate_ai_feedback": generate_ai_use_case,
+        "list_feedbacks": list_use_case,
     }
 
 
@@ -12,7 +12,8 @@ from ....application.dtos.feedback_dto import (
     CreateFeedbackDTO, 
     FeedbackResponseDTO,
     GenerateAIFeedbackDTO,
-    FeedbackFilterDTO
+    FeedbackFilterDTO,
+    FeedbackListItem
 )
 from ....domain.exceptions.validation_exceptions import (
     DuplicateFeedbackError,
@@ -21,10 +22,21 @@ from ....domain.exceptions.validation_exceptions import (
     AIServiceError
 )
 from ....infrastructure.database.connection import get_db
+from .....shared.utils.fast_json import FastJSONResponse, FastJSONRoute
 from ..dependencies import get_feedback_use_cases, require_authentication
 
 
-router = APIRouter(prefix="/feedbacks", tags=["feedbacks"])
+router = APIRouter(prefix="/feedbacks", tags=["feedbacks"], route_class=FastJSONRoute)
+
+
+def _list_response(items: List[FeedbackListItem]) -> FastJSONResponse:
+    """
+    Serializa un listado directamente desde los elementos compactos.
+    
+    Evita la validación de response_model, que crearía un modelo por fila;
+    el esquema documentado sigue siendo FeedbackResponseDTO.
+    """
+    return FastJSONResponse(content=items)
 
 
 @router.post(
@@ -230,9 +242,10 @@ async def list_feedbacks(
         )
         
         list_use_case = use_cases["list_feedbacks"]
-        results = await list_use_case.execute(filter_dto)
-        return results
+        return _list_response(await list_use_case.execute(filter_dto))
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -375,9 +388,14 @@ async def get_feedbacks_by_grabacion(
         HTTPException: 500 si ocurre un error interno
     """
     try:
-        get_by_grabacion_use_case = use_cases["get_feedbacks_by_grabacion"]
-        return await get_by_grabacion_use_case.execute(grabacion_id, skip, limit)
+        list_use_case = use_cases["list_feedbacks"]
+        return _list_response(await list_use_case.by_grabacion(grabacion_id, skip, limit))
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Parámetros inválidos: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -414,9 +432,14 @@ async def get_feedbacks_by_parametro(
         HTTPException: 500 si ocurre un error interno
     """
     try:
-        get_by_parametro_use_case = use_cases["get_feedbacks_by_parametro"]
-        return await get_by_parametro_use_case.execute(parametro_id, skip, limit)
+        list_use_case = use_cases["list_feedbacks"]
+        return _list_response(await list_use_case.by_parametro(parametro_id, skip, limit))
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Parámetros inválidos: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,287 @@
+"""
+Servidor local compatible con la API de OpenAI para pruebas de carga.
+
+Implementa los endpoints usados por OpenAIService (chat completions y
+transcripciones de audio) con respuestas deterministas, latencia configurable
+e inyección de errores 5xx y 429. Permite medir el rendimiento del pipeline de
+feedback sin red y sin costo.
+
+Uso:
+    python -m src.interface.cli.ai_stub_server --port 8090 --latency-dist lognormal \
+        --latency-mean-ms 800 --latency-stddev-ms 300 --rate-limit-rate 0.05 --seed 42
+
+Y en la aplicación:
+    OPENAI_BASE_URL=http://127.0.0.1:8090/v1 OPENAI_API_KEY=stub
+"""
+import argparse
+import asyncio
+import hashlib
+import math
+import random
+import time
+from dataclasses import dataclass
+from email import policy
+from email.parser import BytesParser
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+# Frases usadas para construir respuestas deterministas
+_PHRASES: List[str] = [
+    "Tu ritmo de habla es adecuado y facilita seguir la presentación.",
+    "Procura hacer pausas más marcadas entre las ideas principales.",
+    "La introducción presenta el tema con claridad.",
+    "Varía la entonación para mantener la atención de la audiencia.",
+    "Reduce el uso de muletillas en las transiciones.",
+    "La conclusión resume bien los puntos clave.",
+    "Cuida el volumen al final de las frases.",
+    "Apoya los datos con ejemplos concretos.",
+    "Mantén un ritmo constante en las secciones técnicas.",
+    "Practica la apertura para ganar seguridad desde el inicio.",
+]
+
+
+@dataclass
+class StubConfig:
+    """Configuración de latencia y fallos del servidor simulado."""
+
+    latency_dist: str = "fixed"
+    latency_mean_ms: float = 0.0
+    latency_stddev_ms: float = 0.0
+    latency_min_ms: float = 0.0
+    latency_max_ms: Optional[float] = None
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: int = 1
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Distribución de latencia no soportada: {self.latency_dist}. "
+                f"Opciones: {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+        if not 0 <= self.error_rate <= 1 or not 0 <= self.rate_limit_rate <= 1:
+            raise ValueError("Las tasas de error deben estar entre 0 y 1")
+        if self.error_rate + self.rate_limit_rate > 1:
+            raise ValueError("La suma de error_rate y rate_limit_rate no puede superar 1")
+
+
+class StubBehavior:
+    """
+    Decide la latencia y el resultado de cada petición.
+
+    Usa un generador aleatorio con semilla propia, de modo que la misma
+    secuencia de peticiones produce la misma secuencia de latencias y fallos.
+    """
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self.stats: Dict[str, int] = {"requests": 0, "errors": 0, "rate_limited": 0}
+
+    def sample_latency_ms(self) -> float:
+        """Obtiene una latencia según la distribución configurada."""
+        config = self.config
+        mean = config.latency_mean_ms
+        stddev = config.latency_stddev_ms
+
+        if config.latency_dist == "fixed":
+            value = mean
+        elif config.latency_dist == "uniform":
+            value = self._rng.uniform(max(0.0, mean - stddev), mean + stddev)
+        elif config.latency_dist == "normal":
+            value = self._rng.gauss(mean, stddev)
+        elif config.latency_dist == "lognormal":
+            value = self._sample_lognormal(mean, stddev)
+        else:
+            value = self._rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+        value = max(value, config.latency_min_ms, 0.0)
+        if config.latency_max_ms is not None:
+            value = min(value, config.latency_max_ms)
+        return value
+
+    def sample_outcome(self) -> str:
+        """Retorna 'ok', 'error' o 'rate_limited' según las tasas configuradas."""
+        self.stats["requests"] += 1
+        draw = self._rng.random()
+        if draw < self.config.rate_limit_rate:
+            self.stats["rate_limited"] += 1
+            return "rate_limited"
+        if draw < self.config.rate_limit_rate + self.config.error_rate:
+            self.stats["errors"] += 1
+            return "error"
+        return "ok"
+
+    def _sample_lognormal(self, mean: float, stddev: float) -> float:
+        """Muestra una lognormal parametrizada por su media y desviación reales."""
+        if mean <= 0:
+            return 0.0
+        if stddev <= 0:
+            return mean
+        sigma_sq = math.log(1 + (stddev / mean) ** 2)
+        mu = math.log(mean) - sigma_sq / 2
+        return self._rng.lognormvariate(mu, math.sqrt(sigma_sq))
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.sha256(payload).digest()
+
+
+def _multipart_fields(content_type: str, body: bytes) -> Dict[str, bytes]:
+    """Campos de un cuerpo multipart/form-data, por nombre (sin python-multipart)."""
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    if not message.is_multipart():
+        return {}
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(decode=True) or b""
+        for part in message.iter_parts()
+    }
+
+
+def _deterministic_text(digest: bytes, sentences: int) -> str:
+    """Construye un texto estable a partir del hash de la petición."""
+    chosen = [_PHRASES[digest[i % len(digest)] % len(_PHRASES)] for i in range(sentences)]
+    return "\n".join(chosen)
+
+
+def _error_response(status_code: int, message: str, error_type: str, code: str,
+                    headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    """Error con el mismo formato que la API de OpenAI."""
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, "param": None, "code": code}},
+        headers=headers,
+    )
+
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """
+    Crea la aplicación del servidor simulado.
+
+    Args:
+        config: Configuración de latencia y fallos
+
+    Returns:
+        Aplicación FastAPI compatible con los endpoints de OpenAI usados
+    """
+    behavior = StubBehavior(config or StubConfig())
+    app = FastAPI(title="OpenAI stand-in", docs_url=None, redoc_url=None)
+    app.state.behavior = behavior
+
+    async def simulate() -> Optional[JSONResponse]:
+        # La decisión se toma antes de esperar para que el orden de llegada
+        # determine la secuencia de resultados
+        outcome = behavior.sample_outcome()
+        latency_ms = behavior.sample_latency_ms()
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+        if outcome == "rate_limited":
+            return _error_response(
+                429, "Rate limit reached (simulado)", "requests", "rate_limit_exceeded",
+                headers={"retry-after": str(behavior.config.retry_after_seconds)},
+            )
+        if outcome == "error":
+            return _error_response(500, "Error interno simulado", "server_error", "server_error")
+        return None
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.body()
+        failure = await simulate()
+        if failure is not None:
+            return failure
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return _error_response(400, "JSON inválido", "invalid_request_error", "invalid_json")
+
+        digest = _digest(body)
+        max_tokens = payload.get("max_tokens") or 200
+        # Aproximadamente 12 tokens por frase, como máximo 5 frases
+        content = _deterministic_text(digest, max(1, min(5, max_tokens // 40)))
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in payload.get("messages", []))
+        completion_tokens = len(content.split())
+
+        return {
+            "id": f"chatcmpl-stub-{digest.hex()[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.post("/v1/audio/transcriptions")
+    async def audio_transcriptions(request: Request):
+        # Se usan el archivo y el modelo (no el cuerpo completo, que incluye
+        # un boundary aleatorio) para que el mismo audio produzca siempre la
+        # misma transcripción
+        body = await request.body()
+        failure = await simulate()
+        if failure is not None:
+            return failure
+
+        fields = _multipart_fields(request.headers.get("content-type", ""), body)
+        digest = _digest(fields.get("model", b"") + b"\0" + fields.get("file", body))
+        text = _deterministic_text(digest, 4).replace("\n", " ")
+        return {"text": f"Eh bueno, hola a todos. {text}"}
+
+    @app.get("/stats")
+    async def stats():
+        return dict(behavior.stats)
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Servidor local compatible con OpenAI para pruebas de carga")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-mean-ms", type=float, default=0.0)
+    parser.add_argument("--latency-stddev-ms", type=float, default=0.0)
+    parser.add_argument("--latency-min-ms", type=float, default=0.0)
+    parser.add_argument("--latency-max-ms", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracción de respuestas 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fracción de respuestas 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Valor del header Retry-After en 429")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = StubConfig(
+        latency_dist=args.latency_dist,
+        latency_mean_ms=args.latency_mean_ms,
+        latency_stddev_ms=args.latency_stddev_ms,
+        latency_min_ms=args.latency_min_ms,
+        latency_max_ms=args.latency_max_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_seconds=args.retry_after,
+        seed=args.seed,
+    )
+
+    import uvicorn
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
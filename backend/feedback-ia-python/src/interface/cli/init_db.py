@@ -0,0 +1,28 @@
+"""
+Aplica las migraciones de esquema pendientes (alembic upgrade head).
+
+Pensado para ejecutarse una vez por despliegue (con SCHEMA_AUTO_CREATE=false
+en los workers), en lugar de revisar el esquema en cada arranque.
+
+Uso:
+    python -m src.interface.cli.init_db
+"""
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+from src.database.connection import engine
+
+# Raíz del proyecto (donde está alembic.ini)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    command.upgrade(Config(str(PROJECT_ROOT / "alembic.ini")), "head")
+    print(f"Esquema actualizado en {engine.url.render_as_string(hide_password=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Mide el tiempo de arranque en frío de la aplicación.
+
+Cada muestra se toma en un proceso nuevo: importa `src.main`, ejecuta el
+lifespan y atiende una primera petición a /health. Termina con código 1 si
+la mediana supera el presupuesto.
+
+Uso:
+    python -m src.interface.cli.measure_startup --runs 5 --budget-ms 1000
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# Código ejecutado en el proceso hijo
+_PROBE = """
+import json, time
+start = time.perf_counter()
+import src.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(src.main.app) as client:
+    ready = time.perf_counter()
+    client.get("/health")
+first_response = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (ready - start) * 1000,
+    "first_response_ms": (first_response - start) * 1000,
+}))
+"""
+
+
+def measure_once(env: Dict[str, str]) -> Dict[str, float]:
+    """Arranca un proceso nuevo y retorna sus tiempos en milisegundos."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Mide el arranque en frío de la API")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000.0,
+                        help="Presupuesto para la mediana hasta la primera respuesta")
+    args = parser.parse_args(argv)
+
+    env = {**os.environ, "API_KEY": os.environ.get("API_KEY", "startup-probe")}
+    samples = [measure_once(env) for _ in range(args.runs)]
+
+    summary = {
+        metric: {
+            "median": round(statistics.median(s[metric] for s in samples), 1),
+            "max": round(max(s[metric] for s in samples), 1),
+        }
+        for metric in ("import_ms", "startup_ms", "first_response_ms")
+    }
+    print(json.dumps({"runs": args.runs, "budget_ms": args.budget_ms, **summary}, indent=2))
+
+    if summary["first_response_ms"]["median"] > args.budget_ms:
+        print("Presupuesto de arranque superado", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
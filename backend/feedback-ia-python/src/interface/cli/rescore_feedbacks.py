@@ -0,0 +1,44 @@
+"""
+Re-puntúa los feedbacks automáticos con la rúbrica vigente.
+
+Usa los análisis guardados en analisis_grabacion (no vuelve a llamar al
+servicio de IA). Un trabajo interrumpido se reanuda desde su último
+checkpoint con --resume.
+
+Uso:
+    python -m src.interface.cli.rescore_feedbacks [--parametros 1,2] [--batch-size 1000]
+    python -m src.interface.cli.rescore_feedbacks --resume JOB_ID
+"""
+import argparse
+import logging
+
+from src.infrastructure.jobs import RescoreJob
+
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parametros", help="IDs de parámetros separados por coma (por defecto, todos)")
+    parser.add_argument("--resume", type=int, metavar="JOB_ID", help="reanuda un trabajo existente")
+    parser.add_argument("--batch-size", type=int, default=1000, help="grabaciones por lote")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    job = RescoreJob(batch_size=args.batch_size)
+    if args.resume is not None:
+        job_id = args.resume
+    else:
+        parametros = [int(value) for value in args.parametros.split(",")] if args.parametros else None
+        job_id = job.start(parametros)
+        print(f"Trabajo de re-puntuación {job_id} registrado")
+
+    progress = job.run(job_id)
+    print(
+        f"Trabajo {progress.job_id} {progress.estado}: {progress.grabaciones_procesadas} grabaciones, "
+        f"{progress.feedbacks_actualizados} feedbacks actualizados"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Desglosa las trazas exportadas (TRACING_EXPORT_PATH) por etapa.
+
+Sin --trace-id lista las peticiones más lentas; con --trace-id (el header
+X-Trace-Id de la respuesta) muestra el árbol de spans de una petición con
+su duración total y propia (sin contar los spans hijos).
+
+Uso:
+    python -m src.interface.cli.trace_report [--slowest 10] [--file ./traces/spans.jsonl]
+    python -m src.interface.cli.trace_report --trace-id TRACE_ID
+"""
+import argparse
+import json
+from collections import defaultdict
+from typing import Dict, List
+
+from src.infrastructure.config.settings import get_settings
+
+
+def load_traces(path: str) -> Dict[str, List[dict]]:
+    """Spans del archivo agrupados por trace_id."""
+    traces: Dict[str, List[dict]] = defaultdict(list)
+    with open(path, encoding="utf-8") as spans_file:
+        for line in spans_file:
+            if line.strip():
+                span = json.loads(line)
+                traces[span["trace_id"]].append(span)
+    return traces
+
+
+def _roots(spans: List[dict]) -> List[dict]:
+    ids = {span["span_id"] for span in spans}
+    return [span for span in spans if span["parent_span_id"] not in ids]
+
+
+def print_slowest(traces: Dict[str, List[dict]], limit: int) -> None:
+    """Lista las trazas más lentas (por la duración de su span raíz)."""
+    roots = [root for spans in traces.values() for root in _roots(spans)]
+    roots.sort(key=lambda span: span["duration_ms"], reverse=True)
+    for root in roots[:limit]:
+        print(f"{root['duration_ms']:10.1f} ms  {root['trace_id']}  {root['name']}  ({len(traces[root['trace_id']])} spans)")
+
+
+def print_tree(spans: List[dict]) -> None:
+    """Árbol de spans de una traza, en orden de inicio."""
+    children: Dict[str, List[dict]] = defaultdict(list)
+    for span in spans:
+        children[span["parent_span_id"]].append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span["start_time_unix_nano"])
+
+    def show(span: dict, depth: int) -> None:
+        own = span["duration_ms"] - sum(child["duration_ms"] for child in children[span["span_id"]])
+        label = span["name"]
+        if span["name"] == "db.query":
+            label += "  " + " ".join(span["attributes"].get("db.statement", "").split())[:80]
+        error = "  [ERROR]" if span["status"] == "ERROR" else ""
+        print(f"{span['duration_ms']:10.1f} ms {max(own, 0.0):10.1f} ms  {'  ' * depth}{label}{error}")
+        for child in children[span["span_id"]]:
+            show(child, depth + 1)
+
+    print(f"{'total':>13} {'propio':>13}")
+    for root in sorted(_roots(spans), key=lambda span: span["start_time_unix_nano"]):
+        show(root, 0)
+
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--file", default=None, help="archivo de spans (por defecto, TRACING_EXPORT_PATH)")
+    parser.add_argument("--trace-id", help="traza a desglosar (header X-Trace-Id)")
+    parser.add_argument("--slowest", type=int, default=10, help="trazas a listar sin --trace-id")
+    args = parser.parse_args()
+
+    traces = load_traces(args.file or get_settings().app.tracing_export_path)
+    if args.trace_id is None:
+        print_slowest(traces, args.slowest)
+    elif args.trace_id not in traces:
+        parser.exit(1, f"No hay spans de la traza {args.trace_id}\n")
+    else:
+        print_tree(traces[args.trace_id])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,59 @@
-from fastapi import FastAPI, HTTPException, Request
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-import uvicorn
+from src.api.admin_endpoints import router as admin_router
+from src.api.analysis_job_endpoints import router as analysis_job_router
 from src.api.endpoints import router as public_router
 from src.api.secure_endpoints import router as secure_router
-from src.database.connection import Base, engine
-from src.infrastructure.config.settings import settings
-
-# Crear tablas en la base de datos
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title=settings.app.title,
-    description=settings.app.description,
-    version=settings.app.version,
-    docs_url="/docs" if settings.is_development else None,
-    redoc_url="/redoc" if settings.is_development else None,
-)
-
-# Configurar CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.app.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+from src.database.connection import SessionLocal, engine, init_db
+from src.infrastructure.cache.catalog import get_catalog_cache
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.database.connection import engine as infrastructure_engine
+from src.infrastructure.middleware.deadline_middleware import DeadlineMiddleware
+from src.infrastructure.middleware.metrics_middleware import MetricsMiddleware
+from src.infrastructure.middleware.token_usage_middleware import TokenUsageMiddleware
+from src.infrastructure.middleware.tracing_middleware import TracingMiddleware
+from src.infrastructure.observability.metrics import get_metrics, instrument_engine
+from src.infrastructure.observability.tracing import setup_tracing, trace_engine
+from src.shared.utils.fast_json import FastJSONResponse, FastJSONRoute
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def warm_catalog_cache() -> None:
+    """
+    Carga los catálogos antes de atender peticiones.
+
+    La rúbrica de puntuación no se compila aquí: importa numpy y solo la
+    necesita el primer análisis, que la compila y la deja en la caché.
+    """
+    try:
+        with SessionLocal() as db:
+            get_catalog_cache().sync(db)
+    except SQLAlchemyError:
+        # Sin tablas todavía: se cargan en la primera petición que las use
+        logger.warning("No se pudieron precargar los catálogos", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Tareas de arranque: se ejecutan una vez por worker, no al importar."""
+    if settings.database.schema_auto_create:
+        init_db()
+    warm_catalog_cache()
+    yield
+
 
 # Manejadores de excepciones personalizados
-@app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Maneja excepciones HTTP con formato consistente."""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
@@ -43,7 +63,6 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         }
     )
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Maneja errores de validación de Pydantic."""
     # Si el input recibido es bytes, conviértelo a string para mostrarlo en el error
@@ -56,7 +75,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                 input_data = exc.body
     except Exception:
         input_data = None
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=422,
         content={
             "detail": "Error de validación",
@@ -67,10 +86,9 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
-@app.exception_handler(StarletteHTTPException)
 async def starlette_exception_handler(request: Request, exc: StarletteHTTPException):
     """Maneja excepciones HTTP de Starlette."""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
@@ -79,13 +97,12 @@ async def starlette_exception_handler(request: Request, exc: StarletteHTTPExcept
         }
     )
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Maneja excepciones generales no capturadas."""
     if settings.is_development:
         # En desarrollo, mostrar el error completo
         import traceback
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={
                 "detail": "Error interno del servidor",
@@ -97,7 +114,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         )
     else:
         # En producción, ocultar detalles del error
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={
                 "detail": "Error interno del servidor",
@@ -106,11 +123,6 @@ async def general_exception_handler(request: Request, exc: Exception):
             }
         )
 
-# Incluir routers
-app.include_router(public_router, prefix="/api/v1/public", tags=["public"])
-app.include_router(secure_router, prefix="/api/v1", tags=["authenticated"])
-
-@app.get("/")
 def root():
     """Endpoint raíz con información de la API."""
     return {
@@ -121,7 +133,6 @@ def root():
         "authentication": "Bearer token required for most endpoints"
     }
 
-@app.get("/health")
 def health_check():
     """Endpoint de verificación de salud."""
     return {
@@ -131,7 +142,82 @@ def health_check():
         "environment": "development" if settings.is_development else "production"
     }
 
+async def metrics_endpoint():
+    """Métricas Prometheus del worker (solo con METRICS_ENABLED)."""
+    body, content_type = get_metrics().render()
+    return Response(content=body, media_type=content_type)
+
+def create_app() -> FastAPI:
+    """
+    Construye la aplicación FastAPI.
+    
+    Returns:
+        Aplicación configurada con middlewares, manejadores y routers
+    """
+    app = FastAPI(
+        title=settings.app.title,
+        description=settings.app.description,
+        version=settings.app.version,
+        docs_url="/docs" if settings.is_development else None,
+        redoc_url="/redoc" if settings.is_development else None,
+        lifespan=lifespan,
+    )
+
+    # Configurar CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.app.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Plazo por petición, propagado hasta la capa de IA
+    app.add_middleware(DeadlineMiddleware, default_timeout_ms=settings.app.request_deadline_ms)
+
+    # Uso de tokens de IA por petición (headers X-AI-*)
+    app.add_middleware(TokenUsageMiddleware)
+
+    # Métricas Prometheus: latencia por ruta, consultas y espera del pool
+    metrics = get_metrics()
+    if metrics is not None:
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+        instrument_engine(engine, "legacy")
+        instrument_engine(infrastructure_engine, "infrastructure")
+
+    # Trazas por petición (header X-Trace-Id); envuelve a las métricas
+    if setup_tracing():
+        app.add_middleware(TracingMiddleware)
+        trace_engine(engine)
+        trace_engine(infrastructure_engine)
+
+    # Manejadores de excepciones personalizados
+    app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(StarletteHTTPException, starlette_exception_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
+
+    # Incluir routers
+    app.include_router(public_router, prefix="/api/v1/public", tags=["public"])
+    app.include_router(secure_router, prefix="/api/v1", tags=["authenticated"])
+    app.include_router(analysis_job_router, prefix="/api/v1", tags=["analysis-jobs"])
+    app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
+
+    # Rutas propias: respuestas serializadas con orjson
+    app.router.route_class = FastJSONRoute
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+    if metrics is not None:
+        app.add_api_route("/metrics", metrics_endpoint, methods=["GET"], include_in_schema=False)
+
+    return app
+
+
+app = create_app()
+
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "src.main:app", 
         host="0.0.0.0", 
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text, Boolean, Index, JSON, LargeBinary, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from src.database.connection import Base
+from src.infrastructure.database.types import JSONDocument
 
 class TipoMetrica(Base):
     __tablename__ = "tipos_metrica"
@@ -47,6 +48,22 @@ class Parametro(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class ParametroMetrica(Base):
+    """Métrica del análisis de audio que aporta al puntaje de un parámetro (ver ScoringRubric)."""
+    __tablename__ = "parametro_metricas"
+
+    id = Column(Integer, primary_key=True, index=True)
+    parametro_id = Column(Integer, ForeignKey("parametros.id"), nullable=False, index=True)
+    clave = Column(String(50), nullable=False)
+    fuente = Column(String(100), nullable=False)
+    peso = Column(Float, nullable=False)
+    normalizacion = Column(String(20), nullable=False, default="lineal")
+    objetivo = Column(Float, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("parametro_id", "clave", name="uq_parametro_metricas_parametro_clave"),
+    )
+
 class Grabacion(Base):
     __tablename__ = "grabaciones"
 
@@ -63,6 +80,11 @@ class Grabacion(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Índices (ver migrations/versions): paginación por cursor
+    __table_args__ = (
+        Index("ix_grabaciones_created_at_id", "created_at", "id"),
+    )
+
 class Feedback(Base):
     __tablename__ = "feedbacks"
 
@@ -78,4 +100,92 @@ class Feedback(Base):
     parametro = relationship("Parametro", back_populates="feedbacks")
     
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Índices (ver migrations/versions)
+    __table_args__ = (
+        # Un solo feedback por grabación y parámetro; cubre también búsquedas por grabacion_id
+        Index("uq_feedbacks_grabacion_parametro", "grabacion_id", "parametro_id", unique=True),
+        Index("ix_feedbacks_parametro_id", "parametro_id"),
+        Index("ix_feedbacks_grabacion_es_manual", "grabacion_id", "es_manual"),
+        # Consultas de puntajes bajos
+        Index("ix_feedbacks_valor", "valor"),
+        # Paginación por cursor
+        Index("ix_feedbacks_created_at_id", "created_at", "id"),
+    )
+
+class CatalogVersion(Base):
+    """Versión de cada catálogo; se incrementa en cada escritura (ver src/infrastructure/cache/catalog.py)."""
+    __tablename__ = "catalog_versions"
+
+    catalog = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class AnalisisGrabacion(Base):
+    """Último análisis de cada grabación por analizador, para no repetirlo (ver analisis_grabacion_model)."""
+    __tablename__ = "analisis_grabacion"
+
+    grabacion_id = Column(Integer, ForeignKey("grabaciones.id"), primary_key=True)
+    analizador = Column(String(20), primary_key=True, default="ia")
+    version = Column(String(100), nullable=False, default="")
+    hash_entrada = Column(String(64), nullable=False, default="")
+    resultado = Column(JSONDocument(), nullable=False)
+    metricas = Column(LargeBinary, nullable=True)  # Vector float64 de los campos numéricos
+    duracion_ms = Column(Float, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class RescoreJob(Base):
+    """Trabajo de re-puntuación de feedbacks automáticos (ver src/infrastructure/jobs/rescore_job.py)."""
+    __tablename__ = "rescore_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    estado = Column(String(20), nullable=False, default="pendiente")
+    parametros = Column(JSON, nullable=True)  # None: todos los parámetros
+    # Checkpoint: las grabaciones se recorren en orden de ID
+    ultimo_grabacion_id = Column(Integer, nullable=False, default=0)
+    grabaciones_procesadas = Column(Integer, nullable=False, default=0)
+    feedbacks_actualizados = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+class AnalysisJob(Base):
+    """Avance de un análisis en segundo plano (ver analysis_job_model)."""
+    __tablename__ = "analysis_jobs"
+
+    id = Column(String(32), primary_key=True)
+    tipo = Column(String(50), nullable=False)
+    estado = Column(String(20), nullable=False, default="pendiente")
+    etapa = Column(String(30), nullable=True)
+    progreso = Column(Float, nullable=False, default=0.0)
+    detalle = Column(Text, nullable=True)
+    secuencia = Column(Integer, nullable=False, default=0)  # ID del último evento
+    resultado = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+class Transcripcion(Base):
+    """Transcripción por contenido de audio, idioma y modelo (ver transcript_model)."""
+    __tablename__ = "transcripciones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    hash_audio = Column(String(64), nullable=False)
+    idioma = Column(String(10), nullable=False)
+    modelo = Column(String(50), nullable=False)
+    texto = Column(Text, nullable=True)
+    ruta_comprimida = Column(String(500), nullable=True)  # Texto comprimido fuera de la base de datos
+    palabras = Column(Integer, nullable=False, default=0)
+    duracion_segundos = Column(Float, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("hash_audio", "idioma", "modelo", name="uq_transcripcion_audio_idioma_modelo"),
+    )
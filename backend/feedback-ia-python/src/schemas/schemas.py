@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 from datetime import datetime
 
 # Esquemas para TipoMetrica
@@ -50,6 +50,23 @@ class ParametroResponse(ParametroBase):
 
     model_config = {"from_attributes": True}
 
+# Esquemas para las métricas ponderadas de un Parametro (rúbrica de puntuación)
+class ParametroMetricaBase(BaseModel):
+    clave: str
+    fuente: str
+    peso: float
+    normalizacion: str = "lineal"
+    objetivo: Optional[float] = None
+
+class ParametroMetricaCreate(ParametroMetricaBase):
+    pass
+
+class ParametroMetricaResponse(ParametroMetricaBase):
+    id: int
+    parametro_id: int
+
+    model_config = {"from_attributes": True}
+
 # Esquemas para Grabacion
 class GrabacionBase(BaseModel):
     nombre_archivo: str
@@ -91,4 +108,52 @@ class FeedbackDetailResponse(FeedbackResponse):
     grabacion: GrabacionResponse
     parametro: ParametroResponse
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+# Esquemas para análisis en segundo plano
+class GenerateAIFeedbackRequest(BaseModel):
+    grabacion_id: int
+    parametros_ids: List[int]
+    audio_analysis_data: Dict[str, Any] = {}
+    use_advanced_model: bool = False
+
+class AnalysisJobCreated(BaseModel):
+    job_id: str
+    events_url: str
+
+class AnalysisJobResponse(BaseModel):
+    job_id: str
+    secuencia: int
+    estado: str
+    etapa: Optional[str] = None
+    progreso: float
+    detalle: Optional[str] = None
+    resultado: Optional[Any] = None
+    error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+# Esquemas para creación por lotes (un resultado por elemento, en el orden recibido)
+T = TypeVar("T")
+
+class BatchItemError(BaseModel):
+    error_code: str
+    detail: str
+
+class BatchItemResult(BaseModel, Generic[T]):
+    index: int
+    item: Optional[T] = None
+    error: Optional[BatchItemError] = None
+
+class BatchCreateResponse(BaseModel, Generic[T]):
+    created: int
+    failed: int
+    results: List[BatchItemResult[T]]
+
+# Adaptadores para serializar catálogos cacheados (una respuesta por forma de consulta)
+TipoMetricaListAdapter = TypeAdapter(List[TipoMetricaResponse])
+TipoMetricaAdapter = TypeAdapter(TipoMetricaResponse)
+MetricaListAdapter = TypeAdapter(List[MetricaResponse])
+MetricaAdapter = TypeAdapter(MetricaResponse)
+ParametroListAdapter = TypeAdapter(List[ParametroResponse])
+ParametroAdapter = TypeAdapter(ParametroResponse)
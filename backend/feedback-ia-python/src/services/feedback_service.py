@@ -1,13 +1,82 @@
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from src.models.models import TipoMetrica, Metrica, Parametro, Grabacion, Feedback
+from typing import Any, Dict, List, Optional
+from src.models.models import TipoMetrica, Metrica, Parametro, ParametroMetrica, Grabacion, Feedback
 from src.schemas import schemas
+from src.domain.entities.grabacion import Grabacion as GrabacionEntity
+from src.domain.exceptions.validation_exceptions import (
+    DomainException,
+    DomainValidationError,
+    DuplicateFeedbackError,
+    GrabacionNotFoundError,
+    MetricaNotFoundError,
+    ParametroNotFoundError
+)
+from src.domain.value_objects.archivo_audio import ArchivoAudio
+from src.domain.value_objects.feedback_score import FeedbackScore
+from src.domain.value_objects.metrica_ponderada import MetricaPonderada
+from src.infrastructure.cache.catalog import PARAMETRO_METRICAS, mark_catalog_changed
+from src.infrastructure.cache.response_cache import METRICAS, PARAMETROS, TIPOS_METRICA
+from src.infrastructure.observability.metrics import instrument_repository
+from src.shared.utils.tracing import trace_public_methods
 
+# Columnas de los listados de feedback: se leen como filas planas (Row), sin
+# crear instancias del ORM ni registrarlas en el identity map de la sesión.
+_FEEDBACK_LIST_COLUMNS = select(
+    Feedback.id, Feedback.grabacion_id, Feedback.parametro_id, Feedback.valor,
+    Feedback.comentario, Feedback.es_manual, Feedback.created_at, Feedback.updated_at
+)
+
+
+def _commit_batch(
+    db: Session, model: Any, count: int, valid: Dict[int, Dict[str, Any]],
+    errors: Dict[int, DomainException], *catalogs: str
+) -> Dict[str, Any]:
+    """
+    Inserta los elementos válidos de un lote en una sola sentencia y confirma.
+    
+    Args:
+        db: Sesión de la transacción
+        model: Modelo de la tabla
+        count: Elementos recibidos
+        valid: Columnas de cada elemento válido, por su posición en el lote
+        errors: Error de cada elemento inválido, por su posición en el lote
+        *catalogs: Catálogos a invalidar si se creó algún elemento
+        
+    Returns:
+        Diccionario con el formato de schemas.BatchCreateResponse
+    """
+    created: Dict[int, Dict[str, Any]] = {}
+    if valid:
+        table = model.__table__
+        # executemany con RETURNING: las filas vuelven en el orden de los parámetros
+        stmt = insert(table).returning(*table.columns, sort_by_parameter_order=True)
+        rows = db.execute(stmt, list(valid.values()))
+        created = {index: dict(row._mapping) for index, row in zip(valid, rows)}
+        if catalogs:
+            mark_catalog_changed(db, *catalogs)
+    db.commit()
+    
+    results = []
+    for index in range(count):
+        error = errors.get(index)
+        if error is None:
+            results.append({"index": index, "item": created[index]})
+        else:
+            results.append({"index": index, "error": {"error_code": error.error_code, "detail": error.message}})
+    return {"created": len(created), "failed": len(errors), "results": results}
+
+
+@trace_public_methods
+@instrument_repository
 class FeedbackService:
     @staticmethod
     def create_tipo_metrica(db: Session, tipo_metrica: schemas.TipoMetricaCreate):
         db_tipo_metrica = TipoMetrica(**tipo_metrica.model_dump())
         db.add(db_tipo_metrica)
+        # Invalida la caché de catálogos de todos los workers al confirmar
+        mark_catalog_changed(db, TIPOS_METRICA)
         db.commit()
         db.refresh(db_tipo_metrica)
         return db_tipo_metrica
@@ -24,6 +93,7 @@ class FeedbackService:
     def create_metrica(db: Session, metrica: schemas.MetricaCreate):
         db_metrica = Metrica(**metrica.model_dump())
         db.add(db_metrica)
+        mark_catalog_changed(db, METRICAS)
         db.commit()
         db.refresh(db_metrica)
         return db_metrica
@@ -40,10 +110,33 @@ class FeedbackService:
     def create_parametro(db: Session, parametro: schemas.ParametroCreate):
         db_parametro = Parametro(**parametro.model_dump())
         db.add(db_parametro)
+        mark_catalog_changed(db, PARAMETROS)
         db.commit()
         db.refresh(db_parametro)
         return db_parametro
     
+    @staticmethod
+    def create_parametros_batch(db: Session, parametros: List[schemas.ParametroCreate]):
+        """
+        Crea varios parámetros en una transacción.
+        
+        Los parámetros cuya métrica no existe no se insertan y se reportan en
+        su posición; el resto se inserta en una sola sentencia.
+        
+        Returns:
+            Diccionario con el formato de schemas.BatchCreateResponse
+        """
+        metrica_ids = {parametro.metrica_id for parametro in parametros}
+        existing_metricas = set(db.scalars(select(Metrica.id).where(Metrica.id.in_(metrica_ids))))
+        
+        valid, errors = {}, {}
+        for index, parametro in enumerate(parametros):
+            if parametro.metrica_id not in existing_metricas:
+                errors[index] = MetricaNotFoundError(parametro.metrica_id)
+            else:
+                valid[index] = parametro.model_dump()
+        return _commit_batch(db, Parametro, len(parametros), valid, errors, PARAMETROS)
+    
     @staticmethod
     def get_parametros(db: Session, skip: int = 0, limit: int = 100):
         return db.query(Parametro).offset(skip).limit(limit).all()
@@ -52,6 +145,41 @@ class FeedbackService:
     def get_parametro_by_id(db: Session, parametro_id: int):
         return db.query(Parametro).filter(Parametro.id == parametro_id).first()
     
+    @staticmethod
+    def get_parametro_metricas(db: Session, parametro_id: int):
+        return db.query(ParametroMetrica).filter(
+            ParametroMetrica.parametro_id == parametro_id
+        ).order_by(ParametroMetrica.id).all()
+    
+    @staticmethod
+    def replace_parametro_metricas(
+        db: Session, parametro_id: int, metricas: List[schemas.ParametroMetricaCreate]
+    ):
+        """
+        Reemplaza las métricas ponderadas que evalúan a un parámetro.
+        
+        Una lista vacía vuelve al grupo de métricas por defecto del parámetro.
+        
+        Raises:
+            ParametroNotFoundError: Si el parámetro no existe
+            DomainValidationError: Si alguna métrica no es válida o hay claves repetidas
+        """
+        if FeedbackService.get_parametro_by_id(db, parametro_id) is None:
+            raise ParametroNotFoundError(parametro_id)
+        claves = set()
+        for metrica in metricas:
+            MetricaPonderada(**metrica.model_dump())
+            # La clave es única por parámetro (uq_parametro_metricas_parametro_clave)
+            if metrica.clave in claves:
+                raise DomainValidationError(f"La clave de métrica '{metrica.clave}' está repetida")
+            claves.add(metrica.clave)
+        
+        db.query(ParametroMetrica).filter(ParametroMetrica.parametro_id == parametro_id).delete()
+        db.add_all(ParametroMetrica(parametro_id=parametro_id, **metrica.model_dump()) for metrica in metricas)
+        mark_catalog_changed(db, PARAMETRO_METRICAS)
+        db.commit()
+        return FeedbackService.get_parametro_metricas(db, parametro_id)
+    
     @staticmethod
     def create_grabacion(db: Session, grabacion: schemas.GrabacionCreate):
         db_grabacion = Grabacion(**grabacion.model_dump())
@@ -60,6 +188,34 @@ class FeedbackService:
         db.refresh(db_grabacion)
         return db_grabacion
     
+    @staticmethod
+    def create_grabaciones_batch(db: Session, grabaciones: List[schemas.GrabacionCreate]):
+        """
+        Crea varias grabaciones en una transacción.
+        
+        Cada grabación se valida con las reglas del dominio (formato, ruta,
+        duración y fecha); las inválidas no se insertan y se reportan en su
+        posición.
+        
+        Returns:
+            Diccionario con el formato de schemas.BatchCreateResponse
+        """
+        valid, errors = {}, {}
+        for index, grabacion in enumerate(grabaciones):
+            try:
+                GrabacionEntity(
+                    id=None,
+                    archivo_audio=ArchivoAudio(
+                        grabacion.nombre_archivo, grabacion.ruta_archivo, grabacion.formato, grabacion.duracion
+                    ),
+                    fecha_grabacion=grabacion.fecha_grabacion
+                )
+            except DomainException as e:
+                errors[index] = e
+                continue
+            valid[index] = grabacion.model_dump()
+        return _commit_batch(db, Grabacion, len(grabaciones), valid, errors)
+    
     @staticmethod
     def get_grabaciones(db: Session, skip: int = 0, limit: int = 100):
         return db.query(Grabacion).offset(skip).limit(limit).all()
@@ -72,13 +228,83 @@ class FeedbackService:
     def create_feedback(db: Session, feedback: schemas.FeedbackCreate):
         db_feedback = Feedback(**feedback.model_dump())
         db.add(db_feedback)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            # El índice único (grabacion_id, parametro_id) rechaza duplicados
+            if FeedbackService.get_feedback_by_grabacion_and_parametro(
+                db, feedback.grabacion_id, feedback.parametro_id
+            ) is not None:
+                raise DuplicateFeedbackError(feedback.grabacion_id, feedback.parametro_id)
+            raise
         db.refresh(db_feedback)
         return db_feedback
     
+    @staticmethod
+    def create_feedbacks_batch(db: Session, feedbacks: List[schemas.FeedbackCreate]):
+        """
+        Crea varios feedbacks en una transacción.
+        
+        Valida todo el lote con tres consultas (grabaciones, parámetros y pares
+        ya calificados) e inserta los válidos en una sola sentencia. Los
+        inválidos (puntaje fuera de rango, grabación o parámetro inexistente,
+        par duplicado en la base o en el mismo lote) se reportan en su posición.
+        
+        Returns:
+            Diccionario con el formato de schemas.BatchCreateResponse
+        """
+        try:
+            return FeedbackService._create_feedbacks_batch(db, feedbacks)
+        except IntegrityError:
+            db.rollback()
+            # Otra petición creó uno de los pares entre la validación y la
+            # inserción: al repetir la validación queda reportado como duplicado
+            return FeedbackService._create_feedbacks_batch(db, feedbacks)
+    
+    @staticmethod
+    def _create_feedbacks_batch(db: Session, feedbacks: List[schemas.FeedbackCreate]):
+        grabacion_ids = {feedback.grabacion_id for feedback in feedbacks}
+        parametro_ids = {feedback.parametro_id for feedback in feedbacks}
+        existing_grabaciones = set(db.scalars(select(Grabacion.id).where(Grabacion.id.in_(grabacion_ids))))
+        existing_parametros = set(db.scalars(select(Parametro.id).where(Parametro.id.in_(parametro_ids))))
+        taken = set(db.execute(
+            select(Feedback.grabacion_id, Feedback.parametro_id).where(
+                Feedback.grabacion_id.in_(grabacion_ids),
+                Feedback.parametro_id.in_(parametro_ids)
+            )
+        ).tuples())
+        
+        valid, errors = {}, {}
+        for index, feedback in enumerate(feedbacks):
+            pair = (feedback.grabacion_id, feedback.parametro_id)
+            try:
+                FeedbackScore(feedback.valor)
+                if feedback.grabacion_id not in existing_grabaciones:
+                    raise GrabacionNotFoundError(feedback.grabacion_id)
+                if feedback.parametro_id not in existing_parametros:
+                    raise ParametroNotFoundError(feedback.parametro_id)
+                if pair in taken:
+                    raise DuplicateFeedbackError(*pair)
+            except DomainException as e:
+                errors[index] = e
+                continue
+            taken.add(pair)
+            valid[index] = feedback.model_dump()
+        return _commit_batch(db, Feedback, len(feedbacks), valid, errors)
+    
+    @staticmethod
+    def get_feedback_by_grabacion_and_parametro(db: Session, grabacion_id: int, parametro_id: int):
+        return db.query(Feedback).filter(
+            Feedback.grabacion_id == grabacion_id,
+            Feedback.parametro_id == parametro_id
+        ).first()
+    
     @staticmethod
     def get_feedbacks(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Feedback).offset(skip).limit(limit).all()
+        return db.execute(
+            _FEEDBACK_LIST_COLUMNS.order_by(Feedback.id).offset(skip).limit(limit)
+        ).all()
     
     @staticmethod
     def get_feedback_by_id(db: Session, feedback_id: int):
@@ -86,4 +312,6 @@ class FeedbackService:
     
     @staticmethod
     def get_feedbacks_by_grabacion(db: Session, grabacion_id: int):
-        return db.query(Feedback).filter(Feedback.grabacion_id == grabacion_id).all()
\ No newline at end of file
+        return db.execute(
+            _FEEDBACK_LIST_COLUMNS.where(Feedback.grabacion_id == grabacion_id).order_by(Feedback.id)
+        ).all()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Plazos (deadlines) por petición y llamadas con cobertura (hedging).
+
+El plazo se guarda en una variable de contexto, de modo que se propaga
+desde el middleware HTTP hasta cualquier corrutina que atienda la petición
+sin tener que pasarlo como parámetro por todas las capas.
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Instante límite (time.monotonic) de la petición en curso
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(timeout_seconds: float) -> Token:
+    """
+    Fija el plazo de la petición actual.
+
+    Si ya existe un plazo más cercano, se conserva.
+
+    Args:
+        timeout_seconds: Segundos disponibles desde ahora
+
+    Returns:
+        Token para restaurar el valor anterior con reset_deadline
+    """
+    new_deadline = time.monotonic() + timeout_seconds
+    current = _deadline.get()
+    if current is not None and current < new_deadline:
+        new_deadline = current
+    return _deadline.set(new_deadline)
+
+
+def reset_deadline(token: Token) -> None:
+    """Restaura el plazo anterior."""
+    _deadline.reset(token)
+
+
+def clear_deadline() -> Token:
+    """
+    Quita el plazo del contexto actual.
+
+    Para trabajos en segundo plano que heredan el contexto de la petición
+    pero siguen ejecutándose después de responderla.
+
+    Returns:
+        Token para restaurar el valor anterior con reset_deadline
+    """
+    return _deadline.set(None)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Segundos restantes hasta el plazo.
+
+    Returns:
+        Segundos restantes (0 si ya venció) o None si no hay plazo
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+    return max(0.0, current - time.monotonic())
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: float) -> Iterator[None]:
+    """Context manager que fija un plazo durante el bloque."""
+    token = set_deadline(timeout_seconds)
+    try:
+        yield
+    finally:
+        reset_deadline(token)
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[T]],
+    hedge_after: Optional[float] = None,
+    timeout: Optional[float] = None
+) -> T:
+    """
+    Ejecuta una llamada y, si tarda más de `hedge_after`, lanza una copia.
+
+    Se retorna el primer resultado exitoso y se cancela la llamada restante.
+    Si una de las llamadas falla se sigue esperando a la otra.
+
+    Args:
+        call: Fábrica de la corrutina a ejecutar (se invoca una vez por intento)
+        hedge_after: Segundos antes de lanzar la copia (None o 0 desactiva)
+        timeout: Tiempo máximo total en segundos
+
+    Returns:
+        Resultado de la primera llamada exitosa
+
+    Raises:
+        asyncio.TimeoutError: Si ninguna llamada termina dentro del plazo
+        Exception: El error de la última llamada si todas fallan
+    """
+    loop = asyncio.get_running_loop()
+    end = loop.time() + timeout if timeout is not None else None
+    pending = {asyncio.ensure_future(call())}
+    hedged = not hedge_after or hedge_after <= 0
+    last_error: Optional[BaseException] = None
+
+    try:
+        while pending:
+            wait_for = None if end is None else max(0.0, end - loop.time())
+            if not hedged:
+                wait_for = hedge_after if wait_for is None else min(wait_for, hedge_after)
+
+            done, pending = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_error = task.exception()
+
+            if end is not None and loop.time() >= end:
+                raise asyncio.TimeoutError()
+
+            # Lanzar la copia al vencer el umbral o si el primer intento falló
+            if not hedged:
+                hedged = True
+                pending.add(asyncio.ensure_future(call()))
+
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
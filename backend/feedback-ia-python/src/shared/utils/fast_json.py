@@ -0,0 +1,154 @@
+"""
+Serialización JSON rápida con orjson para las respuestas de la API.
+
+orjson serializa de forma nativa dataclasses (incluidas las de __slots__),
+datetime/date/UUID/Enum y colecciones, directamente a bytes. Los DTOs de la
+aplicación (FeedbackResponseDTO, FeedbackListItem, ...) no necesitan pasar
+por jsonable_encoder.
+
+- FastJSONResponse: respuesta JSON renderizada con orjson.
+- FastJSONRoute: clase de ruta que, para endpoints sin response_model ni
+  anotación de retorno, serializa el valor retornado con orjson en lugar de
+  jsonable_encoder + json.dumps. Los endpoints con response_model conservan
+  la ruta de FastAPI que serializa con Pydantic directamente a bytes (una
+  clase de respuesta personalizada la desactivaría).
+"""
+import inspect
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable
+
+import orjson
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import BaseModel
+
+# Claves no string (p. ej. IDs enteros en diccionarios) como hace json.dumps
+OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Tipos que orjson no serializa de forma nativa."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, BaseException):
+        # Errores de validación pueden incluir la excepción original en su contexto
+        return str(obj)
+    raise TypeError(f"Tipo no serializable a JSON: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serializa a JSON (bytes) con orjson.
+
+    Args:
+        content: Valor a serializar
+
+    Returns:
+        JSON codificado en UTF-8
+
+    Raises:
+        TypeError: Si el valor contiene tipos no serializables
+    """
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """Respuesta JSON renderizada con orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# Parámetro que se agrega al endpoint envuelto para recibir la respuesta
+# temporal de FastAPI (la misma que reciben los parámetros de tipo Response)
+_SUB_RESPONSE_PARAM = "fast_json_sub_response"
+
+
+def _render_with_orjson(endpoint: Callable, status_code: int) -> Callable:
+    """
+    Envuelve un endpoint para que su resultado se serialice con orjson.
+
+    Como FastAPI en serialize_response, el código y los headers fijados en un
+    parámetro `response: Response` del endpoint se copian a la respuesta final.
+    """
+
+    def to_response(result: Any, sub_response: Response) -> Any:
+        if isinstance(result, Response):
+            return result
+        current_status = sub_response.status_code or status_code
+        if not is_body_allowed_for_status_code(current_status):
+            response = Response(status_code=current_status)
+        else:
+            response = FastJSONResponse(result, status_code=current_status)
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    # Anotaciones resueltas como lo hace FastAPI (admite `from __future__ import annotations`)
+    signature = inspect.signature(endpoint, eval_str=True)
+    parameters = list(signature.parameters.values())
+    # FastAPI inyecta la respuesta temporal en un único parámetro de tipo Response:
+    # se reutiliza el del endpoint o se agrega uno propio que no se le pasa
+    own_param = next((
+        parameter.name for parameter in parameters
+        if isinstance(parameter.annotation, type) and issubclass(parameter.annotation, Response)
+    ), None)
+    param_name = own_param or _SUB_RESPONSE_PARAM
+
+    def split_kwargs(kwargs: dict) -> Response:
+        return kwargs[param_name] if own_param else kwargs.pop(param_name)
+
+    # FastAPI ejecuta los endpoints síncronos en el threadpool: se conserva el tipo
+    if inspect.iscoroutinefunction(endpoint):
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            sub_response = split_kwargs(kwargs)
+            return to_response(await endpoint(*args, **kwargs), sub_response)
+    else:
+        @wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            sub_response = split_kwargs(kwargs)
+            return to_response(endpoint(*args, **kwargs), sub_response)
+
+    if not own_param:
+        position = next(
+            (i for i, parameter in enumerate(parameters) if parameter.kind is inspect.Parameter.VAR_KEYWORD),
+            len(parameters)
+        )
+        parameters.insert(position, inspect.Parameter(
+            _SUB_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+        ))
+    # __signature__ evita que inspect.signature siga __wrapped__ hasta el original
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Ruta que serializa con orjson los resultados de endpoints sin response_model.
+
+    Se configura con APIRouter(route_class=FastJSONRoute) o, para las rutas
+    propias de la aplicación, en app.router.route_class.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_model = kwargs.get("response_model")
+        if isinstance(response_model, DefaultPlaceholder):
+            # Sin response_model explícito FastAPI lo infiere de la anotación de retorno
+            response_model = inspect.signature(endpoint).return_annotation
+            if response_model is inspect.Signature.empty:
+                response_model = None
+        response_class = kwargs.get("response_class")
+        if response_model is None and (
+            response_class is None or isinstance(response_class, DefaultPlaceholder)
+        ):
+            endpoint = _render_with_orjson(endpoint, kwargs.get("status_code") or 200)
+        super().__init__(path, endpoint, **kwargs)
@@ -0,0 +1,91 @@
+"""
+Registro del uso de tokens de las llamadas a modelos de lenguaje.
+
+Acumula el uso por petición (variable de contexto) y el total del proceso
+por tipo de llamada, para saber dónde se consume el presupuesto.
+
+Las copias de cobertura se cuentan como llamadas; los reintentos internos
+del SDK de OpenAI no, así que las cifras son una cota inferior de lo facturado.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class TokenUsage:
+    """Tokens consumidos, desglosados por tipo de llamada."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    calls: int = 0
+    by_call_type: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, call_type: str, prompt_tokens: int, completion_tokens: int) -> None:
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.calls += 1
+        entry = self.by_call_type.setdefault(
+            call_type, {"prompt_tokens": 0, "completion_tokens": 0, "calls": 0}
+        )
+        entry["prompt_tokens"] += prompt_tokens
+        entry["completion_tokens"] += completion_tokens
+        entry["calls"] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "calls": self.calls,
+            "by_call_type": {name: dict(values) for name, values in self.by_call_type.items()},
+        }
+
+
+_request_usage: ContextVar[Optional[TokenUsage]] = ContextVar("token_usage", default=None)
+_process_usage = TokenUsage()
+_process_lock = threading.Lock()
+
+
+def record_token_usage(call_type: str, prompt_tokens: int, completion_tokens: int) -> None:
+    """
+    Registra el uso de una llamada en la petición actual y en el total del proceso.
+
+    Args:
+        call_type: Tipo de llamada (comment, suggestions, structure...)
+        prompt_tokens: Tokens del prompt
+        completion_tokens: Tokens de la respuesta
+    """
+    usage = _request_usage.get()
+    if usage is not None:
+        usage.add(call_type, prompt_tokens, completion_tokens)
+    with _process_lock:
+        _process_usage.add(call_type, prompt_tokens, completion_tokens)
+
+
+@contextmanager
+def token_usage_scope() -> Iterator[TokenUsage]:
+    """Abre un acumulador de uso para la petición actual."""
+    usage = TokenUsage()
+    token = _request_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _request_usage.reset(token)
+
+
+def current_token_usage() -> Optional[TokenUsage]:
+    """Uso acumulado en la petición actual, si hay un acumulador abierto."""
+    return _request_usage.get()
+
+
+def process_token_usage() -> Dict:
+    """Uso acumulado del proceso desde el arranque."""
+    with _process_lock:
+        return _process_usage.to_dict()
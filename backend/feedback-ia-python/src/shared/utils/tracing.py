@@ -0,0 +1,134 @@
+"""
+Trazas de las operaciones de una petición (spans de OpenTelemetry).
+
+Los casos de uso, repositorios y servicios de IA marcan sus operaciones con
+@traced o span(); el tracer lo configura la infraestructura al arrancar
+(configure_tracer). Sin tracer configurado (TRACING_ENABLED desactivado)
+las marcas solo comprueban una variable y llaman a la función original.
+
+El span activo se guarda en variables de contexto: las tareas de asyncio
+(asyncio.gather, create_task) lo heredan al crearse. Los hilos de un
+executor no heredan el contexto: hay que envolver la función con
+in_current_context antes de enviarla.
+"""
+import contextvars
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Tracer de OpenTelemetry del proceso (None = trazas desactivadas)
+_tracer = None
+
+
+def configure_tracer(tracer: Any) -> None:
+    """
+    Configura el tracer usado por span() y @traced.
+
+    Args:
+        tracer: opentelemetry.trace.Tracer, o None para desactivar las trazas
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Any:
+    """Tracer configurado, None si las trazas están desactivadas."""
+    return _tracer
+
+
+def tracing_enabled() -> bool:
+    """True si hay un tracer configurado."""
+    return _tracer is not None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Abre un span hijo del activo mientras dura el bloque.
+
+    Las excepciones que salen del bloque quedan registradas en el span.
+
+    Args:
+        name: Nombre de la operación
+        **attributes: Atributos del span (valores str, int, float o bool)
+
+    Yields:
+        El span abierto, o None si las trazas están desactivadas
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.start_as_current_span(name, attributes=attributes or None) as current:
+        yield current
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorador: ejecuta la función dentro de un span.
+
+    Args:
+        name: Nombre del span; por defecto, el nombre calificado de la función
+            (p. ej. GenerateAIFeedbackUseCase.execute)
+    """
+    def decorate(func: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def trace_public_methods(cls: type) -> type:
+    """
+    Decorador de clase: un span por cada método público definido en la clase.
+
+    El span se llama Clase.metodo. Acepta métodos de instancia, estáticos y
+    asíncronos.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_"):
+            continue
+        if isinstance(value, staticmethod):
+            setattr(cls, attr, staticmethod(traced(f"{cls.__name__}.{attr}")(value.__func__)))
+        elif inspect.isfunction(value):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Agrega atributos al span activo (no hace nada sin trazas)."""
+    if _tracer is None:
+        return
+    from opentelemetry import trace
+
+    trace.get_current_span().set_attributes(attributes)
+
+
+def in_current_context(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Envuelve una función para ejecutarla con el contexto actual (span activo,
+    plazo de la petición, uso de tokens) en otro hilo.
+
+    Usar al enviar trabajo a un executor: loop.run_in_executor(None,
+    in_current_context(func)). Cada envoltura sirve para una sola ejecución.
+    """
+    return functools.partial(contextvars.copy_context().run, func)
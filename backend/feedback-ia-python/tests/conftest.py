@@ -0,0 +1,47 @@
+"""
+Fixtures compartidas: base de datos SQLite en memoria para cada prueba.
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import src.models.models  # noqa: F401  Registra los modelos en Base.metadata
+from src.database.connection import Base
+
+
+@pytest.fixture
+def memory_engine():
+    """
+    Crea engines SQLite en memoria, compartidos entre hilos (StaticPool).
+
+    Por defecto crean las tablas de los modelos heredados; metadata=None deja
+    la base vacía y foreign_keys=True activa las claves foráneas.
+    """
+    engines = []
+
+    def make(metadata=Base.metadata, foreign_keys: bool = False):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        if foreign_keys:
+            event.listen(engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys=ON"))
+        if metadata is not None:
+            metadata.create_all(bind=engine)
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def session_factory(memory_engine):
+    """Sesiones sobre una base en memoria con las tablas de los modelos heredados."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=memory_engine())
+
+
+@pytest.fixture
+def db(session_factory):
+    """Sesión sobre una base en memoria con las tablas de los modelos heredados."""
+    with session_factory() as session:
+        yield session
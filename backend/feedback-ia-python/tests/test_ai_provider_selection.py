@@ -0,0 +1,99 @@
+"""
+Pruebas de la selección del proveedor de IA y del servicio basado en reglas.
+"""
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.domain.exceptions.validation_exceptions import AIServiceError
+from src.infrastructure.config.settings import AIConfig
+from src.infrastructure.external_services.ai_service_factory import AIServiceFactory
+from src.infrastructure.external_services.rule_based_ai_service import RuleBasedAIService
+from src.interface.api import dependencies
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    factory = AIServiceFactory(AIConfig(ai_provider="rule_based", ai_tenant_providers={"tenant-ia": "openai"}))
+    monkeypatch.setattr(dependencies, "ai_service_factory", factory)
+
+    app = FastAPI()
+
+    @app.get("/provider")
+    def provider(ai_service=Depends(dependencies.get_ai_service)):
+        return {"service": type(ai_service).__name__, "instance": id(ai_service)}
+
+    return TestClient(app)
+
+
+def test_provider_from_header_tenant_or_default(client):
+    assert client.get("/provider").json()["service"] == "RuleBasedAIService"
+    # El tenant sin configuración usa el proveedor por defecto
+    assert client.get("/provider", headers={"X-Tenant-ID": "otro"}).json()["service"] == "RuleBasedAIService"
+    assert client.get("/provider", headers={"X-Tenant-ID": "tenant-ia"}).json()["service"] == "OpenAIService"
+    # El header X-AI-Provider tiene prioridad sobre el tenant
+    assert client.get(
+        "/provider", headers={"X-Tenant-ID": "tenant-ia", "X-AI-Provider": " Rule_Based "}
+    ).json()["service"] == "RuleBasedAIService"
+
+
+def test_unknown_provider_is_rejected(client):
+    response = client.get("/provider", headers={"X-AI-Provider": "gemini"})
+
+    assert response.status_code == 400
+    assert "gemini" in response.json()["detail"]
+
+
+def test_instances_are_shared_between_requests(client):
+    first = client.get("/provider").json()["instance"]
+    second = client.get("/provider", headers={"X-AI-Provider": "rule_based"}).json()["instance"]
+
+    assert first == second
+
+
+def test_resolve_provider_rejects_unknown_default():
+    factory = AIServiceFactory(AIConfig(ai_provider="desconocido"))
+
+    with pytest.raises(AIServiceError):
+        factory.resolve_provider()
+
+
+def test_rule_based_analysis_shape():
+    service = RuleBasedAIService()
+    audio_data = {"duration": 120, "word_count": 300, "noise_level": 0.2, "filler_words": 4}
+
+    basic = asyncio.run(service.analyze_audio_basic(7, audio_data))
+    advanced = asyncio.run(service.analyze_audio_advanced(7, audio_data))
+
+    assert basic["grabacion_id"] == 7
+    assert basic["provider"] == "rule_based"
+    assert set(RuleBasedAIService.DEFAULT_METRICS) <= set(basic["audio_metrics"])
+    assert basic["audio_metrics"]["speech_rate"] == 150.0
+    assert basic["audio_metrics"]["clarity_score"] == 0.7
+    assert advanced["analysis_type"] == "advanced"
+    assert advanced["audio_metrics"] == basic["audio_metrics"]
+    assert advanced["advanced_metrics"]["filler_words_count"] == 4
+    assert set(advanced["advanced_metrics"]["presentation_structure"]) == {
+        "clear_opening", "logical_flow", "strong_closing"
+    }
+
+
+def test_rule_based_comment_structure_and_suggestions():
+    service = RuleBasedAIService()
+    analysis = asyncio.run(service.analyze_audio_basic(1, {}))
+
+    comment = asyncio.run(service.generate_feedback_comment(analysis, "claridad", 150))
+    structure = asyncio.run(service.analyze_presentation_structure(
+        "Hola a todos. Primero veremos el contexto. Luego los datos. En conclusión, gracias."
+    ))
+    suggestions = asyncio.run(service.get_improvement_suggestions(analysis, ["clarity", "volume", "pace", "pauses"]))
+
+    assert isinstance(comment, str) and comment.startswith("Claridad: ")
+    assert structure["introduction_quality"] == structure["conclusion_quality"] == 0.85
+    assert all(0.0 <= value <= 1.0 for value in structure.values())
+    assert suggestions == [RuleBasedAIService.FALLBACK_SUGGESTIONS[area] for area in ("clarity", "volume", "pace")]
+    with pytest.raises(AIServiceError):
+        asyncio.run(service.transcribe_audio("grabacion.wav"))
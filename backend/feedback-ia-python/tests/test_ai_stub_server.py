@@ -0,0 +1,76 @@
+"""
+Pruebas del servidor local compatible con OpenAI.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.interface.cli.ai_stub_server import StubConfig, StubBehavior, create_stub_app
+
+
+CHAT_BODY = {
+    "model": "gpt-3.5-turbo",
+    "messages": [{"role": "user", "content": "Genera un comentario para claridad con puntaje 7"}],
+    "max_tokens": 200,
+}
+
+
+def test_chat_completion_is_deterministic():
+    client = TestClient(create_stub_app())
+
+    first = client.post("/v1/chat/completions", json=CHAT_BODY)
+    second = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert first.status_code == 200
+    data = first.json()
+    assert data["object"] == "chat.completion"
+    assert data["choices"][0]["message"]["content"]
+    assert data["choices"][0]["message"]["content"] == second.json()["choices"][0]["message"]["content"]
+
+
+def _transcribe(client, audio: bytes, model: str = "whisper-1"):
+    return client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("audio.wav", audio, "audio/wav")},
+        data={"model": model},
+    )
+
+
+def test_transcription_is_deterministic_per_audio():
+    client = TestClient(create_stub_app())
+    audio = b"RIFF" + bytes(range(256)) * 4
+
+    first = _transcribe(client, audio)
+    second = _transcribe(client, audio)
+
+    assert first.status_code == 200
+    assert first.json()["text"]
+    # Cada petición lleva otro boundary multipart; el texto depende solo del audio y el modelo
+    assert first.json()["text"] == second.json()["text"]
+    assert _transcribe(client, audio[::-1]).json()["text"] != first.json()["text"]
+
+
+def test_rate_limit_injection():
+    client = TestClient(create_stub_app(StubConfig(rate_limit_rate=1.0, retry_after_seconds=3)))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
+    assert response.json()["error"]["code"] == "rate_limit_exceeded"
+
+
+def test_seeded_outcomes_are_reproducible():
+    config = StubConfig(latency_dist="lognormal", latency_mean_ms=100, latency_stddev_ms=40,
+                        error_rate=0.2, rate_limit_rate=0.1, seed=7)
+    first, second = StubBehavior(config), StubBehavior(config)
+
+    samples_first = [(first.sample_outcome(), first.sample_latency_ms()) for _ in range(50)]
+    samples_second = [(second.sample_outcome(), second.sample_latency_ms()) for _ in range(50)]
+
+    assert samples_first == samples_second
+    assert {outcome for outcome, _ in samples_first} == {"ok", "error", "rate_limited"}
+
+
+def test_invalid_distribution():
+    with pytest.raises(ValueError):
+        StubConfig(latency_dist="pareto")
@@ -0,0 +1,79 @@
+"""
+Pruebas del análisis por grabación: guardado y reutilización en /grabaciones/{id}/analizar.
+"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.api.secure_endpoints import router
+from src.domain.repositories.analisis_grabacion_repository import ANALIZADOR_AUDIO
+from src.domain.services.audio_analyzer_service import AudioAnalyzerService
+from src.infrastructure.database.connection import Base, get_db
+from src.infrastructure.database.models import GrabacionModel
+from src.infrastructure.database.models.analisis_grabacion_model import AnalisisGrabacionModel
+from src.infrastructure.database.repositories.sqlalchemy_analisis_grabacion_repository import (
+    SQLAlchemyAnalisisGrabacionRepository
+)
+from src.infrastructure.middleware.auth_middleware import verify_api_key
+
+
+@pytest.fixture
+def session_factory(memory_engine):
+    factory = sessionmaker(bind=memory_engine(Base.metadata, foreign_keys=True))
+    with factory() as session:
+        session.add(GrabacionModel(
+            id=1, nombre_archivo="a.wav", ruta_archivo="/audio/a.wav", formato="wav", duracion=120.0
+        ))
+        session.commit()
+    return factory
+
+
+def test_save_skips_missing_grabacion_and_propagates_other_errors(session_factory):
+    with session_factory() as db:
+        repository = SQLAlchemyAnalisisGrabacionRepository(db)
+
+        asyncio.run(repository.save(999, {"x": 1}, analizador=ANALIZADOR_AUDIO))
+        assert db.query(AnalisisGrabacionModel).count() == 0
+
+        @event.listens_for(db.get_bind(), "before_cursor_execute")
+        def reject_insert(conn, cursor, statement, *args):
+            if statement.startswith("INSERT INTO analisis_grabacion"):
+                raise IntegrityError(statement, {}, Exception("CHECK constraint failed"))
+
+        with pytest.raises(IntegrityError):
+            asyncio.run(repository.save(1, {"x": 1}, analizador=ANALIZADOR_AUDIO))
+
+
+def test_analysis_is_stored_and_reused(session_factory, monkeypatch):
+    calls = []
+    analyze = AudioAnalyzerService.analyze_grabacion
+
+    def counting_analyze(self, grabacion):
+        calls.append(grabacion.id)
+        return analyze(self, grabacion)
+
+    monkeypatch.setattr(AudioAnalyzerService, "analyze_grabacion", counting_analyze)
+
+    def override_get_db():
+        with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[verify_api_key] = lambda: "test"
+    client = TestClient(app)
+
+    first = client.get("/grabaciones/1/analizar")
+    second = client.get("/grabaciones/1/analizar")
+
+    assert first.status_code == 200
+    assert first.json() == second.json()
+    assert first.json()["grabacion_id"] == 1
+    assert calls == [1]
+    assert client.get("/grabaciones/999/analizar").status_code == 404
@@ -0,0 +1,137 @@
+"""
+Pruebas del avance de análisis en segundo plano (pub/sub en memoria y tabla).
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from src.api import analysis_job_endpoints
+from src.infrastructure.database.models.analysis_job_model import AnalysisJobModel
+from src.infrastructure.external_services.rule_based_ai_service import RuleBasedAIService
+from src.infrastructure.jobs import AnalysisJobBroker, get_analysis_job_broker
+from src.infrastructure.middleware.auth_middleware import verify_api_key
+from src.infrastructure.middleware.deadline_middleware import DeadlineMiddleware
+from src.interface.api.dependencies import get_ai_service
+from src.shared.utils.deadline import remaining_time
+
+
+async def _follow(broker, job_id, **kwargs):
+    return [event async for event in broker.events(job_id, **kwargs) if event is not None]
+
+
+async def _run(broker, job_id):
+    reporter = broker.reporter(job_id)
+    for etapa in ("analisis", "puntuacion"):
+        await asyncio.sleep(0.01)
+        await reporter.report(etapa, 1.0)
+    await broker.complete(job_id, {"feedbacks": 2})
+
+
+def test_local_subscribers_receive_every_stage(session_factory):
+    broker = AnalysisJobBroker(session_factory, poll_interval_ms=1000)
+    job_id = broker.create("generate_ai")
+
+    async def scenario():
+        follower = asyncio.create_task(_follow(broker, job_id))
+        await asyncio.sleep(0)
+        await _run(broker, job_id)
+        return await follower
+
+    events = asyncio.run(scenario())
+
+    assert [event.etapa for event in events] == ["analisis", "puntuacion", "puntuacion"]
+    assert events[-1].estado == "completado"
+    assert events[-1].resultado == {"feedbacks": 2}
+
+
+def test_other_workers_follow_the_job_table(session_factory):
+    worker = AnalysisJobBroker(session_factory)
+    other = AnalysisJobBroker(session_factory, poll_interval_ms=5)
+    job_id = worker.create("generate_ai")
+
+    async def scenario():
+        follower = asyncio.create_task(_follow(other, job_id, last_event_id=0))
+        await _run(worker, job_id)
+        return await asyncio.wait_for(follower, timeout=2)
+
+    events = asyncio.run(scenario())
+
+    # Puede saltarse eventos intermedios, pero siempre recibe el final
+    assert events[-1].estado == "completado"
+    assert [event.secuencia for event in events] == sorted(event.secuencia for event in events)
+    # Reconectar con Last-Event-ID del evento final no repite nada
+    assert asyncio.run(_follow(other, job_id, last_event_id=events[-1].secuencia)) == []
+
+
+def test_stalled_job_of_another_worker_fails_the_stream(session_factory):
+    worker = AnalysisJobBroker(session_factory)
+    other = AnalysisJobBroker(session_factory, poll_interval_ms=5, stale_after_ms=60000)
+    job_id = worker.create("generate_ai")
+    asyncio.run(worker.reporter(job_id).report("analisis", 0.5))
+    # El worker murió hace dos minutos sin terminar el trabajo
+    with session_factory() as db:
+        db.execute(update(AnalysisJobModel).values(updated_at=datetime.utcnow() - timedelta(minutes=2)))
+        db.commit()
+
+    events = asyncio.run(asyncio.wait_for(_follow(other, job_id), timeout=2))
+
+    assert [event.estado for event in events] == ["en_progreso", "fallido"]
+    assert "no informa avance" in events[-1].error
+    assert other.get(job_id).estado == "fallido"
+
+
+def test_job_outlives_the_request_deadline(session_factory, monkeypatch):
+    broker = AnalysisJobBroker(session_factory)
+    seen = []
+
+    class SlowUseCase:
+        def __init__(self, *args):
+            pass
+
+        async def execute(self, generate_dto, reporter):
+            # Más largo que el plazo de la petición que lanzó el trabajo
+            await asyncio.sleep(0.1)
+            seen.append(remaining_time())
+            return []
+
+    monkeypatch.setattr(analysis_job_endpoints, "SessionLocal", session_factory)
+    monkeypatch.setattr(analysis_job_endpoints, "GenerateAIFeedbackUseCase", SlowUseCase)
+    app = FastAPI()
+    app.include_router(analysis_job_endpoints.router)
+    app.add_middleware(DeadlineMiddleware, default_timeout_ms=20)
+    app.dependency_overrides[get_analysis_job_broker] = lambda: broker
+    app.dependency_overrides[get_ai_service] = lambda: RuleBasedAIService()
+    app.dependency_overrides[verify_api_key] = lambda: "test"
+
+    response = TestClient(app).post("/feedbacks/generate-ai", json={
+        "grabacion_id": 1, "parametros_ids": [1], "audio_analysis_data": {"ruta_archivo": "/audio/a.wav"}
+    })
+
+    assert response.status_code == 202
+    assert seen == [None]
+    assert broker.get(response.json()["job_id"]).estado == "completado"
+
+
+def test_transcription_is_reported_as_its_own_stage():
+    from src.application.use_cases.feedback.generate_ai_feedback import GenerateAIFeedbackUseCase
+
+    class Recorder:
+        def __init__(self):
+            self.events = []
+
+        async def report(self, etapa, progreso, detalle=None):
+            self.events.append((etapa, progreso, detalle))
+
+    recorder = Recorder()
+    use_case = GenerateAIFeedbackUseCase(None, RuleBasedAIService(), None)
+
+    asyncio.run(use_case._get_or_analyze_audio(1, {"ruta_archivo": "/audio/a.wav"}, False, recorder))
+
+    etapas = [(etapa, progreso) for etapa, progreso, _ in recorder.events]
+    assert etapas == [("transcripcion", 0.0), ("transcripcion", 1.0), ("analisis", 0.0)]
+    # Sin transcripción el análisis sigue con las métricas de audio
+    assert recorder.events[1][2].startswith("Sin transcripción")
@@ -0,0 +1,93 @@
+"""
+Pruebas de los endpoints de creación por lotes.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.secure_endpoints import router
+from src.database.connection import get_db
+from src.infrastructure.middleware.auth_middleware import verify_api_key
+
+
+def _client(session_factory) -> TestClient:
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[verify_api_key] = lambda: "test"
+    return TestClient(app)
+
+
+def test_batch_reports_each_item_in_order(session_factory):
+    client = _client(session_factory)
+    tipo = client.post("/tipos-metrica/", json={"nombre": "Voz"}).json()
+    metrica = client.post("/metricas/", json={"nombre": "Claridad", "tipo_metrica_id": tipo["id"]}).json()
+
+    response = client.post("/parametros/batch", json=[
+        {"nombre": "Dicción", "valor": 1.0, "metrica_id": metrica["id"]},
+        {"nombre": "Ritmo", "valor": 2.0, "metrica_id": metrica["id"]},
+    ])
+    assert response.status_code == 201
+    parametros = [result["item"] for result in response.json()["results"]]
+    assert [parametro["nombre"] for parametro in parametros] == ["Dicción", "Ritmo"]
+
+    response = client.post("/grabaciones/batch", json=[
+        {"nombre_archivo": "a.wav", "ruta_archivo": "/audio/a.wav", "formato": "wav"},
+        {"nombre_archivo": "b.txt", "ruta_archivo": "/audio/b.txt", "formato": "txt"},
+    ])
+    assert response.status_code == 207
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 1)
+    assert body["results"][1]["error"]["error_code"] == "DOMAIN_VALIDATION_ERROR"
+    grabacion_id = body["results"][0]["item"]["id"]
+
+    client.post("/feedbacks/", json={"grabacion_id": grabacion_id, "parametro_id": parametros[0]["id"], "valor": 50})
+    response = client.post("/feedbacks/batch", json=[
+        {"grabacion_id": grabacion_id, "parametro_id": parametros[0]["id"], "valor": 70},
+        {"grabacion_id": grabacion_id, "parametro_id": parametros[1]["id"], "valor": 80},
+        {"grabacion_id": 999, "parametro_id": parametros[1]["id"], "valor": 80},
+        {"grabacion_id": grabacion_id, "parametro_id": parametros[1]["id"], "valor": 90},
+        {"grabacion_id": grabacion_id, "parametro_id": 999, "valor": 150},
+    ])
+    assert response.status_code == 207
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 4)
+    assert [result["index"] for result in body["results"]] == [0, 1, 2, 3, 4]
+    assert [(result["error"] or {}).get("error_code") for result in body["results"]] == [
+        "DUPLICATE_FEEDBACK", None, "GRABACION_NOT_FOUND", "DUPLICATE_FEEDBACK", "INVALID_SCORE"
+    ]
+    created = body["results"][1]["item"]
+    assert created["valor"] == 80
+    assert client.get(f"/feedbacks/{created['id']}").json()["parametro_id"] == parametros[1]["id"]
+
+
+def test_batch_size_is_limited(session_factory, monkeypatch):
+    from src.infrastructure.config.settings import get_settings
+
+    monkeypatch.setattr(get_settings().app, "batch_max_items", 2)
+    client = _client(session_factory)
+    item = {"nombre_archivo": "a.wav", "ruta_archivo": "/audio/a.wav"}
+
+    assert client.post("/grabaciones/batch", json=[]).status_code == 400
+    assert client.post("/grabaciones/batch", json=[item] * 3).status_code == 400
+    assert client.post("/grabaciones/batch", json=[item] * 2).status_code == 201
+
+
+def test_duplicate_metric_key_is_rejected(session_factory):
+    client = _client(session_factory)
+    tipo = client.post("/tipos-metrica/", json={"nombre": "Voz"}).json()
+    metrica = client.post("/metricas/", json={"nombre": "Claridad", "tipo_metrica_id": tipo["id"]}).json()
+    parametro = client.post("/parametros/", json={"nombre": "Dicción", "valor": 1.0, "metrica_id": metrica["id"]}).json()
+    url = f"/parametros/{parametro['id']}/metricas"
+    item = {"clave": "claridad", "fuente": "clarity_score", "peso": 1.0}
+
+    response = client.put(url, json=[item, {**item, "fuente": "volume_consistency"}])
+
+    assert response.status_code == 400
+    assert "claridad" in response.json()["detail"]
+    assert client.put(url, json=[item]).status_code == 200
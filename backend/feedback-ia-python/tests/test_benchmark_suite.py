@@ -0,0 +1,29 @@
+"""
+Pruebas de la suite de benchmarks (comparación de resultados y audio sintético).
+"""
+import wave
+
+from benchmarks.suite import compare_results, write_synthetic_wav
+
+
+def _document(**medians):
+    return {"results": {
+        case_id: {"median_s": median, "min_s": median * 0.9} for case_id, median in medians.items()
+    }}
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    base = _document(rapido=1.0, lento=1.0, igual=1.0, solo_base=1.0)
+    new = _document(rapido=0.5, lento=1.5, igual=1.05, solo_nuevo=1.0)
+
+    statuses = {comparison.case_id: comparison.status for comparison in compare_results(base, new, 0.10)}
+
+    assert statuses == {"rapido": "mejora", "lento": "regresión", "igual": "igual"}
+
+
+def test_synthetic_wav_has_requested_duration(tmp_path):
+    path = tmp_path / "dos_horas.wav"
+    write_synthetic_wav(path, 2 * 3600)
+
+    with wave.open(str(path), "rb") as audio:
+        assert audio.getnframes() / audio.getframerate() == 2 * 3600
@@ -0,0 +1,87 @@
+"""
+Pruebas de la caché de catálogos en memoria y su invalidación entre workers.
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import src.models.models  # noqa: F401  Registra los modelos en Base.metadata
+from src.database.connection import Base
+from src.infrastructure.cache.catalog import CatalogCache, mark_catalog_changed
+from src.infrastructure.cache.response_cache import METRICAS, PARAMETROS
+from src.models.models import CatalogVersion, Metrica, Parametro, TipoMetrica
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        TipoMetrica(id=1, nombre="Voz"),
+        Metrica(id=1, nombre="Velocidad", tipo_metrica_id=1),
+        Parametro(id=1, nombre="Palabras por minuto", valor=120, unidad="ppm", metrica_id=1),
+    ])
+    db.commit()
+    return db
+
+
+def test_lookups_are_served_from_memory(db):
+    cache = CatalogCache(refresh_interval_ms=0)
+    parametros = cache.table(db, PARAMETROS)
+
+    # Filas escritas sin pasar por mark_catalog_changed no se ven
+    db.add(Parametro(id=2, nombre="Pausas", valor=3, metrica_id=1))
+    db.commit()
+
+    assert cache.table(db, PARAMETROS) is parametros
+    assert parametros[1].valor.unidad == "ppm"
+    assert list(cache.parametros_by_metrica(db)) == [1]
+
+
+def test_write_invalidates_other_workers_on_sync(db):
+    writer, other = CatalogCache(refresh_interval_ms=0), CatalogCache(refresh_interval_ms=0)
+    other.sync(db)
+    assert len(other.table(db, PARAMETROS)) == 1
+    metricas = other.table(db, METRICAS)
+
+    db.add(Parametro(id=2, nombre="Pausas", valor=3, metrica_id=1))
+    mark_catalog_changed(db, PARAMETROS)
+    db.commit()
+    other.sync(db)
+
+    assert len(other.table(db, PARAMETROS)) == 2
+    assert other.table(db, METRICAS) is metricas
+    assert len(writer.table(db, PARAMETROS)) == 2
+
+
+def test_missing_versions_table_disables_sync(db):
+    cache = CatalogCache(refresh_interval_ms=0)
+    CatalogVersion.__table__.drop(bind=db.get_bind())
+
+    cache.sync(db)
+
+    assert not cache._versions_available
+
+
+def test_transient_error_is_retried_without_touching_the_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'catalogos.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    failures = [OperationalError("SELECT", {}, Exception("database is locked"))]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def fail_once(conn, cursor, statement, *args):
+        if "catalog_versions" in statement and failures:
+            raise failures.pop()
+
+    cache = CatalogCache(refresh_interval_ms=0)
+    session.add(TipoMetrica(id=1, nombre="Voz"))
+    session.flush()
+    cache.sync(session)
+
+    # La transacción en curso de la sesión sigue intacta
+    session.commit()
+    assert session.get(TipoMetrica, 1) is not None
+    assert cache._versions_available
+    cache.sync(session)
+    assert cache._seen_versions
+    session.close()
@@ -0,0 +1,67 @@
+"""
+Pruebas de plazos por petición y llamadas con cobertura (hedging).
+"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.middleware.deadline_middleware import DeadlineMiddleware
+from src.shared.utils.deadline import deadline_scope, hedged_call, remaining_time
+
+
+def test_hedge_returns_fastest_attempt():
+    delays = [0.5, 0.01]
+    started = []
+
+    async def call():
+        delay = delays[len(started)]
+        started.append(delay)
+        await asyncio.sleep(delay)
+        return delay
+
+    result = asyncio.run(hedged_call(call, hedge_after=0.02))
+
+    assert started == [0.5, 0.01]
+    assert result == 0.01
+
+
+def test_no_hedge_when_first_attempt_is_fast():
+    started = []
+
+    async def call():
+        started.append(1)
+        return "ok"
+
+    assert asyncio.run(hedged_call(call, hedge_after=0.05)) == "ok"
+    assert len(started) == 1
+
+
+def test_timeout_is_enforced():
+    async def call():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(hedged_call(call, hedge_after=0.01, timeout=0.05))
+
+
+def test_deadline_scope_keeps_the_closest_deadline():
+    with deadline_scope(0.1):
+        with deadline_scope(10):
+            assert remaining_time() <= 0.1
+    assert remaining_time() is None
+
+
+def test_middleware_propagates_header_deadline():
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware, default_timeout_ms=5000)
+
+    @app.get("/remaining")
+    async def remaining():
+        return {"remaining": remaining_time()}
+
+    client = TestClient(app)
+
+    assert client.get("/remaining", headers={"X-Request-Timeout-Ms": "200"}).json()["remaining"] <= 0.2
+    assert 0.2 < client.get("/remaining").json()["remaining"] <= 5
@@ -0,0 +1,73 @@
+"""
+Pruebas de la serialización con orjson de FastJSONRoute.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.shared.utils.fast_json import FastJSONRoute
+
+
+@dataclass
+class _Item:
+    id: int
+    creado: datetime
+
+
+def _marcar(response: Response) -> None:
+    response.headers["X-Dependencia"] = "si"
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.router.route_class = FastJSONRoute
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return _Item(item_id, datetime(2025, 1, 1))
+
+    @app.get("/parcial")
+    def partial(response: Response, total: int = 2):
+        response.status_code = 207
+        response.headers["X-Total"] = str(total)
+        return {"total": total}
+
+    @app.get("/dependencia", dependencies=[Depends(_marcar)])
+    async def with_dependency():
+        return {"ok": True}
+
+    @app.delete("/items/{item_id}", status_code=204)
+    def delete_item(item_id: int, response: Response):
+        response.headers["X-Eliminado"] = str(item_id)
+
+    return TestClient(app)
+
+
+def test_dataclasses_are_serialized_with_orjson():
+    response = _client().get("/items/3")
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 3, "creado": "2025-01-01T00:00:00"}
+
+
+def test_status_and_headers_from_injected_response_are_kept():
+    client = _client()
+
+    response = client.get("/parcial", params={"total": 5})
+    assert (response.status_code, response.headers["x-total"]) == (207, "5")
+    assert response.json() == {"total": 5}
+    # Los headers fijados por dependencias también llegan al cliente
+    assert client.get("/dependencia").headers["x-dependencia"] == "si"
+
+    response = client.delete("/items/4")
+    assert (response.status_code, response.content) == (204, b"")
+    assert response.headers["x-eliminado"] == "4"
+
+
+def test_openapi_does_not_expose_the_internal_parameter():
+    schema = _client().app.openapi()
+
+    assert [parameter["name"] for parameter in schema["paths"]["/parcial"]["get"]["parameters"]] == ["total"]
+    assert "parameters" not in schema["paths"]["/dependencia"]["get"]
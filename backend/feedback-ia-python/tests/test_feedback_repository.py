@@ -0,0 +1,59 @@
+"""
+Pruebas del repositorio SQLAlchemy de feedbacks.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.feedback import Feedback
+from src.domain.exceptions.validation_exceptions import DuplicateFeedbackError
+from src.domain.value_objects.feedback_score import FeedbackScore
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import (
+    GrabacionModel,
+    MetricaModel,
+    ParametroModel,
+    TipoMetricaModel
+)
+from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import SQLAlchemyFeedbackRepository
+
+
+@pytest.fixture
+def db(memory_engine):
+    with sessionmaker(bind=memory_engine(Base.metadata, foreign_keys=True))() as session:
+        session.add_all([
+            TipoMetricaModel(id=1, nombre="Voz"),
+            MetricaModel(id=1, nombre="Claridad", tipo_metrica_id=1),
+            ParametroModel(id=1, nombre="Dicción", valor=1.0, metrica_id=1),
+            GrabacionModel(id=1, nombre_archivo="a.wav", ruta_archivo="/audio/a.wav"),
+        ])
+        session.commit()
+        yield session
+
+
+def _feedback(grabacion_id: int = 1, parametro_id: int = 1) -> Feedback:
+    return Feedback(None, grabacion_id, parametro_id, FeedbackScore(70), None, True)
+
+
+def test_concurrent_duplicate_maps_to_duplicate_feedback(db, monkeypatch):
+    repository = SQLAlchemyFeedbackRepository(db)
+    asyncio.run(repository.create(_feedback()))
+
+    # Otra petición insertó el par después de la comprobación previa
+    async def not_found(*args):
+        return False
+    monkeypatch.setattr(repository, "exists_by_grabacion_and_parametro", not_found)
+
+    with pytest.raises(DuplicateFeedbackError):
+        asyncio.run(repository.create(_feedback()))
+
+
+def test_other_integrity_errors_are_not_duplicates(db):
+    repository = SQLAlchemyFeedbackRepository(db)
+
+    with pytest.raises(IntegrityError) as error:
+        asyncio.run(repository.create(_feedback(grabacion_id=999)))
+
+    assert "FOREIGN KEY" in str(error.value)
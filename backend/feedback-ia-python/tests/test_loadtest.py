@@ -0,0 +1,67 @@
+"""
+Pruebas del generador de datos y de la prueba de carga.
+"""
+import asyncio
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import func, select
+
+from loadtest.run_workload import parse_mix, percentile_of, run_stage
+from loadtest.seed_data import SeedVolumes, seed
+from src.models.models import CatalogVersion, Feedback, Grabacion, Parametro
+
+
+def test_seed_generates_volumes_with_unique_feedback_pairs(memory_engine):
+    engine = memory_engine()
+    volumes = SeedVolumes(tipos=2, metricas_por_tipo=2, parametros_por_metrica=3, grabaciones=50,
+                          feedbacks_por_grabacion=4)
+
+    manifest = seed(engine, volumes, batch_size=7, now=datetime(2025, 6, 20))
+
+    with engine.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(Parametro)) == 12
+        assert conn.scalar(select(func.count()).select_from(Grabacion)) == 50
+        pairs = conn.execute(select(Feedback.grabacion_id, Feedback.parametro_id)).all()
+        versions = dict(conn.execute(select(CatalogVersion.catalog, CatalogVersion.version)).all())
+    assert len(pairs) == len(set(pairs)) == 200
+    assert {parametro_id for _, parametro_id in pairs} <= set(range(1, 13))
+    assert manifest["grabaciones"] == [1, 50] and manifest["parametros"] == [1, 12]
+    assert set(versions) >= {"tipos_metrica", "metricas", "parametros"}
+
+
+def test_run_stage_reports_latency_percentiles_and_errors_per_route():
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    @app.get("/falla")
+    async def falla():
+        raise HTTPException(status_code=500)
+
+    operations = {
+        "ok": lambda client, rng: _get(client, "GET /ok", "/ok"),
+        "falla": lambda client, rng: _get(client, "GET /falla", "/falla"),
+    }
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await run_stage(client, operations, parse_mix("ok=3,falla=1"), rps=400, duration_s=0.5)
+
+    report = asyncio.run(run())
+
+    routes = report["routes"]
+    assert routes["GET /ok"]["error_rate"] == 0.0
+    assert routes["GET /falla"]["error_rate"] == 1.0
+    assert routes["GET /falla"]["statuses"] == {"500": routes["GET /falla"]["requests"]}
+    assert routes["GET /ok"]["requests"] > routes["GET /falla"]["requests"] > 0
+    assert report["total"]["latency_ms"]["p50"] <= report["total"]["latency_ms"]["p99"]
+    assert percentile_of([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile_of([1.0, 2.0, 3.0, 4.0], 99.9) == 4.0
+
+
+async def _get(client, route, path):
+    return route, await client.get(path)
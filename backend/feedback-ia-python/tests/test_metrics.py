@@ -0,0 +1,98 @@
+"""
+Pruebas de las métricas Prometheus.
+"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.middleware.metrics_middleware import MetricsMiddleware
+from src.infrastructure.observability.metrics import (
+    UNMATCHED_ROUTE,
+    get_metrics,
+    instrument_engine,
+    instrument_repository,
+    observe_llm_call
+)
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch):
+    monkeypatch.setenv("METRICS_ENABLED", "true")
+    get_settings.cache_clear()
+    get_metrics.cache_clear()
+    yield get_metrics()
+    monkeypatch.delenv("METRICS_ENABLED")
+    get_settings.cache_clear()
+    get_metrics.cache_clear()
+
+
+@instrument_repository
+class _Repository:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def count(self):
+        with self._engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            return conn.execute(text("SELECT 2")).scalar()
+
+    @staticmethod
+    async def ping():
+        return "pong"
+
+
+def _sample(metrics, name, **labels):
+    return metrics.registry.get_sample_value(name, labels) or 0.0
+
+
+def test_disabled_metrics_pass_through(memory_engine):
+    assert get_metrics() is None
+    engine = memory_engine(metadata=None)
+    instrument_engine(engine, "test")
+
+    assert _Repository(engine).count() == 2
+    assert asyncio.run(_Repository.ping()) == "pong"
+    with observe_llm_call("comment"):
+        pass
+
+
+def test_hot_paths_are_recorded(metrics_enabled, memory_engine):
+    engine = memory_engine(metadata=None)
+    instrument_engine(engine, "test")
+    assert _Repository(engine).count() == 2
+    with pytest.raises(TimeoutError):
+        with observe_llm_call("comment"):
+            raise TimeoutError()
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics_enabled)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    m = metrics_enabled
+    assert _sample(m, "db_repository_queries_total", repository="_Repository", method="count") == 2
+    assert _sample(m, "db_repository_call_duration_seconds_count", repository="_Repository", method="count") == 1
+    assert _sample(m, "db_query_duration_seconds_count", operation="SELECT") == 2
+    assert _sample(m, "db_pool_checkout_wait_seconds_count", engine="test") == 1
+    assert _sample(m, "llm_call_errors_total", call_type="comment", error="TimeoutError") == 1
+    assert _sample(
+        m, "http_request_duration_seconds_count", method="GET", route="/items/{item_id}", status="200"
+    ) == 2
+    assert _sample(
+        m, "http_request_duration_seconds_count", method="GET", route=UNMATCHED_ROUTE, status="404"
+    ) == 1
+
+    body, _ = m.render()
+    assert b"cache_hit_ratio" in body
+    assert b"analysis_jobs_running" in body
@@ -0,0 +1,60 @@
+"""
+Pruebas del análisis de estructura de OpenAIService.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.exceptions.validation_exceptions import AIServiceError
+from src.infrastructure.external_services.openai_service import OpenAIService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    service = OpenAIService()
+
+    async def transcript(audio_data):
+        return "Hola a todos. Primero... para terminar, gracias."
+    monkeypatch.setattr(service, "_get_transcript_text", transcript)
+    return service
+
+
+def _chat_returning(content):
+    async def chat_completion(call_type, **request):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    return chat_completion
+
+
+def test_structure_comes_from_the_model_response(service, monkeypatch):
+    monkeypatch.setattr(service, "_chat_completion", _chat_returning(
+        'Claro: {"introduction_quality": 0.9, "content_organization": 0.6, '
+        '"transition_quality": 0.5, "conclusion_quality": 1.4}'
+    ))
+
+    structure = asyncio.run(service._analyze_presentation_structure({"ruta_archivo": "/audio/a.wav"}))
+
+    assert structure == {"clear_opening": 0.9, "logical_flow": 0.6, "strong_closing": 1.0}
+
+
+@pytest.mark.parametrize("content", ["no sé", '{"introduction_quality": 0.9}', None])
+def test_unusable_response_falls_back_to_defaults(service, monkeypatch, content):
+    monkeypatch.setattr(service, "_chat_completion", _chat_returning(content))
+
+    with pytest.raises(AIServiceError):
+        asyncio.run(service.analyze_presentation_structure("texto"))
+    assert asyncio.run(service._analyze_presentation_structure({})) == OpenAIService.DEFAULT_STRUCTURE
+    assert asyncio.run(
+        service._analyze_presentation_structure({"ruta_archivo": "/audio/a.wav"})
+    ) == OpenAIService.DEFAULT_STRUCTURE
+
+
+def test_chat_failure_does_not_abort_the_advanced_analysis(service, monkeypatch):
+    async def failing_chat(call_type, **request):
+        raise AIServiceError("Plazo de la petición agotado, se usa el respaldo local")
+    monkeypatch.setattr(service, "_chat_completion", failing_chat)
+
+    analysis = asyncio.run(service.analyze_audio_advanced(1, {"ruta_archivo": "/audio/a.wav"}))
+
+    assert analysis["advanced_metrics"]["presentation_structure"] == OpenAIService.DEFAULT_STRUCTURE
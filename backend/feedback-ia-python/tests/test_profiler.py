@@ -0,0 +1,37 @@
+"""
+Pruebas del perfilador por muestreo.
+"""
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.observability.profiler import ProfilerBusyError, SamplingProfiler
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_samples_busy_threads_in_collapsed_format():
+    profiler = SamplingProfiler()
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy")
+    worker.start()
+    try:
+        profiler.start(interval_ms=2)
+        with pytest.raises(ProfilerBusyError):
+            profiler.start()
+        time.sleep(0.2)
+        result = profiler.stop()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result.samples > 0
+    lines = result.collapsed().splitlines()
+    busy = [line for line in lines if line.startswith("busy;")]
+    assert busy and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(f"{__name__}:_busy_loop" in line for line in busy)
+    assert not profiler.running
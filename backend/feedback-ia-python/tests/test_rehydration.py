@@ -0,0 +1,91 @@
+"""
+Pruebas de la reconstrucción sin validación de filas persistidas.
+"""
+import asyncio
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import List
+
+import pytest
+from src.domain.entities.feedback import Feedback
+from src.domain.entities.parametro import Parametro
+from src.domain.exceptions.validation_exceptions import InvalidScoreError
+from src.domain.rehydration import rehydrate, rehydrator
+from src.domain.value_objects.feedback_score import FeedbackScore
+from src.domain.value_objects.metrica_ponderada import MetricaPonderada
+from src.domain.value_objects.parametro_valor import ParametroValor
+from src.infrastructure.cache.catalog import CatalogCache
+from src.infrastructure.cache.response_cache import METRICAS, PARAMETROS
+from src.infrastructure.database.repositories.sqlalchemy_feedback_repository import SQLAlchemyFeedbackRepository
+from src.schemas import schemas
+from src.services.feedback_service import FeedbackService
+
+
+@dataclass
+class _Etiquetas:
+    nombre: str
+    valores: List[str] = field(default_factory=list)
+    total: int = field(default=0, init=False)
+    historial: List[str] = field(default_factory=list, init=False)
+
+
+@dataclass(frozen=True)
+class _Congelado:
+    clave: str
+    pesos: List[float] = field(default_factory=lambda: [1.0])
+
+
+def test_matches_normal_construction():
+    created_at = datetime(2025, 1, 1)
+    feedback = Feedback(1, 2, 3, FeedbackScore(80.0), "Bien", False, created_at, created_at)
+    ponderada = MetricaPonderada("claridad", "clarity_score", 2.0)
+    parametro = Parametro(4, 5, "Ritmo", ParametroValor(150.0, "ppm"), created_at, created_at)
+
+    assert rehydrator(Feedback)(1, 2, 3, rehydrate(FeedbackScore, value=80.0), "Bien", False, created_at, created_at) == feedback
+    assert rehydrator(MetricaPonderada)("claridad", "clarity_score", 2.0) == ponderada
+    assert rehydrate(Parametro, **{**asdict(parametro), "valor": parametro.valor}) == parametro
+
+
+def test_default_factory_and_init_false_fields():
+    first, second = rehydrator(_Etiquetas)("a"), rehydrator(_Etiquetas)(nombre="b")
+
+    assert first == _Etiquetas("a")
+    assert (first.valores, first.total, first.historial) == ([], 0, [])
+    # Cada instancia recibe una lista nueva, como con __init__
+    assert first.valores is not second.valores
+    assert rehydrator(_Etiquetas)("c", ["x"]).valores == ["x"]
+    assert rehydrator(_Congelado)("k") == _Congelado("k")
+    with pytest.raises(TypeError):
+        rehydrator(_Etiquetas)("d", total=3)
+
+
+def test_skips_validation():
+    # Solo para filas confiables: no valida ni normaliza
+    assert rehydrate(FeedbackScore, value=150.0).value == 150.0
+    with pytest.raises(InvalidScoreError):
+        FeedbackScore(150.0)
+
+
+def test_legacy_rows_are_read_as_stored(db):
+    # La API heredada guarda los valores tal como llegan, sin las reglas del dominio
+    tipo = FeedbackService.create_tipo_metrica(db, schemas.TipoMetricaCreate(nombre="voz"))
+    metrica = FeedbackService.create_metrica(
+        db, schemas.MetricaCreate(nombre="Palabras por minuto", tipo_metrica_id=tipo.id)
+    )
+    parametro = FeedbackService.create_parametro(
+        db, schemas.ParametroCreate(nombre="velocidad ideal", valor=150, metrica_id=metrica.id)
+    )
+    grabacion = FeedbackService.create_grabacion(
+        db, schemas.GrabacionCreate(nombre_archivo="a.wav", ruta_archivo="/audio/a.wav")
+    )
+    FeedbackService.create_feedback(
+        db, schemas.FeedbackCreate(grabacion_id=grabacion.id, parametro_id=parametro.id, valor=150, comentario="  ")
+    )
+
+    catalog = CatalogCache(refresh_interval_ms=0)
+    assert catalog.table(db, METRICAS)[metrica.id].nombre == "Palabras por minuto"
+    assert catalog.table(db, PARAMETROS)[parametro.id].nombre == "velocidad ideal"
+
+    [feedback] = asyncio.run(SQLAlchemyFeedbackRepository(db).get_by_grabacion_id(grabacion.id))
+    assert (feedback.score.value, feedback.comentario) == (150, "  ")
+    assert feedback.score.get_performance_level() == "Excelente"
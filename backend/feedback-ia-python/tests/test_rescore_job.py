@@ -0,0 +1,61 @@
+"""
+Pruebas del trabajo de re-puntuación masiva de feedbacks automáticos.
+"""
+import pytest
+from src.domain.services.feedback_analyzer import FeedbackAnalyzerService
+from src.infrastructure.cache.catalog import CatalogCache
+from src.infrastructure.database.models import RescoreJobModel
+from src.infrastructure.database.repositories.sqlalchemy_analisis_grabacion_repository import encode_metric_vector
+from src.infrastructure.jobs import RescoreJob
+from src.models.models import AnalisisGrabacion, Feedback, Grabacion, Metrica, Parametro, TipoMetrica
+
+ANALYSIS = {
+    "audio_metrics": {
+        "clarity_score": 0.9,
+        "volume_consistency": 0.7,
+        "speech_rate": 140,
+        "pause_patterns": 0.6,
+        "intonation_variety": 0.4,
+    },
+    "duration_seconds": 120,
+}
+
+
+@pytest.fixture
+def session_factory(session_factory):
+    with session_factory() as db:
+        db.add_all([TipoMetrica(id=1, nombre="Voz"), Metrica(id=1, nombre="Otra", tipo_metrica_id=1)])
+        db.add_all([Parametro(id=pid, nombre=f"P{pid}", valor=1, metrica_id=1) for pid in (1, 3)])
+        for gid in (1, 2, 3):
+            db.add(Grabacion(id=gid, nombre_archivo=f"{gid}.wav", ruta_archivo=f"/tmp/{gid}.wav"))
+            # La grabación 3 no tiene vector: se puntúa desde el resultado completo
+            metricas = encode_metric_vector(ANALYSIS) if gid < 3 else None
+            db.add(AnalisisGrabacion(grabacion_id=gid, resultado=ANALYSIS, metricas=metricas))
+            db.add_all([
+                Feedback(grabacion_id=gid, parametro_id=1, valor=0, es_manual=False),
+                Feedback(grabacion_id=gid, parametro_id=3, valor=0, es_manual=gid == 2),
+            ])
+        db.commit()
+    return session_factory
+
+
+def test_rescore_updates_automatic_feedbacks_and_resumes(session_factory):
+    cache = CatalogCache(refresh_interval_ms=0)
+    job = RescoreJob(session_factory, catalog_cache=cache, batch_size=2)
+    job_id = job.start()
+
+    # Simula una interrupción tras el primer lote
+    with session_factory() as db:
+        rubric = cache.rubric(db)
+        job._run_batch(db, db.get(RescoreJobModel, job_id), rubric)
+    progress = job.run(job_id)
+
+    expected = FeedbackAnalyzerService().score_analyses(rubric, [ANALYSIS], [1, 3])[0]
+    with session_factory() as db:
+        valores = {(f.grabacion_id, f.parametro_id): f.valor for f in db.query(Feedback)}
+
+    assert progress.estado == "completado"
+    assert (progress.grabaciones_procesadas, progress.feedbacks_actualizados) == (3, 5)
+    assert valores[(1, 1)] == pytest.approx(expected[0])
+    assert valores[(3, 3)] == pytest.approx(expected[1])
+    assert valores[(2, 3)] == 0  # Los feedbacks manuales no se tocan
@@ -0,0 +1,82 @@
+"""
+Pruebas de la caché de respuestas de catálogos (versiones, ETag y 304).
+"""
+from typing import List
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.infrastructure.cache.response_cache import ResponseCache, cached_json_response, etag_matches
+
+
+def _app(cache: ResponseCache, rows: List[dict]) -> FastAPI:
+    app = FastAPI()
+    adapter = TypeAdapter(List[dict])
+
+    @app.get("/items")
+    def items(request: Request):
+        return cached_json_response(request, "items", ("list",), lambda: list(rows), adapter, cache=cache)
+
+    return app
+
+
+def test_hit_skips_loader_and_serves_304():
+    cache = ResponseCache()
+    rows = [{"id": 1}]
+    client = TestClient(_app(cache, rows))
+
+    first = client.get("/items")
+    rows.append({"id": 2})  # sin bump la caché sigue sirviendo la versión anterior
+    second = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.json() == [{"id": 1}]
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_bump_invalidates_and_changes_etag():
+    cache = ResponseCache()
+    rows = [{"id": 1}]
+    client = TestClient(_app(cache, rows))
+
+    etag = client.get("/items").headers["etag"]
+    rows.append({"id": 2})
+    cache.bump("items")
+    response = client.get("/items", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1}, {"id": 2}]
+    assert response.headers["etag"] != etag
+
+
+def test_etag_depends_only_on_content():
+    rows = [{"id": 1}]
+    first_worker, second_worker = ResponseCache(), ResponseCache()
+    second_worker.bump("items")  # otro proceso con más escrituras registradas
+    first = TestClient(_app(first_worker, rows)).get("/items").headers["etag"]
+    second_client = TestClient(_app(second_worker, rows))
+
+    assert second_client.get("/items").headers["etag"] == first
+    # Una escritura que no cambia el resultado conserva el ETag
+    second_worker.bump("items")
+    assert second_client.get("/items", headers={"If-None-Match": first}).status_code == 304
+
+
+def test_put_with_stale_version_is_not_cached():
+    cache = ResponseCache()
+    version = cache.version("items")
+    cache.bump("items")  # escritura concurrente durante la consulta
+
+    cache.put("items", ("list",), version, b"[]")
+
+    assert cache.get("items", ("list",)) is None
+
+
+def test_etag_matching():
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches('"c"', '"b"')
@@ -0,0 +1,78 @@
+"""
+Pruebas de la rúbrica de puntuación compilada.
+"""
+import asyncio
+
+import pytest
+
+from src.domain.services.feedback_analyzer import FeedbackAnalyzerService
+from src.domain.services.scoring_rubric import DEFAULT_RUBRIC, GRUPO_RITMO, ScoringRubric
+from src.domain.value_objects.metrica_ponderada import MetricaPonderada
+
+AUDIO_METRICS = {
+    "clarity_score": 0.9,
+    "volume_consistency": 0.7,
+    "speech_rate": 140,
+    "pause_patterns": 0.6,
+    "intonation_variety": 0.4,
+}
+
+
+def test_default_groups_match_weighted_average():
+    # Parámetros 1-2 claridad, 3-4 ritmo y el resto entonación (mapeo histórico)
+    scores = DEFAULT_RUBRIC.scores_for([1, 3, 7], AUDIO_METRICS)
+
+    assert scores[0] == pytest.approx((0.9 * 0.25 + 0.7 * 0.20) / 0.45 * 100)
+    assert scores[1] == pytest.approx(((1 - 10 / 150) * 0.20 + 0.6 * 0.15) / 0.35 * 100)
+    assert scores[2] == pytest.approx(40.0)
+
+
+def test_configured_parameters_share_metric_columns():
+    rubric = ScoringRubric.compile(
+        {10: (
+            MetricaPonderada("velocidad", "speech_rate", 1.0, "objetivo", 140.0),
+            MetricaPonderada("entonacion", "intonation_variety", 0.5),
+        )},
+        groups={11: GRUPO_RITMO},
+    )
+
+    assert rubric.parametro_ids == (10, 11)
+    assert rubric.weights.shape == (2, len(rubric.fuentes))
+    assert rubric.fuentes.count("intonation_variety") == 1
+    assert list(rubric.score_all(AUDIO_METRICS)) == pytest.approx([
+        (1.0 + 0.4 * 0.5) / 1.5 * 100,
+        DEFAULT_RUBRIC.score(3, AUDIO_METRICS),
+    ])
+    assert rubric.normalized_metrics(10, AUDIO_METRICS) == pytest.approx({"velocidad": 1.0, "entonacion": 0.4})
+
+
+def test_batch_scores_match_per_analysis_scoring():
+    analyzer = FeedbackAnalyzerService()
+    analyses = [
+        {"audio_metrics": AUDIO_METRICS, "duration_seconds": 20, "background_noise": 0.5},
+        {"audio_metrics": {**AUDIO_METRICS, "speech_rate": 190}, "duration_seconds": 120,
+         "consistency_score": 0.9},
+        {"duration_seconds": 60},
+    ]
+
+    batch = analyzer.score_analyses(DEFAULT_RUBRIC, analyses, [1, 3, 7])
+
+    for row, analysis in zip(batch, analyses):
+        expected = asyncio.run(analyzer.calculate_scores_for_parameters([1, 3, 7], analysis))
+        assert list(row) == pytest.approx(list(expected.values()))
+
+
+def test_stored_vectors_score_like_full_analyses():
+    analyzer = FeedbackAnalyzerService()
+    analyses = [
+        {"audio_metrics": {**AUDIO_METRICS, "pause_patterns": {"count": 3}}, "duration_seconds": 20},
+        {"audio_metrics": {}, "background_noise": 0.5, "consistency_score": 0.9},
+        {"duration_seconds": 60},
+    ]
+    vectors = [analyzer.analysis_vector(analysis) for analysis in analyses]
+
+    expected = analyzer.score_analyses(DEFAULT_RUBRIC, analyses, [1, 3, 7])
+    assert analyzer.score_vectors(DEFAULT_RUBRIC, vectors, [1, 3, 7]) == pytest.approx(expected)
+    assert analyzer.score_vectors(ScoringRubric.compile(
+        {10: (MetricaPonderada("muletillas", "filler_words", 1.0),)}
+    ), vectors) is None
@@ -0,0 +1,47 @@
+"""
+Pruebas del registro de consultas lentas.
+"""
+import logging
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.observability.slow_queries import SlowQueryLog
+from src.services.feedback_service import FeedbackService
+
+
+def test_slow_queries_are_logged_redacted_and_explained(memory_engine, caplog):
+    engine = memory_engine()
+    slow_query_log = SlowQueryLog(threshold_ms=0)
+    slow_query_log.install(engine)
+    slow_query_log.install(engine)
+
+    with sessionmaker(bind=engine)() as db, caplog.at_level(logging.WARNING):
+        FeedbackService.get_feedbacks_by_grabacion(db, 424242)
+        FeedbackService.get_feedbacks_by_grabacion(db, 424242)
+
+    [site] = slow_query_log.stats()
+    assert site["call_site"].startswith("src/services/feedback_service.py:")
+    assert site["call_site"].endswith("(get_feedbacks_by_grabacion)")
+    assert site["count"] == 2
+    assert "feedbacks" in site["plan"]
+    # El plan se captura una vez por intervalo; los valores no se registran
+    assert sum("Plan:" in record.getMessage() for record in caplog.records) == 1
+    assert "424242" not in caplog.text
+    assert "<int>" in caplog.text
+
+
+def test_failed_statements_leave_no_timing_state(memory_engine):
+    engine = memory_engine(metadata=None)
+    slow_query_log = SlowQueryLog(threshold_ms=60000)
+    slow_query_log.install(engine)
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.exec_driver_sql("SELECT * FROM tabla_inexistente")
+        conn.exec_driver_sql("SELECT 1")
+
+        assert not any(key.startswith("slow_query") for key in conn.info)
+    assert slow_query_log.stats() == []
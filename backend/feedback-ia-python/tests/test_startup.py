@@ -0,0 +1,28 @@
+"""
+Pruebas del arranque: importar la aplicación no carga los módulos pesados.
+"""
+import json
+import os
+import subprocess
+import sys
+
+# Se cargan con el primer análisis o al conectar con PostgreSQL, no al arrancar
+_HEAVY_MODULES = (
+    "numpy",
+    "sqlalchemy.dialects.postgresql",
+    "src.domain.services.feedback_analyzer",
+    "src.infrastructure.jobs.rescore_job",
+)
+
+_PROBE = f"""
+import json, sys
+import src.main
+print(json.dumps([name for name in {_HEAVY_MODULES!r} if name in sys.modules]))
+"""
+
+
+def test_importing_the_app_does_not_load_heavy_modules():
+    env = {**os.environ, "API_KEY": os.environ.get("API_KEY", "startup-probe")}
+    result = subprocess.run([sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True, check=True)
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
@@ -0,0 +1,142 @@
+"""
+Pruebas del presupuesto de tokens de los prompts y del registro de uso.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.secure_endpoints import router as secure_router
+from src.infrastructure.external_services.openai_service import OpenAIService
+from src.infrastructure.external_services.prompt_builder import (
+    PROMPT_TOKEN_BUDGETS,
+    estimate_messages_tokens,
+    estimate_tokens,
+    fit_to_budget,
+    select_metrics
+)
+from src.infrastructure.middleware.auth_middleware import verify_api_key
+from src.infrastructure.middleware.token_usage_middleware import TokenUsageMiddleware
+from src.shared.utils.token_usage import process_token_usage, record_token_usage, token_usage_scope
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    return OpenAIService()
+
+
+def _response(content: str, usage=None):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+def test_fit_to_budget_and_metric_selection():
+    text = "palabra " * 500
+
+    assert fit_to_budget("corto", 10) == "corto"
+    assert estimate_tokens(fit_to_budget(text, 50)) <= 50
+    assert fit_to_budget(text, 0) == ""
+    analysis = {"audio_metrics": {"volume_consistency": 0.81234, "speech_rate": 151.0}}
+    assert select_metrics(analysis, "Volumen") == {"volume_consistency": 0.81}
+
+
+def test_last_message_is_truncated_to_the_budget(service):
+    messages = [
+        {"role": "system", "content": "Eres un evaluador de presentaciones."},
+        {"role": "user", "content": "Métricas: " + "x" * 10_000},
+    ]
+
+    fitted = service._fit_messages_to_budget("comment", messages, None)
+
+    assert fitted[0] == messages[0]
+    assert estimate_messages_tokens(fitted) <= PROMPT_TOKEN_BUDGETS["comment"]
+    assert service._fit_messages_to_budget("sin_presupuesto", messages, None) is messages
+
+
+def test_usage_is_recorded_per_request_and_exposed_in_headers():
+    app = FastAPI()
+    app.add_middleware(TokenUsageMiddleware)
+
+    @app.get("/ia")
+    def call_model():
+        record_token_usage("comment", 120, 30)
+        record_token_usage("suggestions", 200, 80)
+        return {}
+
+    @app.get("/sin-ia")
+    def no_model():
+        return {}
+
+    client = TestClient(app)
+    response = client.get("/ia")
+
+    assert response.headers["x-ai-prompt-tokens"] == "320"
+    assert response.headers["x-ai-completion-tokens"] == "110"
+    assert response.headers["x-ai-calls"] == "2"
+    assert "x-ai-calls" not in client.get("/sin-ia").headers
+
+
+def test_token_usage_endpoint_reports_process_totals():
+    app = FastAPI()
+    app.include_router(secure_router, prefix="/api/v1")
+    app.dependency_overrides[verify_api_key] = lambda: "test"
+    client = TestClient(app)
+    before = client.get("/api/v1/ai/token-usage").json()
+
+    record_token_usage("structure", 500, 100)
+
+    after = client.get("/api/v1/ai/token-usage").json()
+    assert after["total_tokens"] - before["total_tokens"] == 600
+    assert after["calls"] - before["calls"] == 1
+    assert after["by_call_type"]["structure"]["prompt_tokens"] >= 500
+    assert after == process_token_usage()
+
+
+def test_cancelled_hedge_copy_is_counted(service):
+    calls = []
+
+    async def create(**request):
+        calls.append(1)
+        # El primer intento tarda más que el retardo de cobertura
+        await asyncio.sleep(1.0 if len(calls) == 1 else 0.0)
+        return _response("Buen ritmo.", SimpleNamespace(prompt_tokens=40, completion_tokens=5))
+
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    service.config.ai_hedge_delay_ms = 20
+    messages = [{"role": "user", "content": "Hola"}]
+
+    async def run():
+        with token_usage_scope() as usage:
+            await service._chat_completion("comment", model="gpt-3.5-turbo", messages=messages)
+        return usage
+
+    usage = asyncio.run(run())
+    assert len(calls) == 2
+    assert (usage.calls, usage.prompt_tokens, usage.completion_tokens) == (2, 80, 10)
+
+
+def test_failed_attempt_is_not_counted(service):
+    calls = []
+
+    async def create(**request):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("502")
+        return _response("Buen ritmo.")
+
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    messages = [{"role": "user", "content": "Hola"}]
+
+    async def run():
+        with token_usage_scope() as usage:
+            await service._chat_completion("comment", model="gpt-3.5-turbo", messages=messages)
+        return usage
+
+    usage = asyncio.run(run())
+    assert len(calls) == 2
+    # Sin usage en la respuesta se estima a partir del prompt y el texto
+    assert usage.calls == 1
+    assert usage.prompt_tokens == estimate_messages_tokens(messages)
+    assert usage.completion_tokens == estimate_tokens("Buen ritmo.")
@@ -0,0 +1,83 @@
+"""
+Pruebas de las trazas: anidación de spans entre tareas, hilos y SQL.
+"""
+import asyncio
+import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.observability.tracing import JsonLinesSpanExporter, trace_engine
+from src.shared.utils.tracing import configure_tracer, in_current_context, span, trace_public_methods, traced
+
+
+@pytest.fixture
+def exporter():
+    memory = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(memory))
+    configure_tracer(provider.get_tracer("test"))
+    yield memory
+    configure_tracer(None)
+
+
+@trace_public_methods
+class _Repository:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def count(self):
+        with self._engine.connect() as conn:
+            return conn.execute(text("SELECT 1")).scalar()
+
+
+@traced()
+async def _lookup(repository):
+    await asyncio.sleep(0)
+    return repository.count()
+
+
+def test_spans_nest_across_tasks_threads_and_sql(exporter):
+    engine = create_engine("sqlite:///:memory:")
+    trace_engine(engine)
+    repository = _Repository(engine)
+
+    async def scenario():
+        with span("request"):
+            await asyncio.gather(_lookup(repository), _lookup(repository))
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await asyncio.get_running_loop().run_in_executor(executor, in_current_context(repository.count))
+
+    asyncio.run(scenario())
+
+    finished = exporter.get_finished_spans()
+    by_id = {item.context.span_id: item for item in finished}
+    edges = Counter((item.name, by_id[item.parent.span_id].name if item.parent else None) for item in finished)
+
+    assert len({item.context.trace_id for item in finished}) == 1
+    assert edges == Counter({
+        ("request", None): 1,
+        ("_lookup", "request"): 2,                     # asyncio.gather
+        ("_Repository.count", "_lookup"): 2,
+        ("_Repository.count", "request"): 1,           # executor con in_current_context
+        ("db.query", "_Repository.count"): 3,
+    })
+
+def test_json_lines_exporter_writes_one_span_per_line(exporter, tmp_path):
+    with span("request", **{"http.route": "/x"}):
+        with span("child"):
+            pass
+
+    path = tmp_path / "spans.jsonl"
+    JsonLinesSpanExporter(str(path)).export(exporter.get_finished_spans())
+
+    child, request = [json.loads(line) for line in path.read_text().splitlines()]
+    assert child["parent_span_id"] == request["span_id"]
+    assert request["parent_span_id"] is None
+    assert request["attributes"] == {"http.route": "/x"}
+    assert child["trace_id"] == request["trace_id"]